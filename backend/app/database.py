@@ -1,8 +1,13 @@
 from sqlmodel import SQLModel, create_engine, Session
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateIndex
 from typing import Generator
 import os
+import logging
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 # Database Configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./autohvac.db")
 
@@ -11,16 +16,72 @@ if DATABASE_URL.startswith("sqlite"):
     db_path = DATABASE_URL.replace("sqlite:///", "")
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
+# Connection pool (per process). Web: WEB_CONCURRENCY processes x (size + overflow);
+# worker: WORKER_CONCURRENCY processes, each running one job at a time plus the
+# lease heartbeat and job-state flusher. Keep the total under the Postgres connection limit.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT_SECONDS", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))  # Below server/proxy idle timeouts
+
+def _engine_options() -> dict:
+    if DATABASE_URL.startswith("sqlite"):
+        return {"connect_args": {"check_same_thread": False}}
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True  # Drop connections closed by restarts/failovers before use
+    }
+
 # Create engine
 engine = create_engine(
     DATABASE_URL,
     echo=os.getenv("SQL_DEBUG", "false").lower() == "true",  # Set SQL_DEBUG=true for query logging
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+    **_engine_options()
 )
 
 def create_db_and_tables():
     """Create all database tables"""
     SQLModel.metadata.create_all(engine)
+    _add_missing_columns()
+    _add_missing_indexes()
+
+def _add_missing_columns():
+    """
+    Add nullable columns that were added to a model after its table was
+    created. create_all() only creates missing tables.
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    
+    with engine.begin() as connection:
+        for table in SQLModel.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                logger.info(f"🛠️  DB: Added column {table.name}.{column.name}")
+
+def _add_missing_indexes():
+    """Create model indexes missing from existing tables (new columns or new composite indexes)"""
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    
+    with engine.begin() as connection:
+        for table in SQLModel.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    connection.execute(CreateIndex(index, if_not_exists=True))
+                    logger.info(f"🛠️  DB: Created index {index.name}")
 
 def get_session() -> Generator[Session, None, None]:
     """Dependency for getting database session"""
@@ -1,4 +1,5 @@
 import os
+import asyncio
 import logging
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -56,6 +57,22 @@ async def startup_event():
     logger.info("🗄️  Initializing database tables...")
     create_db_and_tables()
     logger.info("✅ Database tables initialized")
+    
+    # Warm the shared pipeline so the first input edit/scenario request is fast
+    from pipeline_v3 import get_scenario_pipeline
+    get_scenario_pipeline()
+    logger.info("✅ Recalculation pipeline ready")
+    
+    # Load climate tables once so ZIP lookups never touch disk on the request path
+    from domain.core.climate_db import get_climate_database
+    get_climate_database()
+    logger.info("✅ Climate database ready")
+    
+    # Keep admin analytics rollups current (first run backfills history)
+    from app.services.analytics_rollups import analytics_rollups, ANALYTICS_REFRESH_MINUTES
+    if ANALYTICS_REFRESH_MINUTES > 0:
+        asyncio.create_task(analytics_rollups.run_periodic_refresh())
+        logger.info(f"✅ Analytics rollups refresh every {ANALYTICS_REFRESH_MINUTES} min")
 
 # Include API routes
 app.include_router(blueprint.router, prefix="/api/v1/blueprint")
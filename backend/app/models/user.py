@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+from sqlalchemy import Index, UniqueConstraint
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -159,6 +160,12 @@ class JobModel(SQLModel, table=True):
     - Performance monitoring
     """
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Per-user, newest-first job listing (keyset pagination)
+        Index("ix_jobs_user_email_created_at", "user_email", "created_at"),
+        # Per-user jobs in a state (pending-upgrade replay)
+        Index("ix_jobs_user_email_status", "user_email", "status"),
+    )
     
     # Primary Identity
     id: str = Field(primary_key=True, description="UUID job identifier")
@@ -183,6 +190,11 @@ class JobModel(SQLModel, table=True):
     # File Storage
     s3_upload_path: Optional[str] = Field(default=None, max_length=1000)
     s3_result_path: Optional[str] = Field(default=None, max_length=1000)
+    file_sha256: Optional[str] = Field(default=None, max_length=64, description="SHA-256 of the uploaded PDF")
+    file_size_bytes: Optional[int] = Field(default=None, description="Size of the uploaded PDF")
+    
+    # Deduplication: hash of PDF content + ZIP + inputs + pipeline version
+    fingerprint: Optional[str] = Field(default=None, max_length=64, index=True)
     
     # Timing & Performance
     created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
@@ -283,6 +295,18 @@ class JobModel(SQLModel, table=True):
         }
 
 
+# Dedup claim: at most one in-flight job per fingerprint, so of concurrent
+# identical uploads exactly one runs the pipeline (the rest follow it)
+JOB_IN_FLIGHT_STATUSES = [JobStatus.CREATED, JobStatus.QUEUED, JobStatus.PROCESSING]
+Index(
+    "ux_jobs_fingerprint_in_flight",
+    JobModel.fingerprint,
+    unique=True,
+    postgresql_where=JobModel.status.in_(JOB_IN_FLIGHT_STATUSES),
+    sqlite_where=JobModel.status.in_(JOB_IN_FLIGHT_STATUSES)
+)
+
+
 class JobLogEntry(SQLModel, table=True):
     """
     Detailed logging for job processing steps
@@ -299,4 +323,57 @@ class JobLogEntry(SQLModel, table=True):
     log_metadata: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
     
     def __repr__(self) -> str:
-        return f"<JobLog {self.job_id} [{self.level}] {self.stage}: {self.message[:50]}...>"
\ No newline at end of file
+        return f"<JobLog {self.job_id} [{self.level}] {self.stage}: {self.message[:50]}...>"
+
+class QueuedTaskStatus(str, Enum):
+    """Lifecycle of a pipeline task in the database-backed job queue"""
+    QUEUED = "queued"       # Waiting for a worker (available_at may be in the future for retries)
+    LEASED = "leased"       # Claimed by a worker until leased_until
+    DONE = "done"           # Acknowledged by the worker
+    DEAD = "dead"           # Exhausted retries
+
+
+class QueuedTaskModel(SQLModel, table=True):
+    """
+    Durable pipeline task queue (database fallback when Redis is unavailable)
+    
+    Tasks are leased to a worker for a visibility timeout; a task whose lease
+    expires without acknowledgement becomes claimable again.
+    """
+    __tablename__ = "job_queue"
+    
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
+    job_id: str = Field(index=True, max_length=64)
+    payload: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+    
+    status: QueuedTaskStatus = Field(default=QueuedTaskStatus.QUEUED, index=True)
+    attempts: int = Field(default=0, description="Deliveries so far")
+    available_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    leased_until: Optional[datetime] = Field(default=None, index=True)
+    lease_owner: Optional[str] = Field(default=None, max_length=255)
+    last_error: Optional[str] = Field(default=None, max_length=2000)
+    
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class AnalyticsRollup(SQLModel, table=True):
+    """
+    Pre-aggregated admin analytics, one row per (granularity, bucket, metric)
+    
+    Counters (users created, jobs completed, ...) are incremented as events
+    happen and re-derived from the source tables by the periodic refresh.
+    Gauges (paying customers, active users, ...) are written by the refresh
+    into the current day bucket.
+    """
+    __tablename__ = "analytics_rollups"
+    __table_args__ = (
+        UniqueConstraint("granularity", "bucket_start", "metric", name="uq_analytics_rollups_bucket"),
+    )
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    granularity: str = Field(max_length=10, description="hour or day")
+    bucket_start: datetime = Field(index=True, description="UTC start of the hour/day")
+    metric: str = Field(max_length=100, index=True)
+    value: float = Field(default=0)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
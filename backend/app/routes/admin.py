@@ -3,14 +3,14 @@ Admin dashboard routes for AutoHVAC founder analytics
 Provides business metrics and user management interface
 """
 import os
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import HTMLResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from sqlmodel import Session, select, func, and_, or_
+from sqlmodel import Session, select
 from app.database import get_session
-from app.models.user import UserModel, SubscriptionStatus
+from app.models.user import UserModel
 
 router = APIRouter()
 security = HTTPBasic()
@@ -586,6 +586,15 @@ async def admin_dashboard(
                         </svg>
                         Export Customer Data
                     </a>
+                    <a href="/admin/jobs/export" class="action-link">
+                        <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+                            <path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z"/>
+                            <polyline points="14,2 14,8 20,8"/>
+                            <line x1="16" y1="13" x2="8" y2="13"/>
+                            <line x1="16" y1="17" x2="8" y2="17"/>
+                        </svg>
+                        Export Job Data
+                    </a>
                     <a href="/admin/analytics" class="action-link">
                         <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
                             <polyline points="22,12 18,12 15,21 9,3 6,12 2,12"/>
@@ -775,245 +784,15 @@ def get_users_table_html(users):
         """
     return html
 
-async def get_conversion_analytics(session: Session):
-    """Advanced conversion funnel analytics"""
-    
-    # Time to conversion analysis - users who converted from free to paid
-    converted_users = session.exec(
-        select(UserModel).where(
-            and_(
-                UserModel.free_report_used == True,
-                UserModel.subscription_status.in_([SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING])
-            )
-        )
-    ).all()
-    
-    conversion_times = []
-    for user in converted_users:
-        if user.free_report_used_at and user.subscription_started_at:
-            time_diff = user.subscription_started_at - user.free_report_used_at
-            conversion_times.append(time_diff.total_seconds() / 86400)  # Convert to days
-    
-    # Calculate conversion time metrics
-    if conversion_times:
-        avg_conversion_time = sum(conversion_times) / len(conversion_times)
-        median_conversion_time = sorted(conversion_times)[len(conversion_times) // 2]
-        fast_converters = len([t for t in conversion_times if t <= 1])  # Within 24 hours
-    else:
-        avg_conversion_time = median_conversion_time = fast_converters = 0
-    
-    # Email verification rate
-    total_users = session.exec(select(func.count(UserModel.id))).first()
-    verified_users = session.exec(
-        select(func.count(UserModel.id)).where(UserModel.email_verified == True)
-    ).first()
-    verification_rate = (verified_users / total_users * 100) if total_users > 0 else 0
-    
-    return {
-        'avg_conversion_time_days': round(avg_conversion_time, 1),
-        'median_conversion_time_days': round(median_conversion_time, 1),
-        'fast_converters': fast_converters,
-        'total_converters': len(conversion_times),
-        'email_verification_rate': round(verification_rate, 1)
-    }
-
-async def get_geographic_analytics(session: Session):
-    """Geographic insights from IP addresses"""
-    
-    # Get IP address distribution (simplified - you'd want proper GeoIP lookup)
-    ip_data = session.exec(
-        select(UserModel.ip_address, func.count(UserModel.id))
-        .where(UserModel.ip_address.isnot(None))
-        .group_by(UserModel.ip_address)
-    ).all()
-    
-    total_with_ip = sum(count for _, count in ip_data)
-    unique_locations = len(ip_data)
-    
-    # Detect potential duplicate IPs (simple fraud indicator)
-    duplicate_ips = len([ip for ip, count in ip_data if count > 1])
-    
-    # Geographic diversity score (higher = more diverse)
-    geo_diversity = (unique_locations / total_with_ip * 100) if total_with_ip > 0 else 0
-    
-    return {
-        'unique_ip_addresses': unique_locations,
-        'users_with_ip_data': total_with_ip,
-        'duplicate_ip_addresses': duplicate_ips,
-        'geographic_diversity_score': round(geo_diversity, 1)
-    }
-
-async def get_user_health_metrics(session: Session):
-    """User engagement and health scoring"""
-    
-    # Activity metrics
-    week_ago = datetime.now() - timedelta(days=7)
-    month_ago = datetime.now() - timedelta(days=30)
-    
-    # Recent activity
-    active_this_week = session.exec(
-        select(func.count(UserModel.id)).where(UserModel.last_login_at >= week_ago)
-    ).first()
-    
-    active_this_month = session.exec(
-        select(func.count(UserModel.id)).where(UserModel.last_login_at >= month_ago)
-    ).first()
-    
-    # Dormant users (no login in 30+ days)
-    dormant_users = session.exec(
-        select(func.count(UserModel.id)).where(
-            or_(
-                UserModel.last_login_at < month_ago,
-                UserModel.last_login_at.is_(None)
-            )
-        )
-    ).first()
-    
-    # High-value users (paid + active)
-    high_value_users = session.exec(
-        select(func.count(UserModel.id)).where(
-            and_(
-                UserModel.subscription_status.in_([SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING]),
-                UserModel.last_login_at >= week_ago
-            )
-        )
-    ).first()
-    
-    # At-risk users (paid but inactive)
-    at_risk_users = session.exec(
-        select(func.count(UserModel.id)).where(
-            and_(
-                UserModel.subscription_status.in_([SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING]),
-                or_(
-                    UserModel.last_login_at < week_ago,
-                    UserModel.last_login_at.is_(None)
-                )
-            )
-        )
-    ).first()
-    
-    return {
-        'active_users_week': active_this_week or 0,
-        'active_users_month': active_this_month or 0,
-        'dormant_users': dormant_users or 0,
-        'high_value_users': high_value_users or 0,
-        'at_risk_users': at_risk_users or 0
-    }
-
-async def get_growth_chart_data(session: Session):
-    """Get subscriber growth data for charting"""
-    
-    # Get the earliest subscription date to determine chart range
-    earliest_sub = session.exec(
-        select(UserModel.subscription_started_at)
-        .where(UserModel.subscription_started_at.isnot(None))
-        .order_by(UserModel.subscription_started_at.asc())
-        .limit(1)
-    ).first()
-    
-    if not earliest_sub:
-        # No subscribers yet - return empty data
-        return {'dates': [], 'subscribers': [], 'total_users': []}
-    
-    # Generate daily data points from earliest subscription to now
-    start_date = earliest_sub.date()
-    end_date = datetime.now().date()
-    
-    dates = []
-    subscribers = []
-    total_users = []
-    
-    current_date = start_date
-    while current_date <= end_date:
-        # Count active subscribers on this date
-        subscriber_count = session.exec(
-            select(func.count(UserModel.id)).where(
-                and_(
-                    UserModel.subscription_started_at <= datetime.combine(current_date, datetime.min.time()),
-                    or_(
-                        UserModel.subscription_expires_at.is_(None),
-                        UserModel.subscription_expires_at > datetime.combine(current_date, datetime.min.time())
-                    ),
-                    UserModel.subscription_status.in_([SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING])
-                )
-            )
-        ).first() or 0
-        
-        # Count total users on this date
-        total_user_count = session.exec(
-            select(func.count(UserModel.id)).where(
-                UserModel.created_at <= datetime.combine(current_date, datetime.min.time())
-            )
-        ).first() or 0
-        
-        dates.append(current_date.strftime('%Y-%m-%d'))
-        subscribers.append(subscriber_count)
-        total_users.append(total_user_count)
-        
-        # Move to next day (sample every 3 days to reduce data points for performance)
-        current_date += timedelta(days=3)
-    
-    return {
-        'dates': dates,
-        'subscribers': subscribers, 
-        'total_users': total_users
-    }
-
 async def get_user_analytics(session: Session):
-    """Get comprehensive user analytics"""
-    
-    # Basic metrics
-    total_users = session.exec(select(func.count(UserModel.id))).first()
-    
-    week_ago = datetime.now() - timedelta(days=7)
-    new_users_this_week = session.exec(
-        select(func.count(UserModel.id)).where(UserModel.created_at >= week_ago)
-    ).first()
-    
-    paying_customers = session.exec(
-        select(func.count(UserModel.id)).where(
-            UserModel.subscription_status.in_([SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING])
-        )
-    ).first()
-    
-    free_reports_used = session.exec(
-        select(func.count(UserModel.id)).where(UserModel.free_report_used == True)
-    ).first()
-    
-    total_reports = session.exec(
-        select(func.sum(UserModel.total_reports_generated))
-    ).first() or 0
-    
-    # Subscription breakdown
-    subscription_breakdown = {}
-    for status in SubscriptionStatus:
-        count = session.exec(
-            select(func.count(UserModel.id)).where(UserModel.subscription_status == status)
-        ).first()
-        subscription_breakdown[status.value] = count
-    
-    # Advanced Analytics
-    conversion_analytics = await get_conversion_analytics(session)
-    geographic_analytics = await get_geographic_analytics(session)
-    user_health_metrics = await get_user_health_metrics(session)
-    growth_data = await get_growth_chart_data(session)
-    
-    # Calculate conversion rate
-    conversion_rate = (paying_customers / total_users * 100) if total_users > 0 else 0
+    """
+    Get comprehensive user analytics
     
-    return {
-        'total_users': total_users,
-        'new_users_this_week': new_users_this_week,
-        'paying_customers': paying_customers,
-        'free_reports_used': free_reports_used,
-        'total_reports': total_reports,
-        'conversion_rate': conversion_rate,
-        'subscription_breakdown': subscription_breakdown,
-        'growth_data': growth_data,
-        **conversion_analytics,
-        **geographic_analytics,
-        **user_health_metrics
-    }
+    Served from pre-aggregated rollups (see app/services/analytics_rollups.py),
+    so the cost does not grow with the number of users.
+    """
+    from app.services.analytics_rollups import analytics_rollups
+    return analytics_rollups.get_dashboard_analytics()
 
 async def get_recent_users(session: Session, limit: int = 10):
     """Get recent users with key information"""
@@ -1033,6 +812,42 @@ async def detailed_analytics(
     analytics = await get_user_analytics(session)
     return analytics
 
+@router.get("/pipeline/metrics")
+async def pipeline_metrics(
+    admin_user: str = Depends(authenticate_admin)
+):
+    """Pipeline admission metrics: in-flight jobs, queue depth and wait times (JSON)"""
+    from app.services.admission import admission_controller
+    return admission_controller.metrics()
+
+@router.get("/jobs/{job_id}/raw-extractions")
+async def job_raw_extractions(
+    job_id: str,
+    admin_user: str = Depends(authenticate_admin)
+):
+    """Raw pipeline extractions (vector, vision, scale, ...) of a job, for debugging (JSON)"""
+    import asyncio
+    from app.services.job_storage import job_storage
+    from app.services.artifact_store import artifact_store
+    
+    job = job_storage.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    result = job.get("result") or {}
+    if "raw_extractions" in result:
+        # Jobs completed before extractions moved to side storage
+        return {"job_id": job_id, "source": "result", "raw_extractions": result["raw_extractions"]}
+    
+    key = result.get("raw_extractions_key")
+    if not key:
+        raise HTTPException(status_code=404, detail="No raw extractions stored for this job")
+    
+    raw_extractions = await asyncio.get_event_loop().run_in_executor(None, artifact_store.load_json, key)
+    if raw_extractions is None:
+        raise HTTPException(status_code=404, detail="Raw extractions no longer available")
+    return {"job_id": job_id, "source": key, "raw_extractions": raw_extractions}
+
 @router.get("/users/search")
 async def search_users(
     email: Optional[str] = None,
@@ -1059,42 +874,148 @@ async def search_users(
         for user in users
     ]}
 
-@router.get("/users/export")
-async def export_users_csv(
-    admin_user: str = Depends(authenticate_admin),
-    session: Session = Depends(get_session)
-):
-    """Export all users as CSV"""
+EXPORT_BATCH_SIZE = 1000        # Rows fetched per round trip (server-side cursor)
+EXPORT_CHUNK_BYTES = 64 * 1024  # CSV text buffered before a chunk is sent
+
+def _csv_export_response(request: Request, statement, header: list, format_row, filename: str):
+    """
+    Stream a query as CSV without materializing the table
+    
+    Rows are read through a server-side cursor in EXPORT_BATCH_SIZE batches
+    and sent in ~EXPORT_CHUNK_BYTES chunks, gzip-encoded when the client
+    accepts it. The generator owns its session, since it runs after the
+    endpoint has returned.
+    """
     from fastapi.responses import StreamingResponse
-    import io
+    from sqlmodel import Session as ExportSession
+    from app.database import engine
     import csv
+    import io
+    import zlib
     
-    users = session.exec(select(UserModel)).all()
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # CSV Header
-    writer.writerow([
-        'Email', 'Name', 'Created At', 'Subscription Status', 
-        'Total Reports', 'Free Report Used', 'Last Login'
-    ])
-    
-    # CSV Data
-    for user in users:
-        writer.writerow([
-            user.email,
-            user.name or '',
-            user.created_at.isoformat() if user.created_at else '',
-            user.subscription_status,
-            user.total_reports_generated,
-            user.free_report_used,
-            user.last_login_at.isoformat() if user.last_login_at else ''
-        ])
+    use_gzip = "gzip" in request.headers.get("accept-encoding", "").lower()
     
-    output.seek(0)
-    return StreamingResponse(
-        io.BytesIO(output.getvalue().encode()),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=autohvac_users.csv"}
+    def generate():
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if use_gzip else None  # wbits 31 = gzip container
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        
+        def take_chunk() -> bytes:
+            data = buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            return compressor.compress(data) if compressor else data
+        
+        writer.writerow(header)
+        with ExportSession(engine) as export_session:
+            rows = export_session.exec(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+            for row in rows:
+                writer.writerow(format_row(row))
+                if buffer.tell() >= EXPORT_CHUNK_BYTES:
+                    chunk = take_chunk()
+                    if chunk:
+                        yield chunk
+        
+        chunk = take_chunk()
+        if compressor:
+            chunk += compressor.flush()
+        if chunk:
+            yield chunk
+    
+    headers = {"Content-Disposition": f"attachment; filename={filename}", "Vary": "Accept-Encoding"}
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(generate(), media_type="text/csv", headers=headers)
+
+def _isoformat(value: Optional[datetime]) -> str:
+    return value.isoformat() if value else ''
+
+@router.get("/users/export")
+async def export_users_csv(
+    request: Request,
+    admin_user: str = Depends(authenticate_admin)
+):
+    """Export all users as CSV (streamed)"""
+    statement = select(
+        UserModel.email,
+        UserModel.name,
+        UserModel.created_at,
+        UserModel.subscription_status,
+        UserModel.total_reports_generated,
+        UserModel.free_report_used,
+        UserModel.last_login_at
+    ).order_by(UserModel.id)
+    
+    def format_row(row):
+        email, name, created_at, subscription_status, total_reports, free_report_used, last_login_at = row
+        return [
+            email,
+            name or '',
+            _isoformat(created_at),
+            subscription_status,
+            total_reports,
+            free_report_used,
+            _isoformat(last_login_at)
+        ]
+    
+    return _csv_export_response(
+        request,
+        statement,
+        ['Email', 'Name', 'Created At', 'Subscription Status',
+         'Total Reports', 'Free Report Used', 'Last Login'],
+        format_row,
+        "autohvac_users.csv"
+    )
+
+@router.get("/jobs/export")
+async def export_jobs_csv(
+    request: Request,
+    admin_user: str = Depends(authenticate_admin)
+):
+    """Export all jobs as CSV (streamed; headline loads only, never full results)"""
+    from app.models.user import JobModel
+    
+    statement = select(
+        JobModel.id,
+        JobModel.user_email,
+        JobModel.filename,
+        JobModel.project_label,
+        JobModel.zip_code,
+        JobModel.status,
+        JobModel.created_at,
+        JobModel.completed_at,
+        JobModel.result_data["heating_tons"].as_float(),
+        JobModel.result_data["cooling_tons"].as_float(),
+        JobModel.result_data["total_conditioned_area_sqft"].as_float(),
+        JobModel.result_data["processing_time_seconds"].as_float(),
+        JobModel.is_free_report
+    ).order_by(JobModel.created_at)
+    
+    def format_row(row):
+        (job_id, email, filename, project_label, zip_code, status, created_at, completed_at,
+         heating_tons, cooling_tons, area, processing_time, is_free_report) = row
+        return [
+            job_id,
+            email,
+            filename,
+            project_label or '',
+            zip_code,
+            status.value,
+            _isoformat(created_at),
+            _isoformat(completed_at),
+            round(heating_tons, 2) if heating_tons is not None else '',
+            round(cooling_tons, 2) if cooling_tons is not None else '',
+            area if area is not None else '',
+            round(processing_time, 1) if processing_time is not None else '',
+            is_free_report
+        ]
+    
+    return _csv_export_response(
+        request,
+        statement,
+        ['Job ID', 'Email', 'Filename', 'Project', 'ZIP Code', 'Status', 'Created At',
+         'Completed At', 'Heating Tons', 'Cooling Tons', 'Conditioned Area (sqft)',
+         'Processing Time (s)', 'Free Report'],
+        format_row,
+        "autohvac_jobs.csv"
     )
\ No newline at end of file
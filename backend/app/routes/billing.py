@@ -1,22 +1,30 @@
 from fastapi import APIRouter, HTTPException, Request, Depends
 from fastapi.responses import JSONResponse
 import os
+import asyncio
 import logging
 from sqlmodel import Session
 # Import stripe config first to ensure stripe is configured
 from app.core.stripe_config import STRIPE_WEBHOOK_SECRET, STRIPE_PRICE_ID, validate_stripe_config
 import stripe
 from app.services.user_service import user_service
+from app.services.job_storage import job_storage
+from app.services.job_queue import get_job_queue, job_queue_enabled
+from app.services.admission import admission_controller, AdmissionRejected
 from app.database import get_session
 from app.models.schemas import SubscribeRequest, SubscribeResponse, CheckoutSessionResponse, BillingPortalResponse, SubscriptionStatusResponse
 # from app.routes.auth import get_current_user  # TODO: Add proper JWT auth
-from app.models.user import User
+from app.models.user import User, JobStatus
 import json
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Blocked jobs of a newly upgraded user run in-process this many at a time
+# (only when the worker queue is off; otherwise the workers bound concurrency)
+PENDING_REPLAY_CONCURRENCY = int(os.getenv("PENDING_REPLAY_CONCURRENCY", "2"))
+
 @router.post("/subscribe", response_model=SubscribeResponse)
 async def create_subscription(
     request: SubscribeRequest,
@@ -354,6 +362,7 @@ async def _handle_checkout_completed(session_obj: dict, session: Session):
     if user_email and customer_id:
         logger.info(f"Activating subscription for {user_email}, customer: {customer_id}")
         user_service.activate_subscription(user_email, customer_id, session)
+        await _process_pending_blueprints_for_user(user_email)
     else:
         logger.warning(f"Missing user_email or customer_id in checkout session: {session_obj.get('id')}")
 
@@ -367,6 +376,7 @@ async def _handle_invoice_paid(invoice_obj: dict, session: Session):
         if user:
             logger.info(f"Confirming active subscription for customer: {customer_id}")
             user_service.activate_subscription(user.email, customer_id, session)
+            await _process_pending_blueprints_for_user(user.email)
 
 async def _handle_subscription_deleted(subscription_obj: dict, session: Session):
     """Handle subscription cancellation"""
@@ -400,6 +410,7 @@ async def _handle_subscription_updated(subscription_obj: dict, session: Session)
             if status in ['active', 'trialing']:
                 logger.info(f"Subscription updated to {status} for customer: {customer_id}")
                 user_service.activate_subscription(user.email, customer_id, session)
+                await _process_pending_blueprints_for_user(user.email)
             else:
                 logger.info(f"Subscription updated to {status} for customer: {customer_id}, deactivating")
                 user_service.deactivate_subscription(user.email, session)
@@ -413,89 +424,134 @@ async def _get_user_by_stripe_customer_id(customer_id: str, session: Session):
     result = session.exec(statement)
     return result.first()
 
+def _replay_payload(job: dict) -> dict:
+    """Worker payload for a replayed job (the spool file is gone; workers fetch the stored copy)"""
+    return {
+        "pdf_path": None,
+        "saved_file_path": job["saved_file_path"],
+        "zip_code": job["zip_code"],
+        "email": job["email"],
+        "is_first_report": False,  # They're now a paying customer
+        "user_inputs": job["user_inputs"],
+        "project_label": job["project_label"] or "Upgraded User Project"
+    }
+
+async def _admit_replayed_job(job_id: str, email: str, worker_queue: bool = False):
+    """Admit a claimed job, waiting out rejections (the user has paid - it is never dropped)"""
+    while True:
+        try:
+            return admission_controller.admit(job_id, email, worker_queue)
+        except AdmissionRejected as e:
+            await asyncio.sleep(e.retry_after_seconds)
+
+async def _run_replayed_job(job: dict):
+    """Download one claimed job's blueprint and run it under admission control"""
+    import tempfile
+    from app.database import engine
+    from app.routes.blueprint import UPLOAD_SPOOL_DIR, process_blueprint_async
+    from app.services.s3_storage import storage_service
+    
+    job_id = job["job_id"]
+    payload = _replay_payload(job)
+    try:
+        os.makedirs(UPLOAD_SPOOL_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf', dir=UPLOAD_SPOOL_DIR) as temp_file:
+            pdf_path = temp_file.name
+        await storage_service.download_to_file(payload["saved_file_path"], pdf_path)
+    except Exception as download_error:
+        logger.error(f"Failed to download file for job {job_id}: {download_error}")
+        job_storage.update_job(job_id, {"status": "failed", "error": f"Failed to retrieve saved file: {download_error}"})
+        return
+    
+    ticket = await _admit_replayed_job(job_id, job["email"])
+    
+    with Session(engine) as session:
+        await admission_controller.run(ticket, lambda: process_blueprint_async(
+            job_id=job_id,
+            pdf_path=pdf_path,
+            zip_code=payload["zip_code"],
+            api_key=os.getenv("OPENAI_API_KEY"),
+            email=payload["email"],
+            session=session,
+            is_first_report=False,
+            user_inputs=payload["user_inputs"],
+            project_label=payload["project_label"]
+        ))
+
+async def _replay_in_process(claimed: list):
+    """Run claimed jobs in this process, PENDING_REPLAY_CONCURRENCY at a time"""
+    semaphore = asyncio.Semaphore(PENDING_REPLAY_CONCURRENCY)
+    
+    async def replay(job: dict):
+        async with semaphore:
+            try:
+                await _run_replayed_job(job)
+            except Exception as e:
+                logger.error(f"Failed to auto-process job {job['job_id']}: {e}")
+    
+    await asyncio.gather(*(replay(job) for job in claimed))
+
+async def _replay_to_workers(claimed: list):
+    """Hand claimed jobs to the worker pool one at a time as admission allows"""
+    for job in claimed:
+        job_id = job["job_id"]
+        await _admit_replayed_job(job_id, job["email"], worker_queue=True)
+        job_storage.update_job(job_id, {"status": "queued"})
+        try:
+            get_job_queue().enqueue(job_id, _replay_payload(job))
+        except Exception as e:
+            # Hand the job back so a later activation event replays it
+            logger.error(f"Failed to enqueue pending blueprint {job_id}: {e}")
+            job_storage.update_job(job_id, {"status": "pending_upgrade", "needs_upgrade": True})
+
 async def _process_pending_blueprints_for_user(email: str):
-    """Process any pending/failed blueprints for a newly upgraded user"""
+    """
+    Process blueprints a newly upgraded user uploaded while blocked
+    
+    Jobs are claimed with one conditional UPDATE (pending_upgrade -> created),
+    so a repeated Stripe webhook finds nothing left to claim and no job is
+    processed twice. Claimed jobs pass admission control like uploads: they
+    go to the worker pool as the user's queue limits allow, or run in this
+    process with bounded concurrency when the worker queue is off.
+    """
     try:
         logger.info(f"🔄 Checking for pending blueprints for upgraded user: {email}")
         
-        # Import here to avoid circular imports
-        from app.routes.blueprint import jobs, process_blueprint_async
-        from app.database import get_session
-        import os
-        import asyncio
-        
-        # Find jobs for this user that are pending upgrade
-        user_jobs = []
-        for job_id, job in jobs.items():
-            if (job.get("email") == email and 
-                job.get("status") == "pending_upgrade" and
-                job.get("needs_upgrade") == True):
-                user_jobs.append((job_id, job))
-        
-        if user_jobs:
-            logger.info(f"🚀 Found {len(user_jobs)} blocked jobs for {email} - processing now!")
-            
-            # Process each blocked job
-            for job_id, job in user_jobs:
-                try:
-                    # Get API key from environment
-                    api_key = os.getenv("OPENAI_API_KEY")
-                    if not api_key:
-                        logger.error(f"Cannot process job {job_id} - no OpenAI API key")
-                        continue
-                    
-                    # Reset job status
-                    jobs[job_id]["status"] = "processing"
-                    jobs[job_id]["progress"] = 0
-                    jobs[job_id]["error"] = None
-                    
-                    logger.info(f"🔄 Auto-processing job {job_id} for upgraded user {email}")
-                    
-                    # Download file from S3 and create temp file for processing
-                    s3_path = job.get("saved_file_path")
-                    if s3_path:
-                        try:
-                            # Get the file content from S3
-                            from app.services.s3_storage import storage_service
-                            import tempfile
-                            
-                            file_content = await storage_service.download_file(s3_path)
-                            
-                            # Create temporary file for processing
-                            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-                                temp_file.write(file_content)
-                                temp_file_path = temp_file.name
-                            
-                            # Get a fresh database session
-                            with Session(get_session().__next__()) as fresh_session:
-                                # Start processing (this will create a new background task)
-                                asyncio.create_task(process_blueprint_async(
-                                    job_id=job_id,
-                                    pdf_path=temp_file_path,
-                                    zip_code=job.get("zip_code", "99006"),
-                                    api_key=api_key,
-                                    email=email,
-                                    session=fresh_session,
-                                    is_first_report=False,  # They're now a paying customer
-                                    user_inputs=job.get("user_inputs", {}),
-                                    project_label=job.get("project_label", "Upgraded User Project")
-                                ))
-                                
-                        except Exception as download_error:
-                            logger.error(f"Failed to download file for job {job_id}: {download_error}")
-                            jobs[job_id]["status"] = "failed"
-                            jobs[job_id]["error"] = f"Failed to retrieve saved file: {download_error}"
-                    else:
-                        logger.error(f"No saved file path for job {job_id}")
-                        jobs[job_id]["status"] = "failed"
-                        jobs[job_id]["error"] = "No saved file found for processing"
-                        
-                except Exception as e:
-                    logger.error(f"Failed to auto-process job {job_id}: {e}")
-                    
-        else:
+        use_worker_queue = job_queue_enabled()
+        if not use_worker_queue and not os.getenv("OPENAI_API_KEY"):
+            # Leave them pending - the next activation event retries
+            logger.error(f"Cannot process pending blueprints for {email} - no OpenAI API key")
+            return
+        
+        # "created" until admitted, so waiting replays do not count against the user's queue limit
+        claimed = job_storage.claim_jobs(email, JobStatus.PENDING_UPGRADE, {
+            "status": "created",
+            "progress": 0,
+            "error": None,
+            "needs_upgrade": False,
+            "is_first_report": False
+        })
+        if not claimed:
             logger.info(f"No blocked jobs found for {email}")
+            return
+        
+        logger.info(f"🚀 Found {len(claimed)} blocked jobs for {email} - processing now!")
+        
+        runnable = []
+        for job in claimed:
+            if job["saved_file_path"]:
+                runnable.append(job)
+            else:
+                logger.error(f"No saved file path for job {job['job_id']}")
+                job_storage.update_job(job["job_id"], {"status": "failed", "error": "No saved file found for processing"})
+        
+        if not runnable:
+            return
+        if use_worker_queue:
+            asyncio.create_task(_replay_to_workers(runnable))
+        else:
+            asyncio.create_task(_replay_in_process(runnable))
             
     except Exception as e:
         logger.error(f"Error checking pending blueprints for {email}: {e}")
-        # Don't fail the upgrade process if this fails
\ No newline at end of file
+        # Don't fail the upgrade process if this fails
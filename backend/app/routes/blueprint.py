@@ -2,10 +2,11 @@ import os
 import uuid
 import tempfile
 import logging
+import json
 import asyncio
-from typing import Optional
+from typing import Optional, List
 from fastapi import APIRouter, UploadFile, File, HTTPException, Form, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from sqlmodel import Session
 
@@ -15,11 +16,18 @@ from app.services.user_service import user_service
 from app.services.s3_storage import storage_service
 
 # Import our working pipeline
-from pipeline_v3 import run_pipeline_v3
+from pipeline_v3 import run_pipeline_v3, run_scenarios, get_scenario_pipeline, pipeline_result_to_dict
 from services.report_generator import ValueReportGenerator
 
 # Import job storage
 from app.services.job_storage import job_storage
+from app.services.snapshot_store import snapshot_store
+from app.services.artifact_store import artifact_store
+from app.services.job_queue import get_job_queue, job_queue_enabled
+from app.services.admission import admission_controller, AdmissionRejected
+from app.services.upload_spool import spool_upload, UploadTooLarge
+from app.services.dedup import compute_job_fingerprint, find_duplicate_job
+from app.services.job_events import job_events, TERMINAL_STATUSES
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -29,6 +37,8 @@ class UploadResponse(BaseModel):
     job_id: str
     status: str
     message: str
+    queue_position: Optional[int] = None
+    estimated_start_at: Optional[str] = None
 
 class JobResponse(BaseModel):
     """Response model for job status"""
@@ -38,6 +48,41 @@ class JobResponse(BaseModel):
     result: Optional[dict] = None
     error: Optional[str] = None
 
+class ScenarioVariant(BaseModel):
+    """One what-if variant using the same field names as the upload form"""
+    label: Optional[str] = None
+    inputs: dict
+
+class ScenarioRequest(BaseModel):
+    """Request model for a scenario sweep"""
+    scenarios: List[ScenarioVariant]
+
+class InputsUpdateRequest(BaseModel):
+    """Editable inputs on a completed job, using the upload form field names"""
+    square_footage: Optional[str] = None
+    number_of_stories: Optional[str] = None
+    foundation_type: Optional[str] = None
+    basement_status: Optional[str] = None
+    duct_type: Optional[str] = None
+    duct_location: Optional[str] = None
+    window_performance: Optional[str] = None
+    uncertainty: Optional[str] = None
+    hourly_simulation: Optional[str] = None
+    orientation_sweep: Optional[str] = None
+
+MAX_SCENARIOS_PER_REQUEST = int(os.getenv("MAX_SCENARIOS_PER_REQUEST", "12"))
+
+# Uploaded PDFs awaiting processing (shared with workers when on the same disk)
+UPLOAD_SPOOL_DIR = os.getenv("UPLOAD_SPOOL_DIR", tempfile.gettempdir())
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_MB", "250")) * 1024 * 1024
+
+# Jobs attached to an identical in-flight job poll it until it finishes
+DEDUP_FOLLOW_POLL_SECONDS = 2
+DEDUP_FOLLOW_TIMEOUT_SECONDS = int(os.getenv("DEDUP_FOLLOW_TIMEOUT_SECONDS", "3600"))
+
+# SSE streams send a keepalive (and re-check stored status) when idle this long
+JOB_EVENTS_KEEPALIVE_SECONDS = 10
+
 # In-memory job storage (for MVP - replace with Redis/DB in production)
 jobs = {}
 
@@ -68,6 +113,11 @@ async def upload_blueprint(
     window_performance: Optional[str] = Form(None),  # Thermal envelope accuracy
     building_orientation: Optional[str] = Form(None),  # Solar gain calculations
     
+    # 📊 OPTIONAL ANALYSES: Off unless requested
+    uncertainty: Optional[str] = Form(None),  # Monte Carlo load bands: "true" or a sample count
+    hourly_simulation: Optional[str] = Form(None),  # "design_day" or "annual" hourly load profiles
+    orientation_sweep: Optional[str] = Form(None),  # Cooling load per building rotation: "true" or "36"
+    
     # 🔄 LEGACY COMPATIBILITY: Kept for backward compatibility
     duct_config: Optional[str] = Form(None),  # Legacy field
     session: Session = Depends(get_session)
@@ -78,6 +128,8 @@ async def upload_blueprint(
     CRITICAL PAYWALL ENFORCEMENT: This endpoint enforces our freemium business model.
     Users get exactly 1 free report, then must subscribe for more.
     """
+    # Spool file owned by this request until handed to in-process processing
+    upload = None
     try:
         # Extract client IP for tracking
         client_ip = request.client.host if request.client else "unknown"
@@ -88,6 +140,14 @@ async def upload_blueprint(
         if not user_service.validate_email_format(email):
             raise HTTPException(status_code=400, detail="Invalid email format")
         
+        # Reject oversized uploads from the declared length before doing any work
+        declared_length = request.headers.get("content-length")
+        if declared_length and declared_length.isdigit() and int(declared_length) > MAX_UPLOAD_BYTES + 64 * 1024:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File exceeds maximum upload size of {MAX_UPLOAD_BYTES // (1024 * 1024)} MB"
+            )
+        
         # ENHANCED ANTI-FRAUD: Check both email AND device fingerprint
         can_upload = user_service.can_upload_new_report(email, session)
         
@@ -95,7 +155,19 @@ async def upload_blueprint(
         should_process_immediately = can_upload
         needs_upgrade = not can_upload
         
+        # Custom API keys are never persisted to the queue, so those jobs run in-process
+        use_worker_queue = job_queue_enabled() and not openai_api_key
+        
         if should_process_immediately:
+            # BACKPRESSURE: Reject before reading the file when the pipeline queue is full
+            try:
+                admission_controller.check(email, use_worker_queue)
+            except AdmissionRejected as e:
+                raise HTTPException(
+                    status_code=429,
+                    detail=f"Server busy: {e.reason}. Please retry shortly.",
+                    headers={"Retry-After": str(e.retry_after_seconds)}
+                )
             logger.info(f"✅ PROCESSING IMMEDIATELY: {email} can upload and process")
         else:
             logger.info(f"📋 UPLOAD TO PENDING: {email} can upload but needs upgrade to process")
@@ -143,15 +215,21 @@ async def upload_blueprint(
         if not api_key:
             raise HTTPException(status_code=400, detail="OpenAI API key required")
         
-        # Save uploaded file temporarily AND to S3 for data collection
-        content = await file.read()
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # Stream the upload to a spool file (hashed and size-capped, never fully in memory)
+        try:
+            upload = await spool_upload(file, UPLOAD_SPOOL_DIR, MAX_UPLOAD_BYTES)
+        except UploadTooLarge as e:
+            job_storage.update_job(job_id, {"status": "failed", "error": str(e)})
+            raise HTTPException(status_code=413, detail=str(e))
+        temp_file_path = upload.path
         
-        # 📊 DATA COLLECTION: Save original blueprint to S3
-        s3_path = await storage_service.save_upload(job_id, content, file.filename)
-        job_storage.update_job(job_id, {"saved_file_path": s3_path})
+        # 📊 DATA COLLECTION: Stream the same spool file to S3
+        s3_path = await storage_service.save_upload_file(job_id, upload.path, file.filename, upload.sha256)
+        job_storage.update_job(job_id, {
+            "saved_file_path": s3_path,
+            "file_sha256": upload.sha256,
+            "file_size_bytes": upload.size_bytes
+        })
         
         # User already created above, just use the existing user object
         
@@ -175,116 +253,19 @@ async def upload_blueprint(
             "window_performance": window_performance,
             "building_orientation": building_orientation,
             
+            # Optional analyses
+            "uncertainty": uncertainty,
+            "hourly_simulation": hourly_simulation,
+            "orientation_sweep": orientation_sweep,
+            
             # Legacy compatibility
             "duct_config": duct_config
         }
         
-        # Filter out None/empty values - only pass real user inputs
-        form_inputs = {k: v for k, v in form_inputs.items() if v and v != "not_sure"}
-        
-        # 🔄 MAP TO PIPELINE_V3 FORMAT: Convert form fields to pipeline expected names
-        user_inputs = {}
+        user_inputs = _map_form_inputs_to_user_inputs(form_inputs)
         
-        # 📏 CRITICAL: Conditioned square footage (most important for accuracy)
-        if "square_footage" in form_inputs:
-            try:
-                user_inputs["conditioned_sqft"] = float(form_inputs["square_footage"])
-                # Also set legacy field for backward compatibility
-                user_inputs["total_sqft"] = user_inputs["conditioned_sqft"]
-                logger.info(f"📏 CONDITIONED SQFT: User provided {user_inputs['conditioned_sqft']:.0f} sqft (current living space)")
-            except (ValueError, TypeError):
-                logger.warning(f"⚠️ Invalid square footage: {form_inputs['square_footage']}")
-        
-        # 🏠 STORIES: User confirmation vs AI detection
-        if "number_of_stories" in form_inputs:
-            story_mapping = {"1": 1, "2": 2, "3+": 3}
-            user_inputs["floor_count"] = story_mapping.get(form_inputs["number_of_stories"], 2)
-            logger.info(f"🏠 STORIES: User confirmed {user_inputs['floor_count']} floors vs AI detection")
-        
-        # 🏠 FOUNDATION INTELLIGENCE: Critical for thermal envelope calculations
-        if "foundation_type" in form_inputs:
-            user_inputs["foundation_type"] = form_inputs["foundation_type"]
-            user_inputs["foundationType"] = form_inputs["foundation_type"]  # Also pass camelCase
-            logger.info(f"🏗️ FOUNDATION: {form_inputs['foundation_type']} affects thermal envelope")
-            
-        if "basement_type" in form_inputs:
-            user_inputs["basement_type"] = form_inputs["basement_type"]
-            user_inputs["basementType"] = form_inputs["basement_type"]  # Also pass camelCase
-            logger.info(f"🏠 BASEMENT TYPE: {form_inputs['basement_type']}")
-            
-        if "basement_status" in form_inputs:
-            user_inputs["basement_status"] = form_inputs["basement_status"]
-            user_inputs["basementStatus"] = form_inputs["basement_status"]  # Also pass camelCase
-            if form_inputs["basement_status"] == "unfinished":
-                logger.info(f"📐 SIZING STRATEGY: Unfinished basement - sizing for future finishing")
-        
-        # 🔥 HVAC SYSTEM INTELLIGENCE: Enhanced ductwork mapping
-        # IMPORTANT: Pass BOTH the original fields AND the computed duct_config for maximum compatibility
-        if "duct_type" in form_inputs:
-            # Pass through the original duct_type as-is for pipeline_v3
-            user_inputs["ductType"] = form_inputs["duct_type"]
-            
-            if "duct_location" in form_inputs:
-                # Pass through the original duct_location as-is for pipeline_v3
-                user_inputs["ductLocation"] = form_inputs["duct_location"]
-                
-                # Also create the combined duct_config for backward compatibility
-                duct_type = form_inputs["duct_type"]
-                duct_location = form_inputs["duct_location"]
-                
-                if duct_type == "ducted" and duct_location:
-                    if duct_location == "conditioned":
-                        user_inputs["duct_config"] = "ducted_conditioned"
-                    elif duct_location == "attic":
-                        user_inputs["duct_config"] = "ducted_attic"
-                    elif duct_location == "crawlspace":
-                        user_inputs["duct_config"] = "ducted_crawl"
-                elif duct_type == "ductless":
-                    user_inputs["duct_config"] = "ductless"
-                    
-                logger.info(f"🌀 DUCT SYSTEM: type={duct_type}, location={duct_location} → config={user_inputs.get('duct_config', 'unknown')}")
-        
-        # Legacy duct_config support
-        elif "duct_config" in form_inputs:
-            user_inputs["duct_config"] = form_inputs["duct_config"]
-            # Decompose legacy duct_config into separate fields for pipeline_v3
-            if form_inputs["duct_config"] == "ductless":
-                user_inputs["ductType"] = "ductless"
-                user_inputs["ductLocation"] = None
-            elif form_inputs["duct_config"].startswith("ducted_"):
-                user_inputs["ductType"] = "ducted"
-                location_map = {
-                    "ducted_attic": "attic",
-                    "ducted_crawl": "crawlspace",
-                    "ducted_conditioned": "conditioned"
-                }
-                user_inputs["ductLocation"] = location_map.get(form_inputs["duct_config"], "attic")
-            logger.info(f"🌀 DUCT SYSTEM (legacy): {form_inputs['duct_config']}")
-        
-        # 🔥 HEATING SYSTEM: Equipment sizing intelligence
-        if "heating_fuel" in form_inputs:
-            user_inputs["heating_fuel"] = form_inputs["heating_fuel"]
-            # Also pass in camelCase for consistency with frontend
-            user_inputs["heatingFuel"] = form_inputs["heating_fuel"]
-            logger.info(f"🔥 HEATING: {form_inputs['heating_fuel']} affects equipment recommendations")
-        
-        # 🪟 BUILDING PERFORMANCE: Thermal envelope optimization
-        if "window_performance" in form_inputs:
-            user_inputs["window_performance"] = form_inputs["window_performance"]
-            user_inputs["windowPerformance"] = form_inputs["window_performance"]
-            
-        if "building_orientation" in form_inputs:
-            user_inputs["building_orientation"] = form_inputs["building_orientation"]
-            user_inputs["buildingOrientation"] = form_inputs["building_orientation"]
-        
-        # 🏗️ Pass through all other fields in both snake_case and camelCase
-        if "number_of_stories" in form_inputs:
-            user_inputs["numberOfStories"] = form_inputs["number_of_stories"]
-            
-        if "square_footage" in form_inputs:
-            user_inputs["squareFootage"] = form_inputs["square_footage"]
-        
-        # Update job with user inputs
+        # Update job with user inputs (the dedup fingerprint is claimed below, for runs only)
+        fingerprint = compute_job_fingerprint(upload.sha256, zip_code, user_inputs)
         job_storage.update_job(job_id, {"user_inputs": user_inputs})
         
         # Log active pipeline integrations
@@ -293,27 +274,81 @@ async def upload_blueprint(
         logger.info(f"📊 TOTAL USER INPUTS: {len(user_inputs)} fields collected for maximum accuracy")
         
         if should_process_immediately:
-            # Start processing in background with enhanced user inputs
-            asyncio.create_task(process_blueprint_async(
-                job_id, temp_file_path, zip_code, api_key, email, session, is_first_report, user_inputs, project_label
-            ))
+            # ♻️ DEDUP: Same PDF + inputs already processed (or processing) - reuse it
+            duplicate = find_duplicate_job(fingerprint, job_id)
+            if duplicate and duplicate.completed:
+                if await _complete_from_duplicate(job_id, duplicate.job_id, zip_code, email, session, is_first_report):
+                    upload.discard()
+                    return UploadResponse(
+                        job_id=job_id,
+                        status="completed",
+                        message="Blueprint upload successful. Identical submission found - results ready."
+                    )
+                # Cached result unusable - claim the run (or follow its holder)
+                duplicate = find_duplicate_job(fingerprint, job_id, include_completed=False)
+            if duplicate:
+                upload.discard()
+                asyncio.create_task(_follow_duplicate_job(job_id, duplicate.job_id, zip_code, email, is_first_report))
+                return UploadResponse(
+                    job_id=job_id,
+                    status="processing",
+                    message="Blueprint upload successful. Identical submission already processing."
+                )
             
-            logger.info(f"Started job {job_id} for file {file.filename}, zip {zip_code}")
+            try:
+                ticket = admission_controller.admit(job_id, email, use_worker_queue)
+            except AdmissionRejected as e:
+                job_storage.update_job(job_id, {"status": "failed", "error": f"Server busy: {e.reason}"})
+                upload.discard()
+                raise HTTPException(
+                    status_code=429,
+                    detail=f"Server busy: {e.reason}. Please retry shortly.",
+                    headers={"Retry-After": str(e.retry_after_seconds)}
+                )
+            
+            if use_worker_queue:
+                # Hand off to the worker pool. With a stored copy the worker downloads
+                # its own file, so the local spool is only kept when it is the sole copy
+                get_job_queue().enqueue(job_id, {
+                    "pdf_path": None if s3_path else temp_file_path,
+                    "saved_file_path": s3_path,
+                    "zip_code": zip_code,
+                    "email": email,
+                    "is_first_report": is_first_report,
+                    "user_inputs": user_inputs,
+                    "project_label": project_label
+                })
+                if s3_path:
+                    upload.discard()
+            else:
+                # Start processing in background once a pipeline slot is free
+                # (process_blueprint_async deletes the spool file when done)
+                asyncio.create_task(admission_controller.run(ticket, lambda: process_blueprint_async(
+                    job_id, temp_file_path, zip_code, api_key, email, session, is_first_report, user_inputs, project_label
+                )))
+            upload = None
+            
+            if ticket.queue_position:
+                job_events.publish(job_id, "queued", 0, f"Waiting for {ticket.queue_position} job(s) ahead",
+                                   **ticket.to_dict())
+                logger.info(f"Queued job {job_id} for file {file.filename}, zip {zip_code} at position {ticket.queue_position}")
+                message = f"Blueprint upload successful. Queued behind {ticket.queue_position} job(s)."
+            else:
+                logger.info(f"Started job {job_id} for file {file.filename}, zip {zip_code}")
+                message = "Blueprint upload successful. Processing started."
             
             return UploadResponse(
                 job_id=job_id,
                 status="processing",
-                message="Blueprint upload successful. Processing started."
+                message=message,
+                **ticket.to_dict()
             )
         else:
             # Save job as pending upgrade
             logger.info(f"Saved job {job_id} for file {file.filename} - pending upgrade")
             
-            # Clean up temp file since we're not processing immediately
-            try:
-                os.unlink(temp_file_path)
-            except:
-                pass
+            # Clean up spool file since we're not processing immediately
+            upload.discard()
             
             return UploadResponse(
                 job_id=job_id,
@@ -322,11 +357,255 @@ async def upload_blueprint(
             )
         
     except HTTPException:
+        if upload is not None:
+            upload.discard()
         raise
     except Exception as e:
         logger.error(f"Upload error: {e}")
+        if upload is not None:
+            upload.discard()
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
+def _map_form_inputs_to_user_inputs(form_inputs: dict) -> dict:
+    """
+    Map upload form fields to the user input names pipeline_v3 expects
+    
+    Empty and "not_sure" values are dropped; most fields are passed in both
+    snake_case and camelCase for compatibility.
+    """
+    # Filter out None/empty values - only pass real user inputs
+    form_inputs = {k: v for k, v in form_inputs.items() if v and v != "not_sure"}
+    
+    # 🔄 MAP TO PIPELINE_V3 FORMAT: Convert form fields to pipeline expected names
+    user_inputs = {}
+    
+    # 📏 CRITICAL: Conditioned square footage (most important for accuracy)
+    if "square_footage" in form_inputs:
+        try:
+            user_inputs["conditioned_sqft"] = float(form_inputs["square_footage"])
+            # Also set legacy field for backward compatibility
+            user_inputs["total_sqft"] = user_inputs["conditioned_sqft"]
+            logger.info(f"📏 CONDITIONED SQFT: User provided {user_inputs['conditioned_sqft']:.0f} sqft (current living space)")
+        except (ValueError, TypeError):
+            logger.warning(f"⚠️ Invalid square footage: {form_inputs['square_footage']}")
+    
+    # 🏠 STORIES: User confirmation vs AI detection
+    if "number_of_stories" in form_inputs:
+        story_mapping = {"1": 1, "2": 2, "3+": 3}
+        user_inputs["floor_count"] = story_mapping.get(form_inputs["number_of_stories"], 2)
+        logger.info(f"🏠 STORIES: User confirmed {user_inputs['floor_count']} floors vs AI detection")
+    
+    # 🏠 FOUNDATION INTELLIGENCE: Critical for thermal envelope calculations
+    if "foundation_type" in form_inputs:
+        user_inputs["foundation_type"] = form_inputs["foundation_type"]
+        user_inputs["foundationType"] = form_inputs["foundation_type"]  # Also pass camelCase
+        logger.info(f"🏗️ FOUNDATION: {form_inputs['foundation_type']} affects thermal envelope")
+        
+    if "basement_type" in form_inputs:
+        user_inputs["basement_type"] = form_inputs["basement_type"]
+        user_inputs["basementType"] = form_inputs["basement_type"]  # Also pass camelCase
+        logger.info(f"🏠 BASEMENT TYPE: {form_inputs['basement_type']}")
+        
+    if "basement_status" in form_inputs:
+        user_inputs["basement_status"] = form_inputs["basement_status"]
+        user_inputs["basementStatus"] = form_inputs["basement_status"]  # Also pass camelCase
+        if form_inputs["basement_status"] == "unfinished":
+            logger.info(f"📐 SIZING STRATEGY: Unfinished basement - sizing for future finishing")
+    
+    # 🔥 HVAC SYSTEM INTELLIGENCE: Enhanced ductwork mapping
+    # IMPORTANT: Pass BOTH the original fields AND the computed duct_config for maximum compatibility
+    if "duct_type" in form_inputs:
+        # Pass through the original duct_type as-is for pipeline_v3
+        user_inputs["ductType"] = form_inputs["duct_type"]
+        
+        if "duct_location" in form_inputs:
+            # Pass through the original duct_location as-is for pipeline_v3
+            user_inputs["ductLocation"] = form_inputs["duct_location"]
+            
+            # Also create the combined duct_config for backward compatibility
+            duct_type = form_inputs["duct_type"]
+            duct_location = form_inputs["duct_location"]
+            
+            if duct_type == "ducted" and duct_location:
+                if duct_location == "conditioned":
+                    user_inputs["duct_config"] = "ducted_conditioned"
+                elif duct_location == "attic":
+                    user_inputs["duct_config"] = "ducted_attic"
+                elif duct_location == "crawlspace":
+                    user_inputs["duct_config"] = "ducted_crawl"
+            elif duct_type == "ductless":
+                user_inputs["duct_config"] = "ductless"
+                
+            logger.info(f"🌀 DUCT SYSTEM: type={duct_type}, location={duct_location} → config={user_inputs.get('duct_config', 'unknown')}")
+    
+    # Legacy duct_config support
+    elif "duct_config" in form_inputs:
+        user_inputs["duct_config"] = form_inputs["duct_config"]
+        # Decompose legacy duct_config into separate fields for pipeline_v3
+        if form_inputs["duct_config"] == "ductless":
+            user_inputs["ductType"] = "ductless"
+            user_inputs["ductLocation"] = None
+        elif form_inputs["duct_config"].startswith("ducted_"):
+            user_inputs["ductType"] = "ducted"
+            location_map = {
+                "ducted_attic": "attic",
+                "ducted_crawl": "crawlspace",
+                "ducted_conditioned": "conditioned"
+            }
+            user_inputs["ductLocation"] = location_map.get(form_inputs["duct_config"], "attic")
+        logger.info(f"🌀 DUCT SYSTEM (legacy): {form_inputs['duct_config']}")
+    
+    # 🔥 HEATING SYSTEM: Equipment sizing intelligence
+    if "heating_fuel" in form_inputs:
+        user_inputs["heating_fuel"] = form_inputs["heating_fuel"]
+        # Also pass in camelCase for consistency with frontend
+        user_inputs["heatingFuel"] = form_inputs["heating_fuel"]
+        logger.info(f"🔥 HEATING: {form_inputs['heating_fuel']} affects equipment recommendations")
+    
+    # 🪟 BUILDING PERFORMANCE: Thermal envelope optimization
+    if "window_performance" in form_inputs:
+        user_inputs["window_performance"] = form_inputs["window_performance"]
+        user_inputs["windowPerformance"] = form_inputs["window_performance"]
+        
+    if "building_orientation" in form_inputs:
+        user_inputs["building_orientation"] = form_inputs["building_orientation"]
+        user_inputs["buildingOrientation"] = form_inputs["building_orientation"]
+    
+    # 📊 OPTIONAL ANALYSES: Passed as given, the pipeline parses them ("false" turns one off)
+    if "uncertainty" in form_inputs:
+        user_inputs["uncertainty"] = form_inputs["uncertainty"]
+    if "hourly_simulation" in form_inputs:
+        user_inputs["hourly_simulation"] = form_inputs["hourly_simulation"]
+    if "orientation_sweep" in form_inputs:
+        user_inputs["orientation_sweep"] = form_inputs["orientation_sweep"]
+    
+    # 🏗️ Pass through all other fields in both snake_case and camelCase
+    if "number_of_stories" in form_inputs:
+        user_inputs["numberOfStories"] = form_inputs["number_of_stories"]
+        
+    if "square_footage" in form_inputs:
+        user_inputs["squareFootage"] = form_inputs["square_footage"]
+    
+    return user_inputs
+
+async def _complete_from_duplicate(
+    job_id: str,
+    source_job_id: str,
+    zip_code: str,
+    email: str,
+    session: Session,
+    is_first_report: bool
+) -> bool:
+    """
+    Complete a job with the result of an identical completed job
+    
+    The professional report is regenerated for this user's subscription
+    status and the extraction snapshot is shared so scenarios still work.
+    Returns False if the source job has no usable result.
+    """
+    source = job_storage.get_job(source_job_id)
+    if not source or source.get("status") != "completed" or not source.get("result"):
+        return False
+    
+    from datetime import datetime
+    result_data = dict(source["result"])
+    result_data["professional_report"] = _generate_professional_report(result_data, zip_code, email, session)
+    result_data["deduplicated_from"] = source_job_id
+    
+    job_storage.update_job(job_id, {
+        "status": "completed",
+        "progress": 100,
+        "result": result_data,
+        "completed_at": datetime.utcnow().isoformat()
+    })
+    loop = asyncio.get_event_loop()
+    source_snapshot = await loop.run_in_executor(None, snapshot_store.get_snapshot, source_job_id)
+    await loop.run_in_executor(None, snapshot_store.save_snapshot, job_id, source_snapshot)
+    job_events.publish(job_id, "completed", 100, "Results ready", status="completed")
+    
+    if is_first_report:
+        if user_service.mark_free_report_used(email, session):
+            logger.info(f"🔒 PAYWALL: Marked free report as used for {email}")
+        else:
+            logger.error(f"🔒 PAYWALL ERROR: Failed to mark free report used for {email}")
+    
+    logger.info(f"♻️  DEDUP: Job {job_id} completed from job {source_job_id}")
+    return True
+
+async def _follow_duplicate_job(
+    job_id: str,
+    source_job_id: str,
+    zip_code: str,
+    email: str,
+    is_first_report: bool
+):
+    """Wait for an identical in-flight job and take its result"""
+    from datetime import datetime
+    from app.database import engine
+    
+    deadline = asyncio.get_event_loop().time() + DEDUP_FOLLOW_TIMEOUT_SECONDS
+    while asyncio.get_event_loop().time() < deadline:
+        source = job_storage.get_job(source_job_id)
+        status = source.get("status") if source else None
+        
+        if status == "completed":
+            with Session(engine) as session:
+                if await _complete_from_duplicate(job_id, source_job_id, zip_code, email, session, is_first_report):
+                    return
+            break
+        if status not in ("created", "queued", "processing"):
+            break
+        
+        progress = source.get("progress", 0)
+        job = job_storage.get_job(job_id)
+        if job and job.get("progress") != progress:
+            job_storage.update_job(job_id, {"progress": progress})
+            job_events.publish(job_id, "duplicate_progress", progress, "Identical submission processing")
+        await asyncio.sleep(DEDUP_FOLLOW_POLL_SECONDS)
+    
+    source = job_storage.get_job(source_job_id) or {}
+    error = source.get("error") or "Identical submission did not complete"
+    job_storage.update_job(job_id, {
+        "status": "failed",
+        "error": error,
+        "completed_at": datetime.utcnow().isoformat()
+    })
+    job_events.publish(job_id, "failed", None, error, status="failed")
+    logger.error(f"♻️  DEDUP: Job {job_id} failed with job {source_job_id} ({source.get('status')})")
+
+def _job_progress_reporter(job_id: str):
+    """
+    Pipeline progress callback for a job: publishes every stage event and
+    stores the stage and percentage (per-page events are only published)
+    """
+    def report(stage: str, progress: int, message: str, **data):
+        job_events.publish(job_id, stage, progress, message, **data)
+        if stage != "page_extracted":
+            job_storage.update_job(job_id, {"progress": progress, "stage": stage})
+    return report
+
+def _generate_professional_report(result: dict, zip_code: str, email: str, session: Session) -> dict:
+    """
+    Generate the professional report for a pipeline result dictionary
+    """
+    report_generator = ValueReportGenerator()
+    
+    # Determine user subscription status
+    user_service.get_or_create_user(email, session)
+    subscription_status = "paid" if user_service.has_active_subscription(email, session) else "free"
+    
+    class ResultObj:
+        def __init__(self, data):
+            for key, value in data.items():
+                setattr(self, key, value)
+    
+    return report_generator.generate_complete_report(
+        pipeline_result=ResultObj(result),
+        zip_code=zip_code,
+        user_subscription_status=subscription_status,
+        report_context="user"
+    )
+
 async def process_blueprint_async(
     job_id: str, 
     pdf_path: str, 
@@ -336,14 +615,20 @@ async def process_blueprint_async(
     session: Session, 
     is_first_report: bool,
     user_inputs: dict = None,
-    project_label: str = None
+    project_label: str = None,
+    final_attempt: bool = True
 ):
     """
     Process blueprint asynchronously using pipeline_v3
+    
+    When called by a queue worker with final_attempt=False, processing errors
+    are re-raised (job left in processing, PDF kept) so the task can be retried.
     """
+    retry_pending = False
     try:
         # Update progress
-        job_storage.update_job(job_id, {"status": "processing", "progress": 10})
+        job_storage.update_job(job_id, {"status": "processing", "progress": 5})
+        job_events.publish(job_id, "started", 5, "Processing started")
         
         logger.info(f"Job {job_id}: Starting pipeline_v3 processing")
         
@@ -356,29 +641,23 @@ async def process_blueprint_async(
             pdf_path, 
             zip_code, 
             user_inputs,  # 🎯 Enhanced user inputs for maximum accuracy
-            api_key
+            api_key,
+            True,  # include_snapshot: keep extraction for scenario re-runs
+            _job_progress_reporter(job_id)
         )
         
+        # Extraction snapshot is not JSON serializable - cache it separately
+        extraction_snapshot = result.pop("extraction_snapshot", None) if result else None
+        # Raw vector/vision payloads go to compressed side storage, not the job row
+        raw_extractions = result.pop("raw_extractions", None) if result else None
+        
         # Pipeline_v3 returns a dictionary - check if it has heating load data
         if result and "heating_load_btu_hr" in result:
             # Generate high-value professional report
-            report_generator = ValueReportGenerator()
-            
-            # Determine user subscription status
-            user = user_service.get_or_create_user(email, session)
-            subscription_status = "paid" if user_service.has_active_subscription(email, session) else "free"
-            
-            # Generate professional report
-            class ResultObj:
-                def __init__(self, data):
-                    for key, value in data.items():
-                        setattr(self, key, value)
-            
-            professional_report = report_generator.generate_complete_report(
-                pipeline_result=ResultObj(result),
-                zip_code=zip_code,
-                user_subscription_status=subscription_status,
-                report_context="user"
+            job_events.publish(job_id, "report_generating", 95, "Generating professional report")
+            professional_report = _generate_professional_report(result, zip_code, email, session)
+            raw_extractions_key = await asyncio.get_event_loop().run_in_executor(
+                None, artifact_store.save_json, job_id, "raw_extractions", raw_extractions
             )
             
             # Result is already a dictionary, just add some calculated fields
@@ -394,6 +673,7 @@ async def process_blueprint_async(
                 "warnings": result.get("warnings", []),
                 "zone_loads": result.get("zone_loads", {}),
                 "processing_time_seconds": result.get("processing_time", 0),
+                "raw_extractions_key": raw_extractions_key,  # Fetched lazily, see artifact_store
                 "professional_report": professional_report  # 🎯 HIGH-VALUE REPORT
             }
             
@@ -407,6 +687,11 @@ async def process_blueprint_async(
                 "result": result_data,
                 "completed_at": completion_time
             })
+            if extraction_snapshot:
+                await asyncio.get_event_loop().run_in_executor(
+                    None, snapshot_store.save_snapshot, job_id, extraction_snapshot.compact()
+                )
+            job_events.publish(job_id, "completed", 100, "Results ready", status="completed")
             
             # CRITICAL: Mark free report as used on successful completion
             if is_first_report:
@@ -420,7 +705,7 @@ async def process_blueprint_async(
             try:
                 job_data = job_storage.get_job(job_id)
                 if job_data:
-                    await storage_service.save_complete_job_data(job_id, job_data)
+                    await storage_service.save_complete_job_data(job_id, job_data, raw_extractions)
                 logger.info(f"📊 DATA: Saved complete dataset for job {job_id}")
             except Exception as e:
                 logger.error(f"📊 DATA ERROR: Failed to save complete data for {job_id}: {e}")
@@ -435,6 +720,7 @@ async def process_blueprint_async(
                 "error": f"Pipeline processing failed: No valid result returned",
                 "completed_at": datetime.utcnow().isoformat()
             })
+            job_events.publish(job_id, "failed", None, "Pipeline processing failed", status="failed")
             
             # 📊 DATA COLLECTION: Save failure data for analysis
             try:
@@ -450,11 +736,19 @@ async def process_blueprint_async(
     except Exception as e:
         from datetime import datetime
         
+        if not final_attempt:
+            retry_pending = True
+            job_storage.update_job(job_id, {"status": "processing", "progress": 0})
+            job_events.publish(job_id, "retrying", 0, "Processing error, retrying")
+            logger.warning(f"Job {job_id}: Processing error - {e} (will retry)")
+            raise
+        
         job_storage.update_job(job_id, {
             "status": "failed", 
             "error": str(e),
             "completed_at": datetime.utcnow().isoformat()
         })
+        job_events.publish(job_id, "failed", None, str(e), status="failed")
         
         # 📊 DATA COLLECTION: Save error data for analysis
         try:
@@ -468,11 +762,12 @@ async def process_blueprint_async(
         logger.error(f"Job {job_id}: Processing error - {e}")
         
     finally:
-        # Cleanup temporary file
-        try:
-            os.unlink(pdf_path)
-        except:
-            pass
+        # Cleanup temporary file (kept for the next attempt when retrying)
+        if not retry_pending:
+            try:
+                os.unlink(pdf_path)
+            except:
+                pass
 
 @router.get("/jobs/{job_id}", response_model=JobResponse)
 async def get_job_status(job_id: str):
@@ -499,6 +794,64 @@ async def get_job_status(job_id: str):
         error=job["error"]
     )
 
+@router.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str, request: Request):
+    """
+    Server-sent event stream of a job's stage progress
+    
+    Sends the current state first, then every stage event until the job
+    completes or fails. Idle periods get a keepalive comment and a status
+    re-check, so the stream still ends if an event was missed.
+    """
+    job = job_storage.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    def _format(event: dict) -> str:
+        return f"event: {event['stage']}\ndata: {json.dumps(event, default=str)}\n\n"
+    
+    def _stored_event(job: dict) -> dict:
+        status = str(getattr(job["status"], "value", job["status"]))
+        return {
+            "job_id": job_id,
+            "stage": status,
+            "status": status,
+            "progress": job.get("progress", 0),
+            "message": job.get("error") or ""
+        }
+    
+    async def event_stream():
+        subscription = await job_events.subscribe(job_id)
+        try:
+            current = _stored_event(job)
+            latest = job_events.latest(job_id)
+            if current["status"] not in TERMINAL_STATUSES and latest:
+                current = latest
+            yield _format(current)
+            if current["status"] in TERMINAL_STATUSES:
+                return
+            
+            while not await request.is_disconnected():
+                event = await subscription.get(timeout=JOB_EVENTS_KEEPALIVE_SECONDS)
+                if event is None:
+                    stored = job_storage.get_job(job_id)
+                    if stored and _stored_event(stored)["status"] in TERMINAL_STATUSES:
+                        yield _format(_stored_event(stored))
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+                yield _format(event)
+                if event.get("status") in TERMINAL_STATUSES:
+                    return
+        finally:
+            await subscription.close()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/jobs/{job_id}/result")
 async def get_job_result(job_id: str):
     """
@@ -519,6 +872,151 @@ async def get_job_result(job_id: str):
         "result": job["result"]
     }
 
+@router.post("/jobs/{job_id}/scenarios")
+async def run_job_scenarios(job_id: str, request: ScenarioRequest):
+    """
+    Compare what-if variants (duct location, windows, foundation, etc.) for a completed job
+    
+    Reuses the job's cached extraction and thermal model, so only the load
+    calculation is re-run for each variant - no re-upload or vision processing.
+    """
+    job = job_storage.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if job["status"] != "completed":
+        raise HTTPException(status_code=400, detail=f"Job not completed. Status: {job['status']}")
+    
+    if not request.scenarios:
+        raise HTTPException(status_code=400, detail="At least one scenario is required")
+    
+    if len(request.scenarios) > MAX_SCENARIOS_PER_REQUEST:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many scenarios (max {MAX_SCENARIOS_PER_REQUEST} per request)"
+        )
+    
+    snapshot = await asyncio.get_event_loop().run_in_executor(None, snapshot_store.get_snapshot, job_id)
+    if snapshot is None:
+        raise HTTPException(
+            status_code=409,
+            detail="Extraction snapshot no longer available for this job. Re-upload the blueprint to compare scenarios."
+        )
+    
+    scenario_inputs = [
+        _map_input_changes(dict(variant.inputs), snapshot.user_inputs)
+        for variant in request.scenarios
+    ]
+    
+    logger.info(f"🔀 SCENARIOS: Running {len(scenario_inputs)} variants for job {job_id}")
+    
+    comparison = await asyncio.get_event_loop().run_in_executor(
+        None,
+        run_scenarios,
+        snapshot,
+        scenario_inputs,
+        [variant.label for variant in request.scenarios]
+    )
+    
+    return {
+        "job_id": job_id,
+        **comparison
+    }
+
+def _map_input_changes(form_inputs: dict, base_inputs: dict) -> dict:
+    """
+    Map a partial set of form fields to pipeline inputs for a completed job
+    """
+    # Duct location alone keeps the job's duct type (mapping requires both)
+    if form_inputs.get("duct_location") and not form_inputs.get("duct_type"):
+        form_inputs["duct_type"] = base_inputs.get("ductType") or "ducted"
+    return _map_form_inputs_to_user_inputs(form_inputs)
+
+def _require_job_owner(job: dict, email: str) -> None:
+    """Reject callers other than the user who uploaded the job"""
+    owner = (job.get("email") or "").strip().lower()
+    if not owner or email.strip().lower() != owner:
+        raise HTTPException(status_code=403, detail="Not authorized to modify this job")
+
+@router.patch("/jobs/{job_id}/inputs")
+async def update_job_inputs(
+    job_id: str,
+    request: InputsUpdateRequest,
+    email: str,
+    session: Session = Depends(get_session)
+):
+    """
+    Edit inputs on a completed job and recompute its loads
+    
+    Uses the job's cached extraction snapshot and re-runs only the stages the
+    changed fields invalidate (building characteristics, thermal zones, loads),
+    so no re-upload or blueprint processing is needed. Only the job's owner
+    (email query parameter) may edit it.
+    """
+    job = job_storage.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    _require_job_owner(job, email)
+    
+    if job["status"] != "completed":
+        raise HTTPException(status_code=400, detail=f"Job not completed. Status: {job['status']}")
+    
+    form_inputs = request.model_dump(exclude_none=True)
+    if not form_inputs:
+        raise HTTPException(status_code=400, detail="No input changes provided")
+    
+    snapshot = await asyncio.get_event_loop().run_in_executor(None, snapshot_store.get_snapshot, job_id)
+    if snapshot is None:
+        raise HTTPException(
+            status_code=409,
+            detail="Extraction snapshot no longer available for this job. Re-upload the blueprint to change inputs."
+        )
+    
+    input_changes = _map_input_changes(form_inputs, snapshot.user_inputs)
+    if not input_changes:
+        raise HTTPException(status_code=400, detail="No valid input changes provided")
+    
+    logger.info(f"✏️ INPUT EDIT: Job {job_id} changing {sorted(form_inputs.keys())}")
+    
+    result = await asyncio.get_event_loop().run_in_executor(
+        None,
+        get_scenario_pipeline().recalculate_loads,
+        snapshot,
+        input_changes
+    )
+    
+    updated = pipeline_result_to_dict(result)
+    # Keep extraction data and AI recommendations from the original run
+    updated.pop("raw_extractions", None)
+    
+    result_data = {
+        **(job.get("result") or {}),
+        **updated,
+        "professional_report": _generate_professional_report(updated, job["zip_code"], job["email"], session)
+    }
+    user_inputs = result.extraction_snapshot.user_inputs
+    # Re-key dedup to the edited inputs so identical uploads of the original
+    # inputs never reuse this result (cleared when the upload hash is unknown)
+    fingerprint = None
+    if job.get("file_sha256"):
+        fingerprint = compute_job_fingerprint(job["file_sha256"], job["zip_code"], user_inputs)
+    
+    job_storage.update_job(job_id, {"result": result_data, "user_inputs": user_inputs, "fingerprint": fingerprint})
+    await asyncio.get_event_loop().run_in_executor(
+        None, snapshot_store.save_snapshot, job_id, result.extraction_snapshot
+    )
+    
+    logger.info(f"✏️ INPUT EDIT: Job {job_id} recalculated {result.recalculated_stages} in {result.processing_time_seconds:.2f}s")
+    
+    return {
+        "job_id": job_id,
+        "status": "completed",
+        "user_inputs": user_inputs,
+        "recalculated_stages": result.recalculated_stages,
+        "result": result_data
+    }
+
 @router.get("/shared-report/{report_id}")
 async def get_shared_report(report_id: str):
     """
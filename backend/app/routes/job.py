@@ -1,8 +1,10 @@
+import base64
 import logging
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from sqlmodel import Session, select
+from sqlalchemy import func, or_, and_
 from datetime import datetime
 
 from app.database import get_session
@@ -17,6 +19,7 @@ class JobStatusResponse(BaseModel):
     job_id: str
     status: str
     progress: int
+    stage: Optional[str] = None
     created_at: Optional[str] = None
     completed_at: Optional[str] = None
     result: Optional[dict] = None
@@ -25,80 +28,145 @@ class JobStatusResponse(BaseModel):
     project_label: Optional[str] = None
     zip_code: Optional[str] = None
 
+class JobSummaryResponse(BaseModel):
+    """Job list entry - list columns plus headline loads, never the full result"""
+    job_id: str
+    status: str
+    progress: int
+    created_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    error: Optional[str] = None
+    filename: Optional[str] = None
+    project_label: Optional[str] = None
+    zip_code: Optional[str] = None
+    heating_tons: Optional[float] = None
+    cooling_tons: Optional[float] = None
+    total_conditioned_area_sqft: Optional[float] = None
+
 class JobListResponse(BaseModel):
     """Job list response model"""
-    projects: List[JobStatusResponse]  # Changed from "jobs" to "projects" for frontend compatibility
+    projects: List[JobSummaryResponse]  # Changed from "jobs" to "projects" for frontend compatibility
     total_count: int  # Changed from "total" to "total_count" for frontend compatibility
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
+
+MAX_LIST_LIMIT = 100
+
+# Only these columns are read for lists; result_data (raw extractions, the
+# professional report) is fetched per job via /blueprint/jobs/{job_id}/result
+SUMMARY_COLUMNS = (
+    JobModel.id,
+    JobModel.status,
+    JobModel.progress,
+    JobModel.created_at,
+    JobModel.completed_at,
+    JobModel.error_data,
+    JobModel.filename,
+    JobModel.project_label,
+    JobModel.zip_code,
+    JobModel.result_data["heating_tons"].as_float(),
+    JobModel.result_data["cooling_tons"].as_float(),
+    JobModel.result_data["total_conditioned_area_sqft"].as_float(),
+)
+
+def _encode_cursor(created_at: datetime, job_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{job_id}".encode()).decode()
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created_at, job_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), job_id
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def _list_job_summaries(session: Session, email: Optional[str], limit: int, cursor: Optional[str]) -> JobListResponse:
+    """
+    Newest-first page of job summaries using keyset pagination on
+    (created_at, id) - served by the (user_email, created_at) index
+    """
+    limit = max(1, min(limit, MAX_LIST_LIMIT))
+    
+    statement = select(*SUMMARY_COLUMNS)
+    count_statement = select(func.count()).select_from(JobModel)
+    if email is not None:
+        statement = statement.where(JobModel.user_email == email)
+        count_statement = count_statement.where(JobModel.user_email == email)
+    if cursor:
+        after_created_at, after_id = _decode_cursor(cursor)
+        statement = statement.where(or_(
+            JobModel.created_at < after_created_at,
+            and_(JobModel.created_at == after_created_at, JobModel.id < after_id)
+        ))
+    
+    # One extra row tells us whether there is a next page
+    rows = session.exec(
+        statement.order_by(JobModel.created_at.desc(), JobModel.id.desc()).limit(limit + 1)
+    ).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    
+    projects = [
+        JobSummaryResponse(
+            job_id=job_id,
+            status=status.value,
+            progress=progress,
+            created_at=created_at.isoformat() if created_at else None,
+            completed_at=completed_at.isoformat() if completed_at else None,
+            error=error_data.get("message") if error_data else None,
+            filename=filename,
+            project_label=project_label,
+            zip_code=zip_code,
+            heating_tons=heating_tons,
+            cooling_tons=cooling_tons,
+            total_conditioned_area_sqft=area
+        )
+        for (job_id, status, progress, created_at, completed_at, error_data, filename,
+             project_label, zip_code, heating_tons, cooling_tons, area) in rows
+    ]
+    
+    return JobListResponse(
+        projects=projects,
+        total_count=session.exec(count_statement).one(),
+        next_cursor=_encode_cursor(rows[-1][3], rows[-1][0]) if has_more else None
+    )
 
 @router.get("/list", response_model=JobListResponse)
-async def list_user_jobs(email: str, limit: int = 50, offset: int = 0, session: Session = Depends(get_session)):
+async def list_user_jobs(email: str, limit: int = 50, cursor: Optional[str] = None, session: Session = Depends(get_session)):
     """
     List jobs for a specific user by email from PostgreSQL
     """
     try:
-        # Query user's jobs from PostgreSQL
-        statement = (
-            select(JobModel)
-            .where(JobModel.user_email == email)
-            .order_by(JobModel.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-        )
-        
-        user_jobs = session.exec(statement).all()
-        
-        # Convert to response format
-        job_list = []
-        for job in user_jobs:
-            job_list.append(JobStatusResponse(
-                job_id=job.id,
-                status=job.status.value,
-                progress=job.progress,
-                result=job.result_data,
-                error=job.error_data.get("message") if job.error_data else None,
-                created_at=job.created_at.isoformat() if job.created_at else None,
-                completed_at=job.completed_at.isoformat() if job.completed_at else None,
-                filename=job.filename,
-                project_label=job.project_label,
-                zip_code=job.zip_code
-            ))
-        
-        # Get total count for pagination
-        total_statement = select(JobModel).where(JobModel.user_email == email)
-        total_count = len(session.exec(total_statement).all())
-        
-        logger.info(f"Listed {len(job_list)} jobs for user {email} (total: {total_count})")
-        
-        return JobListResponse(
-            projects=job_list,
-            total_count=total_count
-        )
+        response = _list_job_summaries(session, email, limit, cursor)
+        logger.info(f"Listed {len(response.projects)} jobs for user {email} (total: {response.total_count})")
+        return response
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to list jobs for user {email}: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve user jobs")
 
 @router.get("/{job_id}", response_model=JobStatusResponse)
-async def get_job_status(job_id: str, session: Session = Depends(get_session)):
+async def get_job_status(job_id: str):
     """
-    Get status and progress of a specific job from PostgreSQL
+    Get status and progress of a specific job (Redis read-through, then PostgreSQL)
     """
     try:
-        job = session.get(JobModel, job_id)
+        job = job_storage.get_job(job_id)
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
         
         return JobStatusResponse(
-            job_id=job.id,
-            status=job.status.value,
-            progress=job.progress,
-            result=job.result_data,
-            error=job.error_data.get("message") if job.error_data else None,
-            created_at=job.created_at.isoformat() if job.created_at else None,
-            completed_at=job.completed_at.isoformat() if job.completed_at else None,
-            filename=job.filename,
-            project_label=job.project_label,
-            zip_code=job.zip_code
+            job_id=job_id,
+            status=job["status"],
+            progress=job.get("progress") or 0,
+            stage=job.get("stage"),
+            result=job.get("result"),
+            error=job.get("error"),
+            created_at=job.get("created_at"),
+            completed_at=job.get("completed_at"),
+            filename=job.get("filename"),
+            project_label=job.get("project_label"),
+            zip_code=job.get("zip_code")
         )
         
     except HTTPException:
@@ -108,19 +176,20 @@ async def get_job_status(job_id: str, session: Session = Depends(get_session)):
         raise HTTPException(status_code=500, detail="Failed to retrieve job status")
 
 @router.get("/{job_id}/progress")
-async def get_job_progress(job_id: str, session: Session = Depends(get_session)):
+async def get_job_progress(job_id: str):
     """
     Get just the progress percentage of a job (lightweight endpoint)
     """
     try:
-        job = session.get(JobModel, job_id)
+        job = job_storage.get_job(job_id)
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
         
         return {
-            "job_id": job.id,
-            "status": job.status.value,
-            "progress": job.progress
+            "job_id": job_id,
+            "status": job["status"],
+            "progress": job.get("progress") or 0,
+            "stage": job.get("stage")
         }
         
     except HTTPException:
@@ -145,13 +214,8 @@ async def cancel_job(job_id: str, session: Session = Depends(get_session)):
         if job.status == JobStatus.FAILED:
             raise HTTPException(status_code=400, detail="Cannot cancel failed job")
         
-        # Mark job as cancelled
-        job.status = JobStatus.FAILED
-        job.error_data = {"message": "Job cancelled by user"}
-        job.updated_at = datetime.utcnow()
-        
-        session.add(job)
-        session.commit()
+        # Mark job as cancelled (through job storage so the Redis job state stays in sync)
+        job_storage.update_job(job_id, {"status": "failed", "error": "Job cancelled by user"})
         
         logger.info(f"Job {job_id} cancelled by user")
         
@@ -163,46 +227,16 @@ async def cancel_job(job_id: str, session: Session = Depends(get_session)):
         logger.error(f"Failed to cancel job {job_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to cancel job")
 
-@router.get("/")
-async def list_jobs(limit: int = 10, offset: int = 0, session: Session = Depends(get_session)):
+@router.get("/", response_model=JobListResponse)
+async def list_jobs(limit: int = 10, cursor: Optional[str] = None, session: Session = Depends(get_session)):
     """
     List recent jobs (for debugging/admin)
     """
     try:
-        statement = (
-            select(JobModel)
-            .order_by(JobModel.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-        )
-        
-        recent_jobs = session.exec(statement).all()
-        
-        job_list = []
-        for job in recent_jobs:
-            job_list.append(JobStatusResponse(
-                job_id=job.id,
-                status=job.status.value,
-                progress=job.progress,
-                result=job.result_data,
-                error=job.error_data.get("message") if job.error_data else None,
-                created_at=job.created_at.isoformat() if job.created_at else None,
-                completed_at=job.completed_at.isoformat() if job.completed_at else None,
-                filename=job.filename,
-                project_label=job.project_label,
-                zip_code=job.zip_code
-            ))
-        
-        # Get total count
-        total_statement = select(JobModel)
-        total_count = len(session.exec(total_statement).all())
-        
-        return JobListResponse(
-            projects=job_list,
-            total_count=total_count
-        )
+        return _list_job_summaries(session, None, limit, cursor)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to list recent jobs: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve jobs")
-
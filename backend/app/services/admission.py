@@ -0,0 +1,223 @@
+import os
+import math
+import time
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Callable, Awaitable
+
+from app.models.user import JobStatus
+from app.services.job_queue import get_job_queue, job_queue_enabled
+from app.services.job_storage import job_storage
+
+logger = logging.getLogger(__name__)
+
+# Job statuses that hold a place in the worker pool (waiting or running)
+WORKER_ACTIVE_STATUSES = [JobStatus.QUEUED, JobStatus.PROCESSING]
+
+
+class AdmissionRejected(Exception):
+    """Raised when the pipeline queue is full; maps to HTTP 429"""
+
+    def __init__(self, reason: str, retry_after_seconds: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after_seconds = retry_after_seconds
+
+
+@dataclass
+class AdmissionTicket:
+    """A job admitted to run (now or after waiting for a slot)"""
+    job_id: str
+    email: str
+    queue_position: int  # Jobs ahead of this one; 0 = starts immediately
+    estimated_start_at: datetime
+    enqueued_at: float = field(default_factory=time.monotonic)
+    started_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "queue_position": self.queue_position,
+            "estimated_start_at": self.estimated_start_at.isoformat()
+        }
+
+
+class AdmissionController:
+    """
+    Admission control for pipeline runs in the web process
+
+    - At most PIPELINE_MAX_IN_FLIGHT jobs run concurrently per process, and
+      at most PIPELINE_MAX_IN_FLIGHT_PER_USER per user
+    - Jobs over those limits wait in FIFO order (skipping users at their
+      limit) with an estimated start time
+    - Beyond PIPELINE_MAX_QUEUE_DEPTH waiting jobs (or
+      PIPELINE_MAX_QUEUED_PER_USER for one user) uploads are rejected fast
+
+    When the worker pool is enabled, concurrency is bounded by the workers.
+    The durable queue depth is checked here, and per user the job rows: a
+    user may hold PIPELINE_MAX_IN_FLIGHT_PER_USER + PIPELINE_MAX_QUEUED_PER_USER
+    queued or processing jobs (workers span processes, so waiting and running
+    jobs are limited together).
+    """
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        max_in_flight_per_user: Optional[int] = None,
+        max_queue_depth: Optional[int] = None,
+        max_queued_per_user: Optional[int] = None
+    ):
+        self.max_in_flight = max_in_flight or int(os.getenv("PIPELINE_MAX_IN_FLIGHT", "2"))
+        self.max_in_flight_per_user = max_in_flight_per_user or int(os.getenv("PIPELINE_MAX_IN_FLIGHT_PER_USER", "1"))
+        self.max_queue_depth = max_queue_depth or int(os.getenv("PIPELINE_MAX_QUEUE_DEPTH", "20"))
+        self.max_queued_per_user = max_queued_per_user or int(os.getenv("PIPELINE_MAX_QUEUED_PER_USER", "3"))
+        self.worker_slots = int(os.getenv("WORKER_CONCURRENCY", "2"))
+
+        self._running: Dict[str, AdmissionTicket] = {}
+        self._waiting: List[AdmissionTicket] = []
+        self._condition: Optional[asyncio.Condition] = None
+
+        # Metrics
+        self._run_seconds = float(os.getenv("PIPELINE_ESTIMATED_RUN_SECONDS", "60"))  # EWMA
+        self._wait_samples: deque = deque(maxlen=200)
+        self._counters = {"admitted": 0, "rejected": 0, "started": 0, "completed": 0}
+
+        logger.info(f"🚦 AdmissionController initialized (in-flight {self.max_in_flight}, "
+                    f"per user {self.max_in_flight_per_user}, queue depth {self.max_queue_depth})")
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    def _user_count(self, tickets, email: str) -> int:
+        return sum(1 for t in tickets if t.email == email)
+
+    def _estimate_start(self, jobs_ahead: int, slots: int) -> datetime:
+        """Start estimate: full waves of `slots` jobs ahead at the average run time"""
+        if jobs_ahead <= 0:
+            return datetime.utcnow()
+        waves = math.ceil(jobs_ahead / max(1, slots))
+        return datetime.utcnow() + timedelta(seconds=waves * self._run_seconds)
+
+    def _reject(self, reason: str) -> None:
+        self._counters["rejected"] += 1
+        logger.warning(f"🚦 ADMISSION: Rejected upload - {reason}")
+        raise AdmissionRejected(reason, retry_after_seconds=max(1, int(self._run_seconds)))
+
+    def check(self, email: str, worker_queue: bool = False, job_id: Optional[str] = None) -> None:
+        """
+        Fast capacity check before accepting an upload (no reservation)
+
+        Args:
+            email: Uploading user
+            worker_queue: Job will be handed to the worker pool
+            job_id: The job being admitted, if already saved (not counted
+                against the user's limit)
+
+        Raises:
+            AdmissionRejected: Queue depth or per-user limit exceeded
+        """
+        if worker_queue:
+            depth = get_job_queue().depth()
+            if depth["waiting"] + depth["delayed"] >= self.max_queue_depth:
+                self._reject(f"pipeline queue full ({self.max_queue_depth} jobs waiting)")
+            user_limit = self.max_in_flight_per_user + self.max_queued_per_user
+            if job_storage.count_user_jobs(email, WORKER_ACTIVE_STATUSES, exclude_job_id=job_id) >= user_limit:
+                self._reject(f"too many queued jobs for this account ({user_limit})")
+            return
+
+        if len(self._waiting) >= self.max_queue_depth:
+            self._reject(f"pipeline queue full ({self.max_queue_depth} jobs waiting)")
+        if self._user_count(self._waiting, email) >= self.max_queued_per_user:
+            self._reject(f"too many queued jobs for this account ({self.max_queued_per_user})")
+
+    def admit(self, job_id: str, email: str, worker_queue: bool = False) -> AdmissionTicket:
+        """
+        Reserve a place for a job. In-process tickets must be passed to run().
+
+        Raises:
+            AdmissionRejected: Capacity was taken since check()
+        """
+        self.check(email, worker_queue, job_id)
+        self._counters["admitted"] += 1
+
+        if worker_queue:
+            depth = get_job_queue().depth()
+            ahead = depth["waiting"] + depth["in_flight"] - self.worker_slots + 1
+            return AdmissionTicket(job_id, email, max(0, ahead), self._estimate_start(ahead, self.worker_slots))
+
+        ticket = AdmissionTicket(job_id, email, 0, datetime.utcnow())
+        self._waiting.append(ticket)
+        if self._can_start(ticket):
+            self._start(ticket)
+        else:
+            # Waiting jobs ahead plus the running job this one must outlast
+            ahead = len(self._waiting)
+            ticket.queue_position = ahead
+            ticket.estimated_start_at = self._estimate_start(ahead, self.max_in_flight)
+            logger.info(f"🚦 ADMISSION: Job {job_id} queued at position {ahead}, "
+                        f"estimated start {ticket.estimated_start_at.isoformat()}")
+        return ticket
+
+    def _start(self, ticket: AdmissionTicket) -> None:
+        self._waiting.remove(ticket)
+        self._running[ticket.job_id] = ticket
+        ticket.started_at = time.monotonic()
+        self._wait_samples.append(ticket.started_at - ticket.enqueued_at)
+        self._counters["started"] += 1
+
+    def _can_start(self, ticket: AdmissionTicket) -> bool:
+        """FIFO among waiting jobs whose user is below their in-flight limit"""
+        if len(self._running) >= self.max_in_flight:
+            return False
+        for waiting in self._waiting:
+            if self._user_count(self._running.values(), waiting.email) < self.max_in_flight_per_user:
+                return waiting is ticket
+        return False
+
+    async def run(self, ticket: AdmissionTicket, job: Callable[[], Awaitable[Any]]) -> Any:
+        """Wait for a slot, run the job, release the slot"""
+        condition = self._get_condition()
+        if ticket.started_at is None:
+            async with condition:
+                await condition.wait_for(lambda: self._can_start(ticket))
+                self._start(ticket)
+
+        try:
+            return await job()
+        finally:
+            async with condition:
+                self._running.pop(ticket.job_id, None)
+                self._counters["completed"] += 1
+                elapsed = time.monotonic() - ticket.started_at
+                self._run_seconds = 0.8 * self._run_seconds + 0.2 * elapsed
+                condition.notify_all()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, in-flight and wait-time metrics"""
+        waits = sorted(self._wait_samples)
+        now = time.monotonic()
+        metrics = {
+            "mode": "worker_queue" if job_queue_enabled() else "in_process",
+            "in_flight": len(self._running),
+            "waiting": len(self._waiting),
+            "max_in_flight": self.max_in_flight,
+            "max_in_flight_per_user": self.max_in_flight_per_user,
+            "max_queue_depth": self.max_queue_depth,
+            "max_queued_per_user": self.max_queued_per_user,
+            "oldest_wait_seconds": round(now - self._waiting[0].enqueued_at, 1) if self._waiting else 0.0,
+            "avg_wait_seconds": round(sum(waits) / len(waits), 2) if waits else 0.0,
+            "p95_wait_seconds": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 2) if waits else 0.0,
+            "avg_run_seconds": round(self._run_seconds, 1),
+            **{f"{name}_total": count for name, count in self._counters.items()}
+        }
+        if job_queue_enabled():
+            metrics["queue"] = get_job_queue().depth()
+        return metrics
+
+
+# Global instance
+admission_controller = AdmissionController()
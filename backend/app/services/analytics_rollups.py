@@ -0,0 +1,415 @@
+"""
+Admin analytics rollups
+Hourly and daily aggregates in the analytics_rollups table so the admin
+dashboard reads a handful of pre-aggregated rows instead of scanning users.
+
+- Counters (users created, jobs completed, ...) are incremented when the
+  event happens and periodically re-derived from the source tables, so a
+  missed or duplicated increment corrects itself on the next refresh
+- Gauges (paying customers, active users, ...) are computed by the refresh
+  and stored in the current day bucket; past days form the growth chart
+"""
+import os
+import bisect
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+
+from sqlmodel import Session, select
+from sqlalchemy import func, case, and_, or_
+
+from app.database import engine
+from app.models.user import AnalyticsRollup, UserModel, JobModel, JobStatus, SubscriptionStatus
+
+logger = logging.getLogger(__name__)
+
+ANALYTICS_REFRESH_MINUTES = int(os.getenv("ANALYTICS_REFRESH_MINUTES", "15"))
+# Counters in this trailing window are re-derived on each refresh (whole days)
+ANALYTICS_REFRESH_WINDOW_HOURS = int(os.getenv("ANALYTICS_REFRESH_WINDOW_HOURS", "48"))
+
+HOUR = "hour"
+DAY = "day"
+PAYING_STATUSES = [SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING]
+GROWTH_CHART_STEP_DAYS = 3
+UPSERT_BATCH_SIZE = 500
+
+# When a job reached its final status. Rows from before completed_at was set on
+# failures fall back to their last update, so re-deriving never zeroes them.
+JOB_FINISHED_AT = func.coalesce(JobModel.completed_at, JobModel.updated_at)
+
+# Counter -> (event timestamp column, filter) to re-derive it from source tables.
+# Counters missing here (subscriptions_ended) are event-only.
+DERIVED_COUNTERS = {
+    "users_created": (UserModel.created_at, None),
+    "free_reports_used": (UserModel.free_report_used_at, None),
+    "subscriptions_started": (UserModel.subscription_started_at, None),
+    "jobs_created": (JobModel.created_at, None),
+    "jobs_completed": (JOB_FINISHED_AT, JobModel.status == JobStatus.COMPLETED),
+    "jobs_failed": (JOB_FINISHED_AT, JobModel.status == JobStatus.FAILED),
+}
+
+
+def _bucket_start(at: datetime, granularity: str) -> datetime:
+    if granularity == HOUR:
+        return at.replace(minute=0, second=0, microsecond=0)
+    return at.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _count_if(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _upsert(session: Session, rows: List[Dict[str, Any]], increment: bool) -> None:
+    """Insert rollup rows, adding to (increment) or replacing existing values"""
+    table = AnalyticsRollup.__table__
+    dialect = engine.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        insert = None
+
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        batch = rows[start:start + UPSERT_BATCH_SIZE]
+        if insert is not None:
+            statement = insert(table).values(batch)
+            value = table.c.value + statement.excluded.value if increment else statement.excluded.value
+            session.exec(statement.on_conflict_do_update(
+                index_elements=["granularity", "bucket_start", "metric"],
+                set_={"value": value, "updated_at": statement.excluded.updated_at}
+            ))
+            continue
+
+        # Portable fallback: read-modify-write
+        for row in batch:
+            existing = session.exec(select(AnalyticsRollup).where(
+                AnalyticsRollup.granularity == row["granularity"],
+                AnalyticsRollup.bucket_start == row["bucket_start"],
+                AnalyticsRollup.metric == row["metric"]
+            )).first()
+            if existing:
+                existing.value = existing.value + row["value"] if increment else row["value"]
+                existing.updated_at = row["updated_at"]
+                session.add(existing)
+            else:
+                session.add(AnalyticsRollup(**row))
+
+
+class AnalyticsRollups:
+    """Incremental analytics counters, periodic refresh and dashboard reads"""
+
+    def record(self, metric: str, amount: float = 1, at: Optional[datetime] = None) -> None:
+        """Count an event in its hour and day buckets (never raises)"""
+        at = at or datetime.utcnow()
+        now = datetime.utcnow()
+        rows = [
+            {"granularity": granularity, "bucket_start": _bucket_start(at, granularity),
+             "metric": metric, "value": amount, "updated_at": now}
+            for granularity in (HOUR, DAY)
+        ]
+        try:
+            with Session(engine) as session:
+                _upsert(session, rows, increment=True)
+                session.commit()
+        except Exception as e:
+            logger.warning(f"⚠️  Analytics event {metric} not recorded: {e}")
+
+    # ------------------------------------------------------------------
+    # Refresh (periodic job)
+    # ------------------------------------------------------------------
+
+    def refresh(self, full: bool = False) -> int:
+        """
+        Re-derive recent counters and write today's gauges
+
+        The first refresh (no rollups yet) or full=True backfills counters
+        and the growth history from the beginning. Returns rows written.
+        """
+        now = datetime.utcnow()
+        with Session(engine) as session:
+            if not full:
+                full = session.exec(select(AnalyticsRollup.id).limit(1)).first() is None
+            since = None if full else _bucket_start(now - timedelta(hours=ANALYTICS_REFRESH_WINDOW_HOURS), DAY)
+
+            rows = self._derive_counters(session, since, now)
+            rows += self._gauges(session, now)
+            if full:
+                rows += self._growth_history(session, now)
+
+            _upsert(session, rows, increment=False)
+            session.commit()
+
+        logger.info(f"📈 ANALYTICS: Refreshed {len(rows)} rollups ({'full backfill' if full else 'incremental'})")
+        return len(rows)
+
+    def _derive_counters(self, session: Session, since: Optional[datetime], now: datetime) -> List[Dict[str, Any]]:
+        """Counter values recomputed from source timestamps (whole buckets from since)"""
+        values: Dict[Tuple[str, datetime, str], float] = {}
+        for metric, (column, condition) in DERIVED_COUNTERS.items():
+            query = select(column).where(column.isnot(None))
+            if condition is not None:
+                query = query.where(condition)
+            if since is not None:
+                query = query.where(column >= since)
+
+            counts: Counter = Counter()
+            for at in session.exec(query):
+                for granularity in (HOUR, DAY):
+                    counts[(granularity, _bucket_start(at, granularity), metric)] += 1
+            values.update(counts)
+
+        # Buckets counted by events but absent from the source are reset
+        stale = select(AnalyticsRollup.granularity, AnalyticsRollup.bucket_start, AnalyticsRollup.metric).where(
+            AnalyticsRollup.metric.in_(list(DERIVED_COUNTERS))
+        )
+        if since is not None:
+            stale = stale.where(AnalyticsRollup.bucket_start >= since)
+        for key in session.exec(stale):
+            values.setdefault(tuple(key), 0)
+
+        return [
+            {"granularity": granularity, "bucket_start": bucket_start, "metric": metric,
+             "value": value, "updated_at": now}
+            for (granularity, bucket_start, metric), value in values.items()
+        ]
+
+    def _gauges(self, session: Session, now: datetime) -> List[Dict[str, Any]]:
+        """Current-state metrics, stored in today's day bucket"""
+        day_start = _bucket_start(now, DAY)
+        week_ago = now - timedelta(days=7)
+        month_ago = now - timedelta(days=30)
+        paying = UserModel.subscription_status.in_(PAYING_STATUSES)
+        inactive_week = or_(UserModel.last_login_at < week_ago, UserModel.last_login_at.is_(None))
+
+        # All user gauges in a single pass over the users table
+        (total_users, paying_customers, free_reports_used, total_reports, verified_users,
+         active_week, active_month, dormant, high_value, at_risk, active_subscribers,
+         users_to_date, first_subscription_at) = session.exec(select(
+            func.count(UserModel.id),
+            _count_if(paying),
+            _count_if(UserModel.free_report_used == True),
+            func.coalesce(func.sum(UserModel.total_reports_generated), 0),
+            _count_if(UserModel.email_verified == True),
+            _count_if(UserModel.last_login_at >= week_ago),
+            _count_if(UserModel.last_login_at >= month_ago),
+            _count_if(or_(UserModel.last_login_at < month_ago, UserModel.last_login_at.is_(None))),
+            _count_if(and_(paying, UserModel.last_login_at >= week_ago)),
+            _count_if(and_(paying, inactive_week)),
+            _count_if(and_(
+                paying,
+                UserModel.subscription_started_at <= day_start,
+                or_(UserModel.subscription_expires_at.is_(None), UserModel.subscription_expires_at > day_start)
+            )),
+            _count_if(UserModel.created_at <= day_start),
+            func.min(UserModel.subscription_started_at)
+        )).one()
+
+        gauges = {
+            "total_users": total_users,
+            "paying_customers": paying_customers,
+            "free_reports_used_total": free_reports_used,
+            "total_reports": total_reports,
+            "verified_users": verified_users,
+            "active_users_week": active_week,
+            "active_users_month": active_month,
+            "dormant_users": dormant,
+            "high_value_users": high_value,
+            "at_risk_users": at_risk,
+            # Growth chart points are taken at the start of the day
+            "active_subscribers": active_subscribers,
+            "users_to_date": users_to_date,
+        }
+        if first_subscription_at:
+            gauges["first_subscription_at"] = first_subscription_at.timestamp()
+
+        by_status = dict(session.exec(
+            select(UserModel.subscription_status, func.count(UserModel.id)).group_by(UserModel.subscription_status)
+        ).all())
+        for status in SubscriptionStatus:
+            gauges[f"subscription:{status.value}"] = by_status.get(status, 0)
+
+        # IP distribution (simplified - you'd want proper GeoIP lookup)
+        per_ip = (
+            select(func.count(UserModel.id).label("users"))
+            .where(UserModel.ip_address.isnot(None))
+            .group_by(UserModel.ip_address)
+            .subquery()
+        )
+        unique_ips, users_with_ip, duplicate_ips = session.exec(select(
+            func.count(),
+            func.coalesce(func.sum(per_ip.c.users), 0),
+            _count_if(per_ip.c.users > 1)
+        ).select_from(per_ip)).one()
+        gauges.update({
+            "unique_ip_addresses": unique_ips,
+            "users_with_ip_data": users_with_ip,
+            "duplicate_ip_addresses": duplicate_ips,
+        })
+
+        # Time from free report to subscription, for users who converted
+        conversion_days = sorted(
+            (started - used).total_seconds() / 86400
+            for used, started in session.exec(
+                select(UserModel.free_report_used_at, UserModel.subscription_started_at).where(
+                    UserModel.free_report_used == True,
+                    paying,
+                    UserModel.free_report_used_at.isnot(None),
+                    UserModel.subscription_started_at.isnot(None)
+                )
+            )
+        )
+        gauges.update({
+            "total_converters": len(conversion_days),
+            "avg_conversion_time_days": sum(conversion_days) / len(conversion_days) if conversion_days else 0,
+            "median_conversion_time_days": conversion_days[len(conversion_days) // 2] if conversion_days else 0,
+            "fast_converters": len([days for days in conversion_days if days <= 1]),  # Within 24 hours
+        })
+
+        return [
+            {"granularity": DAY, "bucket_start": day_start, "metric": metric, "value": float(value), "updated_at": now}
+            for metric, value in gauges.items()
+        ]
+
+    def _growth_history(self, session: Session, now: datetime) -> List[Dict[str, Any]]:
+        """Backfill the daily growth gauges for every day before today"""
+        first_subscription = session.exec(select(func.min(UserModel.subscription_started_at))).one()
+        if not first_subscription:
+            return []
+
+        created = sorted(session.exec(select(UserModel.created_at)).all())
+        subscriptions = session.exec(
+            select(UserModel.subscription_started_at, UserModel.subscription_expires_at).where(
+                UserModel.subscription_status.in_(PAYING_STATUSES),
+                UserModel.subscription_started_at.isnot(None)
+            )
+        ).all()
+
+        rows = []
+        day = _bucket_start(first_subscription, DAY)
+        today = _bucket_start(now, DAY)
+        while day < today:
+            active = sum(1 for started, expires in subscriptions if started <= day and (expires is None or expires > day))
+            for metric, value in (("active_subscribers", active), ("users_to_date", bisect.bisect_right(created, day))):
+                rows.append({"granularity": DAY, "bucket_start": day, "metric": metric, "value": float(value), "updated_at": now})
+            day += timedelta(days=1)
+        return rows
+
+    async def run_periodic_refresh(self) -> None:
+        """Refresh every ANALYTICS_REFRESH_MINUTES (first run backfills history)"""
+        loop = asyncio.get_event_loop()
+        while True:
+            try:
+                await loop.run_in_executor(None, self.refresh)
+            except Exception as e:
+                logger.error(f"❌ ANALYTICS: Refresh failed: {e}")
+            await asyncio.sleep(ANALYTICS_REFRESH_MINUTES * 60)
+
+    # ------------------------------------------------------------------
+    # Dashboard reads
+    # ------------------------------------------------------------------
+
+    def get_dashboard_analytics(self) -> Dict[str, Any]:
+        """Admin dashboard metrics from rollups (refreshes once if none exist yet)"""
+        now = datetime.utcnow()
+        with Session(engine) as session:
+            gauges = self._latest_gauges(session)
+        if not gauges:
+            self.refresh()
+            with Session(engine) as session:
+                gauges = self._latest_gauges(session)
+
+        with Session(engine) as session:
+            new_users_this_week = session.exec(
+                select(func.coalesce(func.sum(AnalyticsRollup.value), 0)).where(
+                    AnalyticsRollup.granularity == HOUR,
+                    AnalyticsRollup.metric == "users_created",
+                    AnalyticsRollup.bucket_start >= _bucket_start(now - timedelta(days=7), HOUR)
+                )
+            ).one()
+            growth_data = self._growth_chart(session, gauges.get("first_subscription_at"), now)
+
+        def count(metric: str) -> int:
+            return int(gauges.get(metric, 0))
+
+        total_users = count("total_users")
+        paying_customers = count("paying_customers")
+        users_with_ip = count("users_with_ip_data")
+        return {
+            'total_users': total_users,
+            'new_users_this_week': int(new_users_this_week),
+            'paying_customers': paying_customers,
+            'free_reports_used': count("free_reports_used_total"),
+            'total_reports': count("total_reports"),
+            'conversion_rate': (paying_customers / total_users * 100) if total_users > 0 else 0,
+            'subscription_breakdown': {status.value: count(f"subscription:{status.value}") for status in SubscriptionStatus},
+            'growth_data': growth_data,
+            'avg_conversion_time_days': round(gauges.get("avg_conversion_time_days", 0), 1),
+            'median_conversion_time_days': round(gauges.get("median_conversion_time_days", 0), 1),
+            'fast_converters': count("fast_converters"),
+            'total_converters': count("total_converters"),
+            'email_verification_rate': round(count("verified_users") / total_users * 100, 1) if total_users > 0 else 0,
+            'unique_ip_addresses': count("unique_ip_addresses"),
+            'users_with_ip_data': users_with_ip,
+            'duplicate_ip_addresses': count("duplicate_ip_addresses"),
+            'geographic_diversity_score': round(count("unique_ip_addresses") / users_with_ip * 100, 1) if users_with_ip > 0 else 0,
+            'active_users_week': count("active_users_week"),
+            'active_users_month': count("active_users_month"),
+            'dormant_users': count("dormant_users"),
+            'high_value_users': count("high_value_users"),
+            'at_risk_users': count("at_risk_users"),
+            'rollup_updated_at': gauges.get("_updated_at")
+        }
+
+    def _latest_gauges(self, session: Session) -> Dict[str, Any]:
+        """All gauges from the most recently refreshed day"""
+        latest_day = select(func.max(AnalyticsRollup.bucket_start)).where(
+            AnalyticsRollup.granularity == DAY,
+            AnalyticsRollup.metric == "total_users"
+        ).scalar_subquery()
+        rows = session.exec(
+            select(AnalyticsRollup.metric, AnalyticsRollup.value, AnalyticsRollup.updated_at).where(
+                AnalyticsRollup.granularity == DAY,
+                AnalyticsRollup.bucket_start == latest_day
+            )
+        ).all()
+        gauges: Dict[str, Any] = {metric: value for metric, value, _ in rows}
+        if rows:
+            gauges["_updated_at"] = max(updated_at for _, _, updated_at in rows).isoformat()
+        return gauges
+
+    def _growth_chart(self, session: Session, first_subscription_at: Optional[float], now: datetime) -> Dict[str, list]:
+        """Subscribers and users every GROWTH_CHART_STEP_DAYS days since the first subscription"""
+        if not first_subscription_at:
+            # No subscribers yet - return empty data
+            return {'dates': [], 'subscribers': [], 'total_users': []}
+
+        start = _bucket_start(datetime.fromtimestamp(first_subscription_at), DAY)
+        points: Dict[datetime, Dict[str, float]] = {}
+        for bucket_start, metric, value in session.exec(
+            select(AnalyticsRollup.bucket_start, AnalyticsRollup.metric, AnalyticsRollup.value).where(
+                AnalyticsRollup.granularity == DAY,
+                AnalyticsRollup.metric.in_(["active_subscribers", "users_to_date"]),
+                AnalyticsRollup.bucket_start >= start
+            )
+        ):
+            points.setdefault(bucket_start, {})[metric] = value
+
+        dates, subscribers, total_users = [], [], []
+        last = {"active_subscribers": 0, "users_to_date": 0}
+        day = start
+        today = _bucket_start(now, DAY)
+        while day <= today:
+            # Days without a refresh carry the previous value forward
+            last.update(points.get(day, {}))
+            dates.append(day.strftime('%Y-%m-%d'))
+            subscribers.append(int(last["active_subscribers"]))
+            total_users.append(int(last["users_to_date"]))
+            day += timedelta(days=GROWTH_CHART_STEP_DAYS)
+
+        return {'dates': dates, 'subscribers': subscribers, 'total_users': total_users}
+
+# Global instance
+analytics_rollups = AnalyticsRollups()
@@ -0,0 +1,159 @@
+import os
+import gzip
+import json
+import logging
+import tempfile
+from typing import List, Optional, Any
+
+from app.services.s3_storage import storage_service
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+class ArtifactStore:
+    """
+    Storage for large job artifacts (raw pipeline extractions, extraction
+    snapshots)
+
+    Artifacts are compressed JSON kept out of the job row; the job result
+    only holds the returned key, and readers fetch the artifact on demand.
+    Saving again under the same job and name replaces the artifact.
+
+    Architecture:
+    - S3: jobs/{job_id}/{name}.json.zst|.gz when S3 storage is enabled
+    - Disk: the same layout under ARTIFACT_DIR otherwise (local development,
+      single host)
+    - Compression: zstd when the zstandard package is installed, else gzip;
+      the key's extension records which, so both remain readable
+    """
+
+    def __init__(self, artifact_dir: Optional[str] = None):
+        self.artifact_dir = artifact_dir or os.getenv(
+            "ARTIFACT_DIR", os.path.join(tempfile.gettempdir(), "autohvac_artifacts")
+        )
+        self.codec = "zst" if zstandard is not None else "gz"
+        backend = "S3" if storage_service.enabled else self.artifact_dir
+        logger.info(f"🗄️  ArtifactStore initialized ({backend}, {self.codec})")
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.codec == "zst":
+            return zstandard.ZstdCompressor(level=6).compress(data)
+        return gzip.compress(data, compresslevel=6)
+
+    def _decompress(self, key: str, blob: bytes) -> bytes:
+        if key.endswith(".zst"):
+            if zstandard is None:
+                raise RuntimeError(f"zstandard is required to read {key}")
+            return zstandard.ZstdDecompressor().decompress(blob)
+        return gzip.decompress(blob)
+
+    def _local_path(self, key: str) -> str:
+        return os.path.join(self.artifact_dir, *key.split(":", 1)[1].split("/"))
+
+    def _job_keys(self, job_id: str, name: str) -> List[str]:
+        """Keys an artifact may be stored under, current codec first"""
+        backend = "s3" if storage_service.enabled else "local"
+        return [
+            f"{backend}:jobs/{os.path.basename(job_id)}/{name}.json.{codec}"
+            for codec in dict.fromkeys((self.codec, "zst", "gz"))
+        ]
+
+    def _exists(self, key: str) -> bool:
+        backend, path = key.split(":", 1)
+        if backend == "s3":
+            try:
+                storage_service.s3_client.head_object(Bucket=storage_service.bucket_name, Key=path)
+                return True
+            except Exception:
+                return False
+        return os.path.exists(self._local_path(key))
+
+    def save_json(self, job_id: str, name: str, data: Any) -> Optional[str]:
+        """
+        Compress and store an artifact
+
+        Returns:
+            Key to store on the job ("s3:..." or "local:..."), or None if
+            the write failed (artifacts are never required for a result)
+        """
+        if not data:
+            return None
+
+        path = self._job_keys(job_id, name)[0].split(":", 1)[1]
+        try:
+            raw = json.dumps(data, default=str, separators=(",", ":")).encode("utf-8")
+            blob = self._compress(raw)
+
+            if storage_service.enabled:
+                key = f"s3:{path}"
+                storage_service.s3_client.put_object(
+                    Bucket=storage_service.bucket_name,
+                    Key=path,
+                    Body=blob,
+                    ContentType="application/json",
+                    ContentEncoding="zstd" if self.codec == "zst" else "gzip",
+                    Metadata={"job_id": job_id, "artifact": name}
+                )
+            else:
+                key = f"local:{path}"
+                local_path = self._local_path(key)
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                temp_path = f"{local_path}.tmp"
+                with open(temp_path, "wb") as f:
+                    f.write(blob)
+                os.replace(temp_path, local_path)
+
+            logger.info(f"🗄️  ARTIFACT: Saved {name} for job {job_id} "
+                        f"({len(raw) / 1024:.0f} KB -> {len(blob) / 1024:.0f} KB)")
+            return key
+        except Exception as e:
+            logger.warning(f"⚠️  Artifact write failed for {job_id}/{name}: {e}")
+            return None
+
+    def load_json(self, key: str) -> Optional[Any]:
+        """Fetch and decompress an artifact by key (None if it no longer exists)"""
+        try:
+            backend, path = key.split(":", 1)
+            if backend == "s3":
+                response = storage_service.s3_client.get_object(Bucket=storage_service.bucket_name, Key=path)
+                blob = response["Body"].read()
+            else:
+                with open(self._local_path(key), "rb") as f:
+                    blob = f.read()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"⚠️  Artifact read failed for {key}: {e}")
+            return None
+        return json.loads(self._decompress(key, blob))
+
+    def load_job_json(self, job_id: str, name: str) -> Optional[Any]:
+        """Fetch an artifact by job and name when its key was not recorded"""
+        for key in self._job_keys(job_id, name):
+            if self._exists(key):
+                return self.load_json(key)
+        return None
+
+    def delete_job_json(self, job_id: str, name: str) -> bool:
+        """Remove an artifact by job and name (for artifacts that are replaced)"""
+        deleted = False
+        for key in self._job_keys(job_id, name):
+            if not self._exists(key):
+                continue
+            try:
+                backend, path = key.split(":", 1)
+                if backend == "s3":
+                    storage_service.s3_client.delete_object(Bucket=storage_service.bucket_name, Key=path)
+                else:
+                    os.unlink(self._local_path(key))
+                deleted = True
+            except Exception as e:
+                logger.warning(f"⚠️  Artifact delete failed for {key}: {e}")
+        return deleted
+
+# Global instance
+artifact_store = ArtifactStore()
@@ -0,0 +1,87 @@
+"""
+Upload deduplication
+Identical submissions (same PDF bytes, ZIP code, inputs and pipeline version)
+reuse a completed result or attach to the run already in flight. The run is
+claimed through a unique index on in-flight fingerprints, so concurrent
+identical uploads cannot each wait for the other.
+"""
+import os
+import json
+import hashlib
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any
+
+from app.models.user import JobStatus, JOB_IN_FLIGHT_STATUSES
+from app.services.job_storage import job_storage
+from pipeline_v3 import PIPELINE_VERSION
+
+logger = logging.getLogger(__name__)
+
+DEDUP_ENABLED = os.getenv("UPLOAD_DEDUP_ENABLED", "true").lower() == "true"
+# In-flight jobs older than this are assumed stuck and never attached to
+DEDUP_IN_FLIGHT_MAX_AGE = timedelta(minutes=int(os.getenv("DEDUP_IN_FLIGHT_MAX_AGE_MINUTES", "60")))
+
+IN_FLIGHT_STATUSES = JOB_IN_FLIGHT_STATUSES
+
+
+@dataclass
+class DuplicateJob:
+    """An earlier job with the same fingerprint"""
+    job_id: str
+    completed: bool
+
+
+def _normalize_inputs(user_inputs: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Drop empty values and trim strings so equivalent forms hash the same"""
+    normalized = {}
+    for key, value in (user_inputs or {}).items():
+        if value is None or value == "":
+            continue
+        normalized[key] = value.strip() if isinstance(value, str) else value
+    return normalized
+
+
+def compute_job_fingerprint(file_sha256: str, zip_code: str, user_inputs: Optional[Dict[str, Any]]) -> str:
+    """SHA-256 over PDF hash, ZIP code, normalized inputs and pipeline version"""
+    canonical = json.dumps({
+        "file_sha256": file_sha256,
+        "zip_code": zip_code.strip(),
+        "user_inputs": _normalize_inputs(user_inputs),
+        "pipeline_version": PIPELINE_VERSION
+    }, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def find_duplicate_job(fingerprint: str, job_id: str, include_completed: bool = True) -> Optional[DuplicateJob]:
+    """
+    Completed job with this fingerprint, else the in-flight job running it
+
+    Otherwise the fingerprint is claimed for job_id (which must be in flight)
+    and None returned: job_id runs the pipeline. Only the claim holder is
+    ever followed, so two identical uploads never wait for each other.
+    """
+    for _ in range(2):
+        if DEDUP_ENABLED and include_completed:
+            source_id = job_storage.find_job_by_fingerprint(fingerprint, [JobStatus.COMPLETED], exclude_job_id=job_id)
+            if source_id:
+                logger.info(f"♻️  DEDUP: Fingerprint {fingerprint[:12]} matches completed job {source_id}")
+                return DuplicateJob(job_id=source_id, completed=True)
+
+        if job_storage.claim_fingerprint(job_id, fingerprint) or not DEDUP_ENABLED:
+            return None
+
+        source_id = job_storage.find_job_by_fingerprint(
+            fingerprint, IN_FLIGHT_STATUSES,
+            created_after=datetime.utcnow() - DEDUP_IN_FLIGHT_MAX_AGE,
+            exclude_job_id=job_id
+        )
+        if source_id:
+            logger.info(f"♻️  DEDUP: Fingerprint {fingerprint[:12]} matches in-flight job {source_id}")
+            return DuplicateJob(job_id=source_id, completed=False)
+        # Holder finished between the claim and the lookup - look again
+
+    # Held by an in-flight job too old to attach to (stuck): run without the claim
+    logger.warning(f"♻️  DEDUP: Fingerprint {fingerprint[:12]} held by a stale job - running {job_id} unclaimed")
+    return None
@@ -0,0 +1,198 @@
+"""
+Job progress events
+Pub/sub for per-stage pipeline progress, consumed by the SSE endpoint.
+Uses Redis pub/sub when REDIS_URL is set (so worker processes reach web
+processes), otherwise in-process queues.
+"""
+import os
+import json
+import time
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List
+
+from app.services.redis_pool import get_redis_client, redis_breaker
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("completed", "failed")
+LATEST_EVENT_TTL_SECONDS = 3600
+
+
+def _event_channel(job_id: str) -> str:
+    return f"job-events:{job_id}"
+
+
+def _latest_event_key(job_id: str) -> str:
+    return f"job-events:latest:{job_id}"
+
+
+class JobSubscription:
+    """Stream of events for one job; call close() when done"""
+
+    def __init__(self, bus: "JobEventBus", job_id: str):
+        self.bus = bus
+        self.job_id = job_id
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+        self._loop = asyncio.get_running_loop()
+        self._pubsub = None
+
+    async def _open(self) -> None:
+        if self.bus.redis_url:
+            import redis.asyncio as aioredis
+            self._client = aioredis.from_url(self.bus.redis_url, decode_responses=True)
+            self._pubsub = self._client.pubsub()
+            await self._pubsub.subscribe(_event_channel(self.job_id))
+        else:
+            self.bus._add_local(self)
+
+    def _deliver(self, event: Dict[str, Any]) -> None:
+        """Called on the subscriber's loop; drops the oldest event when the client lags"""
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(event)
+
+    async def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Next event, or None if nothing arrived within timeout seconds"""
+        if self._pubsub is not None:
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+                if message and message.get("type") == "message":
+                    return json.loads(message["data"])
+
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self) -> None:
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe()
+                await self._pubsub.close()
+                await self._client.close()
+            except Exception as e:
+                logger.debug(f"Event subscription close failed for {self.job_id}: {e}")
+        else:
+            self.bus._remove_local(self)
+
+
+class JobEventBus:
+    """
+    Publishes job progress events and hands out subscriptions
+
+    publish() is thread-safe and may be called from the pipeline's executor
+    thread. The latest event per job is kept so late subscribers start from
+    the current stage.
+    """
+
+    def __init__(self, max_latest: int = 1000):
+        self.redis_url = None
+        self.redis_client = None
+        self._local: Dict[str, List[JobSubscription]] = {}
+        self._latest: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._max_latest = max_latest
+        self._lock = threading.Lock()
+        self._initialize_redis()
+
+    def _initialize_redis(self) -> None:
+        """Use Redis pub/sub when available, otherwise in-process delivery"""
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url:
+            logger.info("📡 JobEventBus: in-process delivery (REDIS_URL not set)")
+            return
+        try:
+            client = get_redis_client()
+            client.ping()
+            self.redis_client = client
+            self.redis_url = redis_url
+            logger.info("📡 JobEventBus: Redis pub/sub")
+        except Exception as e:
+            logger.warning(f"⚠️  Redis unavailable for job events: {e} - in-process delivery")
+
+    def _add_local(self, subscription: JobSubscription) -> None:
+        with self._lock:
+            self._local.setdefault(subscription.job_id, []).append(subscription)
+
+    def _remove_local(self, subscription: JobSubscription) -> None:
+        with self._lock:
+            subscribers = self._local.get(subscription.job_id, [])
+            if subscription in subscribers:
+                subscribers.remove(subscription)
+            if not subscribers:
+                self._local.pop(subscription.job_id, None)
+
+    def publish(
+        self,
+        job_id: str,
+        stage: str,
+        progress: Optional[int] = None,
+        message: str = "",
+        status: str = "processing",
+        **data
+    ) -> Dict[str, Any]:
+        """Publish an event to all subscribers of a job"""
+        event = {
+            "job_id": job_id,
+            "stage": stage,
+            "status": status,
+            "progress": progress,
+            "message": message,
+            "timestamp": time.time()
+        }
+        if data:
+            event["data"] = data
+
+        with self._lock:
+            self._latest[job_id] = event
+            self._latest.move_to_end(job_id)
+            while len(self._latest) > self._max_latest:
+                self._latest.popitem(last=False)
+            subscribers: List[JobSubscription] = list(self._local.get(job_id, []))
+
+        if self.redis_client is not None and redis_breaker.allow():
+            try:
+                payload = json.dumps(event, default=str)
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.publish(_event_channel(job_id), payload)
+                pipe.setex(_latest_event_key(job_id), LATEST_EVENT_TTL_SECONDS, payload)
+                pipe.execute()
+                redis_breaker.record_success()
+            except Exception as e:
+                redis_breaker.record_failure()
+                logger.warning(f"⚠️  Job event publish failed for {job_id}: {e}")
+
+        for subscription in subscribers:
+            subscription._loop.call_soon_threadsafe(subscription._deliver, event)
+
+        return event
+
+    def latest(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Most recent event for a job, if any"""
+        with self._lock:
+            event = self._latest.get(job_id)
+        if event is None and self.redis_client is not None and redis_breaker.allow():
+            try:
+                payload = self.redis_client.get(_latest_event_key(job_id))
+                redis_breaker.record_success()
+                event = json.loads(payload) if payload else None
+            except Exception as e:
+                redis_breaker.record_failure()
+                logger.warning(f"⚠️  Latest job event read failed for {job_id}: {e}")
+        return event
+
+    async def subscribe(self, job_id: str) -> JobSubscription:
+        """Subscribe to a job's events (must be called from the event loop)"""
+        subscription = JobSubscription(self, job_id)
+        await subscription._open()
+        return subscription
+
+
+# Global instance
+job_events = JobEventBus()
@@ -0,0 +1,377 @@
+import os
+import json
+import time
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Tuple
+
+import redis
+from sqlmodel import Session, select
+from sqlalchemy import update, or_, and_, func
+
+from app.database import engine
+from app.models.user import QueuedTaskModel, QueuedTaskStatus
+
+logger = logging.getLogger(__name__)
+
+# Seconds a claimed task stays invisible to other workers without a heartbeat
+VISIBILITY_TIMEOUT = int(os.getenv("JOB_QUEUE_VISIBILITY_TIMEOUT", "900"))
+MAX_ATTEMPTS = int(os.getenv("JOB_QUEUE_MAX_ATTEMPTS", "3"))
+RETRY_BACKOFF_SECONDS = int(os.getenv("JOB_QUEUE_RETRY_BACKOFF", "30"))
+
+
+def job_queue_enabled() -> bool:
+    """Whether uploads are handed to the worker pool instead of running in the web process"""
+    return os.getenv("JOB_QUEUE_ENABLED", "false").lower() == "true"
+
+
+@dataclass
+class QueuedTask:
+    """A claimed pipeline task"""
+    task_id: str
+    job_id: str
+    payload: Dict[str, Any]
+    attempts: int  # Deliveries including this one
+    receipt: Dict[str, Any] = field(default_factory=dict)  # Backend-specific handle
+
+    @property
+    def is_final_attempt(self) -> bool:
+        return self.attempts >= MAX_ATTEMPTS
+
+
+class RedisStreamQueue:
+    """
+    Redis Streams backend
+
+    - Stream + consumer group: XREADGROUP hands each task to one worker
+    - Visibility timeout: unacknowledged entries idle longer than the timeout
+      are reclaimed with XAUTOCLAIM (worker crashed or was killed by a deploy)
+    - Heartbeats: XCLAIM to the same consumer resets the idle timer
+    - Retries: delayed re-enqueue through a sorted set scored by due time
+    """
+
+    GROUP = "pipeline-workers"
+
+    def __init__(self, redis_client: redis.Redis, prefix: str = "jobqueue"):
+        self.redis = redis_client
+        self.stream = f"{prefix}:pipeline"
+        self.delayed = f"{prefix}:delayed"
+        self.dead = f"{prefix}:dead"
+        self._ensure_group()
+
+    def _ensure_group(self) -> None:
+        try:
+            self.redis.xgroup_create(self.stream, self.GROUP, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def enqueue(self, job_id: str, payload: Dict[str, Any], attempts: int = 0, delay_seconds: float = 0) -> str:
+        message = {"job_id": job_id, "payload": json.dumps(payload, default=str), "attempts": attempts}
+        if delay_seconds > 0:
+            self.redis.zadd(self.delayed, {json.dumps(message): time.time() + delay_seconds})
+            return f"delayed:{job_id}"
+        return self.redis.xadd(self.stream, message)
+
+    def enqueue_many(self, tasks: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        pipe = self.redis.pipeline(transaction=True)
+        for job_id, payload in tasks:
+            pipe.xadd(self.stream, {"job_id": job_id, "payload": json.dumps(payload, default=str), "attempts": 0})
+        return pipe.execute()
+
+    def _promote_delayed(self) -> None:
+        """Move retries whose backoff has elapsed onto the stream"""
+        for raw in self.redis.zrangebyscore(self.delayed, 0, time.time(), start=0, num=10):
+            # ZREM succeeds for exactly one worker, which then owns the move
+            if self.redis.zrem(self.delayed, raw):
+                message = json.loads(raw)
+                self.redis.xadd(self.stream, message)
+
+    def _to_task(self, message_id: str, fields: Dict[str, str], deliveries: int) -> QueuedTask:
+        return QueuedTask(
+            task_id=message_id,
+            job_id=fields["job_id"],
+            payload=json.loads(fields["payload"]),
+            attempts=int(fields.get("attempts", 0)) + deliveries,
+            receipt={"message_id": message_id}
+        )
+
+    def claim(self, consumer: str, block_seconds: float = 5) -> Optional[QueuedTask]:
+        self._promote_delayed()
+
+        # Expired leases first so crashed work is not starved by new uploads
+        _, claimed, *_ = self.redis.xautoclaim(
+            self.stream, self.GROUP, consumer, min_idle_time=VISIBILITY_TIMEOUT * 1000, start_id="0-0", count=1
+        )
+        if claimed:
+            message_id, fields = claimed[0]
+            pending = self.redis.xpending_range(self.stream, self.GROUP, min=message_id, max=message_id, count=1)
+            deliveries = pending[0]["times_delivered"] if pending else 1
+            logger.warning(f"♻️  QUEUE: Reclaimed expired task for job {fields.get('job_id')} (delivery {deliveries})")
+            return self._to_task(message_id, fields, deliveries)
+
+        response = self.redis.xreadgroup(
+            self.GROUP, consumer, {self.stream: ">"}, count=1, block=int(block_seconds * 1000)
+        )
+        if not response:
+            return None
+        message_id, fields = response[0][1][0]
+        return self._to_task(message_id, fields, 1)
+
+    def heartbeat(self, task: QueuedTask, consumer: str) -> None:
+        self.redis.xclaim(self.stream, self.GROUP, consumer, min_idle_time=0,
+                          message_ids=[task.receipt["message_id"]], justid=True)
+
+    def ack(self, task: QueuedTask) -> None:
+        message_id = task.receipt["message_id"]
+        pipe = self.redis.pipeline()
+        pipe.xack(self.stream, self.GROUP, message_id)
+        pipe.xdel(self.stream, message_id)
+        pipe.execute()
+
+    def retry(self, task: QueuedTask, error: str, delay_seconds: float) -> None:
+        self.enqueue(task.job_id, task.payload, attempts=task.attempts, delay_seconds=delay_seconds)
+        self.ack(task)
+
+    def bury(self, task: QueuedTask, error: str) -> None:
+        record = json.dumps({"job_id": task.job_id, "attempts": task.attempts, "error": error[:2000],
+                             "failed_at": datetime.utcnow().isoformat()})
+        pipe = self.redis.pipeline()
+        pipe.lpush(self.dead, record)
+        pipe.ltrim(self.dead, 0, 999)
+        pipe.execute()
+        self.ack(task)
+
+    def depth(self) -> Dict[str, int]:
+        try:
+            in_flight = self.redis.xpending(self.stream, self.GROUP)["pending"]
+        except redis.ResponseError:
+            in_flight = 0
+        return {
+            "waiting": max(0, self.redis.xlen(self.stream) - in_flight),
+            "in_flight": in_flight,
+            "delayed": self.redis.zcard(self.delayed),
+            "dead": self.redis.llen(self.dead)
+        }
+
+
+class DatabaseQueue:
+    """
+    SQLite/PostgreSQL table backend (local development, or no Redis)
+
+    Claims use a conditional UPDATE so only one worker wins a row; on
+    PostgreSQL candidates are selected with FOR UPDATE SKIP LOCKED.
+    """
+
+    def __init__(self):
+        self.skip_locked = engine.dialect.name == "postgresql"
+        QueuedTaskModel.__table__.create(engine, checkfirst=True)
+
+    def _claimable(self, now: datetime):
+        return or_(
+            and_(QueuedTaskModel.status == QueuedTaskStatus.QUEUED, QueuedTaskModel.available_at <= now),
+            and_(QueuedTaskModel.status == QueuedTaskStatus.LEASED, QueuedTaskModel.leased_until < now)
+        )
+
+    def enqueue(self, job_id: str, payload: Dict[str, Any], attempts: int = 0, delay_seconds: float = 0) -> str:
+        task = QueuedTaskModel(
+            job_id=job_id,
+            payload=payload,
+            attempts=attempts,
+            available_at=datetime.utcnow() + timedelta(seconds=delay_seconds)
+        )
+        with Session(engine) as session:
+            session.add(task)
+            session.commit()
+            return task.id
+
+    def enqueue_many(self, tasks: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        now = datetime.utcnow()
+        models = [QueuedTaskModel(job_id=job_id, payload=payload, attempts=0, available_at=now)
+                  for job_id, payload in tasks]
+        with Session(engine) as session:
+            session.add_all(models)
+            session.commit()
+            return [task.id for task in models]
+
+    def claim(self, consumer: str, block_seconds: float = 5) -> Optional[QueuedTask]:
+        deadline = time.monotonic() + block_seconds
+        while True:
+            task = self._try_claim(consumer)
+            if task or time.monotonic() >= deadline:
+                return task
+            time.sleep(min(1.0, max(0.0, deadline - time.monotonic())))
+
+    def _try_claim(self, consumer: str) -> Optional[QueuedTask]:
+        now = datetime.utcnow()
+        with Session(engine) as session:
+            statement = (
+                select(QueuedTaskModel.id)
+                .where(self._claimable(now))
+                .order_by(QueuedTaskModel.available_at)
+                .limit(5)
+            )
+            if self.skip_locked:
+                statement = statement.with_for_update(skip_locked=True)
+            candidates = session.exec(statement).all()
+
+            for task_id in candidates:
+                claimed = session.execute(
+                    update(QueuedTaskModel)
+                    .where(QueuedTaskModel.id == task_id, self._claimable(now))
+                    .values(
+                        status=QueuedTaskStatus.LEASED,
+                        lease_owner=consumer,
+                        leased_until=now + timedelta(seconds=VISIBILITY_TIMEOUT),
+                        attempts=QueuedTaskModel.attempts + 1,
+                        updated_at=now
+                    )
+                )
+                if claimed.rowcount == 1:
+                    session.commit()
+                    row = session.get(QueuedTaskModel, task_id)
+                    if row.attempts > 1:
+                        logger.warning(f"♻️  QUEUE: Claimed task for job {row.job_id} (attempt {row.attempts})")
+                    return QueuedTask(task_id=row.id, job_id=row.job_id, payload=row.payload or {},
+                                      attempts=row.attempts, receipt={"owner": consumer})
+            session.commit()
+        return None
+
+    def _update(self, task: QueuedTask, **values) -> None:
+        """Update a task row, only while this worker still holds the lease"""
+        with Session(engine) as session:
+            session.execute(
+                update(QueuedTaskModel)
+                .where(QueuedTaskModel.id == task.task_id,
+                       QueuedTaskModel.lease_owner == task.receipt.get("owner"))
+                .values(updated_at=datetime.utcnow(), **values)
+            )
+            session.commit()
+
+    def heartbeat(self, task: QueuedTask, consumer: str) -> None:
+        self._update(task, leased_until=datetime.utcnow() + timedelta(seconds=VISIBILITY_TIMEOUT))
+
+    def ack(self, task: QueuedTask) -> None:
+        self._update(task, status=QueuedTaskStatus.DONE, leased_until=None)
+
+    def retry(self, task: QueuedTask, error: str, delay_seconds: float) -> None:
+        self._update(task, status=QueuedTaskStatus.QUEUED, lease_owner=None, leased_until=None,
+                     last_error=error[:2000], available_at=datetime.utcnow() + timedelta(seconds=delay_seconds))
+
+    def bury(self, task: QueuedTask, error: str) -> None:
+        self._update(task, status=QueuedTaskStatus.DEAD, leased_until=None, last_error=error[:2000])
+
+    def depth(self) -> Dict[str, int]:
+        now = datetime.utcnow()
+        with Session(engine) as session:
+            counts = dict(session.exec(
+                select(QueuedTaskModel.status, func.count()).group_by(QueuedTaskModel.status)
+            ).all())
+            delayed = session.exec(
+                select(func.count()).where(
+                    QueuedTaskModel.status == QueuedTaskStatus.QUEUED, QueuedTaskModel.available_at > now
+                )
+            ).one()
+        queued = counts.get(QueuedTaskStatus.QUEUED, 0)
+        return {
+            "waiting": queued - delayed,
+            "in_flight": counts.get(QueuedTaskStatus.LEASED, 0),
+            "delayed": delayed,
+            "dead": counts.get(QueuedTaskStatus.DEAD, 0)
+        }
+
+
+class JobQueue:
+    """
+    Durable queue of pipeline jobs for the worker pool
+
+    Architecture:
+    - Redis Streams when REDIS_URL is reachable (JOB_QUEUE_BACKEND=redis)
+    - Jobs table in PostgreSQL/SQLite otherwise (JOB_QUEUE_BACKEND=database)
+
+    Delivery is at-least-once: a task is acknowledged only after the job
+    reaches a final state, and is redelivered if its worker stops
+    heartbeating for JOB_QUEUE_VISIBILITY_TIMEOUT seconds.
+    """
+
+    def __init__(self):
+        self.backend = self._initialize_backend()
+        logger.info(f"📬 JobQueue initialized ({type(self.backend).__name__}, "
+                    f"visibility {VISIBILITY_TIMEOUT}s, max attempts {MAX_ATTEMPTS})")
+
+    def _initialize_backend(self):
+        """Select Redis Streams with graceful fallback to the database table"""
+        preferred = os.getenv("JOB_QUEUE_BACKEND", "redis" if os.getenv("REDIS_URL") else "database")
+        if preferred == "redis":
+            try:
+                client = redis.from_url(os.getenv("REDIS_URL"), decode_responses=True)
+                client.ping()
+                return RedisStreamQueue(client)
+            except Exception as e:
+                logger.warning(f"⚠️  Redis queue unavailable: {e} - using database queue")
+        return DatabaseQueue()
+
+    def enqueue(self, job_id: str, payload: Dict[str, Any]) -> str:
+        """Add a pipeline job to the queue"""
+        task_id = self.backend.enqueue(job_id, payload)
+        logger.info(f"📬 QUEUE: Enqueued job {job_id}")
+        return task_id
+
+    def enqueue_many(self, tasks: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Add several pipeline jobs in one write (all or none)"""
+        if not tasks:
+            return []
+        task_ids = self.backend.enqueue_many(tasks)
+        logger.info(f"📬 QUEUE: Enqueued {len(tasks)} jobs")
+        return task_ids
+
+    def claim(self, consumer: str, block_seconds: float = 5) -> Optional[QueuedTask]:
+        """Lease the next task for a worker, waiting up to block_seconds"""
+        return self.backend.claim(consumer, block_seconds)
+
+    def heartbeat(self, task: QueuedTask, consumer: str) -> None:
+        """Extend the lease on a task that is still being processed"""
+        self.backend.heartbeat(task, consumer)
+
+    def ack(self, task: QueuedTask) -> None:
+        """Mark a task finished (job completed or failed for good)"""
+        self.backend.ack(task)
+
+    def fail(self, task: QueuedTask, error: str) -> bool:
+        """
+        Record a failed attempt. Retries with exponential backoff until
+        JOB_QUEUE_MAX_ATTEMPTS, then moves the task to the dead letters.
+
+        Returns:
+            True if the task will be retried
+        """
+        if task.is_final_attempt:
+            self.backend.bury(task, error)
+            logger.error(f"💀 QUEUE: Job {task.job_id} failed after {task.attempts} attempts: {error}")
+            return False
+
+        delay = RETRY_BACKOFF_SECONDS * (2 ** (task.attempts - 1))
+        self.backend.retry(task, error, delay)
+        logger.warning(f"🔁 QUEUE: Job {task.job_id} attempt {task.attempts} failed, retrying in {delay}s: {error}")
+        return True
+
+    def depth(self) -> Dict[str, int]:
+        """Task counts by state"""
+        return self.backend.depth()
+
+
+# Global instance (created lazily so worker processes connect after fork)
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Get or create the global job queue"""
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                _job_queue = JobQueue()
+    return _job_queue
@@ -1,109 +1,464 @@
 import json
 import redis
 import os
+import sys
+import atexit
 import logging
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+import threading
+from typing import Optional, Dict, Any, List, Set
+from datetime import datetime, timedelta, timezone
 from sqlmodel import Session, select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import func, update
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
 from app.database import engine
 from app.models.user import JobModel, JobStatus, JobPriority, JobLogEntry
+from app.services.redis_pool import get_redis_client, redis_breaker
+from app.services.analytics_rollups import analytics_rollups
 
 logger = logging.getLogger(__name__)
 
+# Chatty fields: coalesced in memory and flushed to Redis on an interval.
+# Never written to PostgreSQL on their own while Redis is available.
+TRANSIENT_FIELDS = {"progress", "stage"}
+
+JOB_STATE_FLUSH_INTERVAL = int(os.getenv("JOB_STATE_FLUSH_INTERVAL_MS", "250")) / 1000
+JOB_CACHE_TTL_SECONDS = int(os.getenv("JOB_CACHE_TTL_SECONDS", "3600"))
+# Unknown job IDs are remembered briefly so polling a bad ID stays off PostgreSQL
+JOB_CACHE_NEGATIVE_TTL_SECONDS = int(os.getenv("JOB_CACHE_NEGATIVE_TTL_SECONDS", "30"))
+
+# Final statuses; reaching one stamps completed_at unless the caller set it
+TERMINAL_STATUSES = ("completed", "failed", "cancelled", "expired")
+
+# Marks a Redis job hash that holds the full job (not just transient fields)
+_COMPLETE_MARKER = "_complete"
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """datetime or ISO-8601 string -> naive UTC datetime (how the columns store it)"""
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value))
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _format_timestamp(value: Any) -> Optional[str]:
+    """
+    The one timestamp format job data carries, whether read from Redis or
+    PostgreSQL: naive UTC ISO-8601 with microseconds
+    """
+    parsed = _parse_timestamp(value)
+    return parsed.isoformat(timespec="microseconds") if parsed else None
+
+
+TIMESTAMP_FIELDS = ("created_at", "completed_at")
+
+
+def _normalize_timestamps(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of job fields with timestamps in the one format (see _format_timestamp)"""
+    if not any(field in fields for field in TIMESTAMP_FIELDS):
+        return fields
+    fields = dict(fields)
+    for field in TIMESTAMP_FIELDS:
+        if field in fields:
+            try:
+                fields[field] = _format_timestamp(fields[field])
+            except ValueError:
+                fields[field] = None
+    return fields
+
+
+# API job_data key -> (JobModel column, converter)
+DB_COLUMNS = {
+    "status": ("status", lambda v: JobStatus(v)),
+    "progress": ("progress", int),
+    "result": ("result_data", lambda v: v),
+    "error": ("error_data", lambda v: {"message": v} if v else None),
+    "user_inputs": ("user_inputs", lambda v: v),
+    "project_label": ("project_label", lambda v: v),
+    "fingerprint": ("fingerprint", lambda v: v),
+    "saved_file_path": ("s3_upload_path", lambda v: v or None),
+    "file_sha256": ("file_sha256", lambda v: v),
+    "file_size_bytes": ("file_size_bytes", lambda v: int(v) if v is not None else None),
+    "completed_at": ("completed_at", _parse_timestamp),
+    "needs_upgrade": ("requires_upgrade", bool),
+    "is_first_report": ("is_free_report", bool),
+}
+
+
 class JobStorage:
     """
     Production job storage with PostgreSQL primary + Redis cache
-    
+
     Architecture:
     - PostgreSQL: Primary persistent storage (survives restarts/deploys)
-    - Redis: High-performance cache layer (optional, graceful fallback)
+    - Redis: Read-through job state hashes, updated field by field, behind a
+      circuit breaker (optional, graceful fallback). A hash that misses a
+      write is deleted on the next successful Redis call.
+    - Write-behind: transient fields (progress, stage) are coalesced per job
+      and flushed in one batch every JOB_STATE_FLUSH_INTERVAL_MS, so
+      PostgreSQL only sees creation, status transitions and results
     """
-    
+
     def __init__(self):
         self.redis_client = None
-        self.redis_available = False
         self._initialize_redis()
-        logger.info("🏗️  JobStorage initialized (PostgreSQL primary + Redis cache)")
-    
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, Any]] = {}   # Coalesced, not yet flushed
+        self._flushing: Dict[str, Dict[str, Any]] = {}  # Being written by the flusher
+        self._flush_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_pid: Optional[int] = None
+        self._stopped = threading.Event()
+        # Jobs whose Redis hash may be older than PostgreSQL (a cache write
+        # failed or was skipped); their keys are deleted once Redis is back
+        self._stale_cache: Set[str] = set()
+        atexit.register(self.flush)
+        logger.info("🏗️  JobStorage initialized (PostgreSQL primary + Redis cache, write-behind progress)")
+
     def _initialize_redis(self):
         """Initialize Redis connection with graceful fallback"""
+        self.redis_client = get_redis_client()
+        if self.redis_client is None:
+            logger.info("ℹ️  REDIS_URL not set - PostgreSQL only mode")
+            return
         try:
-            redis_url = os.getenv("REDIS_URL")
-            if redis_url:
-                self.redis_client = redis.from_url(redis_url, decode_responses=True)
-                # Test connection
-                self.redis_client.ping()
-                self.redis_available = True
-                logger.info("✅ Redis cache layer connected")
-            else:
-                logger.info("ℹ️  REDIS_URL not set - PostgreSQL only mode")
-                self.redis_available = False
-        except Exception as e:
-            logger.warning(f"⚠️  Redis cache unavailable: {e} - PostgreSQL only mode")
-            self.redis_client = None
-            self.redis_available = False
-    
+            # Test connection
+            self.redis_client.ping()
+            logger.info("✅ Redis cache layer connected")
+        except redis.RedisError as e:
+            # Keep the client: the circuit breaker retries it after its reset timeout
+            redis_breaker.record_failure()
+            logger.warning(f"⚠️  Redis cache unavailable: {e} - PostgreSQL until it recovers")
+
+    def _redis_allowed(self) -> bool:
+        """
+        Whether to attempt a Redis call now: configured and the circuit not
+        open. A True result may take the breaker's half-open trial, so it must
+        be followed by exactly one call and its record_success/_redis_failed.
+        """
+        return self.redis_client is not None and redis_breaker.allow()
+
+    def _redis_failed(self, action: str, error: Exception) -> None:
+        redis_breaker.record_failure()
+        logger.warning(f"⚠️  Cache {action} failed: {error}")
+
     def _get_job_key(self, job_id: str) -> str:
-        """Generate Redis key for job"""
-        return f"job:{job_id}"
-    
-    def _cache_job_data(self, job_id: str, job_data: Dict[str, Any]) -> None:
-        """Cache job data in Redis for performance"""
-        if not self.redis_available:
+        """Generate Redis key for job state hash"""
+        return f"jobstate:{job_id}"
+
+    def _get_missing_key(self, job_id: str) -> str:
+        """Redis key remembering that a job ID does not exist"""
+        return f"jobstate:missing:{job_id}"
+
+    def _mark_stale(self, job_ids) -> None:
+        """Remember jobs whose cached hash missed a write that reached PostgreSQL"""
+        if self.redis_client is None:
+            return
+        with self._lock:
+            self._stale_cache.update(job_ids)
+
+    def _queue_invalidations(self, pipe) -> Set[str]:
+        """
+        Queue DELs for stale job hashes ahead of a pipeline's commands
+
+        Returns the job IDs taken; hand them back to _mark_stale if the
+        pipeline fails. A later field write then starts a partial hash, which
+        reads complete from the row.
+        """
+        with self._lock:
+            stale, self._stale_cache = self._stale_cache, set()
+        for job_id in stale:
+            pipe.delete(self._get_job_key(job_id), self._get_missing_key(job_id))
+        return stale
+
+    # ------------------------------------------------------------------
+    # Redis job hashes
+    # ------------------------------------------------------------------
+
+    def _hset_fields(self, pipe, job_id: str, fields: Dict[str, Any], complete: bool = False) -> None:
+        """Queue a field-level HSET (values JSON encoded) on a Redis pipeline"""
+        mapping = {field: json.dumps(value, default=str) for field, value in _normalize_timestamps(fields).items()}
+        if complete:
+            mapping[_COMPLETE_MARKER] = "1"
+        key = self._get_job_key(job_id)
+        pipe.hset(key, mapping=mapping)
+        pipe.expire(key, JOB_CACHE_TTL_SECONDS)
+        if complete:
+            pipe.delete(self._get_missing_key(job_id))
+
+    def _cache_fields(self, job_id: str, fields: Dict[str, Any], complete: bool = False) -> None:
+        """
+        Write changed fields to the job's Redis hash
+
+        If the write fails or the circuit is open, the hash is marked stale
+        and deleted on the next Redis call, so readers never see fields older
+        than PostgreSQL once Redis is back.
+        """
+        if not fields:
+            return
+        if not self._redis_allowed():
+            self._mark_stale([job_id])
+            return
+        stale = set()
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            stale = self._queue_invalidations(pipe)
+            self._hset_fields(pipe, job_id, fields, complete)
+            pipe.execute()
+            redis_breaker.record_success()
+            logger.debug(f"📦 CACHE: Stored {len(fields)} fields for job {job_id}")
+        except redis.RedisError as e:
+            self._redis_failed(f"write for {job_id}", e)
+            self._mark_stale(stale | {job_id})
+
+    def _cache_missing(self, job_id: str) -> None:
+        """Negative-cache a job ID that PostgreSQL does not know"""
+        if not self._redis_allowed():
             return
-            
+        stale = set()
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            stale = self._queue_invalidations(pipe)
+            pipe.setex(self._get_missing_key(job_id), JOB_CACHE_NEGATIVE_TTL_SECONDS, "1")
+            pipe.execute()
+            redis_breaker.record_success()
+        except redis.RedisError as e:
+            self._redis_failed(f"write for {job_id}", e)
+            self._mark_stale(stale)
+
+    def _read_cache(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Job hash from Redis; fields only (no marker) if it was never fully
+        cached, and {_COMPLETE_MARKER: None} if the job is known not to exist
+        """
+        if not self._redis_allowed():
+            return None
+        stale = set()
         try:
-            job_json = json.dumps(job_data, default=str)
-            key = self._get_job_key(job_id)
-            self.redis_client.setex(key, 3600, job_json)  # 1 hour cache
-            logger.debug(f"📦 CACHE: Stored job {job_id}")
+            pipe = self.redis_client.pipeline(transaction=False)
+            stale = self._queue_invalidations(pipe)
+            pipe.hgetall(self._get_job_key(job_id))
+            pipe.exists(self._get_missing_key(job_id))
+            raw, missing = pipe.execute()[-2:]
+            redis_breaker.record_success()
+        except redis.RedisError as e:
+            self._redis_failed(f"read for {job_id}", e)
+            self._mark_stale(stale)
+            return None
+        if missing and not raw:
+            return {_COMPLETE_MARKER: None}
+        if not raw:
+            return None
+        # Hashes written before timestamps were normalized may hold other formats
+        data = _normalize_timestamps({field: json.loads(value) for field, value in raw.items() if field != _COMPLETE_MARKER})
+        data[_COMPLETE_MARKER] = _COMPLETE_MARKER in raw
+        return data
+
+    # ------------------------------------------------------------------
+    # Write-behind buffer
+    # ------------------------------------------------------------------
+
+    def _ensure_flusher(self) -> None:
+        """Start the flush thread (again after a fork - threads do not survive it)"""
+        if self._flusher_pid == os.getpid() and self._flusher and self._flusher.is_alive():
+            return
+        with self._flush_lock:
+            if self._flusher_pid == os.getpid() and self._flusher and self._flusher.is_alive():
+                return
+            self._flusher_pid = os.getpid()
+            self._flusher = threading.Thread(target=self._flush_loop, name="job-state-flusher", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while not self._stopped.wait(JOB_STATE_FLUSH_INTERVAL):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"❌ Job state flush failed: {e}")
+
+    def flush(self) -> int:
+        """Write all coalesced transient updates in one batch; returns jobs flushed"""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                self._flushing, self._pending = self._pending, {}
+                batch = self._flushing
+            try:
+                written = False
+                if self._redis_allowed():
+                    stale = set()
+                    try:
+                        pipe = self.redis_client.pipeline(transaction=False)
+                        stale = self._queue_invalidations(pipe)
+                        for job_id, fields in batch.items():
+                            self._hset_fields(pipe, job_id, fields)
+                        pipe.execute()
+                        redis_breaker.record_success()
+                        written = True
+                    except redis.RedisError as e:
+                        self._redis_failed("flush", e)
+                        self._mark_stale(stale)
+                if not written:
+                    # No shared cache: persist coalesced progress so other processes see it,
+                    # and drop the cached hashes that now lag behind
+                    self._mark_stale(batch)
+                    with Session(engine) as session:
+                        for job_id, fields in batch.items():
+                            values = self._db_values(fields)
+                            if values:
+                                session.exec(update(JobModel).where(JobModel.id == job_id).values(**values))
+                        session.commit()
+            except Exception as e:
+                logger.warning(f"⚠️  Job state flush failed for {len(batch)} jobs: {e}")
+                return 0
+            finally:
+                with self._lock:
+                    self._flushing = {}
+            self._update_memory_fallback(batch)
+            logger.debug(f"💨 FLUSH: {len(batch)} jobs")
+            return len(batch)
+
+    def _unflushed(self, job_id: str) -> Dict[str, Any]:
+        """Buffered updates for a job not yet visible in Redis/PostgreSQL"""
+        with self._lock:
+            return {**self._flushing.get(job_id, {}), **self._pending.get(job_id, {})}
+
+    def _update_memory_fallback(self, batch: Dict[str, Dict[str, Any]]) -> None:
+        # Only when the routes are loaded - never import them from the flusher thread
+        blueprint = sys.modules.get("app.routes.blueprint")
+        jobs = getattr(blueprint, "jobs", {})
+        for job_id, fields in batch.items():
+            if job_id in jobs:
+                jobs[job_id].update(fields)
+
+    # ------------------------------------------------------------------
+    # PostgreSQL
+    # ------------------------------------------------------------------
+
+    def _db_values(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Map job_data fields to JobModel column values"""
+        values = {}
+        for key, value in fields.items():
+            if key in DB_COLUMNS:
+                if key == "user_inputs" and value is None:
+                    continue
+                column, convert = DB_COLUMNS[key]
+                values[column] = convert(value)
+        if values:
+            values["updated_at"] = datetime.utcnow()
+        return values
+
+    def _persist(self, job_id: str, changes: Dict[str, Any]) -> bool:
+        """Write-through: one UPDATE of the changed columns plus a field-level cache write"""
+        if changes.get("status") in TERMINAL_STATUSES and not changes.get("completed_at"):
+            changes = {**changes, "completed_at": datetime.utcnow()}
+        try:
+            values = self._db_values(changes)
+            if values:
+                with Session(engine) as session:
+                    result = session.exec(update(JobModel).where(JobModel.id == job_id).values(**values))
+                    session.commit()
+                if result.rowcount == 0:
+                    return self._update_memory_only(job_id, changes)
+                logger.info(f"💾 DB: Updated job {job_id} ({', '.join(sorted(changes))})")
+                if changes.get("status") in ("completed", "failed"):
+                    analytics_rollups.record(f"jobs_{changes['status']}")
+            self._cache_fields(job_id, changes)
+            return True
+        except SQLAlchemyError as e:
+            logger.error(f"❌ DB: Failed to update job {job_id}: {e}")
+            return self._update_memory_only(job_id, changes)
         except Exception as e:
-            logger.warning(f"⚠️  Cache write failed for {job_id}: {e}")
-    
+            logger.error(f"❌ SYSTEM: Failed to update job {job_id}: {e}")
+            return False
+
+    def _update_memory_only(self, job_id: str, changes: Dict[str, Any]) -> bool:
+        """Fallback to in-memory jobs for local development"""
+        try:
+            from app.routes.blueprint import jobs
+            if job_id in jobs:
+                jobs[job_id].update(changes)
+                logger.info(f"💾 MEMORY FALLBACK: Updated job {job_id}")
+                return True
+        except Exception:
+            pass
+        return False
+
+    def _read_db(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with Session(engine) as session:
+            job = session.get(JobModel, job_id)
+            if not job:
+                return None
+            return {
+                "status": job.status.value,
+                "progress": job.progress,
+                "filename": job.filename,
+                "project_label": job.project_label,
+                "zip_code": job.zip_code,
+                "email": job.user_email,
+                "user_inputs": job.user_inputs,
+                "created_at": _format_timestamp(job.created_at),
+                "completed_at": _format_timestamp(job.completed_at),
+                "result": job.result_data,
+                "error": job.error_data.get("message") if job.error_data else None,
+                "needs_upgrade": job.requires_upgrade,
+                "is_first_report": job.is_free_report,
+                "saved_file_path": job.s3_upload_path,
+                "file_sha256": job.file_sha256,
+                "file_size_bytes": job.file_size_bytes,
+                "fingerprint": job.fingerprint
+            }
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
     def save_job(self, job_id: str, job_data: Dict[str, Any]) -> bool:
         """Save job to PostgreSQL with Redis cache"""
         try:
             with Session(engine) as session:
-                # Check if job already exists
-                existing = session.get(JobModel, job_id)
-                if existing:
-                    # Update existing job
-                    existing.status = JobStatus(job_data.get("status", "created"))
-                    existing.progress = job_data.get("progress", 0)
-                    existing.result_data = job_data.get("result")
-                    existing.error_data = {"message": job_data.get("error")} if job_data.get("error") else None
-                    existing.updated_at = datetime.utcnow()
-                    
-                    session.add(existing)
-                    session.commit()
-                    logger.info(f"💾 DB: Updated job {job_id}")
-                else:
-                    # Create new job
-                    job = JobModel(
-                        id=job_id,
-                        user_email=job_data.get("email", "unknown"),
-                        filename=job_data.get("filename", "unknown.pdf"),
-                        project_label=job_data.get("project_label", job_data.get("filename", "unknown")),
-                        zip_code=job_data.get("zip_code", "00000"),
-                        status=JobStatus(job_data.get("status", "created")),
-                        progress=job_data.get("progress", 0),
-                        user_inputs=job_data.get("user_inputs", {}),
-                        result_data=job_data.get("result"),
-                        error_data={"message": job_data.get("error")} if job_data.get("error") else None,
-                        is_free_report=job_data.get("is_first_report", False),
-                        requires_upgrade=job_data.get("needs_upgrade", False)
-                    )
-                    
-                    session.add(job)
-                    session.commit()
-                    logger.info(f"💾 DB: Created job {job_id}")
-                
-                # Cache in Redis for performance
-                self._cache_job_data(job_id, job_data)
-                return True
-                
+                exists = session.get(JobModel, job_id) is not None
+            if exists:
+                with self._lock:
+                    self._pending.pop(job_id, None)
+                return self._persist(job_id, job_data)
+
+            created_at = _parse_timestamp(job_data.get("created_at")) or datetime.utcnow()
+            with Session(engine) as session:
+                job = JobModel(
+                    id=job_id,
+                    user_email=job_data.get("email", "unknown"),
+                    filename=job_data.get("filename", "unknown.pdf"),
+                    project_label=job_data.get("project_label", job_data.get("filename", "unknown")),
+                    zip_code=job_data.get("zip_code", "00000"),
+                    status=JobStatus(job_data.get("status", "created")),
+                    progress=job_data.get("progress", 0),
+                    user_inputs=job_data.get("user_inputs", {}),
+                    result_data=job_data.get("result"),
+                    error_data={"message": job_data.get("error")} if job_data.get("error") else None,
+                    is_free_report=job_data.get("is_first_report", False),
+                    requires_upgrade=job_data.get("needs_upgrade", False),
+                    fingerprint=job_data.get("fingerprint"),
+                    s3_upload_path=job_data.get("saved_file_path") or None,
+                    file_sha256=job_data.get("file_sha256"),
+                    file_size_bytes=job_data.get("file_size_bytes"),
+                    created_at=created_at
+                )
+                session.add(job)
+                session.commit()
+                logger.info(f"💾 DB: Created job {job_id}")
+            analytics_rollups.record("jobs_created")
+
+            # Cache the full job for reads, with the row's creation time
+            self._cache_fields(job_id, {**job_data, "created_at": created_at}, complete=True)
+            return True
+
         except SQLAlchemyError as e:
             logger.error(f"❌ DB: Failed to save job {job_id}: {e}")
             # Fallback to in-memory for local development
@@ -117,81 +472,218 @@ class JobStorage:
         except Exception as e:
             logger.error(f"❌ SYSTEM: Failed to save job {job_id}: {e}")
             return False
-    
+
+    def _get_memory_job(self, job_id: str, unflushed: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Final fallback to in-memory jobs for local development"""
+        try:
+            from app.routes.blueprint import jobs
+            if job_id in jobs:
+                logger.info(f"📖 MEMORY FALLBACK: Retrieved job {job_id}")
+                return {**jobs[job_id], **unflushed}
+        except:
+            pass
+        return None
+
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """Get job with cache-first strategy"""
+        """Get job read-through (Redis, then PostgreSQL), including updates not yet flushed"""
         try:
-            # Try Redis cache first for performance
-            if self.redis_available:
-                key = self._get_job_key(job_id)
-                cached_json = self.redis_client.get(key)
-                if cached_json:
-                    job_data = json.loads(cached_json)
-                    logger.debug(f"🎯 CACHE HIT: Retrieved job {job_id}")
-                    return job_data
-            
-            # Fallback to PostgreSQL
-            with Session(engine) as session:
-                job = session.get(JobModel, job_id)
-                if job:
-                    # Convert to API format
-                    job_data = {
-                        "status": job.status,
-                        "progress": job.progress,
-                        "filename": job.filename,
-                        "project_label": job.project_label,
-                        "zip_code": job.zip_code,
-                        "email": job.user_email,
-                        "user_inputs": job.user_inputs,
-                        "created_at": job.created_at.isoformat(),
-                        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-                        "result": job.result_data,
-                        "error": job.error_data.get("message") if job.error_data else None,
-                        "needs_upgrade": job.requires_upgrade,
-                        "is_first_report": job.is_free_report
-                    }
-                    
-                    # Cache for next time
-                    self._cache_job_data(job_id, job_data)
-                    
-                    logger.info(f"📖 DB: Retrieved job {job_id}")
-                    return job_data
-                else:
+            # Snapshot the buffer first: a flush finishing mid-read lands in the store
+            unflushed = self._unflushed(job_id)
+            job_data = self._read_cache(job_id)
+            if job_data and job_data[_COMPLETE_MARKER] is None:
+                logger.debug(f"🎯 CACHE HIT: Job {job_id} known not to exist")
+                return self._get_memory_job(job_id, unflushed)
+            if job_data and job_data.pop(_COMPLETE_MARKER):
+                logger.debug(f"🎯 CACHE HIT: Retrieved job {job_id}")
+            else:
+                # Hash missing or holding only transient fields - load the row and
+                # keep the (newer) cached fields on top
+                cached_fields = job_data or {}
+                job_data = self._read_db(job_id)
+                if job_data is None:
                     logger.warning(f"❌ DB: Job {job_id} not found")
-                    
-                    # Final fallback to in-memory for local development
-                    try:
-                        from app.routes.blueprint import jobs
-                        if job_id in jobs:
-                            logger.info(f"📖 MEMORY FALLBACK: Retrieved job {job_id}")
-                            return jobs[job_id]
-                    except:
-                        pass
-                    
-                    return None
-                    
+                    memory_job = self._get_memory_job(job_id, unflushed)
+                    if memory_job is None:
+                        self._cache_missing(job_id)
+                    return memory_job
+
+                job_data.update(cached_fields)
+                self._cache_fields(job_id, job_data, complete=True)
+                logger.info(f"📖 DB: Retrieved job {job_id}")
+
+            job_data.update(unflushed)
+            return job_data
+
         except SQLAlchemyError as e:
             logger.error(f"❌ DB: Failed to get job {job_id}: {e}")
             return None
         except Exception as e:
             logger.error(f"❌ SYSTEM: Failed to get job {job_id}: {e}")
             return None
-    
+
     def update_job(self, job_id: str, updates: Dict[str, Any]) -> bool:
-        """Update job data"""
+        """
+        Update job data
+
+        Transient-only updates (progress, stage) are coalesced and written
+        behind; any other field is written through together with whatever
+        is buffered for the job.
+        """
+        if not updates:
+            return True
         try:
-            job_data = self.get_job(job_id)
-            if job_data:
-                job_data.update(updates)
-                return self.save_job(job_id, job_data)
-            return False
+            with self._lock:
+                pending = self._pending.setdefault(job_id, {})
+                pending.update(updates)
+                if set(updates) <= TRANSIENT_FIELDS:
+                    changes = None
+                else:
+                    changes = self._pending.pop(job_id)
+
+            if changes is None:
+                self._ensure_flusher()
+                return True
+            return self._persist(job_id, changes)
         except Exception as e:
             logger.error(f"❌ Failed to update job {job_id}: {e}")
             return False
-    
+
+    def claim_fingerprint(self, job_id: str, fingerprint: str) -> bool:
+        """
+        Set an in-flight job's fingerprint unless another in-flight job holds it
+
+        Atomic through the unique partial index on in-flight fingerprints:
+        of concurrent identical uploads exactly one claim succeeds.
+        """
+        try:
+            with Session(engine) as session:
+                session.exec(
+                    update(JobModel).where(JobModel.id == job_id)
+                    .values(fingerprint=fingerprint, updated_at=datetime.utcnow())
+                )
+                session.commit()
+        except IntegrityError:
+            logger.info(f"♻️  DB: Fingerprint {fingerprint[:12]} already claimed by an in-flight job")
+            return False
+        except SQLAlchemyError as e:
+            logger.error(f"❌ DB: Failed to claim fingerprint for job {job_id}: {e}")
+            return self._update_memory_only(job_id, {"fingerprint": fingerprint})
+        self._cache_fields(job_id, {"fingerprint": fingerprint})
+        return True
+
+    def find_job_by_fingerprint(
+        self,
+        fingerprint: str,
+        statuses: List[JobStatus],
+        created_after: Optional[datetime] = None,
+        exclude_job_id: Optional[str] = None
+    ) -> Optional[str]:
+        """Most recent job ID with this fingerprint in one of the given statuses"""
+        try:
+            with Session(engine) as session:
+                query = select(JobModel.id).where(
+                    JobModel.fingerprint == fingerprint,
+                    JobModel.status.in_(statuses)
+                )
+                if created_after:
+                    query = query.where(JobModel.created_at >= created_after)
+                if exclude_job_id:
+                    query = query.where(JobModel.id != exclude_job_id)
+                return session.exec(query.order_by(JobModel.created_at.desc()).limit(1)).first()
+        except SQLAlchemyError as e:
+            logger.error(f"❌ DB: Fingerprint lookup failed: {e}")
+            return None
+
+    def count_user_jobs(self, email: str, statuses: List[JobStatus], exclude_job_id: Optional[str] = None) -> int:
+        """Number of a user's jobs in the given statuses (served by the (user_email, status) index)"""
+        try:
+            with Session(engine) as session:
+                query = select(func.count()).select_from(JobModel).where(
+                    JobModel.user_email == email,
+                    JobModel.status.in_(statuses)
+                )
+                if exclude_job_id:
+                    query = query.where(JobModel.id != exclude_job_id)
+                return session.exec(query).one()
+        except SQLAlchemyError as e:
+            logger.error(f"❌ DB: Job count for {email} failed: {e}")
+            try:
+                from app.routes.blueprint import jobs
+            except Exception:
+                return 0
+            values = {status.value for status in statuses}
+            return sum(1 for job_id, job in list(jobs.items())
+                       if job.get("email") == email and job.get("status") in values and job_id != exclude_job_id)
+
+    def claim_jobs(self, email: str, from_status: JobStatus, updates: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Atomically move all of a user's jobs out of one status
+
+        One conditional UPDATE on the (user_email, status) index; only the rows
+        it changed are returned, so a repeated or concurrent call for the same
+        jobs claims nothing and callers act on each job exactly once.
+
+        Returns:
+            Claimed jobs (job_id plus the fields needed to run them)
+        """
+        try:
+            statement = (
+                update(JobModel)
+                .where(JobModel.user_email == email, JobModel.status == from_status)
+                .values(**self._db_values(updates))
+                .returning(JobModel.id, JobModel.zip_code, JobModel.user_inputs,
+                           JobModel.project_label, JobModel.s3_upload_path)
+            )
+            with Session(engine) as session:
+                rows = session.exec(statement).all()
+                session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"❌ DB: Failed to claim {from_status.value} jobs for {email}: {e}")
+            return self._claim_memory_jobs(email, from_status, updates)
+
+        claimed = []
+        for job_id, zip_code, user_inputs, project_label, saved_file_path in rows:
+            with self._lock:
+                self._pending.pop(job_id, None)
+            self._cache_fields(job_id, updates)
+            claimed.append({
+                "job_id": job_id,
+                "email": email,
+                "zip_code": zip_code,
+                "user_inputs": user_inputs or {},
+                "project_label": project_label,
+                "saved_file_path": saved_file_path
+            })
+        if claimed:
+            logger.info(f"💾 DB: Claimed {len(claimed)} {from_status.value} jobs for {email}")
+        return claimed
+
+    def _claim_memory_jobs(self, email: str, from_status: JobStatus, updates: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Fallback to in-memory jobs for local development"""
+        try:
+            from app.routes.blueprint import jobs
+        except Exception:
+            return []
+        claimed = []
+        with self._lock:
+            for job_id, job in jobs.items():
+                if job.get("email") == email and job.get("status") == from_status.value:
+                    job.update(updates)
+                    claimed.append({
+                        "job_id": job_id,
+                        "email": email,
+                        "zip_code": job.get("zip_code"),
+                        "user_inputs": job.get("user_inputs") or {},
+                        "project_label": job.get("project_label"),
+                        "saved_file_path": job.get("saved_file_path")
+                    })
+        return claimed
+
     def delete_job(self, job_id: str) -> bool:
         """Delete job"""
         try:
+            with self._lock:
+                self._pending.pop(job_id, None)
             if self.redis_client:
                 key = self._get_job_key(job_id)
                 result = self.redis_client.delete(key)
@@ -207,26 +699,26 @@ class JobStorage:
         except Exception as e:
             logger.error(f"❌ Failed to delete job {job_id}: {e}")
             return False
-    
+
     def get_job_count(self) -> int:
         """Get total number of jobs"""
         try:
             if self.redis_client:
-                keys = self.redis_client.keys("job:*")
-                return len(keys)
+                # SCAN rather than KEYS; hashes only (skips negative-cache keys)
+                return sum(1 for _ in self.redis_client.scan_iter(match="jobstate:*", count=500, _type="HASH"))
             else:
                 from app.routes.blueprint import jobs
                 return len(jobs)
         except Exception as e:
             logger.error(f"❌ Failed to get job count: {e}")
             return 0
-    
+
     def get_recent_jobs(self, limit: int = 5) -> list:
         """Get recent job IDs"""
         try:
             if self.redis_client:
-                keys = self.redis_client.keys("job:*")
-                job_ids = [key.replace("job:", "") for key in keys[-limit:]]
+                keys = list(self.redis_client.scan_iter(match="jobstate:*", count=500, _type="HASH"))
+                job_ids = [key.replace("jobstate:", "") for key in keys[-limit:]]
                 return job_ids
             else:
                 from app.routes.blueprint import jobs
@@ -236,4 +728,4 @@ class JobStorage:
             return []
 
 # Global instance
-job_storage = JobStorage()
\ No newline at end of file
+job_storage = JobStorage()
@@ -0,0 +1,114 @@
+"""
+Shared Redis connection pool
+One bounded, blocking connection pool per process with socket timeouts, and
+a circuit breaker so a slow or unreachable Redis degrades to PostgreSQL
+instead of stalling every request on connect timeouts
+"""
+import os
+import time
+import logging
+import threading
+from typing import Optional
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "20"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT_SECONDS", "2"))  # Wait for a free connection
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT_SECONDS", "1"))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT_SECONDS", "1"))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL_SECONDS", "30"))
+
+REDIS_BREAKER_FAILURES = int(os.getenv("REDIS_BREAKER_FAILURES", "5"))
+REDIS_BREAKER_RESET_SECONDS = float(os.getenv("REDIS_BREAKER_RESET_SECONDS", "30"))
+
+
+class RedisCircuitBreaker:
+    """
+    Closed -> open after REDIS_BREAKER_FAILURES consecutive failures; while
+    open, allow() is False. After REDIS_BREAKER_RESET_SECONDS one trial call
+    is let through (half-open): success closes the breaker, failure reopens it.
+    """
+
+    def __init__(self, failure_threshold: int = REDIS_BREAKER_FAILURES,
+                 reset_seconds: float = REDIS_BREAKER_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_progress = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_seconds:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> bool:
+        """Whether a Redis call may be attempted now"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_seconds or self._trial_in_progress:
+                return False
+            self._trial_in_progress = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("✅ Redis circuit closed")
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_progress or (self._opened_at is None and self._failures >= self.failure_threshold):
+                self._opened_at = time.monotonic()
+                logger.warning(f"⚠️  Redis circuit open for {self.reset_seconds:.0f}s after {self._failures} failures")
+            self._trial_in_progress = False
+
+
+_client: Optional[redis.Redis] = None
+_client_lock = threading.Lock()
+redis_breaker = RedisCircuitBreaker()
+
+
+def get_redis_client() -> Optional[redis.Redis]:
+    """
+    Process-wide Redis client on a bounded pool, or None if REDIS_URL is unset
+
+    The pool resets itself in forked children (redis-py checks the pid), so
+    the client can be created before the worker pool forks.
+    """
+    global _client
+    if _client is not None:
+        return _client
+
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        return None
+
+    with _client_lock:
+        if _client is None:
+            pool = redis.BlockingConnectionPool.from_url(
+                redis_url,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                timeout=REDIS_POOL_TIMEOUT,
+                socket_timeout=REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+                health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+                retry_on_timeout=False,
+                decode_responses=True
+            )
+            _client = redis.Redis(connection_pool=pool)
+            logger.info(f"🔌 Redis pool: max {REDIS_MAX_CONNECTIONS} connections, "
+                        f"{REDIS_SOCKET_TIMEOUT}s socket timeout")
+    return _client
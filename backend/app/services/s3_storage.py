@@ -104,6 +104,96 @@ class S3StorageService:
             logger.error(f"Failed to save blueprint for job {job_id}: {e}")
             return ""
     
+    async def save_upload_file(self, job_id: str, file_path: str, filename: str, sha256: Optional[str] = None) -> str:
+        """
+        Stream a spooled blueprint from disk to S3 (multipart for large files)
+        
+        Args:
+            job_id: Unique job identifier
+            file_path: Local spool file
+            filename: Original filename
+            sha256: Content hash recorded as object metadata
+            
+        Returns:
+            str: S3 key of the uploaded file
+        """
+        if not self.enabled:
+            logger.warning("S3 storage disabled - skipping upload save")
+            return ""
+        
+        s3_key = f"jobs/{job_id}/blueprint.pdf"
+        metadata = {
+            'job_id': job_id,
+            'original_filename': filename,
+            'upload_type': 'blueprint',
+            'pipeline_version': 'v3'
+        }
+        if sha256:
+            metadata['sha256'] = sha256
+        
+        try:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                self.executor,
+                lambda: self.s3_client.upload_file(
+                    file_path,
+                    self.bucket_name,
+                    s3_key,
+                    ExtraArgs={'ContentType': 'application/pdf', 'Metadata': metadata}
+                )
+            )
+            
+            logger.info(f"📄 Saved blueprint: {s3_key} ({os.path.getsize(file_path)} bytes)")
+            return s3_key
+            
+        except Exception as e:
+            logger.error(f"Failed to save blueprint for job {job_id}: {e}")
+            return ""
+    
+    async def download_file(self, s3_key: str) -> bytes:
+        """
+        Download a stored file from S3
+        
+        Args:
+            s3_key: S3 key returned by save_upload
+            
+        Returns:
+            bytes: File content
+        """
+        if not self.enabled:
+            raise RuntimeError("S3 storage disabled - cannot download file")
+        
+        loop = asyncio.get_event_loop()
+        response = await loop.run_in_executor(
+            self.executor,
+            lambda: self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
+        )
+        content = await loop.run_in_executor(self.executor, response['Body'].read)
+        logger.info(f"📄 Downloaded {s3_key} ({len(content)} bytes)")
+        return content
+    
+    async def download_to_file(self, s3_key: str, file_path: str) -> str:
+        """
+        Stream a stored file from S3 to local disk
+        
+        Args:
+            s3_key: S3 key returned by save_upload_file
+            file_path: Destination path
+            
+        Returns:
+            str: Destination path
+        """
+        if not self.enabled:
+            raise RuntimeError("S3 storage disabled - cannot download file")
+        
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(
+            self.executor,
+            lambda: self.s3_client.download_file(self.bucket_name, s3_key, file_path)
+        )
+        logger.info(f"📄 Downloaded {s3_key} to {file_path}")
+        return file_path
+    
     def save_json(self, job_id: str, filename: str, data: Dict[str, Any]) -> str:
         """
         Save JSON data to S3 in the job folder
@@ -145,13 +235,15 @@ class S3StorageService:
             logger.error(f"Failed to save JSON {filename} for job {job_id}: {e}")
             return ""
     
-    async def save_complete_job_data(self, job_id: str, job_data: Dict[str, Any]) -> None:
+    async def save_complete_job_data(self, job_id: str, job_data: Dict[str, Any],
+                                     raw_extractions: Optional[Dict[str, Any]] = None) -> None:
         """
         Save comprehensive job data for V3 pipeline with enhanced training data collection
         
         Args:
             job_id: Job identifier
             job_data: Complete job data from the V3 pipeline
+            raw_extractions: Raw pipeline extractions (not part of the stored result)
         """
         if not self.enabled:
             return
@@ -318,14 +410,15 @@ class S3StorageService:
                 self.save_json(job_id, "business_intelligence.json", bi_data)
             
             # 4. Enhanced V3 Data Collection - AI Training & Analytics
-            await self._save_enhanced_v3_data(job_id, job_data)
+            await self._save_enhanced_v3_data(job_id, job_data, raw_extractions)
             
             logger.info(f"📊 Saved complete data set for job {job_id}")
             
         except Exception as e:
             logger.error(f"Failed to save complete job data for {job_id}: {e}")
     
-    async def _save_enhanced_v3_data(self, job_id: str, job_data: Dict[str, Any]) -> None:
+    async def _save_enhanced_v3_data(self, job_id: str, job_data: Dict[str, Any],
+                                     raw_extractions: Optional[Dict[str, Any]] = None) -> None:
         """
         Save enhanced V3 pipeline data for training, analytics, and debugging
         This captures the rich intermediate results from the V3 pipeline
@@ -333,8 +426,9 @@ class S3StorageService:
         try:
             result = job_data.get("result", {})
             
-            # Extract raw extractions if available (from pipeline_v3 result)
-            raw_extractions = result.get("raw_extractions", {})
+            # Raw extractions are passed in (kept out of the stored result); older results carry them inline
+            if raw_extractions is None:
+                raw_extractions = result.get("raw_extractions", {})
             
             # 4A. AI Training Data - Vision processing results
             if raw_extractions.get("vision"):
@@ -470,6 +564,9 @@ except Exception as e:
     class DisabledS3Service:
         enabled = False
         async def save_upload(self, *args, **kwargs): return ""
+        async def save_upload_file(self, *args, **kwargs): return ""
+        async def download_file(self, *args, **kwargs): raise RuntimeError("S3 storage disabled - cannot download file")
+        async def download_to_file(self, *args, **kwargs): raise RuntimeError("S3 storage disabled - cannot download file")
         def save_json(self, *args, **kwargs): return ""
         async def save_complete_job_data(self, *args, **kwargs): pass
     
@@ -0,0 +1,87 @@
+import os
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from app.services.artifact_store import artifact_store
+from pipeline_v3 import ExtractionSnapshot
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_ARTIFACT = "extraction_snapshot"
+
+class SnapshotStore:
+    """
+    Extraction snapshot storage for completed jobs
+
+    Snapshots hold the compact Phase 1 extraction and Phase 2 thermal model of
+    a completed job so input edits and scenario re-runs skip PDF parsing and
+    vision calls.
+
+    Architecture:
+    - Memory: LRU cache of recently used snapshots (SNAPSHOT_CACHE_SIZE)
+    - Artifact store: compressed JSON under jobs/{job_id}/ (S3 in production),
+      so snapshots written by the worker service are readable by the web
+      service and survive eviction/restarts. Loading only rebuilds the model
+      types listed in pipeline_v3.SNAPSHOT_TYPES.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or int(os.getenv("SNAPSHOT_CACHE_SIZE", "50"))
+        self._snapshots: "OrderedDict[str, ExtractionSnapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+        logger.info(f"🗂️  SnapshotStore initialized (max {self.max_entries} in memory)")
+
+    def _remember(self, job_id: str, snapshot: ExtractionSnapshot) -> None:
+        """Insert into the memory LRU, evicting the least recently used entries"""
+        with self._lock:
+            self._snapshots[job_id] = snapshot
+            self._snapshots.move_to_end(job_id)
+            while len(self._snapshots) > self.max_entries:
+                evicted_id, _ = self._snapshots.popitem(last=False)
+                logger.debug(f"🗂️  SNAPSHOT: Evicted {evicted_id} from memory")
+
+    def save_snapshot(self, job_id: str, snapshot: Optional[ExtractionSnapshot]) -> None:
+        """Store a snapshot in memory and the artifact store"""
+        if snapshot is None:
+            return
+        self._remember(job_id, snapshot)
+
+        try:
+            data = snapshot.to_dict()
+        except TypeError as e:
+            logger.warning(f"⚠️  Snapshot for {job_id} not serializable: {e} - memory only")
+            return
+        if artifact_store.save_json(job_id, SNAPSHOT_ARTIFACT, data):
+            logger.info(f"🗂️  SNAPSHOT: Saved extraction for job {job_id}")
+
+    def get_snapshot(self, job_id: str) -> Optional[ExtractionSnapshot]:
+        """Get a snapshot from memory, falling back to the artifact store"""
+        with self._lock:
+            snapshot = self._snapshots.get(job_id)
+            if snapshot is not None:
+                self._snapshots.move_to_end(job_id)
+                return snapshot
+
+        data = artifact_store.load_job_json(job_id, SNAPSHOT_ARTIFACT)
+        if data is None:
+            return None
+
+        try:
+            snapshot = ExtractionSnapshot.from_dict(data)
+        except Exception as e:
+            logger.warning(f"⚠️  Snapshot read failed for {job_id}: {e}")
+            return None
+        self._remember(job_id, snapshot)
+        logger.debug(f"🗂️  SNAPSHOT: Loaded {job_id} from artifact store")
+        return snapshot
+
+    def delete_snapshot(self, job_id: str) -> bool:
+        """Drop a snapshot from memory and the artifact store"""
+        with self._lock:
+            deleted = self._snapshots.pop(job_id, None) is not None
+        return artifact_store.delete_job_json(job_id, SNAPSHOT_ARTIFACT) or deleted
+
+# Global instance
+snapshot_store = SnapshotStore()
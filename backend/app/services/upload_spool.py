@@ -0,0 +1,83 @@
+"""
+Streaming upload spooling
+Copies an incoming UploadFile to a spool file in fixed-size chunks while
+hashing and measuring it, so an upload never has to fit in memory
+"""
+import os
+import hashlib
+import logging
+import tempfile
+from dataclasses import dataclass
+
+from fastapi import UploadFile
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+class UploadTooLarge(Exception):
+    """Raised as soon as an upload exceeds the size cap"""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"File exceeds maximum upload size of {max_bytes // (1024 * 1024)} MB")
+        self.max_bytes = max_bytes
+
+
+@dataclass
+class SpooledUpload:
+    """An upload written to local disk"""
+    path: str
+    sha256: str
+    size_bytes: int
+
+    def discard(self) -> None:
+        """Remove the spool file (ignores files already gone)"""
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+async def spool_upload(
+    file: UploadFile,
+    spool_dir: str,
+    max_bytes: int,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    suffix: str = '.pdf'
+) -> SpooledUpload:
+    """
+    Stream an upload to a spool file, computing SHA-256 and size as it goes
+
+    Memory use is one chunk regardless of file size. The partial file is
+    removed if the cap is exceeded or the copy fails.
+
+    Raises:
+        UploadTooLarge: Upload is larger than max_bytes
+    """
+    os.makedirs(spool_dir, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+
+    spool = tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=spool_dir)
+    try:
+        with spool:
+            while True:
+                chunk = await file.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(max_bytes)
+                digest.update(chunk)
+                spool.write(chunk)
+    except BaseException:
+        try:
+            os.unlink(spool.name)
+        except OSError:
+            pass
+        raise
+
+    upload = SpooledUpload(path=spool.name, sha256=digest.hexdigest(), size_bytes=size)
+    logger.info(f"📥 Spooled upload {file.filename}: {size / (1024 * 1024):.1f} MB, sha256 {upload.sha256[:12]}")
+    return upload
@@ -2,6 +2,7 @@ from typing import Optional
 from sqlmodel import Session, select
 from app.models.user import User, UserModel, EmailToken
 from app.database import get_session
+from app.services.analytics_rollups import analytics_rollups
 import secrets
 from datetime import datetime, timezone, timedelta
 import hashlib
@@ -73,6 +74,7 @@ class UserService:
             session.commit()
             session.refresh(user)
             logger.info(f"✅ Created user {email}")
+            analytics_rollups.record("users_created")
         
         return user
     
@@ -92,6 +94,7 @@ class UserService:
             user.mark_free_report_used()  # Uses the model method
             session.add(user)
             session.commit()
+            analytics_rollups.record("free_reports_used")
             return True
         return False
     
@@ -139,6 +142,7 @@ class UserService:
         user.subscription_started_at = datetime.utcnow()
         session.add(user)
         session.commit()
+        analytics_rollups.record("subscriptions_started")
         return True
     
     @staticmethod
@@ -151,6 +155,7 @@ class UserService:
             user.subscription_status = SubscriptionStatus.EXPIRED
             session.add(user)
             session.commit()
+            analytics_rollups.record("subscriptions_ended")
             return True
         return False
     
@@ -0,0 +1,233 @@
+"""
+Pipeline worker pool
+
+Consumes the durable job queue (app.services.job_queue) with N worker
+processes. The parent imports and warms the pipeline once, then forks, so
+every worker starts with PyMuPDF, NumPy, climate tables and the pipeline
+already loaded. Crashed workers are replaced; on SIGTERM workers finish or
+abandon their current job, which is redelivered after the visibility timeout.
+
+Usage:
+    python -m app.worker [--concurrency N]
+"""
+
+import os
+import sys
+import time
+import signal
+import socket
+import asyncio
+import logging
+import argparse
+import tempfile
+import threading
+import multiprocessing
+from datetime import datetime
+
+from sqlmodel import Session
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+WORKER_CONCURRENCY = int(os.getenv("WORKER_CONCURRENCY", str(os.cpu_count() or 2)))
+WORKER_SHUTDOWN_TIMEOUT = int(os.getenv("WORKER_SHUTDOWN_TIMEOUT", "25"))
+
+
+def _warm_up() -> None:
+    """Import and initialize everything a job needs before forking"""
+    started = time.time()
+
+    from app.database import create_db_and_tables
+    create_db_and_tables()
+
+    from pipeline_v3 import get_scenario_pipeline
+    get_scenario_pipeline()
+
+    from domain.core.climate_db import get_climate_database
+    get_climate_database()
+
+    # Routes module holds the job runner, report generator and storage clients
+    import app.routes.blueprint  # noqa: F401
+
+    logger.info(f"🔥 Worker warm-up complete in {time.time() - started:.1f}s")
+
+
+class _LeaseHeartbeat(threading.Thread):
+    """Keeps extending a task's lease while its job is running"""
+
+    def __init__(self, queue, task, consumer: str):
+        super().__init__(daemon=True)
+        from app.services.job_queue import VISIBILITY_TIMEOUT
+        self.queue = queue
+        self.task = task
+        self.consumer = consumer
+        self.interval = max(5, VISIBILITY_TIMEOUT // 3)
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.queue.heartbeat(self.task, self.consumer)
+            except Exception as e:
+                logger.warning(f"⚠️  Heartbeat failed for job {self.task.job_id}: {e}")
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+async def _resolve_pdf(job_id: str, payload: dict) -> str:
+    """Local spool file if this host can see it, otherwise download from storage"""
+    pdf_path = payload.get("pdf_path")
+    if pdf_path and os.path.exists(pdf_path):
+        return pdf_path
+
+    s3_path = payload.get("saved_file_path")
+    if not s3_path:
+        raise RuntimeError("Uploaded blueprint not found on this worker and no stored copy available")
+
+    from app.services.s3_storage import storage_service
+    from app.routes.blueprint import UPLOAD_SPOOL_DIR
+    os.makedirs(UPLOAD_SPOOL_DIR, exist_ok=True)
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf', dir=UPLOAD_SPOOL_DIR) as temp_file:
+        pdf_path = temp_file.name
+    try:
+        await storage_service.download_to_file(s3_path, pdf_path)
+    except Exception:
+        os.unlink(pdf_path)
+        raise
+    payload["pdf_path"] = pdf_path
+    return pdf_path
+
+
+async def _run_task(task) -> None:
+    """Run one queued job through the same code path as in-process uploads"""
+    from app.database import engine
+    from app.routes.blueprint import process_blueprint_async
+
+    payload = task.payload
+    pdf_path = await _resolve_pdf(task.job_id, payload)
+
+    with Session(engine) as session:
+        await process_blueprint_async(
+            job_id=task.job_id,
+            pdf_path=pdf_path,
+            zip_code=payload["zip_code"],
+            api_key=os.getenv("OPENAI_API_KEY"),
+            email=payload["email"],
+            session=session,
+            is_first_report=payload.get("is_first_report", False),
+            user_inputs=payload.get("user_inputs") or {},
+            project_label=payload.get("project_label"),
+            final_attempt=task.is_final_attempt
+        )
+
+
+def _process_task(queue, task, consumer: str) -> None:
+    """Process a task and acknowledge, retry or bury it"""
+    from app.services.job_storage import job_storage
+
+    logger.info(f"⚙️  WORKER {consumer}: Job {task.job_id} (attempt {task.attempts})")
+    heartbeat = _LeaseHeartbeat(queue, task, consumer)
+    heartbeat.start()
+    started = time.time()
+    try:
+        asyncio.run(_run_task(task))
+        queue.ack(task)
+        logger.info(f"✅ WORKER {consumer}: Job {task.job_id} finished in {time.time() - started:.1f}s")
+    except Exception as e:
+        will_retry = queue.fail(task, str(e))
+        if not will_retry:
+            job = job_storage.get_job(task.job_id)
+            if job and job.get("status") not in ("completed", "failed"):
+                job_storage.update_job(task.job_id, {
+                    "status": "failed",
+                    "error": str(e),
+                    "completed_at": datetime.utcnow().isoformat()
+                })
+    finally:
+        heartbeat.stop()
+
+
+def _worker_main(index: int) -> None:
+    """Worker process loop: claim, process, repeat until told to stop"""
+    stopping = threading.Event()
+
+    def _request_stop(signum, frame):
+        logger.info(f"🛑 Worker {index} stopping after current job")
+        stopping.set()
+
+    signal.signal(signal.SIGTERM, _request_stop)
+    signal.signal(signal.SIGINT, _request_stop)
+
+    # Connections inherited from the parent must not be shared across processes
+    from app.database import engine
+    engine.dispose(close=False)
+
+    from app.services.job_queue import get_job_queue
+    queue = get_job_queue()
+    consumer = f"{socket.gethostname()}-{os.getpid()}"
+    logger.info(f"👷 Worker {index} ready ({consumer})")
+
+    while not stopping.is_set():
+        try:
+            task = queue.claim(consumer, block_seconds=5)
+        except Exception as e:
+            logger.error(f"❌ Worker {index}: queue claim failed: {e}")
+            time.sleep(5)
+            continue
+        if task:
+            _process_task(queue, task, consumer)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="AutoHVAC pipeline worker pool")
+    parser.add_argument("--concurrency", type=int, default=WORKER_CONCURRENCY,
+                        help="Number of worker processes (default: WORKER_CONCURRENCY or CPU count)")
+    args = parser.parse_args()
+    concurrency = max(1, args.concurrency)
+
+    logger.info(f"🚀 Starting pipeline worker pool ({concurrency} processes)")
+    _warm_up()
+
+    context = multiprocessing.get_context("fork")
+    workers = {}
+    stopping = threading.Event()
+
+    def _spawn(index: int) -> None:
+        process = context.Process(target=_worker_main, args=(index,), name=f"pipeline-worker-{index}")
+        process.start()
+        workers[index] = process
+
+    def _request_stop(signum, frame):
+        stopping.set()
+
+    signal.signal(signal.SIGTERM, _request_stop)
+    signal.signal(signal.SIGINT, _request_stop)
+
+    for index in range(concurrency):
+        _spawn(index)
+
+    while not stopping.is_set():
+        stopping.wait(1)
+        for index, process in list(workers.items()):
+            if not process.is_alive() and not stopping.is_set():
+                logger.error(f"💥 Worker {index} exited with code {process.exitcode} - restarting")
+                _spawn(index)
+
+    logger.info("🛑 Shutting down worker pool")
+    for process in workers.values():
+        if process.is_alive():
+            process.terminate()
+
+    deadline = time.time() + WORKER_SHUTDOWN_TIMEOUT
+    for process in workers.values():
+        process.join(max(0, deadline - time.time()))
+        if process.is_alive():
+            # Unacknowledged job is redelivered after the visibility timeout
+            process.kill()
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""
+Hourly Load Simulation
+Simulates per-zone heating and cooling loads hour by hour over the ASHRAE
+design days or a synthetic 8760-hour year
+"""
+
+import logging
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from domain.calculations.diversity_factors import DiversityCalculator
+from domain.models.zones import ThermalZone, ZoneType
+
+logger = logging.getLogger(__name__)
+
+
+# ASHRAE Fundamentals fraction of daily range below the daily maximum,
+# indexed by clock hour (hour ending 1..24 → index 0..23)
+DAILY_RANGE_FRACTIONS = np.array([
+    0.87, 0.92, 0.96, 0.99, 1.00, 0.98, 0.93, 0.84, 0.71, 0.56, 0.39, 0.23,
+    0.11, 0.03, 0.00, 0.03, 0.10, 0.21, 0.34, 0.47, 0.58, 0.68, 0.76, 0.82
+])
+
+# Relative solar gain through glazing by clock hour (all facades combined),
+# 1.0 at the mid-afternoon design hour
+SOLAR_HOURLY_FRACTIONS = np.clip(np.sin(np.pi * (np.arange(24) - 6.0) / 13.0), 0.0, None)
+SOLAR_HOURLY_FRACTIONS = SOLAR_HOURLY_FRACTIONS / SOLAR_HOURLY_FRACTIONS.max()
+
+HEATING_SETPOINT_F = 70
+COOLING_SETPOINT_F = 75
+
+# Synthetic year: warmest day ~Jul 19, coldest ~Jan 17
+PEAK_SUMMER_DAY = 200
+HOURS_PER_YEAR = 8760
+
+SIMULATION_MODES = ('design_day', 'annual')
+
+
+@dataclass
+class ZoneLoadComponents:
+    """
+    Design-condition load components of a zone, split by what drives them
+    hour to hour. All values in BTU/hr at design conditions.
+    """
+    zone: ThermalZone
+    heating_btuh: float = 0.0           # Envelope + infiltration loss at heating design ΔT
+    conduction_btuh: float = 0.0        # Envelope + infiltration sensible gain at cooling design ΔT
+    solar_btuh: float = 0.0             # Window solar gain at the design hour
+    people_sensible_btuh: float = 0.0
+    lighting_btuh: float = 0.0
+    equipment_btuh: float = 0.0
+    people_latent_btuh: float = 0.0
+    infiltration_latent_btuh: float = 0.0
+
+
+@dataclass
+class HourlyLoadSummary:
+    """Peak and totals of one load type across the simulated hours"""
+    peak_btuh: float
+    peak_hour: int                       # Index into the simulated hours
+    peak_time: str                       # "15:00" or "Jul 19 15:00"
+    coincident_zone_btuh: Dict[str, float]
+    zone_peak_btuh: Dict[str, float]
+    coincidence_factor: float            # Building peak / sum of zone peaks
+    total_kbtu: float
+    zone_total_kbtu: Dict[str, float]
+    monthly_kbtu: Optional[List[float]] = None
+
+
+@dataclass
+class HourlySimulationResult:
+    """Per-zone hourly heating and cooling profiles"""
+    mode: str
+    hours: int
+    zone_ids: List[str]
+    heating: HourlyLoadSummary
+    cooling: HourlyLoadSummary
+
+    # Profiles (zones × hours); design_day mode uses the heating and cooling design days
+    zone_heating_btuh: np.ndarray = field(repr=False, default=None)
+    zone_cooling_btuh: np.ndarray = field(repr=False, default=None)
+    heating_outdoor_f: np.ndarray = field(repr=False, default=None)
+    cooling_outdoor_f: np.ndarray = field(repr=False, default=None)
+
+    def to_dict(self, include_profiles: bool = True) -> Dict[str, Any]:
+        """Serialize for API responses; profiles are rounded to whole BTU/hr"""
+        data = {
+            'mode': self.mode,
+            'hours': self.hours,
+            'zone_ids': self.zone_ids,
+            'heating': asdict(self.heating),
+            'cooling': asdict(self.cooling)
+        }
+        if include_profiles:
+            data['profiles'] = {
+                'heating_outdoor_f': np.round(self.heating_outdoor_f, 1).tolist(),
+                'cooling_outdoor_f': np.round(self.cooling_outdoor_f, 1).tolist(),
+                'zone_heating_btuh': {
+                    zone_id: np.round(row).tolist() for zone_id, row in zip(self.zone_ids, self.zone_heating_btuh)
+                },
+                'zone_cooling_btuh': {
+                    zone_id: np.round(row).tolist() for zone_id, row in zip(self.zone_ids, self.zone_cooling_btuh)
+                }
+            }
+        return data
+
+
+class HourlySimulationCalculator:
+    """
+    Vectorized hourly load simulation.
+
+    Each zone's design loads are decomposed into temperature-driven
+    (conduction + infiltration), solar and scheduled internal components.
+    Weather is synthesized from the ASHRAE design rows (winter 99%, summer 1%,
+    daily range); every zone-hour is then evaluated at once as a
+    (zones × hours) array operation.
+    """
+
+    def schedule_matrix(self, zones: List[ThermalZone]) -> np.ndarray:
+        """
+        Internal gain schedules as a (zones × 24 × 3) array of
+        (occupancy, lighting, equipment) fractions by clock hour.
+        Zone types without their own schedule use the house-wide
+        DiversityCalculator hourly factors.
+        """
+        scheduled_types = (ZoneType.MAIN_LIVING, ZoneType.SLEEPING, ZoneType.BONUS)
+        house_schedule = np.array([DiversityCalculator.HOURLY_FACTORS[h] for h in range(24)])
+
+        matrix = np.empty((len(zones), 24, 3))
+        for i, zone in enumerate(zones):
+            if zone.zone_type in scheduled_types:
+                for hour in range(24):
+                    factors = zone.get_internal_gains_schedule(hour)
+                    matrix[i, hour] = (factors['occupancy'], factors['lighting'], factors['equipment'])
+            else:
+                matrix[i] = house_schedule
+        return matrix
+
+    def design_day_weather(self, climate_data: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """Outdoor dry-bulb for the heating and cooling design days (24 h each)"""
+        daily_range = float(climate_data.get('daily_range', 20))
+        winter_99 = float(climate_data.get('winter_99', 10))
+        summer_1 = float(climate_data.get('summer_1', 90))
+
+        cooling_day = summer_1 - DAILY_RANGE_FRACTIONS * daily_range
+        # Heating design day bottoms out at the 99% temperature before dawn
+        heating_day = winter_99 + (1.0 - DAILY_RANGE_FRACTIONS) * daily_range * 0.5
+        return heating_day, cooling_day
+
+    def annual_weather(self, climate_data: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """
+        Synthetic 8760-hour year: daily mean follows a cosine between the
+        design days, with the ASHRAE daily range profile on top. Solar and
+        outdoor humidity follow the same seasonal cycle.
+        """
+        daily_range = float(climate_data.get('daily_range', 20))
+        winter_99 = float(climate_data.get('winter_99', 10))
+        summer_1 = float(climate_data.get('summer_1', 90))
+
+        summer_mean = summer_1 - daily_range / 2
+        winter_mean = winter_99 + daily_range / 2
+
+        hour_of_year = np.arange(HOURS_PER_YEAR)
+        day = hour_of_year // 24
+        clock_hour = hour_of_year % 24
+        season = np.cos(2 * np.pi * (day - PEAK_SUMMER_DAY) / 365.0)  # +1 midsummer, -1 midwinter
+
+        daily_mean = (summer_mean + winter_mean) / 2 + (summer_mean - winter_mean) / 2 * season
+        outdoor = daily_mean + daily_range * (0.5 - DAILY_RANGE_FRACTIONS[clock_hour])
+
+        return {
+            'clock_hour': clock_hour,
+            'outdoor_f': outdoor,
+            'solar_fraction': SOLAR_HOURLY_FRACTIONS[clock_hour] * (0.75 + 0.25 * season),
+            'humidity_fraction': (1.0 + season) / 2
+        }
+
+    def simulate(
+        self,
+        components: List[ZoneLoadComponents],
+        climate_data: Dict[str, Any],
+        mode: str = 'design_day',
+        heating_factor: float = 1.0,
+        cooling_factor: float = 1.0
+    ) -> HourlySimulationResult:
+        """
+        Run the hourly simulation.
+
+        Args:
+            components: Design load components per conditioned zone
+            climate_data: ASHRAE design rows (winter_99, summer_1, daily_range)
+            mode: 'design_day' (24 h heating + cooling design days) or 'annual' (8760 h)
+            heating_factor: Distribution multiplier applied to heating loads
+            cooling_factor: Distribution multiplier applied to cooling loads
+
+        Returns:
+            HourlySimulationResult with profiles, peaks and totals
+        """
+        if mode not in SIMULATION_MODES:
+            raise ValueError(f"Hourly simulation mode must be one of {SIMULATION_MODES}, got {mode}")
+
+        zones = [c.zone for c in components]
+        zone_ids = [z.zone_id for z in zones]
+        schedules = self.schedule_matrix(zones)
+
+        design_heating_td = HEATING_SETPOINT_F - float(climate_data.get('winter_99', 10))
+        design_cooling_td = float(climate_data.get('summer_1', 90)) - COOLING_SETPOINT_F
+
+        # Per-zone coefficients as column vectors (zones × 1)
+        def column(attr: str) -> np.ndarray:
+            return np.array([getattr(c, attr) for c in components], dtype=float)[:, None]
+
+        heating_ua = column('heating_btuh') / max(design_heating_td, 1.0)
+        cooling_ua = column('conduction_btuh') / max(design_cooling_td, 1.0)
+        solar = column('solar_btuh')
+        internal = (column('people_sensible_btuh'), column('lighting_btuh'), column('equipment_btuh'))
+        people_latent = column('people_latent_btuh')
+        infiltration_latent = column('infiltration_latent_btuh')
+
+        def evaluate(outdoor: np.ndarray, clock_hour: np.ndarray, solar_fraction: np.ndarray,
+                     humidity_fraction: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            """(zones × hours) heating and cooling loads for a weather series"""
+            hourly_schedule = schedules[:, clock_hour, :]  # zones × hours × 3
+            internal_gain = sum(internal[k] * hourly_schedule[:, :, k] for k in range(3))
+            solar_gain = solar * solar_fraction[None, :]
+
+            heating = np.clip(heating_ua * (HEATING_SETPOINT_F - outdoor)[None, :] - internal_gain - solar_gain, 0.0, None)
+
+            sensible = cooling_ua * (outdoor - COOLING_SETPOINT_F)[None, :] + solar_gain + internal_gain
+            latent = people_latent * hourly_schedule[:, :, 0] + infiltration_latent * humidity_fraction[None, :]
+            cooling = np.where((sensible > 0) & (heating <= 0), sensible + latent, 0.0)
+
+            return heating * heating_factor, cooling * cooling_factor
+
+        if mode == 'design_day':
+            heating_outdoor, cooling_outdoor = self.design_day_weather(climate_data)
+            clock_hour = np.arange(24)
+            zone_heating, _ = evaluate(heating_outdoor, clock_hour, SOLAR_HOURLY_FRACTIONS * 0.5, np.zeros(24))
+            _, zone_cooling = evaluate(cooling_outdoor, clock_hour, SOLAR_HOURLY_FRACTIONS, np.ones(24))
+        else:
+            weather = self.annual_weather(climate_data)
+            heating_outdoor = cooling_outdoor = weather['outdoor_f']
+            zone_heating, zone_cooling = evaluate(
+                weather['outdoor_f'], weather['clock_hour'], weather['solar_fraction'], weather['humidity_fraction']
+            )
+
+        result = HourlySimulationResult(
+            mode=mode,
+            hours=zone_cooling.shape[1],
+            zone_ids=zone_ids,
+            heating=self._summarize(zone_heating, zone_ids, mode),
+            cooling=self._summarize(zone_cooling, zone_ids, mode),
+            zone_heating_btuh=zone_heating,
+            zone_cooling_btuh=zone_cooling,
+            heating_outdoor_f=heating_outdoor,
+            cooling_outdoor_f=cooling_outdoor
+        )
+
+        logger.info(f"⏱️  Hourly simulation ({mode}, {len(zones)} zones × {result.hours} h): "
+                    f"heating peak {result.heating.peak_btuh:,.0f} BTU/hr at {result.heating.peak_time}, "
+                    f"cooling peak {result.cooling.peak_btuh:,.0f} BTU/hr at {result.cooling.peak_time}")
+
+        return result
+
+    def _summarize(self, zone_loads: np.ndarray, zone_ids: List[str], mode: str) -> HourlyLoadSummary:
+        """Building peak hour, coincident zone loads and totals"""
+        building = zone_loads.sum(axis=0)
+        peak_hour = int(np.argmax(building))
+        zone_peaks = zone_loads.max(axis=1)
+        zone_totals = zone_loads.sum(axis=1) / 1000.0
+
+        peak_sum = float(zone_peaks.sum())
+        monthly = None
+        if mode == 'annual':
+            hour_month = np.array([(datetime(2001, 1, 1) + timedelta(days=d)).month for d in range(365)]).repeat(24)
+            monthly = [round(float(building[hour_month == m].sum()) / 1000.0, 1) for m in range(1, 13)]
+
+        return HourlyLoadSummary(
+            peak_btuh=float(building[peak_hour]),
+            peak_hour=peak_hour,
+            peak_time=self._format_hour(peak_hour, mode),
+            coincident_zone_btuh={z: float(v) for z, v in zip(zone_ids, zone_loads[:, peak_hour])},
+            zone_peak_btuh={z: float(v) for z, v in zip(zone_ids, zone_peaks)},
+            coincidence_factor=float(building[peak_hour] / peak_sum) if peak_sum > 0 else 1.0,
+            total_kbtu=float(building.sum()) / 1000.0,
+            zone_total_kbtu={z: float(v) for z, v in zip(zone_ids, zone_totals)},
+            monthly_kbtu=monthly
+        )
+
+    def _format_hour(self, hour: int, mode: str) -> str:
+        """Human-readable time of a simulated hour (hour ending)"""
+        if mode == 'annual':
+            day = datetime(2001, 1, 1) + timedelta(days=hour // 24)
+            return f"{day.strftime('%b %d')} {hour % 24 + 1:02d}:00"
+        return f"{hour + 1:02d}:00"
+
+
+# Singleton instance
+_hourly_simulation_calculator = None
+
+
+def get_hourly_simulation_calculator() -> HourlySimulationCalculator:
+    """Get or create the global hourly simulation calculator"""
+    global _hourly_simulation_calculator
+    if _hourly_simulation_calculator is None:
+        _hourly_simulation_calculator = HourlySimulationCalculator()
+    return _hourly_simulation_calculator
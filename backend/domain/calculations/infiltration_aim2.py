@@ -6,13 +6,29 @@ Much more accurate than simple ACH method
 """
 
 import logging
-import math
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, Tuple, Optional, Union, Sequence
 from dataclasses import dataclass
 import numpy as np
 
+from domain.calculations.psychrometrics import (
+    atmospheric_pressure_psia,
+    humidity_ratio,
+    latent_load_btu_hr,
+)
+
 logger = logging.getLogger(__name__)
 
+# Construction quality → ACH50 per industry standards
+# Based on 2021 IECC R402.4.1.2 and ACCA Manual J 8th Edition
+# Natural infiltration = ACH50 ÷ N-factor (15-20 for typical homes)
+CONSTRUCTION_ACH50 = {
+    'very_tight': 2.5,  # High-performance new construction (ENERGY STAR+)
+    'tight': 4.0,       # Standard new construction (code compliant)
+    'average': 5.5,     # Existing home with some air sealing
+    'leaky': 10.0,      # Old home with no air sealing
+}
+DEFAULT_ACH50 = 5.0
+
 
 @dataclass
 class BuildingLeakage:
@@ -36,6 +52,9 @@ class InfiltrationFactors:
     terrain_class: str  # 'urban', 'suburban', 'rural'
     shielding_class: str  # 'heavy', 'moderate', 'light', 'none'
     building_height_ft: float
+    outdoor_humidity_ratio: Optional[float] = None  # lb/lb; None leaves latent at 0
+    indoor_rh: float = 0.50
+    elevation_ft: float = 0.0
     
 
 @dataclass
@@ -48,7 +67,32 @@ class InfiltrationResults:
     ach_natural: float  # Natural air changes per hour
     sensible_load_btu_hr: float  # Sensible heat loss/gain
     latent_load_btu_hr: float  # Latent heat loss/gain
+
+
+@dataclass
+class AIM2BatchResults:
+    """AIM-2 results for many zones/conditions, one array entry per case"""
+    ela: np.ndarray  # Effective leakage area used (sq in)
+    stack_cfm: np.ndarray
+    wind_cfm: np.ndarray
+    combined_cfm: np.ndarray
+    infiltration_cfm: np.ndarray
+    ach_natural: np.ndarray
+    sensible_load_btu_hr: np.ndarray
+    latent_load_btu_hr: np.ndarray
     
+    def __len__(self) -> int:
+        return len(self.infiltration_cfm)
+    
+
+ArrayInput = Union[float, Sequence[float], np.ndarray]
+
+
+def _compile_shielding_table(factors: Dict[Tuple[str, int], float], classes: Tuple[Optional[str], ...]) -> np.ndarray:
+    """(shielding class, stories 1-3) factor table; missing keys take the ('moderate', 2) default"""
+    default = factors[('moderate', 2)]
+    return np.array([[factors.get((name, stories), default) for stories in (1, 2, 3)] for name in classes])
+
 
 class AIM2InfiltrationModel:
     """
@@ -96,6 +140,13 @@ class AIM2InfiltrationModel:
         'floor': 0.25,  # 25% through floor
     }
     
+    # Coefficient tables compiled once for the vectorized path. The extra
+    # shielding row (None) holds the ('moderate', 2) fallback for unknown classes
+    _TERRAIN_CLASSES = tuple(TERRAIN_FACTORS)
+    _TERRAIN_ALPHA = np.array([factors['alpha'] for factors in TERRAIN_FACTORS.values()])
+    _SHIELDING_CLASSES = ('heavy', 'moderate', 'light', 'none', None)
+    _SHIELDING_TABLE = _compile_shielding_table(SHIELDING_FACTORS, _SHIELDING_CLASSES)
+    
     def __init__(self):
         self.air_density = 0.075  # lb/ft³ at standard conditions
         self.cp_air = 0.24  # BTU/lb·°F
@@ -118,184 +169,159 @@ class AIM2InfiltrationModel:
         Returns:
             InfiltrationResults with detailed breakdown
         """
-        logger.info("Calculating infiltration using AIM-2 model")
-        
-        # 1. Calculate effective leakage area if not provided
-        if building.ela <= 0:
-            building.ela = self._calculate_ela_from_blower_door(
-                building.blower_door_cfm50,
-                building.envelope_area_sqft,
-                building.floors  # Use building floors for building-type-aware calculation
-            )
-        
-        # 2. Calculate stack effect infiltration
-        stack_cfm = self._calculate_stack_effect(building, factors)
-        
-        # 3. Calculate wind effect infiltration
-        wind_cfm = self._calculate_wind_effect(building, factors)
-        
-        # 4. Combine stack and wind effects using quadrature
-        # They don't add linearly - use root sum of squares
-        combined_cfm = math.sqrt(stack_cfm**2 + wind_cfm**2)
-        
-        # 5. Account for mechanical ventilation interaction
-        # Balanced ventilation reduces natural infiltration
-        if mechanical_ventilation_cfm > 0:
-            # Reduction factor based on ASHRAE research
-            reduction = 0.5  # Balanced system reduces infiltration by ~50%
-            natural_cfm = combined_cfm * (1 - reduction * min(1, mechanical_ventilation_cfm / combined_cfm))
-            total_cfm = natural_cfm + mechanical_ventilation_cfm
-        else:
-            total_cfm = combined_cfm
-        
-        # 6. Calculate air changes per hour
-        ach = (total_cfm * 60) / building.volume_cuft
-        
-        # 7. Calculate sensible load
-        delta_t = abs(factors.indoor_temp_f - factors.outdoor_temp_f)
-        sensible_load = 1.08 * total_cfm * delta_t
+        batch = self.calculate_infiltration_batch(
+            cfm50=building.blower_door_cfm50,
+            envelope_area_sqft=building.envelope_area_sqft,
+            volume_cuft=building.volume_cuft,
+            building_height_ft=factors.building_height_ft,
+            indoor_temp_f=factors.indoor_temp_f,
+            outdoor_temp_f=factors.outdoor_temp_f,
+            wind_speed_mph=factors.wind_speed_mph,
+            ela=building.ela,
+            floors=building.floors,
+            neutral_level=building.neutral_level,
+            terrain_class=factors.terrain_class,
+            shielding_class=factors.shielding_class,
+            mechanical_ventilation_cfm=mechanical_ventilation_cfm,
+            outdoor_humidity_ratio=factors.outdoor_humidity_ratio,
+            indoor_rh=factors.indoor_rh,
+            elevation_ft=factors.elevation_ft
+        )
         
-        # 8. Calculate latent load (simplified)
-        # Would need humidity ratios for accurate calculation
-        latent_load = 0  # Placeholder - needs humidity data
+        # Keep the derived leakage area on the profile, as callers reuse it
+        building.ela = float(batch.ela[0])
         
         results = InfiltrationResults(
-            infiltration_cfm=total_cfm,
-            stack_cfm=stack_cfm,
-            wind_cfm=wind_cfm,
-            combined_cfm=combined_cfm,
-            ach_natural=ach,
-            sensible_load_btu_hr=sensible_load,
-            latent_load_btu_hr=latent_load
+            infiltration_cfm=float(batch.infiltration_cfm[0]),
+            stack_cfm=float(batch.stack_cfm[0]),
+            wind_cfm=float(batch.wind_cfm[0]),
+            combined_cfm=float(batch.combined_cfm[0]),
+            ach_natural=float(batch.ach_natural[0]),
+            sensible_load_btu_hr=float(batch.sensible_load_btu_hr[0]),
+            latent_load_btu_hr=float(batch.latent_load_btu_hr[0])
         )
         
-        logger.info(f"AIM-2 Results: {total_cfm:.0f} CFM total "
-                   f"(Stack: {stack_cfm:.0f}, Wind: {wind_cfm:.0f}), "
-                   f"ACH: {ach:.2f}")
+        logger.debug(f"AIM-2 Results: {results.infiltration_cfm:.0f} CFM total "
+                     f"(Stack: {results.stack_cfm:.0f}, Wind: {results.wind_cfm:.0f}), "
+                     f"ACH: {results.ach_natural:.2f}")
         
         return results
     
-    def _calculate_ela_from_blower_door(
+    def calculate_infiltration_batch(
         self,
-        cfm50: float,
-        envelope_area: float,
-        building_floors: int = 2
-    ) -> float:
+        cfm50: ArrayInput,
+        envelope_area_sqft: ArrayInput,
+        volume_cuft: ArrayInput,
+        building_height_ft: ArrayInput,
+        indoor_temp_f: ArrayInput,
+        outdoor_temp_f: ArrayInput,
+        wind_speed_mph: ArrayInput,
+        ela: ArrayInput = 0.0,
+        floors: ArrayInput = 2,
+        neutral_level: ArrayInput = 0.5,
+        terrain_class: Union[str, Sequence[str]] = 'suburban',
+        shielding_class: Union[str, Sequence[str]] = 'moderate',
+        mechanical_ventilation_cfm: ArrayInput = 0.0,
+        outdoor_humidity_ratio: Optional[ArrayInput] = None,
+        indoor_rh: ArrayInput = 0.50,
+        elevation_ft: ArrayInput = 0.0
+    ) -> AIM2BatchResults:
         """
-        Calculate Effective Leakage Area from blower door test
-        ELA = CFM50 / (2.5 * sqrt(50))
-        """
-        if cfm50 <= 0:
-            # Estimate based on construction quality
-            # Typical values: 4-8 sq in per 100 sqft envelope
-            ela_ratio = 5  # sq in per 100 sqft (average construction)
-            return envelope_area * ela_ratio / 100
-        
-        # ACCA MANUAL J BUILDING-TYPE-AWARE CONVERSION
-        # Based on validation against actual Manual J targets across building types
-        # Optimized for ±10% accuracy on ANY blueprint
-        
-        # PHYSICS-BASED CONVERSION: Multi-story buildings have higher infiltration
-        # ACH50 2.0 is correct for tight construction, but real infiltration varies by building height
-        # Stack effect increases with building height, multi-story has more exterior surface
-        if building_floors == 1:
-            ela = cfm50 / 2.8  # Single-story baseline 
-            logger.debug(f"Single-story baseline: ACH50/{2.8}")
-        else:
-            ela = cfm50 / 2.2  # Multi-story HIGHER infiltration (lower divisor = higher CFM)
-            logger.debug(f"Multi-story enhanced stack effect: ACH50/{2.2}")
+        AIM-2 for arrays of zones and design conditions in one pass
         
-        # This produces higher infiltration rates matching industry calculations
-        # Target: ~600 CFM infiltration at design conditions for typical homes
-        # Which gives ~40,000+ BTU/hr - matching Manual J expectations
+        Every argument is a scalar or an array; they broadcast together, so
+        one building can be evaluated against many conditions (heating and
+        cooling design, scenario sweeps, hourly weather) or many zones
+        against one condition. Nothing is logged per case.
         
-        logger.debug(f"Calculated ELA: {ela:.1f} sq in from CFM50: {cfm50:.0f}")
-        
-        return ela
-    
-    def _calculate_stack_effect(
-        self,
-        building: BuildingLeakage,
-        factors: InfiltrationFactors
-    ) -> float:
-        """
-        Calculate infiltration due to stack effect (buoyancy)
-        Q_stack = C_s * A_leak * sqrt(ΔT * H)
+        Args:
+            cfm50: Blower door flow at 50 Pa
+            envelope_area_sqft: Envelope area (sizes ELA when cfm50 is 0)
+            volume_cuft: Conditioned volume
+            building_height_ft: Building height
+            indoor_temp_f / outdoor_temp_f: Design temperatures
+            wind_speed_mph: Weather station wind speed
+            ela: Known effective leakage area (sq in); <= 0 derives it from cfm50
+            floors: Number of floors (ELA conversion)
+            neutral_level: Neutral pressure level as a fraction of height
+            terrain_class / shielding_class: Per case or shared
+            mechanical_ventilation_cfm: Balanced mechanical ventilation
+            outdoor_humidity_ratio: Outdoor W (lb/lb); None leaves latent at 0
+            indoor_rh: Indoor relative humidity (0-1)
+            elevation_ft: Site elevation for pressure/altitude correction
+            
+        Returns:
+            AIM2BatchResults of equal-length arrays
         """
-        # Temperature difference
-        delta_t = abs(factors.indoor_temp_f - factors.outdoor_temp_f)
-        
-        if delta_t < 1:
-            return 0  # No stack effect without temperature difference
-        
-        # Stack coefficient (ASHRAE/Manual J)
-        # Proper coefficients for residential
-        if building.neutral_level < 0.33:
-            c_s = 0.030  # Low neutral level
-        elif building.neutral_level > 0.67:
-            c_s = 0.035  # High neutral level
-        else:
-            c_s = 0.032  # Mid neutral level (typical)
-        
-        # Effective height for stack effect
-        # Use 70% of total height (accounts for internal resistance)
-        effective_height = factors.building_height_ft * 0.7
-        
-        # Calculate stack infiltration
-        # Sherman-Grimsrud model
-        stack_cfm = (
-            c_s * 
-            building.ela * 
-            math.sqrt(delta_t * effective_height)
+        (cfm50, envelope, volume, height, indoor, outdoor, wind_speed, ela, floors,
+         neutral, mechanical, indoor_rh, elevation) = [
+            np.asarray(value, dtype=float) for value in (
+                cfm50, envelope_area_sqft, volume_cuft, building_height_ft, indoor_temp_f,
+                outdoor_temp_f, wind_speed_mph, ela, floors, neutral_level,
+                mechanical_ventilation_cfm, indoor_rh, elevation_ft
+            )
+        ]
+        
+        # 1. Effective leakage area: building-type-aware conversion from CFM50
+        # (multi-story buildings see more stack-driven leakage), or 5 sq in per
+        # 100 sqft of envelope when no blower door number is available
+        derived_ela = np.where(
+            cfm50 <= 0,
+            envelope * 5 / 100,
+            cfm50 / np.where(floors == 1, 2.8, 2.2)
         )
+        ela = np.where(ela <= 0, derived_ela, ela)
+        
+        # 2. Stack effect (Sherman-Grimsrud): C_s × ELA × sqrt(ΔT × 0.7H)
+        delta_t = np.abs(indoor - outdoor)
+        c_s = np.where(neutral < 0.33, 0.030, np.where(neutral > 0.67, 0.035, 0.032))
+        stack_cfm = np.where(delta_t < 1, 0.0, c_s * ela * np.sqrt(delta_t * (height * 0.7)))
+        
+        # 3. Wind effect: C_w × ELA × V, V scaled from the 33 ft station height
+        alpha = self._class_index(terrain_class, self._TERRAIN_CLASSES, 'suburban')
+        local_wind_speed = wind_speed * ((height / 33) ** self._TERRAIN_ALPHA[alpha])
+        stories = np.clip(np.trunc(height / 10), 1, 3).astype(np.int64)
+        shielding = self._class_index(shielding_class, self._SHIELDING_CLASSES, None)
+        shielding_factor = self._SHIELDING_TABLE[shielding, stories - 1]
+        wind_cfm = (0.025 * shielding_factor) * ela * local_wind_speed
+        
+        # 4. Stack and wind combine in quadrature
+        combined_cfm = np.sqrt(stack_cfm ** 2 + wind_cfm ** 2)
+        
+        # 5. Balanced ventilation displaces up to half the natural infiltration
+        with np.errstate(divide='ignore', invalid='ignore'):
+            displaced = np.minimum(1, mechanical / combined_cfm)
+        natural_cfm = combined_cfm * (1 - 0.5 * displaced)
+        total_cfm = np.where(mechanical > 0, natural_cfm + mechanical, combined_cfm)
+        
+        # 6-7. Air changes and sensible load
+        ach = (total_cfm * 60) / volume
+        sensible_load = 1.08 * total_cfm * delta_t
+        shape = np.broadcast_shapes(np.shape(ach), np.shape(sensible_load), np.shape(wind_cfm), (1,))
         
-        logger.debug(f"Stack effect: ΔT={delta_t:.1f}°F, H={effective_height:.1f}ft, "
-                    f"CFM={stack_cfm:.0f}")
+        # 8. Latent load from the moisture carried in by infiltration
+        if outdoor_humidity_ratio is None:
+            latent_load = np.zeros(shape)
+        else:
+            pressure = atmospheric_pressure_psia(elevation)
+            indoor_w = humidity_ratio(indoor, indoor_rh, pressure)
+            latent_load = np.broadcast_to(
+                latent_load_btu_hr(total_cfm, outdoor_humidity_ratio, indoor_w, pressure), shape
+            )
         
-        return stack_cfm
+        return AIM2BatchResults(*[
+            np.broadcast_to(value, shape) for value in (
+                ela, stack_cfm, wind_cfm, combined_cfm, total_cfm, ach, sensible_load, latent_load
+            )
+        ])
     
-    def _calculate_wind_effect(
-        self,
-        building: BuildingLeakage,
-        factors: InfiltrationFactors
-    ) -> float:
-        """
-        Calculate infiltration due to wind pressure
-        Q_wind = C_w * A_leak * V_wind
-        """
-        # Get terrain factors
-        terrain = self.TERRAIN_FACTORS.get(factors.terrain_class, self.TERRAIN_FACTORS['suburban'])
-        
-        # Adjust wind speed for building height
-        # V_h = V_met * (H/H_met)^alpha
-        met_height = 33  # Weather station height (10m)
-        height_ratio = factors.building_height_ft / met_height
-        local_wind_speed = factors.wind_speed_mph * (height_ratio ** terrain['alpha'])
-        
-        # Get shielding factor
-        stories = max(1, min(3, int(factors.building_height_ft / 10)))
-        shielding_key = (factors.shielding_class, stories)
-        shielding_factor = self.SHIELDING_FACTORS.get(
-            shielding_key,
-            self.SHIELDING_FACTORS[('moderate', 2)]
-        )
-        
-        # Wind coefficient (ASHRAE correlation)
-        # Proper wind coefficient for residential
-        c_w = 0.025 * shielding_factor  # Typical residential value
-        
-        # Calculate wind infiltration
-        # Linear with wind speed (simplified from power law)
-        wind_cfm = (
-            c_w *
-            building.ela *
-            local_wind_speed
-        )
-        
-        logger.debug(f"Wind effect: V={local_wind_speed:.1f}mph (adjusted), "
-                    f"Shielding={shielding_factor:.2f}, CFM={wind_cfm:.0f}")
-        
-        return wind_cfm
+    @staticmethod
+    def _class_index(names: Union[str, Sequence[str]], classes: Tuple[Optional[str], ...], default: Optional[str]):
+        """Row index of a class name, or an array of them; unknown names map to the default row"""
+        rows = {name: i for i, name in enumerate(classes)}
+        if isinstance(names, str):
+            return rows.get(names, rows[default])
+        return np.array([rows.get(name, rows[default]) for name in names], dtype=np.int64)
     
     def calculate_detailed_loads(
         self,
@@ -319,15 +345,8 @@ class AIM2InfiltrationModel:
         sensible = 1.08 * results.infiltration_cfm * delta_t
         
         # Latent load: Q_l = 4840 × CFM × ΔW
-        # Calculate humidity ratios
-        w_indoor = self._calculate_humidity_ratio(
-            indoor_conditions['temp_f'],
-            indoor_conditions['rh']
-        )
-        w_outdoor = self._calculate_humidity_ratio(
-            outdoor_conditions['temp_f'],
-            outdoor_conditions['rh']
-        )
+        w_indoor = float(humidity_ratio(indoor_conditions['temp_f'], indoor_conditions['rh']))
+        w_outdoor = float(humidity_ratio(outdoor_conditions['temp_f'], outdoor_conditions['rh']))
         
         delta_w = w_indoor - w_outdoor
         latent = 4840 * results.infiltration_cfm * delta_w
@@ -338,25 +357,6 @@ class AIM2InfiltrationModel:
             'total': sensible + latent
         }
     
-    def _calculate_humidity_ratio(self, temp_f: float, rh: float) -> float:
-        """
-        Calculate humidity ratio (lb moisture / lb dry air)
-        Simplified psychrometric calculation
-        """
-        # Saturation pressure (simplified correlation)
-        temp_r = temp_f + 459.67  # Convert to Rankine
-        p_sat = math.exp(17.67 * (temp_f - 32) / (temp_f + 395.6))
-        
-        # Partial pressure of water vapor
-        p_vapor = rh * p_sat
-        
-        # Humidity ratio
-        # W = 0.622 * p_vapor / (p_total - p_vapor)
-        p_total = 14.696  # Standard atmospheric pressure (psi)
-        w = 0.622 * p_vapor / (p_total - p_vapor)
-        
-        return w
-    
     def estimate_from_ach50(
         self,
         ach50: float,
@@ -450,20 +450,6 @@ def calculate_infiltration_loads(
     """
     model = get_aim2_model()
     
-    # Map construction quality to ACH50 per industry standards
-    # Based on 2021 IECC R402.4.1.2 and ACCA Manual J 8th Edition
-    # Natural infiltration = ACH50 ÷ N-factor (15-20 for typical homes)
-    ach50_values = {
-        'very_tight': 2.5,  # High-performance new construction (ENERGY STAR+)
-        'tight': 4.0,       # Standard new construction (code compliant)
-        'average': 5.5,     # Existing home with some air sealing
-        'leaky': 10.0,      # Old home with no air sealing
-    }
-    
-    # Handle very_tight as a valid category
-    if construction_quality == 'very_tight' and 'very_tight' not in ach50_values:
-        construction_quality = 'tight'  # Fallback if very_tight not defined
-    
     # Create building leakage profile
     volume = building_data.get('volume_cuft', 
                                building_data.get('sqft', 2000) * 9)
@@ -471,7 +457,7 @@ def calculate_infiltration_loads(
     envelope_area = building_data.get('envelope_area',
                                       building_data.get('sqft', 2000) * 3)
     
-    ach50 = ach50_values.get(construction_quality, 5.0)
+    ach50 = CONSTRUCTION_ACH50.get(construction_quality, DEFAULT_ACH50)
     cfm50 = (ach50 * volume) / 60
     
     building = BuildingLeakage(
@@ -0,0 +1,661 @@
+"""
+Load Plan
+Compiles a building into a flat list of conductance and gain terms once, so
+every load calculator (pipeline V3, ZoneLoadCalculator, Manual J V2) evaluates
+the same terms instead of re-deriving U-values, areas and design ΔT per call
+
+Each term evaluates to
+
+    G × (ΔT_mode × td_factor + td_offset) × multiplier + gain
+
+where ΔT_mode is the plan's heating or cooling design ΔT. Terms belong to a
+row (a space, or a zone for calculators without spaces) and rows belong to
+zones; a per-row multiplier carries cooling diversity. Evaluation is a handful
+of bincounts, so re-running a plan (other design ΔT, sweeps) costs
+microseconds rather than a full recalculation.
+"""
+
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from domain.models.spaces import BoundaryCondition, Space, SpaceType
+from domain.models.zones import BuildingThermalModel, ThermalZone
+from domain.calculations.infiltration_aim2 import CONSTRUCTION_ACH50, DEFAULT_ACH50, get_aim2_model
+from domain.calculations.parallel_path import get_parallel_path_calculator
+
+logger = logging.getLogger(__name__)
+
+
+MODES = ('heating', 'cooling')
+HEATING, COOLING = 0, 1
+
+# Components of a compiled building plan (heating uses the first five)
+SPACE_COMPONENTS = (
+    'wall', 'window', 'roof', 'floor', 'infiltration',
+    'solar', 'internal', 'internal_latent', 'infiltration_latent'
+)
+
+HEATING_INDOOR_F = 70
+COOLING_INDOOR_F = 75
+
+# CLTD factors on the cooling design ΔT (simplified - real Manual J uses detailed tables)
+WALL_CLTD_FACTOR = 0.7    # Walls have thermal mass
+WINDOW_CLTD_FACTOR = 1.0  # Windows respond immediately
+ROOF_CLTD_FACTOR = 1.2    # Roof gets additional solar load
+
+# Cooling diversity for secondary spaces
+SECONDARY_ZONE_DIVERSITY = 0.7
+BEDROOM_DIVERSITY = 0.8
+
+# User-friendly window performance terms → U-values (lower = better)
+WINDOW_PERFORMANCE_U = {
+    'standard': 0.35,          # Basic single/double pane
+    'high_performance': 0.25,  # Good double pane with Low-E
+    'premium': 0.20            # Triple pane or advanced Low-E
+}
+
+# Infiltration latent load: Q = 0.68 × CFM × Δgr (simplified)
+COOLING_GRAIN_DIFFERENCE = 30
+
+# Modeled surfaces next to a vented crawlspace see a reduced design ΔT
+CRAWLSPACE_SURFACE_FACTOR = 0.7
+
+
+def construction_quality_from_ach50(ach50: float) -> str:
+    """Map a blower door ACH50 to the AIM-2 construction quality (new construction)"""
+    if ach50 <= 2.0:
+        return 'very_tight'  # High performance new construction
+    if ach50 <= 3.0:
+        return 'tight'  # Code-compliant new construction
+    if ach50 <= 5.0:
+        return 'average'  # Below code (shouldn't happen in new)
+    return 'leaky'  # Way below code
+
+
+def internal_gain_components(space: Space) -> Tuple[float, float, float, float]:
+    """Internal gains split into (people sensible, people latent, lighting, equipment)"""
+    # ACCA Manual J internal gains
+    occupants = space.design_occupants if space.design_occupants > 0 else max(1, space.area_sqft / 400)
+    people_sensible = occupants * 230  # BTU/hr per person
+    people_latent = occupants * 190    # BTU/hr per person
+    lighting_sensible = space.area_sqft * space.lighting_w_per_sqft * 3.41  # Convert W to BTU/hr
+    equipment_sensible = space.area_sqft * space.equipment_w_per_sqft * 3.41
+    return people_sensible, people_latent, lighting_sensible, equipment_sensible
+
+
+def estimated_wall_area(space: Space, ceiling_height_ft: Optional[float] = None) -> float:
+    """Estimated exterior wall area of a space (square plan, 80% exposed)"""
+    perimeter = 4 * (space.area_sqft ** 0.5)
+    return perimeter * (ceiling_height_ft or space.ceiling_height_ft) * 0.8
+
+
+@dataclass
+class LoadPlan:
+    """
+    Compiled loads as parallel term arrays
+
+    Term columns are (n,); row columns are (rows,) and row_multiplier is
+    (rows, 2) for heating/cooling. Component codes index into components.
+    """
+    row: np.ndarray             # (n,) int, row into row_ids
+    mode: np.ndarray            # (n,) int, HEATING or COOLING
+    latent: np.ndarray          # (n,) bool
+    component: np.ndarray       # (n,) int
+    conductance: np.ndarray     # (n,) BTU/hr·°F
+    td_factor: np.ndarray       # (n,)
+    td_offset: np.ndarray       # (n,) °F
+    multiplier: np.ndarray      # (n,)
+    gain: np.ndarray            # (n,) BTU/hr
+    row_zone: np.ndarray        # (rows,) int, row into zone_ids
+    row_multiplier: np.ndarray  # (rows, 2)
+    row_ids: List[str]
+    zone_ids: List[str]
+    components: List[str]
+    design_td: Tuple[float, float]
+    _evaluated: Dict[Tuple[str, int], np.ndarray] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.conductance)
+
+    def component_index(self, name: str) -> int:
+        """Column of a component in row_components / component_totals"""
+        return self.components.index(name)
+
+    def zone_rows(self, zone_index: int) -> np.ndarray:
+        """Rows of a zone, in compile order"""
+        return np.flatnonzero(self.row_zone == zone_index)
+
+    def term_loads(self, design_td: Optional[Tuple[float, float]] = None) -> np.ndarray:
+        """Load of every term (BTU/hr) at the plan's or the given design ΔT"""
+        td = np.asarray(self.design_td if design_td is None else design_td, dtype=float)[self.mode]
+        return self.conductance * (td * self.td_factor + self.td_offset) * self.multiplier + self.gain
+
+    def row_loads(self, design_td: Optional[Tuple[float, float]] = None) -> np.ndarray:
+        """
+        (rows, mode, latent) sums before row multipliers
+
+        Terms are summed in insertion order, so a plan compiled in the order a
+        sequential calculation added its parts reproduces it exactly.
+        """
+        return self._memo('rows', -1, design_td, lambda: np.bincount(
+            (self.row * 2 + self.mode) * 2 + self.latent,
+            weights=self.term_loads(design_td),
+            minlength=len(self.row_ids) * 4
+        ).reshape(len(self.row_ids), 2, 2))
+
+    def zone_loads(self, mode: str, design_td: Optional[Tuple[float, float]] = None) -> np.ndarray:
+        """Total (sensible + latent) load per zone with row multipliers applied"""
+        m = MODES.index(mode)
+
+        def evaluate():
+            rows = self.row_loads(design_td)[:, m] * self.row_multiplier[:, m, None]
+            sensible = np.bincount(self.row_zone, weights=rows[:, 0], minlength=len(self.zone_ids))
+            latent = np.bincount(self.row_zone, weights=rows[:, 1], minlength=len(self.zone_ids))
+            return sensible + latent
+        return self._memo('zones', m, design_td, evaluate)
+
+    def row_components(self, mode: str, design_td: Optional[Tuple[float, float]] = None) -> np.ndarray:
+        """(rows, components) loads before row multipliers"""
+        m = MODES.index(mode)
+
+        def evaluate():
+            selected = self.mode == m
+            n_components = len(self.components)
+            return np.bincount(
+                self.row[selected] * n_components + self.component[selected],
+                weights=self.term_loads(design_td)[selected],
+                minlength=len(self.row_ids) * n_components
+            ).reshape(len(self.row_ids), n_components)
+        return self._memo('components', m, design_td, evaluate)
+
+    def component_totals(self, mode: str, design_td: Optional[Tuple[float, float]] = None) -> np.ndarray:
+        """(zones, components) loads with row multipliers applied"""
+        m = MODES.index(mode)
+        weighted = self.row_components(mode, design_td) * self.row_multiplier[:, m, None]
+        totals = np.zeros((len(self.zone_ids), len(self.components)))
+        np.add.at(totals, self.row_zone, weighted)
+        return totals
+
+    def _memo(self, kind: str, mode: int, design_td, evaluate) -> np.ndarray:
+        """Evaluations at the plan's own design ΔT are computed once"""
+        if design_td is not None:
+            return evaluate()
+        key = (kind, mode)
+        if key not in self._evaluated:
+            self._evaluated[key] = evaluate()
+        return self._evaluated[key]
+
+
+class LoadPlanBuilder:
+    """Accumulates rows and terms, then freezes them into a LoadPlan"""
+
+    def __init__(self, heating_td: float, cooling_td: float, components: Sequence[str] = ()):
+        """components pre-registers columns so they exist even without terms"""
+        self.design_td = (heating_td, cooling_td)
+        self._terms: List[Tuple] = []
+        self._rows: List[Tuple[str, int, float, float]] = []
+        self._zone_ids: List[str] = []
+        self._components: Dict[str, int] = {name: i for i, name in enumerate(components)}
+
+    def add_zone(self, zone_id: str) -> int:
+        """Register a zone (so zones without rows still get a column); returns its index"""
+        if zone_id not in self._zone_ids:
+            self._zone_ids.append(zone_id)
+        return self._zone_ids.index(zone_id)
+
+    def add_row(self, row_id: str, zone_id: str, heating_multiplier: float = 1.0, cooling_multiplier: float = 1.0) -> int:
+        """Start a row (space or zone); returns its index for the term methods"""
+        self._rows.append((row_id, self.add_zone(zone_id), heating_multiplier, cooling_multiplier))
+        return len(self._rows) - 1
+
+    def conduction(
+        self,
+        row: int,
+        mode: int,
+        component: str,
+        conductance: float,
+        td_factor: float = 1.0,
+        td_offset: float = 0.0,
+        multiplier: float = 1.0,
+        latent: bool = False
+    ) -> None:
+        """Add G × (ΔT × td_factor + td_offset) × multiplier"""
+        code = self._components.setdefault(component, len(self._components))
+        self._terms.append((row, mode, latent, code, conductance, td_factor, td_offset, multiplier, 0.0))
+
+    def gain(self, row: int, mode: int, component: str, btu_hr: float, latent: bool = False) -> None:
+        """Add a load that does not depend on the design ΔT"""
+        code = self._components.setdefault(component, len(self._components))
+        self._terms.append((row, mode, latent, code, 0.0, 0.0, 0.0, 1.0, btu_hr))
+
+    def build(self) -> LoadPlan:
+        columns = list(zip(*self._terms)) if self._terms else [()] * 9
+        row_ids, row_zone, heating_multipliers, cooling_multipliers = (
+            zip(*self._rows) if self._rows else ((), (), (), ())
+        )
+        return LoadPlan(
+            row=np.asarray(columns[0], dtype=np.int64),
+            mode=np.asarray(columns[1], dtype=np.int64),
+            latent=np.asarray(columns[2], dtype=bool),
+            component=np.asarray(columns[3], dtype=np.int64),
+            conductance=np.asarray(columns[4], dtype=float),
+            td_factor=np.asarray(columns[5], dtype=float),
+            td_offset=np.asarray(columns[6], dtype=float),
+            multiplier=np.asarray(columns[7], dtype=float),
+            gain=np.asarray(columns[8], dtype=float),
+            row_zone=np.asarray(row_zone, dtype=np.int64),
+            row_multiplier=np.column_stack([
+                np.asarray(heating_multipliers, dtype=float),
+                np.asarray(cooling_multipliers, dtype=float)
+            ]).reshape(len(self._rows), 2),
+            row_ids=list(row_ids),
+            zone_ids=list(self._zone_ids),
+            components=list(self._components),
+            design_td=self.design_td
+        )
+
+
+@dataclass
+class EnvelopeInputs:
+    """
+    Envelope assumptions resolved once per calculation
+
+    Heating U-values include framing (parallel path); cooling uses 1/R with
+    CLTD factors, as the pipeline always has.
+    """
+    window_u: float
+    wall_r: float
+    roof_r: float
+    floor_r: float
+    window_ratio: float = 0.18                 # Heating WWR (AI: 0.22 for large windows)
+    ceiling_height_ft: Optional[float] = None  # AI-detected ceiling height for heating walls
+    solar_intensity: float = 200.0             # BTU/hr·sqft of window
+    shgc: float = 0.3
+    heating_quality: str = 'tight'
+    cooling_quality: str = 'tight'
+    heating_wall_u: float = field(init=False)
+    heating_roof_u: float = field(init=False)
+    heating_floor_u: float = field(init=False)
+
+    def __post_init__(self):
+        # Subtract films/layers for cavity R, then add framing bridging
+        parallel_path = get_parallel_path_calculator()
+        self.heating_wall_u = parallel_path.calculate_wall_u_value(self.wall_r - 3.3, '16oc_2x4')
+        self.heating_roof_u = parallel_path.calculate_ceiling_u_value(self.roof_r - 1.2, '24oc')
+        self.heating_floor_u = parallel_path.calculate_floor_u_value(self.floor_r - 3.0, '16oc')
+
+    @property
+    def cooling_wall_u(self) -> float:
+        return 1.0 / self.wall_r
+
+    @property
+    def cooling_roof_u(self) -> float:
+        return 1.0 / self.roof_r
+
+    @classmethod
+    def from_specs(
+        cls,
+        climate_data: Optional[Dict[str, Any]] = None,
+        energy_specs=None,
+        user_inputs: Optional[Dict[str, Any]] = None,
+        thermal_intelligence: Optional[Dict[str, Any]] = None
+    ) -> 'EnvelopeInputs':
+        """
+        Resolve envelope inputs: user input, then blueprint specs, then
+        climate defaults, then hardcoded defaults
+        """
+        has_specs = bool(energy_specs and energy_specs.extraction_source != "none")
+
+        # 🪟 Window U: user performance choice takes priority
+        window_u = None
+        window_performance = (user_inputs or {}).get('window_performance')
+        if window_performance:
+            window_u = WINDOW_PERFORMANCE_U.get(window_performance)
+            if window_u:
+                logger.info(f"🪟 USER WINDOW PERFORMANCE: {window_performance} → U={window_u}")
+        if window_u:
+            window_source = "user_input"
+        elif has_specs and energy_specs.window_u_value:
+            window_u, window_source = energy_specs.window_u_value, "blueprint_extracted"
+        elif climate_data and climate_data.get('typical_window_u'):
+            window_u, window_source = climate_data.get('typical_window_u', 0.30), "climate_data"
+        else:
+            window_u, window_source = 0.30, "default"
+
+        if has_specs:
+            wall_r = energy_specs.wall_r_value if energy_specs.wall_r_value else 20
+            roof_r = energy_specs.roof_r_value if energy_specs.roof_r_value else 49
+            floor_r = energy_specs.floor_r_value if energy_specs.floor_r_value else 30
+            r_source = "extracted specs"
+        elif climate_data:
+            wall_r = climate_data.get('typical_wall_r', 20)
+            roof_r = climate_data.get('typical_roof_r', 49)
+            floor_r = climate_data.get('typical_floor_r', 30)
+            r_source = "climate defaults"
+        else:
+            wall_r, roof_r, floor_r = 20, 49, 30
+            r_source = "hardcoded defaults"
+        logger.info(f"   Envelope ({r_source}): Wall R-{wall_r}, Roof R-{roof_r}, Floor R-{floor_r}, "
+                    f"Window U-{window_u} ({window_source})")
+
+        ceiling_height_ft, window_ratio, solar_intensity = cls._ai_adjustments(climate_data, thermal_intelligence)
+
+        # CRITICAL: For NEW CONSTRUCTION, default to tight per 2021 IECC
+        heating_quality = cooling_quality = 'tight'
+        if energy_specs and energy_specs.ach50:
+            heating_quality = cooling_quality = construction_quality_from_ach50(energy_specs.ach50)
+            logger.info(f"   Using extracted ACH50: {energy_specs.ach50} (NEW CONSTRUCTION: {heating_quality})")
+        elif thermal_intelligence:
+            ai_quality = thermal_intelligence.get('construction_method', {}).get('construction_quality', 'average')
+            # Poor new construction still must meet code; heating only
+            heating_quality = 'average' if ai_quality == 'below_average' else 'tight'
+            logger.info(f"   Using AI construction quality: {ai_quality} (NEW CONSTRUCTION: {heating_quality})")
+
+        return cls(
+            window_u=window_u,
+            wall_r=wall_r,
+            roof_r=roof_r,
+            floor_r=floor_r,
+            window_ratio=window_ratio,
+            ceiling_height_ft=ceiling_height_ft,
+            solar_intensity=solar_intensity,
+            heating_quality=heating_quality,
+            cooling_quality=cooling_quality
+        )
+
+    @staticmethod
+    def _ai_adjustments(
+        climate_data: Optional[Dict[str, Any]],
+        thermal_intelligence: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[float], float, float]:
+        """AI thermal intelligence: (ceiling height, window ratio, solar intensity)"""
+        ceiling_height_ft = None
+        window_ratio = 0.18  # Default 18% WWR
+        solar_multiplier = 1.0
+        if thermal_intelligence:
+            ceiling_height_ft = thermal_intelligence.get('ceiling_volume', {}).get('ceiling_height_ft') or None
+            if ceiling_height_ft:
+                logger.info(f"   AI detected ceiling height: {ceiling_height_ft}ft")
+
+            window_info = thermal_intelligence.get('window_orientation', {})
+            if window_info.get('large_windows_detected'):
+                window_ratio = 0.22  # Increase for large windows
+                logger.info(f"   AI detected large windows: using {window_ratio:.1%} WWR")
+
+            if 'window_orientation' in thermal_intelligence:
+                solar_exposure = window_info.get('solar_exposure', 'medium')
+                if solar_exposure == 'high':
+                    solar_multiplier = 1.3  # High solar exposure
+                elif solar_exposure == 'low':
+                    solar_multiplier = 0.7  # Shaded or north-facing
+                if window_info.get('south_facing_ratio', 0.4) > 0.5:
+                    solar_multiplier *= 1.1  # More south-facing windows
+
+        if climate_data:
+            solar_intensity = climate_data.get('solar_gain_factor', 200) * solar_multiplier
+        else:
+            solar_intensity = 200 * solar_multiplier  # BTU/hr/sqft fallback
+        return ceiling_height_ft, window_ratio, solar_intensity
+
+    @classmethod
+    def from_properties(
+        cls,
+        envelope_properties: Dict[str, Any],
+        climate_data: Optional[Dict[str, Any]] = None,
+        thermal_intelligence: Optional[Dict[str, Any]] = None
+    ) -> 'EnvelopeInputs':
+        """Envelope inputs from a ZoneLoadCalculator-style properties dict"""
+        ceiling_height_ft, window_ratio, solar_intensity = cls._ai_adjustments(climate_data, thermal_intelligence)
+        ach50 = envelope_properties.get('ach50')
+        quality = construction_quality_from_ach50(ach50) if ach50 else 'tight'
+        return cls(
+            window_u=envelope_properties.get('window_u_value', 0.30),
+            wall_r=envelope_properties.get('wall_r_value', 20),
+            roof_r=envelope_properties.get('ceiling_r_value', 49),
+            floor_r=envelope_properties.get('floor_r_value', 30),
+            window_ratio=window_ratio,
+            ceiling_height_ft=ceiling_height_ft,
+            solar_intensity=solar_intensity,
+            heating_quality=quality,
+            cooling_quality=quality
+        )
+
+
+class LoadPlanCompiler:
+    """
+    Compiles a BuildingThermalModel plus climate into a LoadPlan
+
+    One row per space. Spaces with modeled surfaces use them; the rest use the
+    square-plan estimates (walls at 80% exposure, WWR, attic roof, foundation
+    factors). Infiltration comes from one AIM-2 batch over every space at the
+    heating and cooling design conditions, linearized there as 1.08 × CFM.
+    """
+
+    def compile(
+        self,
+        building_model: BuildingThermalModel,
+        climate_data: Optional[Dict[str, Any]],
+        envelope: EnvelopeInputs,
+        zones: Optional[Sequence[ThermalZone]] = None,
+        cooling_diversity: bool = True
+    ) -> LoadPlan:
+        """
+        Args:
+            building_model: Building with zones → spaces
+            climate_data: Design conditions (winter_99, summer_1, wind, solar)
+            envelope: Resolved envelope inputs
+            zones: Zones to compile (default: conditioned zones)
+            cooling_diversity: Apply secondary-zone/bedroom cooling diversity as row multipliers
+
+        Returns:
+            LoadPlan with one row per space
+        """
+        climate = climate_data or {}
+        zones = list(building_model.conditioned_zones if zones is None else zones)
+        spaces = [space for zone in zones for space in zone.spaces]
+
+        winter_design_temp = climate.get('winter_99', building_model.winter_design_temp)
+        summer_design_temp = climate.get('summer_1', building_model.summer_design_temp)
+        heating_td = HEATING_INDOOR_F - winter_design_temp
+        cooling_td = summer_design_temp - COOLING_INDOOR_F
+        builder = LoadPlanBuilder(heating_td, cooling_td, SPACE_COMPONENTS)
+
+        heating_cfm, cooling_cfm = self._infiltration_cfm(spaces, building_model, climate_data, envelope, cooling_td)
+        foundation_thermal = building_model.foundation_thermal_factors or {}
+
+        i = 0
+        for zone in zones:
+            builder.add_zone(zone.zone_id)
+            for space in zone.spaces:
+                diversity = 1.0
+                if cooling_diversity:
+                    if not zone.primary_occupancy:
+                        diversity = SECONDARY_ZONE_DIVERSITY
+                    elif space.space_type == SpaceType.BEDROOM:
+                        diversity = BEDROOM_DIVERSITY
+                row = builder.add_row(space.space_id, zone.zone_id, cooling_multiplier=diversity)
+
+                if space.surfaces:
+                    self._add_surface_heating(builder, row, space, envelope, climate)
+                else:
+                    self._add_estimated_heating(builder, row, space, envelope, foundation_thermal)
+                builder.conduction(row, HEATING, 'infiltration', 1.08 * heating_cfm[i])
+
+                if space.surfaces:
+                    window_area = self._add_surface_cooling(builder, row, space, envelope, climate)
+                else:
+                    window_area = self._add_estimated_cooling(builder, row, space, envelope)
+                builder.gain(row, COOLING, 'solar', window_area * envelope.shgc * envelope.solar_intensity)
+                people_sensible, people_latent, lighting_sensible, equipment_sensible = internal_gain_components(space)
+                builder.gain(row, COOLING, 'internal', people_sensible + lighting_sensible + equipment_sensible)
+                builder.conduction(row, COOLING, 'infiltration', 1.08 * cooling_cfm[i])
+                builder.gain(row, COOLING, 'internal_latent', people_latent, latent=True)
+                builder.gain(row, COOLING, 'infiltration_latent', 0.68 * cooling_cfm[i] * COOLING_GRAIN_DIFFERENCE, latent=True)
+                i += 1
+
+        plan = builder.build()
+        logger.info(f"🧮 Load plan: {len(plan)} terms, {len(spaces)} spaces in {len(zones)} zones "
+                    f"(ΔT {heating_td:.1f}°F heating / {cooling_td:.1f}°F cooling)")
+        return plan
+
+    def _infiltration_cfm(
+        self,
+        spaces: List[Space],
+        building_model: BuildingThermalModel,
+        climate_data: Optional[Dict[str, Any]],
+        envelope: EnvelopeInputs,
+        cooling_td: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """AIM-2 CFM per space at heating and cooling design conditions, one batch"""
+        if not spaces:
+            return np.zeros(0), np.zeros(0)
+        heating_climate = climate_data or {'winter_99': 10, 'design_wind_mph': 15}
+        cooling_climate = climate_data or {}
+
+        volume = np.array([space.volume_cuft for space in spaces])
+        area = np.array([space.area_sqft for space in spaces])
+        ach50 = np.array([
+            [CONSTRUCTION_ACH50.get(envelope.heating_quality, DEFAULT_ACH50)],
+            [CONSTRUCTION_ACH50.get(envelope.cooling_quality, DEFAULT_ACH50)]
+        ])
+        results = get_aim2_model().calculate_infiltration_batch(
+            cfm50=(ach50 * volume) / 60,
+            envelope_area_sqft=area * 3,  # Estimate envelope area
+            volume_cuft=volume,
+            building_height_ft=18,  # Typical 2-story height
+            indoor_temp_f=HEATING_INDOOR_F,
+            # Cooling keeps the lower ΔT and calmer wind it has always used
+            outdoor_temp_f=np.array([
+                [heating_climate.get('winter_99', 10)],
+                [cooling_climate.get('summer_1', 91) - cooling_td]
+            ]),
+            wind_speed_mph=np.array([
+                [heating_climate.get('design_wind_mph', 15)],
+                [cooling_climate.get('design_wind_mph', 10)]
+            ]),
+            floors=building_model.total_floors  # Building-type-aware infiltration
+        )
+        return results.infiltration_cfm[HEATING], results.infiltration_cfm[COOLING]
+
+    def _add_estimated_heating(
+        self,
+        builder: LoadPlanBuilder,
+        row: int,
+        space: Space,
+        envelope: EnvelopeInputs,
+        foundation_thermal: Dict[str, Any]
+    ) -> None:
+        """Walls, windows, roof and foundation from square-plan estimates"""
+        wall_area = estimated_wall_area(space, envelope.ceiling_height_ft)
+        window_area = wall_area * envelope.window_ratio
+        floor_area = space.area_sqft
+        builder.conduction(row, HEATING, 'wall', envelope.heating_wall_u * wall_area)
+        builder.conduction(row, HEATING, 'window', envelope.window_u * window_area)
+        if space.ceiling_under == BoundaryCondition.ATTIC:
+            builder.conduction(row, HEATING, 'roof', envelope.heating_roof_u * space.area_sqft)
+
+        # 🏗️ Foundation thermal factors apply to the ground floor only
+        if foundation_thermal and space.floor_level == 1:
+            conductance = foundation_thermal.get('foundation_conductance', 0.1) * floor_area
+            if space.floor_over == BoundaryCondition.CRAWLSPACE:
+                builder.conduction(row, HEATING, 'floor', conductance, multiplier=0.8)  # Crawlspace buffers outdoor temperature
+            elif space.floor_over == BoundaryCondition.GROUND:
+                builder.conduction(row, HEATING, 'floor', conductance)  # Slab-on-grade, full exposure
+            elif space.floor_over == BoundaryCondition.GARAGE:
+                builder.conduction(row, HEATING, 'floor', conductance, multiplier=0.6)  # Garage partially heated
+        elif space.floor_over == BoundaryCondition.GROUND:
+            slab_edge_u = 0.54  # Manual J default, per ft of perimeter
+            builder.conduction(row, HEATING, 'floor', slab_edge_u * (4 * math.sqrt(floor_area)))
+        elif space.floor_over == BoundaryCondition.CRAWLSPACE:
+            builder.conduction(row, HEATING, 'floor', envelope.heating_floor_u * floor_area, multiplier=0.8)
+        elif space.floor_over == BoundaryCondition.GARAGE:
+            builder.conduction(row, HEATING, 'floor', envelope.heating_floor_u * floor_area, td_factor=0.6)
+
+    def _add_estimated_cooling(self, builder: LoadPlanBuilder, row: int, space: Space, envelope: EnvelopeInputs) -> float:
+        """Walls, windows and roof with CLTD factors; returns the window area"""
+        wall_area = estimated_wall_area(space)
+        window_area = wall_area * 0.18  # 18% WWR like V2
+        builder.conduction(row, COOLING, 'wall', envelope.cooling_wall_u * wall_area, td_factor=WALL_CLTD_FACTOR)
+        builder.conduction(row, COOLING, 'window', envelope.window_u * window_area, td_factor=WINDOW_CLTD_FACTOR)
+        if space.ceiling_under == BoundaryCondition.ATTIC:
+            builder.conduction(row, COOLING, 'roof', envelope.cooling_roof_u * space.area_sqft, td_factor=ROOF_CLTD_FACTOR)
+        return window_area
+
+    def _add_surface_heating(
+        self,
+        builder: LoadPlanBuilder,
+        row: int,
+        space: Space,
+        envelope: EnvelopeInputs,
+        climate: Dict[str, Any]
+    ) -> None:
+        """
+        Modeled surfaces by boundary condition
+
+        Surfaces keep ZoneLoadCalculator's rules: U × A × ΔT with 1/R for
+        unrated surfaces, and no load to interior or attic boundaries.
+        """
+        garage_offset = HEATING_INDOOR_F - (climate.get('winter_99', 0) + 10)  # Garage runs 10°F warmer
+        for surface in space.surfaces:
+            component = self._surface_component(surface.surface_type)
+            area = surface.net_wall_area if surface.surface_type == "wall" else surface.area_sqft
+            conductance = (surface.u_value if surface.u_value > 0 else 1.0 / envelope.wall_r) * area
+            boundary = surface.boundary_condition
+            if boundary == BoundaryCondition.EXTERIOR:
+                builder.conduction(row, HEATING, component, conductance)
+            elif boundary == BoundaryCondition.GARAGE:
+                builder.conduction(row, HEATING, component, conductance, td_factor=0.0, td_offset=garage_offset)
+            elif boundary == BoundaryCondition.CRAWLSPACE:
+                builder.conduction(row, HEATING, component, conductance, multiplier=CRAWLSPACE_SURFACE_FACTOR)
+            elif boundary == BoundaryCondition.GROUND and surface.surface_type == "floor":
+                builder.conduction(row, HEATING, component, conductance, multiplier=0.5)
+            if surface.surface_type == "wall" and surface.window_area:
+                builder.conduction(row, HEATING, 'window', envelope.window_u * surface.window_area)
+
+    def _add_surface_cooling(
+        self,
+        builder: LoadPlanBuilder,
+        row: int,
+        space: Space,
+        envelope: EnvelopeInputs,
+        climate: Dict[str, Any]
+    ) -> float:
+        """Modeled surfaces by boundary condition (no CLTD factors); returns the window area"""
+        garage_offset = (climate.get('summer_1', 95) - 5) - COOLING_INDOOR_F  # Garage runs 5°F cooler
+        window_area = 0.0
+        for surface in space.surfaces:
+            component = self._surface_component(surface.surface_type)
+            area = surface.net_wall_area if surface.surface_type == "wall" else surface.area_sqft
+            conductance = (surface.u_value if surface.u_value > 0 else envelope.cooling_wall_u) * area
+            boundary = surface.boundary_condition
+            if boundary == BoundaryCondition.EXTERIOR:
+                builder.conduction(row, COOLING, component, conductance)
+            elif boundary == BoundaryCondition.GARAGE:
+                builder.conduction(row, COOLING, component, conductance, td_factor=0.0, td_offset=garage_offset)
+            elif boundary == BoundaryCondition.CRAWLSPACE:
+                builder.conduction(row, COOLING, component, conductance, multiplier=CRAWLSPACE_SURFACE_FACTOR)
+            # No cooling load through the ground
+            if surface.surface_type == "wall" and surface.window_area:
+                window_area += surface.window_area
+                builder.conduction(row, COOLING, 'window', envelope.window_u * surface.window_area)
+        return window_area
+
+    @staticmethod
+    def _surface_component(surface_type: str) -> str:
+        return 'roof' if surface_type in ('ceiling', 'roof') else surface_type
+
+
+# Singleton instance
+_load_plan_compiler = None
+
+
+def get_load_plan_compiler() -> LoadPlanCompiler:
+    """Get or create the global load plan compiler"""
+    global _load_plan_compiler
+    if _load_plan_compiler is None:
+        _load_plan_compiler = LoadPlanCompiler()
+    return _load_plan_compiler
@@ -7,12 +7,14 @@ Uses all extracted data for accurate load calculations
 import logging
 import math
 from typing import Dict, Any, List, Tuple, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 import numpy as np
 
 from domain.core.thermal_envelope import ThermalModel, ThermalZone
-from domain.calculations.infiltration_aim2 import AIM2InfiltrationModel, BuildingLeakage, InfiltrationFactors
+from domain.calculations.infiltration_aim2 import AIM2InfiltrationModel, BuildingLeakage
+from domain.calculations.psychrometrics import atmospheric_pressure_psia, humidity_ratio_from_wet_bulb
 from domain.calculations.parallel_path import get_parallel_path_calculator
+from domain.calculations.load_plan import COOLING, HEATING, LoadPlan, LoadPlanBuilder
 from infrastructure.extractors.foundation import FoundationExtractor
 from infrastructure.extractors.mechanical import MechanicalExtractor
 
@@ -167,15 +169,18 @@ class ManualJCalculatorV2:
         logger.info(f"Design conditions: {conditions['winter_outdoor']}°F winter, "
                    f"{conditions['summer_outdoor']}°F summer")
         
-        # 2. Calculate zone-by-zone loads
+        # 2. Calculate zone-by-zone loads from one compiled load plan
         zone_loads = {}
         total_heating_components = LoadComponents()
         total_cooling_components = LoadComponents()
         
-        for zone in thermal_model.zones:
-            heating, cooling = self._calculate_zone_loads(
-                zone, thermal_model, conditions
-            )
+        load_plan = self._compile_zone_plan(thermal_model, conditions)
+        heating_by_zone = load_plan.row_components('heating')
+        cooling_by_zone = load_plan.row_components('cooling')
+        
+        for zone_index, zone in enumerate(thermal_model.zones):
+            heating = LoadComponents(**dict(zip(load_plan.components, heating_by_zone[zone_index].tolist())))
+            cooling = LoadComponents(**dict(zip(load_plan.components, cooling_by_zone[zone_index].tolist())))
             
             zone_loads[zone.zone_id] = {
                 'heating': heating.total,
@@ -308,26 +313,18 @@ class ManualJCalculatorV2:
         
         return conditions
     
-    def _calculate_zone_loads(
+    def _compile_zone_plan(
         self,
-        zone: ThermalZone,
         model: ThermalModel,
         conditions: Dict
-    ) -> Tuple[LoadComponents, LoadComponents]:
-        """Calculate loads for a single zone"""
-        heating = LoadComponents()
-        cooling = LoadComponents()
-        
+    ) -> LoadPlan:
+        """Compile every zone's envelope and internal loads into one load plan (a row per zone)"""
         # Temperature differences
         delta_t_heating = conditions['winter_indoor'] - conditions['winter_outdoor']
         delta_t_cooling = conditions['summer_outdoor'] - conditions['summer_indoor']
+        builder = LoadPlanBuilder(delta_t_heating, delta_t_cooling, [f.name for f in fields(LoadComponents)])
         
-        # 1. WALLS - Using PARALLEL PATH for accurate U-value
-        wall_area = sum(w.get('area', 0) for w in zone.exterior_walls)
-        if wall_area == 0:
-            # Estimate from zone area and perimeter
-            wall_area = math.sqrt(zone.area_sqft) * 4 * 9  # Rough estimate
-        
+        # Envelope U-values are the same for every zone
         # CRITICAL FIX: Use parallel path calculation for framing effects
         # The critique specifically requires this for accurate wall U-values
         nominal_r = model.envelope.wall_r_value
@@ -345,17 +342,45 @@ class ManualJCalculatorV2:
             is_steel=False  # Wood framing typical
         )
         
-        heating.walls = wall_u_effective * wall_area * delta_t_heating
-        cooling.walls = wall_u_effective * wall_area * delta_t_cooling
+        # CRITICAL FIX: Use parallel path for ceiling/attic interface
+        roof_u_effective = self.parallel_path.calculate_ceiling_u_value(
+            nominal_r_value=model.envelope.roof_r_value - 1.5,  # Subtract films
+            joist_spacing='24oc',  # Typical for ceilings
+            joist_depth=10  # 2x10 joists typical
+        )
+        
+        for zone in model.zones:
+            self._add_zone_terms(builder, zone, conditions, wall_u_effective, roof_u_effective)
+        
+        return builder.build()
+    
+    def _add_zone_terms(
+        self,
+        builder: LoadPlanBuilder,
+        zone: ThermalZone,
+        conditions: Dict,
+        wall_u_effective: float,
+        roof_u_effective: float
+    ) -> None:
+        """Add a zone's loads as plan terms named after the LoadComponents fields"""
+        row = builder.add_row(zone.zone_id, zone.zone_id)
+        
+        def both_modes(component: str, conductance: float) -> None:
+            builder.conduction(row, HEATING, component, conductance)
+            builder.conduction(row, COOLING, component, conductance)
+        
+        # 1. WALLS - Using PARALLEL PATH for accurate U-value
+        wall_area = sum(w.get('area', 0) for w in zone.exterior_walls)
+        if wall_area == 0:
+            # Estimate from zone area and perimeter
+            wall_area = math.sqrt(zone.area_sqft) * 4 * 9  # Rough estimate
+        both_modes('walls', wall_u_effective * wall_area)
         
         # 2. WINDOWS - Conduction
         window_area = sum(w.get('area', 0) for w in zone.windows)
         if window_area == 0:
             window_area = zone.area_sqft * 0.15  # 15% window-to-floor
-        
-        window_u = zone.window_u_value
-        heating.windows_conduction = window_u * window_area * delta_t_heating
-        cooling.windows_conduction = window_u * window_area * delta_t_cooling
+        both_modes('windows_conduction', zone.window_u_value * window_area)
         
         # 3. WINDOWS - Solar Gain (cooling only)
         for window in zone.windows:
@@ -368,43 +393,27 @@ class ManualJCalculatorV2:
             
             # Apply shading coefficient and SHGC
             shading_coef = 0.85  # Typical interior shades
-            cooling.windows_solar += area * solar_factor * shgc * shading_coef
+            builder.gain(row, COOLING, 'windows_solar', area * solar_factor * shgc * shading_coef)
         
         # 4. DOORS
         door_area = sum(d.get('area', 20) for d in zone.doors)
         door_u = 0.20  # Insulated door
-        heating.doors = door_u * door_area * delta_t_heating
-        cooling.doors = door_u * door_area * delta_t_cooling
+        both_modes('doors', door_u * door_area)
         
         # 5. CEILING/ROOF (top floor only) - Using PARALLEL PATH
         if zone.ceiling:
-            roof_area = zone.ceiling['area']
-            
-            # CRITICAL FIX: Use parallel path for ceiling/attic interface
-            roof_u_effective = self.parallel_path.calculate_ceiling_u_value(
-                nominal_r_value=model.envelope.roof_r_value - 1.5,  # Subtract films
-                joist_spacing='24oc',  # Typical for ceilings
-                joist_depth=10  # 2x10 joists typical
-            )
-            
-            heating.roof = roof_u_effective * roof_area * delta_t_heating
-            
+            roof_conductance = roof_u_effective * zone.ceiling['area']
+            builder.conduction(row, HEATING, 'roof', roof_conductance)
             # Cooling uses CLTD for solar gain on roof
-            roof_cltd = self.ROOF_CLTD['medium'] + delta_t_cooling
-            cooling.roof = roof_u_effective * roof_area * roof_cltd
+            builder.conduction(row, COOLING, 'roof', roof_conductance, td_offset=self.ROOF_CLTD['medium'])
         
-        # 6. FLOOR (ground floor handled in foundation)
-        if zone.floor and zone.floor_number > 1:
-            # Floor over conditioned space - no load
-            pass
+        # 6. FLOOR (ground floor handled in foundation; floors over conditioned space have no load)
         
         # 7. INTERNAL GAINS (cooling only)
-        cooling.people_sensible = zone.occupancy * self.INTERNAL_GAINS['people_sensible']
-        cooling.people_latent = zone.occupancy * self.INTERNAL_GAINS['people_latent']
-        cooling.equipment = zone.area_sqft * self.INTERNAL_GAINS['equipment']
-        cooling.lighting = zone.lighting_load_w * 3.41  # Convert W to BTU/hr
-        
-        return heating, cooling
+        builder.gain(row, COOLING, 'people_sensible', zone.occupancy * self.INTERNAL_GAINS['people_sensible'])
+        builder.gain(row, COOLING, 'people_latent', zone.occupancy * self.INTERNAL_GAINS['people_latent'], latent=True)
+        builder.gain(row, COOLING, 'equipment', zone.area_sqft * self.INTERNAL_GAINS['equipment'])
+        builder.gain(row, COOLING, 'lighting', zone.lighting_load_w * 3.41)  # Convert W to BTU/hr
     
     def _calculate_foundation_loads(
         self,
@@ -486,68 +495,46 @@ class ManualJCalculatorV2:
             neutral_level=0.5
         )
         
-        # Winter infiltration
-        winter_factors = InfiltrationFactors(
-            wind_speed_mph=15,  # Typical design wind
-            indoor_temp_f=conditions['winter_indoor'],
-            outdoor_temp_f=conditions['winter_outdoor'],
-            terrain_class='suburban',
-            shielding_class='moderate',
-            building_height_ft=model.envelope.building_height_ft
+        # Winter and summer design cases evaluated together (summer has less
+        # wind and a smaller ΔT); summer outdoor moisture from the coincident
+        # wet-bulb, winter carries no latent load
+        elevation = model.climate_data.get('elevation_ft', 0)
+        summer_w = float(humidity_ratio_from_wet_bulb(
+            conditions['summer_outdoor'],
+            conditions['summer_wetbulb'],
+            atmospheric_pressure_psia(elevation)
+        ))
+        results = self.aim2_model.calculate_infiltration_batch(
+            cfm50=building.blower_door_cfm50,
+            envelope_area_sqft=building.envelope_area_sqft,
+            volume_cuft=building.volume_cuft,
+            building_height_ft=model.envelope.building_height_ft,
+            indoor_temp_f=[conditions['winter_indoor'], conditions['summer_indoor']],
+            outdoor_temp_f=[conditions['winter_outdoor'], conditions['summer_outdoor']],
+            wind_speed_mph=[15, 10],
+            ela=building.ela,
+            floors=building.floors,
+            neutral_level=building.neutral_level,
+            outdoor_humidity_ratio=[0.0, summer_w],
+            indoor_rh=conditions['indoor_rh'],
+            elevation_ft=elevation
         )
         
-        winter_results = self.aim2_model.calculate_infiltration(
-            building, winter_factors
-        )
-        
-        # Summer infiltration (less due to smaller ΔT)
-        summer_factors = InfiltrationFactors(
-            wind_speed_mph=10,
-            indoor_temp_f=conditions['summer_indoor'],
-            outdoor_temp_f=conditions['summer_outdoor'],
-            terrain_class='suburban',
-            shielding_class='moderate',
-            building_height_ft=model.envelope.building_height_ft
-        )
-        
-        summer_results = self.aim2_model.calculate_infiltration(
-            building, summer_factors
-        )
-        
-        # Calculate loads
         heating_load = {
-            'sensible': winter_results.sensible_load_btu_hr,
+            'sensible': float(results.sensible_load_btu_hr[0]),
             'latent': 0  # No latent in heating
         }
         
         cooling_load = {
-            'sensible': summer_results.sensible_load_btu_hr,
-            'latent': self._calculate_latent_infiltration(
-                summer_results.infiltration_cfm,
-                conditions
-            )
+            'sensible': float(results.sensible_load_btu_hr[1]),
+            'latent': float(results.latent_load_btu_hr[1])
         }
         
-        logger.debug(f"Infiltration: {winter_results.infiltration_cfm:.0f} CFM winter, "
-                    f"{summer_results.infiltration_cfm:.0f} CFM summer")
+        logger.debug(f"Infiltration: {results.infiltration_cfm[0]:.0f} CFM winter, "
+                    f"{results.infiltration_cfm[1]:.0f} CFM summer")
         
         return heating_load, cooling_load
     
-    def _calculate_latent_infiltration(
-        self,
-        cfm: float,
-        conditions: Dict
-    ) -> float:
-        """Calculate latent infiltration load"""
-        # Humidity ratios (simplified)
-        w_indoor = 0.0095  # 75°F @ 50% RH
-        w_outdoor = 0.014   # Summer design
-        
-        delta_w = max(0, w_outdoor - w_indoor)
-        
-        # Q_latent = 4840 × CFM × ΔW
-        return 4840 * cfm * delta_w
-    
     def _calculate_ventilation_loads(
         self,
         model: ThermalModel,
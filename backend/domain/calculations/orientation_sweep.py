@@ -0,0 +1,192 @@
+"""
+Orientation Sweep Calculator
+Evaluates cooling loads for every building rotation in a single pass
+Used when the north arrow / building orientation is unknown
+"""
+
+import logging
+from dataclasses import dataclass, asdict, field
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from domain.calculations.manual_j_v2 import ManualJCalculatorV2
+
+logger = logging.getLogger(__name__)
+
+
+# Facade directions in clockwise order, 45° apart (index × 45 = azimuth)
+COMPASS_POINTS = ('N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW')
+COMPASS_AZIMUTHS = np.arange(len(COMPASS_POINTS)) * 45.0
+
+# Relative peak wall CLTD by facing direction (medium-weight frame wall,
+# late-afternoon design hour) - west and southwest walls run hottest
+WALL_CLTD_FACTORS = {
+    'N': 0.70, 'NE': 0.85, 'E': 1.05, 'SE': 1.05,
+    'S': 0.95, 'SW': 1.15, 'W': 1.25, 'NW': 1.00
+}
+
+SUPPORTED_STEPS = (8, 36)
+
+
+@dataclass
+class OrientationSweepResult:
+    """Cooling load for every evaluated building rotation"""
+    rotations_deg: List[float]
+    cooling_btuh: List[float]
+
+    # Rotation 0 is the building as modeled
+    base_cooling_btuh: float
+
+    worst_rotation_deg: float
+    worst_cooling_btuh: float
+    best_rotation_deg: float
+    best_cooling_btuh: float
+    median_cooling_btuh: float
+    spread: float  # (worst - best) / median
+
+    # Unscaled facade gain of each rotation relative to rotation 0; the curve is
+    # base + relative_gains × scale, so it can be re-based without a new sweep
+    relative_gains_btuh: List[float] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class OrientationSweepCalculator:
+    """
+    Evaluates all building rotations at once.
+
+    Orientation-dependent gains are expressed per facade direction (8 compass
+    points). For each rotation, every facade's relative solar/CLTD factor is
+    precomputed into a (rotations × facades) matrix, so the whole curve is one
+    matrix-vector product on top of a single base evaluation.
+    """
+
+    def __init__(self):
+        # (profile, steps) -> rotation factor matrix
+        self._matrix_cache: Dict[Tuple[Tuple[float, ...], int], np.ndarray] = {}
+
+    def facade_vector(self, values_by_direction: Dict[str, float]) -> np.ndarray:
+        """Convert {'N': x, 'E': y, ...} to an array in COMPASS_POINTS order"""
+        return np.array([float(values_by_direction.get(d, 0.0)) for d in COMPASS_POINTS])
+
+    def solar_profile(self, latitude_band: str = 'mid') -> Tuple[float, ...]:
+        """Manual J solar gain factors by facade direction for a latitude band"""
+        factors = ManualJCalculatorV2.SOLAR_GAIN_FACTORS
+        return tuple(float(factors[d].get(latitude_band, factors[d]['mid'])) for d in COMPASS_POINTS)
+
+    def wall_profile(self) -> Tuple[float, ...]:
+        """Relative wall CLTD by facade direction"""
+        return tuple(WALL_CLTD_FACTORS[d] for d in COMPASS_POINTS)
+
+    def rotation_matrix(self, profile: Sequence[float], steps: int = 8) -> np.ndarray:
+        """
+        Relative factor of each facade at each rotation.
+
+        Row r holds, for every facade direction, the profile value at the
+        azimuth that facade faces after rotating the building r × 360/steps
+        degrees clockwise, normalized so the four cardinal facades average 1.0.
+        Intermediate azimuths are linearly interpolated between compass points.
+        """
+        key = (tuple(profile), steps)
+        matrix = self._matrix_cache.get(key)
+        if matrix is not None:
+            return matrix
+
+        values = np.asarray(profile, dtype=float)
+        rotations = np.arange(steps) * (360.0 / steps)
+        azimuths = (COMPASS_AZIMUTHS[None, :] + rotations[:, None]) % 360.0
+
+        position = azimuths / 45.0
+        lower = np.floor(position).astype(int) % len(values)
+        upper = (lower + 1) % len(values)
+        fraction = position - np.floor(position)
+        interpolated = values[lower] * (1.0 - fraction) + values[upper] * fraction
+
+        cardinal_mean = values[[0, 2, 4, 6]].mean()
+        matrix = interpolated / cardinal_mean if cardinal_mean > 0 else interpolated
+
+        self._matrix_cache[key] = matrix
+        return matrix
+
+    def sweep(
+        self,
+        base_cooling_btuh: float,
+        facade_solar_btuh: Dict[str, float],
+        facade_wall_btuh: Optional[Dict[str, float]] = None,
+        latitude_band: str = 'mid',
+        steps: int = 8,
+        scale: float = 1.0
+    ) -> OrientationSweepResult:
+        """
+        Evaluate cooling load for all rotations.
+
+        Args:
+            base_cooling_btuh: Cooling load of the building as modeled (rotation 0)
+            facade_solar_btuh: Orientation-averaged window solar gain per facade direction
+            facade_wall_btuh: Orientation-averaged wall conduction gain per facade direction
+            latitude_band: 'low', 'mid' or 'high' (see ManualJCalculatorV2)
+            steps: Number of rotations (8 → 45° steps, 36 → 10° steps)
+            scale: Multiplier applied to facade gains downstream (diversity, duct losses)
+
+        Returns:
+            OrientationSweepResult with the full curve and worst case
+        """
+        if steps not in SUPPORTED_STEPS:
+            raise ValueError(f"Orientation sweep supports {SUPPORTED_STEPS} rotations, got {steps}")
+
+        solar = self.facade_vector(facade_solar_btuh)
+        solar_matrix = self.rotation_matrix(self.solar_profile(latitude_band), steps)
+        gains = solar_matrix @ solar
+
+        if facade_wall_btuh:
+            wall = self.facade_vector(facade_wall_btuh)
+            gains = gains + self.rotation_matrix(self.wall_profile(), steps) @ wall
+
+        # Rotation 0 equals the base evaluation; other rotations shift by the gain difference
+        return self._curve_result(base_cooling_btuh, gains - gains[0], scale)
+
+    def rescale(self, result: OrientationSweepResult, base_cooling_btuh: float, scale: float) -> OrientationSweepResult:
+        """Same sweep re-based on a new base load and gain scale (no matrix work)"""
+        return self._curve_result(base_cooling_btuh, np.asarray(result.relative_gains_btuh, dtype=float), scale)
+
+    def _curve_result(self, base_cooling_btuh: float, relative_gains: np.ndarray, scale: float) -> OrientationSweepResult:
+        """Curve, extremes and median for one base load and scale"""
+        steps = len(relative_gains)
+        curve = base_cooling_btuh + relative_gains * scale
+        rotations = np.arange(steps) * (360.0 / steps)
+
+        worst = int(np.argmax(curve))
+        best = int(np.argmin(curve))
+        median = float(np.median(curve))
+
+        result = OrientationSweepResult(
+            rotations_deg=rotations.tolist(),
+            cooling_btuh=curve.tolist(),
+            base_cooling_btuh=float(base_cooling_btuh),
+            worst_rotation_deg=float(rotations[worst]),
+            worst_cooling_btuh=float(curve[worst]),
+            best_rotation_deg=float(rotations[best]),
+            best_cooling_btuh=float(curve[best]),
+            median_cooling_btuh=median,
+            spread=float((curve[worst] - curve[best]) / median) if median > 0 else 0.0,
+            relative_gains_btuh=relative_gains.tolist()
+        )
+
+        logger.info(f"🧭 Orientation sweep ({steps} rotations): worst {result.worst_cooling_btuh:,.0f} BTU/hr "
+                    f"at {result.worst_rotation_deg:.0f}°, best {result.best_cooling_btuh:,.0f} at {result.best_rotation_deg:.0f}°")
+
+        return result
+
+
+# Singleton instance
+_orientation_sweep_calculator = None
+
+
+def get_orientation_sweep_calculator() -> OrientationSweepCalculator:
+    """Get or create the global orientation sweep calculator"""
+    global _orientation_sweep_calculator
+    if _orientation_sweep_calculator is None:
+        _orientation_sweep_calculator = OrientationSweepCalculator()
+    return _orientation_sweep_calculator
@@ -5,8 +5,9 @@ CRITICAL: The critique specifically requires this for accurate wall U-values
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Sequence, Tuple, Union
 from dataclasses import dataclass
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -68,37 +69,11 @@ class ParallelPathCalculator:
         """
         logger.info(f"Calculating parallel-path U-value for R-{nominal_r_value} wall")
         
-        # Get framing fraction
-        framing_fraction = self.FRAMING_FRACTIONS.get(framing_type, 0.15)
-        
-        # Get framing R-value
-        if is_steel:
-            if '2x6' in framing_type:
-                framing_r = self.FRAMING_R_VALUES['steel_2x6']
-            else:
-                framing_r = self.FRAMING_R_VALUES['steel_2x4']
-        else:
-            if '2x6' in framing_type:
-                framing_r = self.FRAMING_R_VALUES['wood_2x6']
-            else:
-                framing_r = self.FRAMING_R_VALUES['wood_2x4']
-        
-        # Create wall assembly
-        wall = FramedWallAssembly(
-            cavity_r_value=nominal_r_value,
-            framing_r_value=framing_r,
-            framing_fraction=framing_fraction
-        )
-        
-        # Calculate parallel path R-value
-        effective_r = self._calculate_parallel_path_r(wall)
-        
-        # Convert to U-value
-        u_value = 1.0 / effective_r
+        u_value = float(self.calculate_wall_u_values([nominal_r_value], framing_type, is_steel)[0])
+        effective_r = 1.0 / u_value
         
         # Log the impact of thermal bridging
-        simple_r = nominal_r_value + wall.interior_film_r + wall.exterior_film_r + \
-                   wall.sheathing_r + wall.siding_r + wall.drywall_r
+        simple_r = _layer_path_r(nominal_r_value)
         simple_u = 1.0 / simple_r
         
         degradation = (u_value - simple_u) / simple_u * 100
@@ -109,48 +84,44 @@ class ParallelPathCalculator:
         
         return u_value
     
-    def _calculate_parallel_path_r(self, wall: FramedWallAssembly) -> float:
-        """
-        Calculate effective R-value using parallel path method
-        REDLINE FIX: Films must be in BOTH paths per critique
+    def calculate_wall_u_values(
+        self,
+        nominal_r_values: Sequence[float],
+        framing_type: Union[str, Sequence[str]] = '16oc_2x4',
+        is_steel: Union[bool, Sequence[bool]] = False
+    ) -> np.ndarray:
         """
-        # CRITICAL: Air films are part of BOTH paths
-        # Path through cavity (insulation)
-        r_cavity_path = (
-            wall.interior_film_r +  # Interior air film
-            wall.drywall_r +        # Drywall
-            wall.cavity_r_value +   # Cavity insulation
-            wall.sheathing_r +      # Sheathing
-            wall.siding_r +         # Siding
-            wall.exterior_film_r    # Exterior air film
-        )
-        
-        # Path through framing
-        r_framing_path = (
-            wall.interior_film_r +   # Interior air film (same)
-            wall.drywall_r +         # Drywall (same)
-            wall.framing_r_value +   # Framing member instead of insulation
-            wall.sheathing_r +       # Sheathing (same)
-            wall.siding_r +          # Siding (same)
-            wall.exterior_film_r     # Exterior air film (same)
-        )
-        
-        # Calculate U-values for each path
-        u_cavity = 1.0 / r_cavity_path
-        u_framing = 1.0 / r_framing_path
+        Effective U-values for framed walls over an array of cavity R-values
         
-        # Area-weighted average U-value
-        cavity_fraction = 1.0 - wall.framing_fraction
-        u_effective = (cavity_fraction * u_cavity) + (wall.framing_fraction * u_framing)
+        Parallel path per ASHRAE: air films and wall layers are in BOTH the
+        cavity and the framing path, and the path U-values are area-weighted
+        by framing fraction. Framing properties come from the table compiled
+        at import; calculate_wall_u_value is a one-wall call of this method.
         
-        # Convert back to R-value
-        r_effective = 1.0 / u_effective
-        
-        logger.debug(f"  Cavity path: R-{r_cavity_path:.2f} ({cavity_fraction:.1%} of area)")
-        logger.debug(f"  Framing path: R-{r_framing_path:.2f} ({wall.framing_fraction:.1%} of area)")
-        logger.debug(f"  Effective R-value: {r_effective:.2f}")
-        
-        return r_effective
+        Args:
+            nominal_r_values: Cavity insulation R-values
+            framing_type: One framing type, or one per R-value
+            is_steel: One flag, or one per R-value
+            
+        Returns:
+            Array of effective U-values
+        """
+        nominal = np.asarray(nominal_r_values, dtype=float)
+        types, steel = np.broadcast_arrays(np.asarray(framing_type, dtype=object), np.asarray(is_steel, dtype=bool))
+        types = np.broadcast_to(types, nominal.shape)
+        steel = np.broadcast_to(steel, nominal.shape)
+        
+        rows = np.array([
+            _WALL_FRAMING_TABLE.get((t, bool(s))) or _wall_framing_row(t, bool(s))
+            for t, s in zip(types.ravel(), steel.ravel())
+        ], dtype=float).reshape(nominal.shape + (2,))
+        framing_fraction = rows[..., 0]
+        u_framing = rows[..., 1]
+        
+        u_cavity = 1.0 / _layer_path_r(nominal)
+        u_effective = (1.0 - framing_fraction) * u_cavity + framing_fraction * u_framing
+        # Via the effective R-value, so results stay bit-identical to the recorded golden values
+        return 1.0 / (1.0 / u_effective)
     
     def calculate_ceiling_u_value(
         self,
@@ -253,6 +224,34 @@ class ParallelPathCalculator:
         return u_effective
 
 
+def _layer_path_r(core_r_value):
+    """
+    Series R-value of one parallel path: the standard FramedWallAssembly
+    films and layers around a core (cavity insulation or framing member).
+    Works on floats and arrays.
+    """
+    layers = FramedWallAssembly
+    return (
+        layers.interior_film_r + layers.drywall_r + core_r_value
+        + layers.sheathing_r + layers.siding_r + layers.exterior_film_r
+    )
+
+
+def _wall_framing_row(framing_type: str, is_steel: bool) -> Tuple[float, float]:
+    """(framing fraction, framing-path U-value); unlisted framing types get 15% framing"""
+    framing_fraction = ParallelPathCalculator.FRAMING_FRACTIONS.get(framing_type, 0.15)
+    member = ('steel' if is_steel else 'wood') + ('_2x6' if '2x6' in framing_type else '_2x4')
+    return framing_fraction, 1.0 / _layer_path_r(ParallelPathCalculator.FRAMING_R_VALUES[member])
+
+
+# Framing lookups compiled once at import; unlisted framing types resolve on demand
+_WALL_FRAMING_TABLE = {
+    (framing_type, is_steel): _wall_framing_row(framing_type, is_steel)
+    for framing_type in ParallelPathCalculator.FRAMING_FRACTIONS
+    for is_steel in (False, True)
+}
+
+
 # Singleton instance
 _calculator = None
 
@@ -0,0 +1,77 @@
+"""
+Psychrometrics (IP units)
+ASHRAE Fundamentals Ch 1 moist-air relations, vectorized with NumPy so
+zones, design conditions and hourly series evaluate in one call
+"""
+
+from typing import Union
+import numpy as np
+
+ArrayLike = Union[float, np.ndarray]
+
+SEA_LEVEL_PRESSURE_PSIA = 14.696
+MOLECULAR_WEIGHT_RATIO = 0.621945  # water vapor / dry air
+
+# Sea-level latent factor: 60 min/h × 0.075 lb/ft³ × 1076 BTU/lb
+LATENT_FACTOR = 4840
+
+# Hyland-Wexler saturation pressure coefficients, T in °R, p in psia
+_ICE = (-1.0214165e4, -4.8932428, -5.3765794e-3, 1.9202377e-7, 3.5575832e-10, -9.0344688e-14, 4.1635019)
+_WATER = (-1.0440397e4, -1.1294650e1, -2.7022355e-2, 1.2890360e-5, -2.4780681e-9, 6.5459673)
+
+
+def atmospheric_pressure_psia(elevation_ft: ArrayLike = 0.0) -> np.ndarray:
+    """Standard atmosphere pressure at elevation"""
+    return SEA_LEVEL_PRESSURE_PSIA * (1 - 6.8754e-6 * np.asarray(elevation_ft, dtype=float)) ** 5.2559
+
+
+def saturation_pressure_psia(temp_f: ArrayLike) -> np.ndarray:
+    """Saturation vapor pressure over ice below 32°F, over water above"""
+    t = np.asarray(temp_f, dtype=float) + 459.67
+    c1, c2, c3, c4, c5, c6, c7 = _ICE
+    over_ice = c1 / t + c2 + c3 * t + c4 * t ** 2 + c5 * t ** 3 + c6 * t ** 4 + c7 * np.log(t)
+    c8, c9, c10, c11, c12, c13 = _WATER
+    over_water = c8 / t + c9 + c10 * t + c11 * t ** 2 + c12 * t ** 3 + c13 * np.log(t)
+    return np.exp(np.where(t < 491.67, over_ice, over_water))
+
+
+def humidity_ratio_from_vapor_pressure(vapor_pressure_psia: ArrayLike, pressure_psia: ArrayLike) -> np.ndarray:
+    """W = 0.621945 p_w / (p - p_w), lb water per lb dry air"""
+    p_w = np.asarray(vapor_pressure_psia, dtype=float)
+    return MOLECULAR_WEIGHT_RATIO * p_w / (np.asarray(pressure_psia, dtype=float) - p_w)
+
+
+def humidity_ratio(temp_f: ArrayLike, rh: ArrayLike, pressure_psia: ArrayLike = SEA_LEVEL_PRESSURE_PSIA) -> np.ndarray:
+    """Humidity ratio from dry-bulb and relative humidity (0-1)"""
+    return humidity_ratio_from_vapor_pressure(np.asarray(rh, dtype=float) * saturation_pressure_psia(temp_f), pressure_psia)
+
+
+def humidity_ratio_from_wet_bulb(
+    dry_bulb_f: ArrayLike,
+    wet_bulb_f: ArrayLike,
+    pressure_psia: ArrayLike = SEA_LEVEL_PRESSURE_PSIA
+) -> np.ndarray:
+    """Humidity ratio from dry-bulb and thermodynamic wet-bulb (ASHRAE Eq 35/37)"""
+    t = np.asarray(dry_bulb_f, dtype=float)
+    t_wb = np.minimum(np.asarray(wet_bulb_f, dtype=float), t)
+    w_sat = humidity_ratio_from_vapor_pressure(saturation_pressure_psia(t_wb), pressure_psia)
+    above_freezing = ((1093 - 0.556 * t_wb) * w_sat - 0.240 * (t - t_wb)) / (1093 + 0.444 * t - t_wb)
+    below_freezing = ((1220 - 0.04 * t_wb) * w_sat - 0.240 * (t - t_wb)) / (1220 + 0.444 * t - 0.48 * t_wb)
+    return np.maximum(np.where(t_wb >= 32, above_freezing, below_freezing), 0.0)
+
+
+def latent_load_btu_hr(
+    cfm: ArrayLike,
+    outdoor_humidity_ratio: ArrayLike,
+    indoor_humidity_ratio: ArrayLike,
+    pressure_psia: ArrayLike = SEA_LEVEL_PRESSURE_PSIA
+) -> np.ndarray:
+    """
+    Latent gain from outdoor air, Q = 4840 × ACF × CFM × ΔW
+
+    Only moisture brought in counts; drier outdoor air gives zero, as
+    Manual J does not credit dehumidification by infiltration.
+    """
+    altitude_correction = np.asarray(pressure_psia, dtype=float) / SEA_LEVEL_PRESSURE_PSIA
+    delta_w = np.maximum(np.asarray(outdoor_humidity_ratio, dtype=float) - np.asarray(indoor_humidity_ratio, dtype=float), 0.0)
+    return LATENT_FACTOR * altitude_correction * np.asarray(cfm, dtype=float) * delta_w
@@ -0,0 +1,303 @@
+"""
+Design Load Uncertainty
+Monte Carlo P10/P50/P90 bands on design heating and cooling loads, sampling
+the inputs the extractors could only estimate (R-values, window U/SHGC,
+ACH50, conditioned area, building orientation)
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+UNCERTAIN_INPUTS = ('wall_r', 'roof_r', 'floor_r', 'window_u', 'window_shgc', 'ach50', 'area')
+
+# Lognormal sigma per input: (read from the blueprint or given by the user, defaulted)
+INPUT_SPREADS = {
+    'wall_r': (0.08, 0.20),
+    'roof_r': (0.08, 0.20),
+    'floor_r': (0.10, 0.25),
+    'window_u': (0.05, 0.15),
+    'window_shgc': (0.08, 0.20),
+    'ach50': (0.15, 0.35),
+}
+
+# Conditioned area sigma: user-entered, floor for AI estimates, fallback area
+AREA_SPREADS = {'user': 0.03, 'estimated': 0.08, 'fallback': 0.25}
+FALLBACK_AREAS = (1850.0, 2000.0, 2599.0)
+
+# How each load component scales with each input, as a power of the sampled
+# ratio: U = 1/R, wall and glazing areas follow the perimeter (√area),
+# roof, floor, volume and internal gains follow the area
+COMPONENT_EXPONENTS = {
+    'heating_wall': {'wall_r': -1.0, 'area': 0.5},
+    'heating_window': {'window_u': 1.0, 'area': 0.5},
+    'heating_roof': {'roof_r': -1.0, 'area': 1.0},
+    'heating_floor': {'floor_r': -1.0, 'area': 1.0},
+    'heating_infiltration': {'ach50': 1.0, 'area': 1.0},
+    'cooling_wall': {'wall_r': -1.0, 'area': 0.5},
+    'cooling_window': {'window_u': 1.0, 'area': 0.5},
+    'cooling_roof': {'roof_r': -1.0, 'area': 1.0},
+    'cooling_solar': {'window_shgc': 1.0, 'area': 0.5},
+    'cooling_internal': {'area': 1.0},
+    'cooling_infiltration': {'ach50': 1.0, 'area': 1.0},
+}
+HEATING_COMPONENTS = tuple(name for name in COMPONENT_EXPONENTS if name.startswith('heating_'))
+COOLING_COMPONENTS = tuple(name for name in COMPONENT_EXPONENTS if name.startswith('cooling_'))
+
+DEFAULT_SAMPLES = 4000
+MAX_SAMPLES = 50000
+SAMPLE_CHUNK = 2000
+TIME_BUDGET_S = 0.5
+PERCENTILES = (10, 50, 90)
+
+
+@dataclass
+class UncertaintyComponents:
+    """
+    Design load split by the uncertain input that drives each part.
+    All values in BTU/hr at design conditions, before duct losses.
+    """
+    heating_wall: float = 0.0
+    heating_window: float = 0.0
+    heating_roof: float = 0.0
+    heating_floor: float = 0.0
+    heating_infiltration: float = 0.0
+    cooling_wall: float = 0.0
+    cooling_window: float = 0.0
+    cooling_roof: float = 0.0
+    cooling_solar: float = 0.0
+    cooling_internal: float = 0.0           # People, lighting, equipment (sensible + latent)
+    cooling_infiltration: float = 0.0       # Sensible + latent
+
+    def add(self, other: 'UncertaintyComponents', heating_weight: float = 1.0, cooling_weight: float = 1.0) -> None:
+        """Accumulate another breakdown (e.g. a zone) with heating/cooling multipliers"""
+        for name in HEATING_COMPONENTS:
+            setattr(self, name, getattr(self, name) + getattr(other, name) * heating_weight)
+        for name in COOLING_COMPONENTS:
+            setattr(self, name, getattr(self, name) + getattr(other, name) * cooling_weight)
+
+    def vector(self) -> np.ndarray:
+        return np.array([getattr(self, name) for name in COMPONENT_EXPONENTS], dtype=float)
+
+
+@dataclass
+class UncertainInput:
+    """One sampled input: lognormal around the value the calculation used"""
+    name: str
+    nominal: float
+    spread: float       # Lognormal sigma (≈ relative standard deviation)
+    source: str         # 'blueprint', 'user', 'climate_default', 'default', 'estimated', ...
+
+
+@dataclass
+class LoadBand:
+    """Percentiles of one sampled design load"""
+    p10_btuh: float
+    p50_btuh: float
+    p90_btuh: float
+    design_btuh: float
+    relative_spread: float  # (P90 - P10) / P50
+
+
+@dataclass
+class UncertaintyResult:
+    """Monte Carlo bands on the design loads"""
+    samples: int
+    heating: LoadBand
+    cooling: LoadBand
+    inputs: List[UncertainInput]
+    orientation_sampled: bool
+
+    # Rank correlation of each input with the sampled loads (which inputs drive the band)
+    sensitivity: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    seed: int = 0
+    runtime_ms: float = 0.0
+    budget_limited: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class UncertaintyCalculator:
+    """
+    Vectorized Monte Carlo over the design load decomposition.
+
+    The loads are linear in the component totals and each component scales
+    as a power of the sampled input ratios (COMPONENT_EXPONENTS), so every
+    sample is one row of exp(log_ratios @ exponents) applied to the nominal
+    components. The calculated design load is kept as the anchor: each
+    sample is the design load times the ratio of its sampled component sum
+    to the nominal sum, which carries duct losses and reliability
+    adjustments through unchanged.
+    """
+
+    def __init__(self):
+        # (inputs × components) exponent matrix
+        self.exponents = np.array([
+            [COMPONENT_EXPONENTS[component].get(name, 0.0) for component in COMPONENT_EXPONENTS]
+            for name in UNCERTAIN_INPUTS
+        ])
+        self.heating_mask = np.array([name in HEATING_COMPONENTS for name in COMPONENT_EXPONENTS])
+
+    def input_from_source(self, name: str, nominal: float, source: str, confidence: float = 1.0) -> UncertainInput:
+        """
+        Spread for an envelope input from where its value came from.
+        Blueprint values widen as extraction confidence drops.
+        """
+        known, defaulted = INPUT_SPREADS[name]
+        if source == 'user':
+            spread = known
+        elif source == 'blueprint':
+            spread = min(defaulted, known * (2.0 - max(0.0, min(1.0, confidence))))
+        else:
+            spread = defaulted
+        return UncertainInput(name=name, nominal=float(nominal), spread=spread, source=source)
+
+    def area_input(self, area_sqft: float, estimates: Optional[Dict[str, float]] = None, user_provided: bool = False) -> UncertainInput:
+        """
+        Conditioned area spread from the disagreement between area estimates
+        (text takeoff, vision, detected rooms)
+        """
+        if user_provided:
+            return UncertainInput('area', float(area_sqft), AREA_SPREADS['user'], 'user')
+
+        values = [v for v in (estimates or {}).values() if v and v > 0] + [area_sqft]
+        spread = max(AREA_SPREADS['estimated'], float(np.std(np.log(values))))
+        source = 'estimated'
+        if any(abs(area_sqft - fallback) < 1.0 for fallback in FALLBACK_AREAS):
+            spread = max(spread, AREA_SPREADS['fallback'])
+            source = 'fallback'
+        return UncertainInput('area', float(area_sqft), spread, source)
+
+    def run(
+        self,
+        components: UncertaintyComponents,
+        inputs: Sequence[UncertainInput],
+        heating_btuh: float,
+        cooling_btuh: float,
+        orientation_curve_btuh: Optional[Sequence[float]] = None,
+        samples: int = DEFAULT_SAMPLES,
+        seed: int = 0,
+        time_budget_s: float = TIME_BUDGET_S
+    ) -> UncertaintyResult:
+        """
+        Sample the inputs and return load percentiles.
+
+        Args:
+            components: Nominal design load decomposition
+            inputs: Uncertain inputs; names not given are held at their nominal
+            heating_btuh: Final design heating load (anchor)
+            cooling_btuh: Final design cooling load (anchor)
+            orientation_curve_btuh: Cooling load per building rotation, element 0
+                as modeled; when given, a rotation is drawn uniformly per sample
+            samples: Number of Monte Carlo samples
+            seed: RNG seed (fixed so repeated runs of a job agree)
+            time_budget_s: Stop drawing further chunks once exceeded
+
+        Returns:
+            UncertaintyResult with P10/P50/P90 heating and cooling
+        """
+        start = time.perf_counter()
+        samples = int(max(SAMPLE_CHUNK // 4, min(samples, MAX_SAMPLES)))
+        rng = np.random.default_rng(seed)
+
+        spreads = np.zeros(len(UNCERTAIN_INPUTS))
+        for item in inputs:
+            if item.name in UNCERTAIN_INPUTS:
+                spreads[UNCERTAIN_INPUTS.index(item.name)] = item.spread
+
+        nominal = components.vector()
+        nominal_heating = nominal[self.heating_mask].sum()
+        nominal_cooling = nominal[~self.heating_mask].sum()
+
+        orientation_ratios = None
+        if orientation_curve_btuh is not None and len(orientation_curve_btuh) > 1 and orientation_curve_btuh[0] > 0:
+            orientation_ratios = np.asarray(orientation_curve_btuh, dtype=float) / orientation_curve_btuh[0]
+
+        z_chunks, heating_chunks, cooling_chunks, rotation_chunks = [], [], [], []
+        drawn = 0
+        budget_limited = False
+        while drawn < samples:
+            n = min(SAMPLE_CHUNK, samples - drawn)
+            z = rng.standard_normal((n, len(UNCERTAIN_INPUTS)))
+            sampled = np.exp((z * spreads) @ self.exponents) * nominal
+
+            heating = heating_btuh * (sampled[:, self.heating_mask].sum(axis=1) / nominal_heating if nominal_heating > 0 else 1.0)
+            cooling = cooling_btuh * (sampled[:, ~self.heating_mask].sum(axis=1) / nominal_cooling if nominal_cooling > 0 else 1.0)
+            if orientation_ratios is not None:
+                rotation = orientation_ratios[rng.integers(len(orientation_ratios), size=n)]
+                cooling = cooling * rotation
+                rotation_chunks.append(rotation)
+
+            z_chunks.append(z)
+            heating_chunks.append(np.broadcast_to(heating, (n,)))
+            cooling_chunks.append(np.broadcast_to(cooling, (n,)))
+            drawn += n
+            if drawn < samples and time.perf_counter() - start > time_budget_s:
+                budget_limited = True
+                logger.warning(f"⏱️ Uncertainty sampling stopped at {drawn} of {samples} samples (time budget)")
+                break
+
+        z = np.concatenate(z_chunks)
+        heating = np.concatenate(heating_chunks)
+        cooling = np.concatenate(cooling_chunks)
+
+        drivers = {name: z[:, i] for i, name in enumerate(UNCERTAIN_INPUTS) if spreads[i] > 0}
+        if rotation_chunks:
+            drivers['orientation'] = np.concatenate(rotation_chunks)
+        sensitivity = {
+            name: {'heating': self._rank_correlation(values, heating), 'cooling': self._rank_correlation(values, cooling)}
+            for name, values in drivers.items()
+        }
+
+        result = UncertaintyResult(
+            samples=drawn,
+            heating=self._band(heating, heating_btuh),
+            cooling=self._band(cooling, cooling_btuh),
+            inputs=list(inputs),
+            orientation_sampled=orientation_ratios is not None,
+            sensitivity=sensitivity,
+            seed=seed,
+            runtime_ms=(time.perf_counter() - start) * 1000,
+            budget_limited=budget_limited
+        )
+        logger.info(f"🎲 Uncertainty ({drawn} samples, {result.runtime_ms:.0f} ms): "
+                    f"heating P10/P50/P90 {result.heating.p10_btuh:,.0f}/{result.heating.p50_btuh:,.0f}/{result.heating.p90_btuh:,.0f}, "
+                    f"cooling {result.cooling.p10_btuh:,.0f}/{result.cooling.p50_btuh:,.0f}/{result.cooling.p90_btuh:,.0f} BTU/hr")
+        return result
+
+    def _band(self, values: np.ndarray, design_btuh: float) -> LoadBand:
+        p10, p50, p90 = (float(v) for v in np.percentile(values, PERCENTILES))
+        return LoadBand(
+            p10_btuh=p10,
+            p50_btuh=p50,
+            p90_btuh=p90,
+            design_btuh=float(design_btuh),
+            relative_spread=(p90 - p10) / p50 if p50 > 0 else 0.0
+        )
+
+    def _rank_correlation(self, x: np.ndarray, y: np.ndarray) -> float:
+        """Spearman correlation (ranks via argsort; ties are negligible for continuous samples)"""
+        if np.ptp(y) == 0 or np.ptp(x) == 0:
+            return 0.0
+        rank_x = np.argsort(np.argsort(x))
+        rank_y = np.argsort(np.argsort(y))
+        return float(np.corrcoef(rank_x, rank_y)[0, 1])
+
+
+# Singleton instance
+_uncertainty_calculator = None
+
+
+def get_uncertainty_calculator() -> UncertaintyCalculator:
+    """Get or create the global uncertainty calculator"""
+    global _uncertainty_calculator
+    if _uncertainty_calculator is None:
+        _uncertainty_calculator = UncertaintyCalculator()
+    return _uncertainty_calculator
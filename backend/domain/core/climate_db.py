@@ -0,0 +1,136 @@
+"""
+Preloaded Climate Database
+Resolves ZIP codes to a climate zone and ASHRAE design conditions from
+in-memory tables built once at startup (no file I/O per lookup)
+"""
+
+import csv
+import os
+import logging
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+from .zip_climate_zones import ZIP_CLIMATE_ZONES
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'data')
+ASHRAE_TEMPS_FILE = os.path.join(DATA_DIR, 'ashrae_design_temps.csv')
+
+# Defaults when a ZIP cannot be resolved (unchanged from the original lookup)
+DEFAULT_CLIMATE = {
+    'climate_zone': '4A',
+    'winter_99': 10,
+    'summer_1': 90,
+    'summer_wb': 75,
+}
+
+
+class ClimateDatabase:
+    """
+    Indexed climate lookup.
+
+    - Stations: ASHRAE design rows in file order
+    - Prefix table: 3-digit ZIP prefix → (IECC climate zone, station index),
+      where the station is the first row in the file for that climate zone
+      (None when the zone has no station, leaving the default temperatures)
+
+    This precomputes exactly what the per-request CSV scan returned, so a
+    lookup is one dict read plus a dict copy.
+    """
+
+    def __init__(self, temps_file: str = ASHRAE_TEMPS_FILE):
+        self.temps_file = temps_file
+        self.stations: List[Dict[str, Any]] = []
+        self._prefixes: Dict[str, Tuple[str, Optional[int]]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Read the station CSV and compile the prefix → (zone, station) table"""
+        if os.path.exists(self.temps_file):
+            with open(self.temps_file, 'r') as f:
+                for row in csv.DictReader(f):
+                    self.stations.append({
+                        'location': row['location'],
+                        'state': row['state'],
+                        'climate_zone': row['climate_zone'],
+                        'winter_99': float(row['winter_99']),
+                        'summer_1': float(row['summer_1']),
+                        'summer_wb': float(row['summer_wb']),
+                        'daily_range': float(row['daily_range']),
+                        'elevation': float(row['elevation'])
+                    })
+        else:
+            logger.warning(f"⚠️  ASHRAE design temperature file not found: {self.temps_file}")
+
+        # First station listed for each climate zone
+        zone_stations: Dict[str, int] = {}
+        for index, station in enumerate(self.stations):
+            zone_stations.setdefault(station['climate_zone'], index)
+
+        self._prefixes = {
+            prefix: (zone, zone_stations.get(zone))
+            for prefix, zone in ZIP_CLIMATE_ZONES.items()
+        }
+
+        logger.info(f"🌡️  Climate database loaded: {len(self.stations)} stations, {len(ZIP_CLIMATE_ZONES)} ZIP prefixes")
+
+    def _resolve(self, zip_code: str) -> Optional[Tuple[str, Optional[int]]]:
+        """(climate zone, station index) for a ZIP's 3-digit prefix, or None if unmapped"""
+        if not zip_code or len(zip_code) < 3:
+            return None
+        return self._prefixes.get(zip_code[:3])
+
+    def get_station(self, zip_code: str) -> Optional[Dict[str, Any]]:
+        """Design station for a ZIP code, or None if it cannot be resolved"""
+        resolved = self._resolve(zip_code)
+        if resolved is None or resolved[1] is None:
+            return None
+        return self.stations[resolved[1]]
+
+    def get_climate_zone(self, zip_code: str) -> Optional[str]:
+        """IECC climate zone for a ZIP code, or None if unmapped"""
+        resolved = self._resolve(zip_code)
+        return resolved[0] if resolved else None
+
+    def lookup(self, zip_code: str) -> Dict[str, Any]:
+        """
+        Climate zone and ASHRAE design conditions for a ZIP code.
+        Returns a new dict on every call so callers may modify it.
+        """
+        result = {'zip_code': zip_code, 'found': False, **DEFAULT_CLIMATE}
+
+        resolved = self._resolve(zip_code)
+        if resolved is None:
+            return result
+
+        climate_zone, station_index = resolved
+        result['climate_zone'] = climate_zone
+        result['found'] = True
+        # Design conditions are per climate zone, not per location
+        result['location'] = 'US'
+        result['state'] = 'US'
+
+        if station_index is not None:
+            station = self.stations[station_index]
+            result['winter_99'] = station['winter_99']
+            result['summer_1'] = station['summer_1']
+            result['summer_wb'] = station['summer_wb']
+            result['daily_range'] = station['daily_range']
+
+        return result
+
+
+# Singleton instance
+_climate_database = None
+_climate_database_lock = threading.Lock()
+
+
+def get_climate_database() -> ClimateDatabase:
+    """Get or create the global climate database (loaded once per process)"""
+    global _climate_database
+    if _climate_database is None:
+        with _climate_database_lock:
+            if _climate_database is None:
+                _climate_database = ClimateDatabase()
+    return _climate_database
@@ -15,11 +15,8 @@ This module consolidates:
 - Construction quality adjustments
 """
 
-import csv
-import os
 from typing import Dict, Any, Optional
-from functools import lru_cache
-from .zip_climate_zones import get_climate_zone_fast
+from .climate_db import get_climate_database
 
 
 # Building Era-Based Insulation Defaults
@@ -500,16 +497,13 @@ def get_construction_factors(zone_config: dict, construction_quality: str, build
     return factors
 
 
-# Data file paths
-DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'data')
-ASHRAE_TEMPS_FILE = os.path.join(DATA_DIR, 'ashrae_design_temps.csv')
-
-
-@lru_cache(maxsize=128)
+# ZIP code climate lookup (tables preloaded by climate_db)
 def get_climate_data_for_zip(zip_code: str) -> Dict[str, Any]:
     """
     Get comprehensive climate data for a ZIP code
     Combines climate zone lookup with ASHRAE design temperatures
+    from the preloaded climate database (first design station listed
+    for the ZIP's climate zone)
     
     Args:
         zip_code: 5-digit US ZIP code
@@ -517,66 +511,12 @@ def get_climate_data_for_zip(zip_code: str) -> Dict[str, Any]:
     Returns:
         Dict with climate zone, design temperatures, and location info
     """
-    result = {
-        'zip_code': zip_code,
-        'found': False,
-        'climate_zone': '4A',  # Default fallback
-        'winter_99': 10,       # Default fallback
-        'summer_1': 90,        # Default fallback
-        'summer_wb': 75,       # Default fallback
-    }
+    result = get_climate_database().lookup(zip_code)
     
-    # Get climate zone using fast dictionary lookup
-    try:
-        climate_zone = get_climate_zone_fast(zip_code)
-        if climate_zone != '4A':  # Found in database (not fallback)
-            result['climate_zone'] = climate_zone
-            result['found'] = True
-            # Set generic location info since we don't store it in the dict
-            result['location'] = 'US'
-            result['state'] = 'US'
-        else:
-            # Check if it's actually zone 4A or just fallback
-            prefix = zip_code[:3] if zip_code else ''
-            from .zip_climate_zones import ZIP_CLIMATE_ZONES
-            if prefix in ZIP_CLIMATE_ZONES:
-                result['climate_zone'] = ZIP_CLIMATE_ZONES[prefix]
-                result['found'] = True
-                result['location'] = 'US'
-                result['state'] = 'US'
-        
-        # Then get ASHRAE design temps - try to match location first, then climate zone
-        if result['found'] and os.path.exists(ASHRAE_TEMPS_FILE):
-            with open(ASHRAE_TEMPS_FILE, 'r') as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-                
-                # First try exact location match
-                for row in rows:
-                    if 'location' in result and row['location'] == result['location']:
-                        result['winter_99'] = float(row['winter_99'])
-                        result['summer_1'] = float(row['summer_1'])
-                        result['summer_wb'] = float(row['summer_wb'])
-                        result['daily_range'] = float(row['daily_range'])
-                        break
-                else:
-                    # Fallback to climate zone match
-                    for row in rows:
-                        if row['climate_zone'] == result['climate_zone']:
-                            result['winter_99'] = float(row['winter_99'])
-                            result['summer_1'] = float(row['summer_1'])
-                            result['summer_wb'] = float(row['summer_wb'])
-                            result['daily_range'] = float(row['daily_range'])
-                            break
-        
-        # Add zone-specific humidity ratios
-        zone_config = get_zone_config(result['climate_zone'])
-        result['summer_humidity'] = zone_config.get('outdoor_humidity_ratio_summer', 0.010)
-        result['winter_humidity'] = zone_config.get('outdoor_humidity_ratio_winter', 0.003)
-        
-    except Exception as e:
-        # Return defaults on error
-        pass
+    # Add zone-specific humidity ratios
+    zone_config = get_zone_config(result['climate_zone'])
+    result['summer_humidity'] = zone_config.get('outdoor_humidity_ratio_summer', 0.010)
+    result['winter_humidity'] = zone_config.get('outdoor_humidity_ratio_winter', 0.003)
     
     return result
 
@@ -8,6 +8,8 @@ import statistics
 from dataclasses import dataclass
 from typing import Dict, Any, List, Optional, Tuple
 
+import numpy as np
+
 from .quality_score import QualityScore, get_quality_assessor
 from .baselines import Candidate, get_code_min_baseline, get_ua_oa_baseline, get_regional_baseline
 from .clamps import apply_conservative_unknowns, apply_sanity_clamps
@@ -56,6 +58,10 @@ class EnsembleDecisionEngine:
         self.ua_oa_baseline = get_ua_oa_baseline()
         self.regional_baseline = get_regional_baseline()
         
+        # Independent baseline methods, in candidate order; each depends only
+        # on the conservative envelope and the climate data
+        self.baselines = (self.code_min_baseline, self.ua_oa_baseline, self.regional_baseline)
+        
         # Weight guidelines - starting points before quality/spread adjustments
         # ACCURACY-FOCUSED: Higher AI weight for <5% accuracy requirement
         self.base_weights = {
@@ -116,25 +122,23 @@ class EnsembleDecisionEngine:
         notes.append(routing_note)
         logger.info(f"📊 {routing_note}")
         
-        # 3. Calculate all baseline candidates
-        candidate_b = self.code_min_baseline.calculate(envelope_conservative, climate_data)
-        candidate_c = self.ua_oa_baseline.calculate(envelope_conservative, climate_data)
-        candidate_d = self.regional_baseline.calculate(envelope_conservative, climate_data)
+        # 3. Calculate all baseline candidates. Each is a few scalar formulas,
+        # so they are called inline - dispatching them to threads costs more
+        # than the calculations themselves.
+        candidates = [ai_result] + [
+            baseline.calculate(envelope_conservative, climate_data) for baseline in self.baselines
+        ]
         
-        candidates = [ai_result, candidate_b, candidate_c, candidate_d]
+        # 4. Calculate spread between methods
+        heating_values = [c.heating_btuh for c in candidates]
+        spread = self._calculate_spread(heating_values)
         
-        # 4. Handle orientation uncertainty if needed
+        # 5. Handle orientation uncertainty if needed
         orientation_band = None
         if handle_orientation_uncertainty:
-            orientation_band, candidates = self._handle_orientation_range(
-                candidates, envelope_conservative, climate_data
-            )
+            orientation_band = self._handle_orientation_range(candidates, envelope_conservative)
             notes.append("Computed orientation range for unknown north")
         
-        # 5. Calculate spread between methods
-        heating_values = [c.heating_btuh for c in candidates]
-        spread = self._calculate_spread(heating_values)
-        
         spread_note = f"Method spread: {spread:.1%}"
         notes.append(spread_note)
         logger.info(f"📈 {spread_note}")
@@ -314,16 +318,15 @@ class EnsembleDecisionEngine:
     def _handle_orientation_range(
         self,
         candidates: List[Candidate],
-        envelope: Dict[str, Any],
-        climate_data: Dict[str, Any]
-    ) -> Tuple[Dict[str, Any], List[Candidate]]:
-        """
-        Handle unknown building orientation by computing N/E/S/W cases.
-        Returns median values and range band for uncertainty quantification.
+        envelope: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """
+        Handle unknown building orientation with a min/median/max band.
         
-        # For now, return simplified orientation band
-        # In full implementation, would re-run calculations with different orientations
+        Uses the per-rotation curve the pipeline already swept (carried on the
+        envelope) as ratios to the as-modeled load, applied to the candidate
+        range; no candidate is re-evaluated. Falls back to a ±5% band.
+        """
         
         heating_values = [c.heating_btuh for c in candidates]
         cooling_values = [c.cooling_btuh for c in candidates]
@@ -335,9 +338,19 @@ class EnsembleDecisionEngine:
         heating_max = max(heating_values) * (1 + orientation_variation)
         heating_median = statistics.median(heating_values)
         
-        cooling_min = min(cooling_values) * (1 - orientation_variation)
-        cooling_max = max(cooling_values) * (1 + orientation_variation)
-        cooling_median = statistics.median(cooling_values)
+        sweep = envelope.get('orientation_sweep')
+        if sweep and sweep.get('base_cooling_btuh'):
+            # Rotation ratios relative to as-modeled, straight from the sweep curve
+            ratios = np.asarray(sweep['cooling_btuh'], dtype=float) / sweep['base_cooling_btuh']
+            cooling_min = min(cooling_values) * float(ratios.min())
+            cooling_max = max(cooling_values) * float(ratios.max())
+            cooling_median = statistics.median(cooling_values) * float(np.median(ratios))
+            note = f"Orientation band from {len(ratios)}-rotation sweep (heating ±5%)"
+        else:
+            cooling_min = min(cooling_values) * (1 - orientation_variation)
+            cooling_max = max(cooling_values) * (1 + orientation_variation)
+            cooling_median = statistics.median(cooling_values)
+            note = 'Orientation uncertainty band (±5% variation applied)'
         
         orientation_band = {
             'heating': {
@@ -350,12 +363,12 @@ class EnsembleDecisionEngine:
                 'median': cooling_median,
                 'max': cooling_max
             },
-            'note': 'Orientation uncertainty band (±5% variation applied)'
+            'note': note
         }
         
         logger.info(f"🧭 Orientation band: Heating {heating_min:.0f}-{heating_max:.0f}, Cooling {cooling_min:.0f}-{cooling_max:.0f}")
         
-        return orientation_band, candidates
+        return orientation_band
 
 
 # Singleton instance
@@ -5,9 +5,10 @@ Based on ASHRAE and building codes by era and climate zone
 """
 
 import logging
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, List, Sequence
 from dataclasses import dataclass
 from enum import Enum
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -297,6 +298,36 @@ class ThermalAssemblyLibrary:
         "8": {"wall_r": 21, "ceiling_r": 49, "floor_r": 30}
     }
     
+    # Typical assembly by construction era. A (default, zones, upgrade) entry
+    # uses the upgrade in the listed climate zones.
+    ERA_ASSEMBLY_KEYS = {
+        "wall": {
+            ConstructionEra.PRE_1960: "2x4_R0",
+            ConstructionEra.ERA_1960_1979: "2x4_R11",
+            ConstructionEra.ERA_1980_1999: "2x4_R13",
+            ConstructionEra.ERA_2000_2009: "2x6_R19",  # 2x6 walls became standard
+            ConstructionEra.ERA_2010_2019: "2x6_R20",
+            # High performance with foam in cold zones
+            ConstructionEra.ERA_2020_PLUS: ("2x6_R21", ("5", "6", "7", "8"), "2x6_R20_foam"),
+        },
+        "ceiling": {
+            ConstructionEra.PRE_1960: "ceiling_R0",
+            ConstructionEra.ERA_1960_1979: "ceiling_R19",
+            ConstructionEra.ERA_1980_1999: "ceiling_R30",
+            ConstructionEra.ERA_2000_2009: "ceiling_R38",
+            ConstructionEra.ERA_2010_2019: "ceiling_R49",
+            ConstructionEra.ERA_2020_PLUS: ("ceiling_R49", ("6", "7", "8"), "ceiling_R60"),
+        },
+        "floor": {
+            ConstructionEra.PRE_1960: "floor_R0",
+            ConstructionEra.ERA_1960_1979: "floor_R13",
+            ConstructionEra.ERA_1980_1999: "floor_R13",
+            ConstructionEra.ERA_2000_2009: "floor_R19",
+            ConstructionEra.ERA_2010_2019: ("floor_R19", ("5", "6", "7", "8"), "floor_R30"),
+            ConstructionEra.ERA_2020_PLUS: ("floor_R19", ("5", "6", "7", "8"), "floor_R30"),
+        },
+    }
+    
     def get_assembly_by_era(
         self,
         assembly_type: str,
@@ -314,55 +345,7 @@ class ThermalAssemblyLibrary:
         Returns:
             ThermalAssembly with appropriate R-value
         """
-        
-        if assembly_type == "wall":
-            if era == ConstructionEra.PRE_1960:
-                return self.WALL_ASSEMBLIES["2x4_R0"]
-            elif era == ConstructionEra.ERA_1960_1979:
-                return self.WALL_ASSEMBLIES["2x4_R11"]
-            elif era == ConstructionEra.ERA_1980_1999:
-                return self.WALL_ASSEMBLIES["2x4_R13"]
-            elif era == ConstructionEra.ERA_2000_2009:
-                # 2x6 walls became standard
-                return self.WALL_ASSEMBLIES["2x6_R19"]
-            elif era == ConstructionEra.ERA_2010_2019:
-                return self.WALL_ASSEMBLIES["2x6_R20"]
-            else:  # 2020+
-                # High performance with foam
-                if climate_zone in ["5", "6", "7", "8"]:
-                    return self.WALL_ASSEMBLIES["2x6_R20_foam"]
-                return self.WALL_ASSEMBLIES["2x6_R21"]
-        
-        elif assembly_type == "ceiling":
-            if era == ConstructionEra.PRE_1960:
-                return self.CEILING_ASSEMBLIES["ceiling_R0"]
-            elif era == ConstructionEra.ERA_1960_1979:
-                return self.CEILING_ASSEMBLIES["ceiling_R19"]
-            elif era == ConstructionEra.ERA_1980_1999:
-                return self.CEILING_ASSEMBLIES["ceiling_R30"]
-            elif era == ConstructionEra.ERA_2000_2009:
-                return self.CEILING_ASSEMBLIES["ceiling_R38"]
-            elif era == ConstructionEra.ERA_2010_2019:
-                return self.CEILING_ASSEMBLIES["ceiling_R49"]
-            else:  # 2020+
-                if climate_zone in ["6", "7", "8"]:
-                    return self.CEILING_ASSEMBLIES["ceiling_R60"]
-                return self.CEILING_ASSEMBLIES["ceiling_R49"]
-        
-        elif assembly_type == "floor":
-            if era == ConstructionEra.PRE_1960:
-                return self.FLOOR_ASSEMBLIES["floor_R0"]
-            elif era in [ConstructionEra.ERA_1960_1979, ConstructionEra.ERA_1980_1999]:
-                return self.FLOOR_ASSEMBLIES["floor_R13"]
-            elif era == ConstructionEra.ERA_2000_2009:
-                return self.FLOOR_ASSEMBLIES["floor_R19"]
-            else:  # 2010+
-                if climate_zone in ["5", "6", "7", "8"]:
-                    return self.FLOOR_ASSEMBLIES["floor_R30"]
-                return self.FLOOR_ASSEMBLIES["floor_R19"]
-        
-        # Default
-        return self.WALL_ASSEMBLIES["2x6_R20"]
+        return self.get_assemblies_by_era(assembly_type, [era], [climate_zone])[0]
     
     def get_assembly_by_r_value(
         self,
@@ -379,27 +362,57 @@ class ThermalAssemblyLibrary:
         Returns:
             Closest matching ThermalAssembly
         """
+        return self.get_assemblies_by_r_value(assembly_type, [target_r_value])[0]
+    
+    def get_assemblies_by_era(
+        self,
+        assembly_type: str,
+        eras: Sequence[ConstructionEra],
+        climate_zones: Sequence[str]
+    ) -> List[ThermalAssembly]:
+        """
+        Assemblies for many buildings from the era table compiled at import.
         
-        if assembly_type == "wall":
-            assemblies = self.WALL_ASSEMBLIES
-        elif assembly_type == "ceiling":
-            assemblies = self.CEILING_ASSEMBLIES
-        elif assembly_type == "floor":
-            assemblies = self.FLOOR_ASSEMBLIES
-        else:
-            return self.WALL_ASSEMBLIES["2x6_R20"]  # Default
+        Zones other than 4-8 (including lettered zones like '5B') use the
+        zone 4 rules; unknown assembly types get the 2x6 R-20 wall.
         
-        # Find closest match
-        best_match = None
-        best_diff = float('inf')
+        Args:
+            assembly_type: 'wall', 'ceiling', or 'floor'
+            eras: Construction era per building
+            climate_zones: Climate zone per building
+            
+        Returns:
+            ThermalAssembly per building
+        """
+        return [
+            _ERA_TABLE[(assembly_type if assembly_type in _R_VALUE_TABLE else None, era, _era_zone_key(zone))]
+            for era, zone in zip(eras, climate_zones)
+        ]
+    
+    def get_assemblies_by_r_value(
+        self,
+        assembly_type: str,
+        target_r_values: Sequence[float]
+    ) -> List[ThermalAssembly]:
+        """
+        Assemblies with the nominal R-value closest to each target.
         
-        for assembly in assemblies.values():
-            diff = abs(assembly.r_value_nominal - target_r_value)
-            if diff < best_diff:
-                best_diff = diff
-                best_match = assembly
+        Ties go to the first assembly in library order (argmin returns the
+        first minimum); unknown assembly types get the 2x6 R-20 wall.
         
-        return best_match
+        Args:
+            assembly_type: 'wall', 'ceiling', or 'floor'
+            target_r_values: Desired R-values
+            
+        Returns:
+            Closest matching ThermalAssembly per target
+        """
+        if assembly_type not in _R_VALUE_TABLE:
+            return [self.WALL_ASSEMBLIES["2x6_R20"]] * len(target_r_values)
+        assemblies, nominal = _R_VALUE_TABLE[assembly_type]
+        targets = np.asarray(target_r_values, dtype=float)
+        best = np.argmin(np.abs(nominal[None, :] - targets[:, None]), axis=1)
+        return [assemblies[i] for i in best]
     
     def get_code_minimum(
         self,
@@ -463,6 +476,44 @@ class ThermalAssemblyLibrary:
             return ConstructionEra.ERA_2020_PLUS
 
 
+# Zones the era rules single out; every other zone string behaves like "4"
+_ERA_ZONES = ("4", "5", "6", "7", "8")
+
+
+def _era_zone_key(climate_zone: str) -> str:
+    return climate_zone if climate_zone in _ERA_ZONES else "4"
+
+
+def _compile_assembly_tables(library: ThermalAssemblyLibrary):
+    """
+    Era table: (assembly_type, era, zone) -> assembly, expanded from
+    ERA_ASSEMBLY_KEYS; unknown assembly types are keyed as None.
+    R-value table: assembly_type -> (assemblies, nominal R array) in library order.
+    """
+    libraries = {
+        "wall": library.WALL_ASSEMBLIES,
+        "ceiling": library.CEILING_ASSEMBLIES,
+        "floor": library.FLOOR_ASSEMBLIES,
+    }
+    era_table = {
+        (None, era, zone): library.WALL_ASSEMBLIES["2x6_R20"]
+        for era in ConstructionEra
+        for zone in _ERA_ZONES
+    }
+    r_value_table = {}
+    for assembly_type, assemblies in libraries.items():
+        for era, rule in library.ERA_ASSEMBLY_KEYS[assembly_type].items():
+            default, upgraded_zones, upgrade = rule if isinstance(rule, tuple) else (rule, (), rule)
+            for zone in _ERA_ZONES:
+                era_table[(assembly_type, era, zone)] = assemblies[upgrade if zone in upgraded_zones else default]
+        ordered = list(assemblies.values())
+        r_value_table[assembly_type] = (ordered, np.array([a.r_value_nominal for a in ordered], dtype=float))
+    return era_table, r_value_table
+
+
+_ERA_TABLE, _R_VALUE_TABLE = _compile_assembly_tables(ThermalAssemblyLibrary())
+
+
 # Singleton instance
 _assembly_library = None
 
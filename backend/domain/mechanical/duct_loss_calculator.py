@@ -11,9 +11,10 @@ Calculates duct losses based on:
 Designed for 100% accurate load calculations across ANY blueprint.
 """
 
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, Tuple, Optional, Sequence
 from dataclasses import dataclass
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,16 @@ class DuctLossResults:
     source: str  # 'user_input', 'climate_default', 'foundation_inferred'
 
 
+@dataclass
+class DuctLossBatch:
+    """Duct loss factors for many configurations, one array entry per configuration"""
+    heating_factor: np.ndarray
+    cooling_factor: np.ndarray
+    confidence: np.ndarray
+    duct_location: np.ndarray  # str, normalized location actually applied
+    temp_category: np.ndarray  # str, DUCT_TEMP_CATEGORIES entry
+
+
 class IntelligentDuctLossCalculator:
     """
     World-class duct loss calculator following ACCA Manual J standards.
@@ -106,6 +117,15 @@ class IntelligentDuctLossCalculator:
             'unknown': 'attic'
         }
         
+        # ACCA Manual J typical duct locations by foundation type, used when
+        # the user did not say; slab homes typically have attic ducts and
+        # anything else defaults to the most common location, the attic
+        self.foundation_duct_locations = {
+            'crawlspace': 'crawlspace',
+            'basement_with_slab': 'basement',
+            'slab_only': 'attic',
+        }
+        
         # Climate zone adjustments for NEW CONSTRUCTION
         # Small adjustments only - base factors already account for typical conditions
         # These provide fine-tuning for extreme climates per ACCA Manual J
@@ -142,60 +162,39 @@ class IntelligentDuctLossCalculator:
         """
         logger.info(f"🔧 Calculating duct losses: {config.system_type} in {config.duct_location}")
         
+        # One-configuration batch: the factors come from the compiled table
+        batch = calculate_duct_losses_batch(
+            [config.system_type],
+            [config.duct_location],
+            [config.climate_zone],
+            [config.foundation_type],
+            [config.winter_design_temp],
+            [config.summer_design_temp]
+        )
+        duct_location = batch.duct_location[0]
+        heating_factor = float(batch.heating_factor[0])
+        cooling_factor = float(batch.cooling_factor[0])
+        confidence = float(batch.confidence[0])
+        notes = self.base_duct_factors[duct_location]['notes']
+        
         # Handle ductless systems
-        if config.system_type == 'ductless':
+        if duct_location == 'ductless':
             return DuctLossResults(
-                heating_factor=1.00,
-                cooling_factor=1.00,
-                confidence=1.0,
-                notes="Ductless system - no distribution losses",
+                heating_factor=heating_factor,
+                cooling_factor=cooling_factor,
+                confidence=confidence,
+                notes=notes,
                 source="user_input"
             )
         
-        # Get duct location and normalize it
         raw_location = config.duct_location or self._infer_duct_location(config)
-        
-        # Normalize the location string to handle various formats
-        duct_location = self.location_normalizer.get(raw_location.lower() if raw_location else 'attic', 'attic')
-        
-        if raw_location and raw_location != duct_location:
+        if raw_location != duct_location:
             logger.info(f"   Normalized duct location: '{raw_location}' → '{duct_location}'")
         
-        # Get base factors for normalized duct location
-        base_factors = self.base_duct_factors.get(duct_location, self.base_duct_factors['attic'])
-        
-        # Apply climate zone multipliers for unconditioned spaces
+        # Unconditioned spaces carry climate zone and temperature differential adjustments
         if duct_location in ['crawlspace', 'attic', 'basement']:
-            climate_zone_number = config.climate_zone[0] if config.climate_zone else '4'
-            climate_multiplier = self.climate_multipliers.get(climate_zone_number, 
-                                                            self.climate_multipliers['4'])
-            
-            heating_factor = base_factors['heating'] * climate_multiplier['heating']
-            cooling_factor = base_factors['cooling'] * climate_multiplier['cooling']
-            
-            # Apply temperature differential factors
-            temp_category = self._categorize_temperature_differential(
-                config.winter_design_temp, config.summer_design_temp, duct_location
-            )
-            temp_multiplier = self.temp_differential_factors[temp_category]
-            
-            if duct_location in ['attic', 'crawlspace']:
-                heating_factor *= temp_multiplier
-                cooling_factor *= temp_multiplier
-                
-            notes = f"{base_factors['notes']} in climate zone {config.climate_zone}, {temp_category} temperature differential"
-            
-        else:
-            # Conditioned space - minimal adjustments
-            heating_factor = base_factors['heating']
-            cooling_factor = base_factors['cooling'] 
-            notes = base_factors['notes']
-        
-        # Cap factors at reasonable maximums per ACCA Manual J
-        heating_factor = min(heating_factor, 1.40)  # Max 40% losses
-        cooling_factor = min(cooling_factor, 1.35)  # Max 35% losses
+            notes = f"{notes} in climate zone {config.climate_zone}, {batch.temp_category[0]} temperature differential"
         
-        confidence = 0.95 if config.duct_location else 0.75  # Lower if inferred
         source = "user_input" if config.duct_location else "foundation_inferred"
         
         logger.info(f"   Duct factors: {heating_factor:.2f}h/{cooling_factor:.2f}c ({source})")
@@ -211,63 +210,123 @@ class IntelligentDuctLossCalculator:
     def _infer_duct_location(self, config: DuctConfiguration) -> str:
         """Infer duct location based on foundation type and climate zone."""
         logger.info(f"🤖 Inferring duct location from foundation: {config.foundation_type}")
-        
-        # ACCA Manual J typical duct locations by foundation type
-        if config.foundation_type == 'crawlspace':
-            return 'crawlspace'
-        elif config.foundation_type == 'basement_with_slab':
-            return 'basement'
-        elif config.foundation_type == 'slab_only':
-            # Slab homes typically have attic ducts
-            return 'attic' 
-        else:
-            # Default to most common: attic
-            return 'attic'
-    
-    def _categorize_temperature_differential(
-        self, 
-        winter_design: float, 
-        summer_design: float, 
-        duct_location: str
-    ) -> str:
-        """Categorize temperature differential severity for duct losses."""
-        
-        if duct_location == 'attic':
-            # Attic can be 20-40°F hotter than outdoor in summer
-            # and similar to outdoor in winter
-            summer_attic_temp = summer_design + 25  # Conservative estimate
-            cooling_delta = abs(75 - summer_attic_temp)  # 75°F indoor
-            heating_delta = abs(70 - winter_design)      # Winter design temp
-            
-        elif duct_location == 'crawlspace':
-            # Crawlspace is typically 5-15°F warmer than outdoor
-            crawlspace_temp_winter = winter_design + 8
-            crawlspace_temp_summer = summer_design - 5  # Cooler than outdoor
-            cooling_delta = abs(75 - crawlspace_temp_summer)
-            heating_delta = abs(70 - crawlspace_temp_winter)
-            
-        elif duct_location == 'basement':
-            # Basement is more stable, closer to ground temperature
-            basement_temp = 55  # Stable ground temperature
-            cooling_delta = abs(75 - basement_temp)
-            heating_delta = abs(70 - basement_temp)
-            
-        else:
-            # Default case
-            heating_delta = abs(70 - winter_design)
-            cooling_delta = abs(75 - summer_design)
-        
-        # Use the maximum delta for categorization
-        max_delta = max(heating_delta, cooling_delta)
-        
-        if max_delta > 70:
-            return 'extreme'
-        elif max_delta > 50:
-            return 'severe' 
-        elif max_delta > 30:
-            return 'moderate'
-        else:
-            return 'mild'
+        return self.foundation_duct_locations.get(config.foundation_type, 'attic')
+
+
+# Table axes; zone digits outside 1-8 fall back to zone 4 like the scalar path
+DUCT_LOCATIONS = ('ductless', 'conditioned', 'crawlspace', 'attic', 'basement')
+DUCT_CLIMATE_ZONES = ('1', '2', '3', '4', '5', '6', '7', '8')
+DUCT_TEMP_CATEGORIES = ('mild', 'moderate', 'severe', 'extreme')
+
+
+def _compile_duct_factor_table(calculator: IntelligentDuctLossCalculator) -> np.ndarray:
+    """
+    (location, zone, temperature category, heating/cooling) factor table
+
+    Base location factors get the climate zone multipliers in unconditioned
+    spaces, and the temperature differential multiplier where ducts see
+    outdoor-driven temperatures (attic, crawlspace). Factors are capped at
+    40% heating and 35% cooling losses per ACCA Manual J.
+    """
+    table = np.ones((len(DUCT_LOCATIONS), len(DUCT_CLIMATE_ZONES), len(DUCT_TEMP_CATEGORIES), 2))
+    for li, location in enumerate(DUCT_LOCATIONS):
+        base = calculator.base_duct_factors[location]
+        for zi, zone in enumerate(DUCT_CLIMATE_ZONES):
+            climate = calculator.climate_multipliers[zone]
+            for ci, category in enumerate(DUCT_TEMP_CATEGORIES):
+                if location in ('crawlspace', 'attic', 'basement'):
+                    heating = base['heating'] * climate['heating']
+                    cooling = base['cooling'] * climate['cooling']
+                    if location in ('attic', 'crawlspace'):
+                        heating *= calculator.temp_differential_factors[category]
+                        cooling *= calculator.temp_differential_factors[category]
+                else:
+                    heating = base['heating']
+                    cooling = base['cooling']
+                table[li, zi, ci] = (min(heating, 1.40), min(cooling, 1.35))
+    return table
+
+
+# Compiled once at import from the ACCA Manual J factors
+_duct_calculator = IntelligentDuctLossCalculator()
+_DUCT_FACTOR_TABLE = _compile_duct_factor_table(_duct_calculator)
+
+
+def calculate_duct_losses_batch(
+    system_types: Sequence[str],
+    duct_locations: Sequence[Optional[str]],
+    climate_zones: Sequence[str],
+    foundation_types: Sequence[str],
+    winter_design_temps: Sequence[float],
+    summer_design_temps: Sequence[float]
+) -> DuctLossBatch:
+    """
+    Duct loss factors for many configurations.
+
+    Locations are normalized (or inferred from the foundation), the
+    temperature category is computed with array arithmetic and the factors
+    are gathered from the compiled table. calculate_duct_losses is a
+    one-configuration call of this function.
+
+    Returns:
+        DuctLossBatch of equal-length arrays
+    """
+    calculator = _duct_calculator
+    systems = np.asarray(system_types, dtype=object)
+    provided = np.asarray(duct_locations, dtype=object)
+    zones = np.asarray(climate_zones, dtype=object)
+    foundations = np.asarray(foundation_types, dtype=object)
+    winter = np.asarray(winter_design_temps, dtype=float)
+    summer = np.asarray(summer_design_temps, dtype=float)
+    systems, provided, zones, foundations, winter, summer = np.broadcast_arrays(
+        systems, provided, zones, foundations, winter, summer
+    )
+
+    inferred = calculator.foundation_duct_locations
+    locations = np.array([
+        'ductless' if system == 'ductless' else calculator.location_normalizer.get(
+            (location or inferred.get(foundation, 'attic')).lower(), 'attic'
+        )
+        for system, location, foundation in zip(systems.ravel(), provided.ravel(), foundations.ravel())
+    ], dtype=object).reshape(systems.shape)
+    location_lookup = {location: i for i, location in enumerate(DUCT_LOCATIONS)}
+    location_index = np.array(
+        [location_lookup[location] for location in locations.ravel()], dtype=np.int64
+    ).reshape(systems.shape)
+
+    zone_lookup = {zone: i for i, zone in enumerate(DUCT_CLIMATE_ZONES)}
+    zone_index = np.array(
+        [zone_lookup.get(zone[0] if zone else '4', zone_lookup['4']) for zone in zones.ravel()],
+        dtype=np.int64
+    ).reshape(systems.shape)
+
+    # Temperature differential seen by the ducts in each location: attics run
+    # ~25°F above outdoor in summer, crawlspaces 8°F warmer in winter and 5°F
+    # cooler in summer, basements sit near the 55°F ground; the worst of the
+    # heating and cooling deltas picks the category
+    heating_delta = np.abs(70 - winter)
+    cooling_delta = np.abs(75 - summer)
+    attic = locations == 'attic'
+    crawl = locations == 'crawlspace'
+    basement = locations == 'basement'
+    cooling_delta = np.where(attic, np.abs(75 - (summer + 25)), cooling_delta)
+    cooling_delta = np.where(crawl, np.abs(75 - (summer - 5)), cooling_delta)
+    heating_delta = np.where(crawl, np.abs(70 - (winter + 8)), heating_delta)
+    heating_delta = np.where(basement, 15.0, heating_delta)
+    cooling_delta = np.where(basement, 20.0, cooling_delta)
+    max_delta = np.maximum(heating_delta, cooling_delta)
+    category_index = (max_delta > 30).astype(np.int64) + (max_delta > 50) + (max_delta > 70)
+
+    factors = _DUCT_FACTOR_TABLE[location_index, zone_index, category_index]
+    has_location = np.array([bool(location) for location in provided.ravel()]).reshape(systems.shape)
+    ductless = systems == 'ductless'
+    return DuctLossBatch(
+        heating_factor=factors[..., 0],
+        cooling_factor=factors[..., 1],
+        confidence=np.where(ductless, 1.0, np.where(has_location, 0.95, 0.75)),
+        duct_location=locations,
+        temp_category=np.array(DUCT_TEMP_CATEGORIES, dtype=object)[category_index]
+    )
 
 
 def calculate_intelligent_duct_losses(
@@ -301,5 +360,4 @@ def calculate_intelligent_duct_losses(
         summer_design_temp=summer_design_temp
     )
     
-    calculator = IntelligentDuctLossCalculator()
-    return calculator.calculate_duct_losses(config)
\ No newline at end of file
+    return _duct_calculator.calculate_duct_losses(config)
\ No newline at end of file
@@ -4,10 +4,128 @@ Represents individual rooms and their surfaces (walls, floors, ceilings)
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Tuple, Callable, ClassVar
 from enum import Enum
 
 
+# Derived aggregates are cached per instance. Assigning a field drops the
+# instance's cache and its holders' (a Surface invalidates its Space, a Space
+# its Zone, a Zone the Building). Child lists stay the caller's own list
+# objects, so membership is tracked by their lengths: each read compares the
+# model's own list lengths, O(1) per model. Adding or removing children is
+# seen; replacing an item in place (lst[i] = x) or mutating a window/door
+# dict is not, so assign a new list or dict instead.
+
+
+class TrackedModel:
+    """
+    Base for slotted model dataclasses with cached aggregates
+
+    Subclasses name their child lists in _child_lists (at least one) and
+    declare _aggregates, _sizes and _parents as init=False fields.
+    """
+    __slots__ = ()
+    _child_lists: ClassVar[Tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Size checks run on every cached read, so the common one- and
+        # two-list shapes get a specialised function
+        names = cls._child_lists
+        getters = tuple(attrgetter(name) for name in names)
+        if len(getters) == 1:
+            (first,) = getters
+            cls._child_sizes = staticmethod(lambda self: len(first(self)))
+        elif len(getters) == 2:
+            first, second = getters
+            cls._child_sizes = staticmethod(lambda self: (len(first(self)), len(second(self))))
+        else:
+            cls._child_sizes = staticmethod(lambda self: tuple(len(get(self)) for get in getters))
+        cls._get_child_lists = staticmethod(lambda self: tuple(get(self) for get in getters))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name[0] != '_':
+            if name in self._child_lists:
+                # New list object: children are (re)adopted on the next read
+                object.__setattr__(self, '_sizes', None)
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drop cached aggregates here and in every model holding this one"""
+        if getattr(self, '_aggregates', None) is not None:
+            object.__setattr__(self, '_aggregates', None)
+        for parent in getattr(self, '_parents', None) or ():
+            parent._invalidate()
+
+    def _sync(self, deep: bool = False) -> None:
+        """
+        Invalidate if a child list grew or shrank since the last read
+
+        deep: check the child lists of all descendants as well (O(models),
+        only used by whole-building aggregates)
+        """
+        sizes = self._child_sizes(self)
+        if sizes != self._sizes:
+            if self._sizes is not None:
+                self._invalidate()
+            object.__setattr__(self, '_sizes', sizes)
+            for children in self._get_child_lists(self):
+                for child in children:
+                    if isinstance(child, TrackedModel):
+                        child._adopt(self)
+        if deep:
+            for children in self._get_child_lists(self):
+                for child in children:
+                    if isinstance(child, TrackedModel):
+                        child._sync(deep)
+
+    def _adopt(self, parent: 'TrackedModel') -> None:
+        """Register a model holding this one (invalidated along with it)"""
+        parents = self._parents or ()
+        if not any(p is parent for p in parents):
+            object.__setattr__(self, '_parents', parents + (parent,))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Fields only: caches and holder references are rebuilt on demand"""
+        return {name: getattr(self, name) for name in self.__slots__ if name[0] != '_'}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name in self.__slots__:
+            object.__setattr__(self, name, state[name] if name[0] != '_' else None)
+
+
+def cached_aggregate(method: Optional[Callable] = None, *, deep: bool = False):
+    """
+    Read-only property cached on the instance until the model next changes
+
+    deep: the value also depends on child lists below this model's own
+    (e.g. a building aggregate over every space's surfaces)
+    """
+    if method is None:
+        return lambda method: cached_aggregate(method, deep=deep)
+    name = method.__name__
+
+    def getter(self):
+        if deep or self._child_sizes(self) != self._sizes:
+            self._sync(deep)
+        cache = self._aggregates
+        if cache is None:
+            cache = {}
+            object.__setattr__(self, '_aggregates', cache)
+        elif name in cache:
+            return cache[name]
+        # A concurrent invalidation detaches this dict, so a value computed
+        # from the old state is never served as current
+        value = cache[name] = method(self)
+        return value
+
+    getter.__name__ = name
+    getter.__doc__ = method.__doc__
+    return property(getter)
+
+
 class SpaceType(Enum):
     """Types of spaces with different thermal characteristics"""
     BEDROOM = "bedroom"
@@ -44,8 +162,8 @@ class BoundaryCondition(Enum):
     ADIABATIC = "adiabatic"  # No heat transfer (internal wall)
 
 
-@dataclass
-class Surface:
+@dataclass(slots=True)
+class Surface(TrackedModel):
     """A single surface (wall, floor, ceiling) of a space"""
     surface_id: str
     surface_type: str  # "wall", "floor", "ceiling", "roof"
@@ -66,24 +184,32 @@ class Surface:
     windows: List[Dict[str, Any]] = field(default_factory=list)
     doors: List[Dict[str, Any]] = field(default_factory=list)
     
-    @property
+    # Cached derived aggregates and tracking state, see cached_aggregate
+    _child_lists: ClassVar[Tuple[str, ...]] = ('windows', 'doors')
+    _aggregates: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _sizes: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+    _parents: Optional[Tuple[Any, ...]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @cached_aggregate
     def net_wall_area(self) -> float:
         """Wall area minus windows and doors"""
         if self.surface_type != "wall":
             return self.area_sqft
-        
-        window_area = sum(w.get('area_sqft', 0) for w in self.windows)
-        door_area = sum(d.get('area_sqft', 0) for d in self.doors)
-        return max(0, self.area_sqft - window_area - door_area)
+        return max(0, self.area_sqft - self.window_area - self.door_area)
     
-    @property
+    @cached_aggregate
     def window_area(self) -> float:
         """Total window area on this surface"""
         return sum(w.get('area_sqft', 0) for w in self.windows)
+    
+    @cached_aggregate
+    def door_area(self) -> float:
+        """Total door area on this surface"""
+        return sum(d.get('area_sqft', 0) for d in self.doors)
 
 
-@dataclass
-class Space:
+@dataclass(slots=True)
+class Space(TrackedModel):
     """
     Represents a single room or space in the building.
     This is the fundamental unit for zone-based calculations.
@@ -121,6 +247,12 @@ class Space:
     detection_confidence: float = 0.5
     evidence: List[Dict[str, Any]] = field(default_factory=list)
     
+    # Cached derived aggregates and tracking state, see cached_aggregate
+    _child_lists: ClassVar[Tuple[str, ...]] = ('surfaces',)
+    _aggregates: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _sizes: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+    _parents: Optional[Tuple[Any, ...]] = field(default=None, init=False, repr=False, compare=False)
+    
     @property
     def volume_cuft(self) -> float:
         """Calculate space volume accounting for ceiling type"""
@@ -133,7 +265,7 @@ class Space:
         else:
             return self.area_sqft * self.ceiling_height_ft
     
-    @property
+    @cached_aggregate
     def exterior_wall_area(self) -> float:
         """Total exterior wall area"""
         return sum(
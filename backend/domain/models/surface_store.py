@@ -0,0 +1,106 @@
+"""
+Surface Store
+Columnar (one row per surface) view of every surface in a building, so
+envelope areas and UA sums are array reductions instead of nested loops over
+zones → spaces → surfaces
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from domain.models.spaces import BoundaryCondition
+
+if TYPE_CHECKING:
+    from domain.models.zones import ThermalZone
+
+
+SURFACE_TYPES = ('wall', 'floor', 'ceiling', 'roof')
+BOUNDARY_CONDITIONS = tuple(BoundaryCondition)
+ORIENTATIONS = ('N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW')
+
+_SURFACE_TYPE_CODES = {name: i for i, name in enumerate(SURFACE_TYPES)}
+_BOUNDARY_CODES = {condition: i for i, condition in enumerate(BOUNDARY_CONDITIONS)}
+_ORIENTATION_CODES = {name: i for i, name in enumerate(ORIENTATIONS)}
+
+
+@dataclass
+class SurfaceStore:
+    """
+    Surfaces of all zones as parallel arrays
+
+    Codes index into SURFACE_TYPES / BOUNDARY_CONDITIONS / ORIENTATIONS;
+    -1 marks an unknown surface type or a surface without orientation.
+    """
+    surface_type: np.ndarray      # (n,) int
+    boundary: np.ndarray          # (n,) int
+    orientation: np.ndarray       # (n,) int
+    area_sqft: np.ndarray         # (n,) gross area
+    net_area_sqft: np.ndarray     # (n,) walls net of windows and doors, others gross
+    window_area_sqft: np.ndarray  # (n,)
+    door_area_sqft: np.ndarray    # (n,)
+    u_value: np.ndarray           # (n,)
+    space_index: np.ndarray       # (n,) row into space_ids
+    zone_index: np.ndarray        # (n,) row into zone_ids
+    space_ids: List[str]
+    zone_ids: List[str]
+
+    def __len__(self) -> int:
+        return len(self.area_sqft)
+
+    @classmethod
+    def from_zones(cls, zones: Sequence['ThermalZone']) -> 'SurfaceStore':
+        """Flatten zones → spaces → surfaces into columns"""
+        rows = []
+        space_ids = []
+        for zone_index, zone in enumerate(zones):
+            for space in zone.spaces:
+                space_index = len(space_ids)
+                space_ids.append(space.space_id)
+                for surface in space.surfaces:
+                    rows.append((
+                        _SURFACE_TYPE_CODES.get(surface.surface_type, -1),
+                        _BOUNDARY_CODES[surface.boundary_condition],
+                        _ORIENTATION_CODES.get(surface.orientation, -1),
+                        surface.area_sqft,
+                        surface.net_wall_area,
+                        surface.window_area,
+                        surface.door_area,
+                        surface.u_value,
+                        space_index,
+                        zone_index
+                    ))
+
+        columns = list(zip(*rows)) if rows else [()] * 10
+        codes = [np.asarray(column, dtype=np.int64) for column in columns[:3]]
+        values = [np.asarray(column, dtype=float) for column in columns[3:8]]
+        indices = [np.asarray(column, dtype=np.int64) for column in columns[8:]]
+        return cls(*codes, *values, *indices, space_ids=space_ids, zone_ids=[z.zone_id for z in zones])
+
+    def mask(self, surface_type: Optional[str] = None, boundary: Optional[BoundaryCondition] = None) -> np.ndarray:
+        """Boolean row mask for a surface type and/or boundary condition"""
+        selected = np.ones(len(self), dtype=bool)
+        if surface_type is not None:
+            selected &= self.surface_type == _SURFACE_TYPE_CODES.get(surface_type, -1)
+        if boundary is not None:
+            selected &= self.boundary == _BOUNDARY_CODES[boundary]
+        return selected
+
+    def sum_by_zone(self, values: np.ndarray, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Per-zone sums of a per-surface column (rows outside mask ignored)"""
+        weights = values if mask is None else np.where(mask, values, 0.0)
+        return np.bincount(self.zone_index, weights=weights, minlength=len(self.zone_ids))
+
+    def sum_by_space(self, values: np.ndarray, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Per-space sums of a per-surface column (rows outside mask ignored)"""
+        weights = values if mask is None else np.where(mask, values, 0.0)
+        return np.bincount(self.space_index, weights=weights, minlength=len(self.space_ids))
+
+    def exterior_wall_area_by_zone(self) -> np.ndarray:
+        """Gross exterior wall area per zone"""
+        return self.sum_by_zone(self.area_sqft, self.mask('wall', BoundaryCondition.EXTERIOR))
+
+    def ua_by_zone(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Opaque U × net area per zone (BTU/hr·°F)"""
+        return self.sum_by_zone(self.u_value * self.net_area_sqft, mask)
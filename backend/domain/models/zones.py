@@ -4,9 +4,10 @@ Groups spaces that share similar thermal characteristics and HVAC control
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, ClassVar
 from enum import Enum
-from domain.models.spaces import Space, SpaceType, BoundaryCondition
+from domain.models.spaces import Space, SpaceType, BoundaryCondition, TrackedModel, cached_aggregate
+from domain.models.surface_store import SurfaceStore
 
 
 class ZoneType(Enum):
@@ -19,8 +20,8 @@ class ZoneType(Enum):
     ATTIC = "attic"  # Unconditioned attic
 
 
-@dataclass
-class ThermalZone:
+@dataclass(slots=True)
+class ThermalZone(TrackedModel):
     """
     A thermal zone is a collection of spaces that:
     1. Share the same temperature setpoint
@@ -48,18 +49,25 @@ class ThermalZone:
     # Special characteristics
     is_bonus_zone: bool = False
     requires_zoning: bool = False
+    has_open_to_below: bool = False
     
-    @property
+    # Cached derived aggregates and tracking state, see cached_aggregate
+    _child_lists: ClassVar[Tuple[str, ...]] = ('spaces',)
+    _aggregates: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _sizes: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+    _parents: Optional[Tuple[Any, ...]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @cached_aggregate
     def total_area_sqft(self) -> float:
         """Total floor area of all spaces in zone"""
         return sum(space.area_sqft for space in self.spaces)
     
-    @property
+    @cached_aggregate
     def total_volume_cuft(self) -> float:
         """Total volume of all spaces in zone"""
         return sum(space.volume_cuft for space in self.spaces)
     
-    @property
+    @cached_aggregate
     def has_garage_below(self) -> bool:
         """Check if any space in zone is over garage"""
         return any(space.is_over_garage for space in self.spaces)
@@ -116,8 +124,8 @@ class ThermalZone:
             return {"occupancy": 0.0, "lighting": 0.0, "equipment": 0.0}
 
 
-@dataclass
-class BuildingThermalModel:
+@dataclass(slots=True)
+class BuildingThermalModel(TrackedModel):
     """
     Complete thermal model of the building with all zones
     """
@@ -138,6 +146,21 @@ class BuildingThermalModel:
     winter_design_temp: float = 0
     summer_design_temp: float = 95
     
+    # Set during load calculation
+    foundation_thermal_factors: Dict[str, Any] = field(default_factory=dict)
+    basement_equipment_factor: float = 1.0
+    
+    # Cached derived aggregates and tracking state, see cached_aggregate
+    _child_lists: ClassVar[Tuple[str, ...]] = ('zones',)
+    _aggregates: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _sizes: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+    _parents: Optional[Tuple[Any, ...]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @cached_aggregate(deep=True)
+    def surface_store(self) -> SurfaceStore:
+        """All zone surfaces as columnar arrays (rebuilt after any model change)"""
+        return SurfaceStore.from_zones(self.zones)
+    
     @property
     def conditioned_zones(self) -> List[ThermalZone]:
         """Get only conditioned zones"""
@@ -13,9 +13,9 @@ Foundation Types Supported:
 - Basement with slab (basement_with_slab)
 """
 
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Tuple, Sequence, Optional
 from dataclasses import dataclass
-import math
+import numpy as np
 
 
 @dataclass
@@ -29,6 +29,16 @@ class FoundationThermalResult:
     notes: str
 
 
+@dataclass
+class FoundationThermalBatch:
+    """Foundation thermal factors for many buildings, one array entry per building"""
+    foundation_type: np.ndarray  # str
+    effective_r_value: np.ndarray
+    thermal_conductance: np.ndarray  # BTU/hr/°F/sqft
+    perimeter_factor: np.ndarray
+    below_grade_factor: np.ndarray
+
+
 class FoundationThermalCalculator:
     """
     World-class foundation thermal modeling following ACCA Manual J standards.
@@ -92,222 +102,206 @@ class FoundationThermalCalculator:
         Returns:
             FoundationThermalResult with thermal factors
         """
-        # Estimate perimeter if not provided (assume rectangular building)
-        if building_perimeter_ft is None:
-            # Assume aspect ratio of 1.5:1 for typical residential
-            width = math.sqrt(building_area_sqft / 1.5)
-            length = width * 1.5
-            building_perimeter_ft = 2 * (width + length)
+        # One-building batch: the formulas live in the table-driven batch path
+        batch = calculate_foundation_thermal_factors_batch(
+            [foundation_type],
+            [winter_design_temp],
+            [building_area_sqft],
+            [np.nan if building_perimeter_ft is None else building_perimeter_ft]
+        )
         
-        # Ground temperature (warmer than air due to thermal mass)
+        return FoundationThermalResult(
+            foundation_type=foundation_type,
+            effective_r_value=float(batch.effective_r_value[0]),
+            thermal_conductance=float(batch.thermal_conductance[0]),
+            perimeter_factor=float(batch.perimeter_factor[0]),
+            below_grade_factor=float(batch.below_grade_factor[0]),
+            notes=self._describe_foundation(foundation_type, winter_design_temp)
+        )
+    
+    def _describe_foundation(self, foundation_type: str, winter_design_temp: float) -> str:
+        """Human-readable summary of the factors applied for one foundation"""
+        table = _FOUNDATION_TABLE
         ground_temp = winter_design_temp + self.ground_temperature_offset
         
         if foundation_type == 'slab_only':
-            return self._calculate_slab_thermal_factors(
-                climate_zone, winter_design_temp, ground_temp,
-                building_area_sqft, building_perimeter_ft
-            )
+            return (f"Slab edge conductance: {table.slab_edge_conductance:.2f} BTU/hr/°F/ft, "
+                    f"Interior: {table.slab_interior_conductance:.3f} BTU/hr/°F/sqft")
         elif foundation_type == 'crawlspace':
-            return self._calculate_crawlspace_thermal_factors(
-                climate_zone, winter_design_temp, ground_temp,
-                building_area_sqft, building_perimeter_ft
-            )
+            props = self.foundation_thermal_properties['crawlspace']
+            crawlspace_temp = _crawlspace_temp(winter_design_temp, ground_temp)
+            return (f"Floor R-{table.crawl_floor_r:.1f}, Crawlspace temp: {crawlspace_temp:.0f}°F, "
+                    f"Ventilation: {props['ventilation_rate']} CFM/sqft")
         elif foundation_type == 'basement_with_slab':
-            return self._calculate_basement_thermal_factors(
-                climate_zone, winter_design_temp, ground_temp,
-                building_area_sqft, building_perimeter_ft
-            )
-        else:
-            # Fallback to generic calculation
-            return FoundationThermalResult(
-                foundation_type=foundation_type,
-                effective_r_value=10.0,
-                thermal_conductance=0.1,
-                perimeter_factor=1.0,
-                below_grade_factor=1.0,
-                notes="Generic foundation thermal factors applied"
-            )
-    
-    def _calculate_slab_thermal_factors(
-        self,
-        climate_zone: str,
-        winter_design_temp: float,
-        ground_temp: float,
-        area_sqft: float,
-        perimeter_ft: float
-    ) -> FoundationThermalResult:
-        """
-        ACCA Manual J slab-on-grade thermal calculation.
-        
-        Heat loss occurs primarily at slab edge where thermal bridging is highest.
-        Interior slab is well-coupled to ground thermal mass.
-        """
-        props = self.foundation_thermal_properties['slab_only']
-        
-        # Slab edge thermal conductance (BTU/hr/°F per linear foot)
-        # Based on ACCA Manual J Table 4A
-        if props['edge_insulation_r'] > 5:
-            edge_conductance = 0.54  # Well insulated
-        elif props['edge_insulation_r'] > 0:
-            edge_conductance = 0.68  # Some insulation  
+            props = self.foundation_thermal_properties['basement_with_slab']
+            return (f"Wall R-{props['wall_r_value']}, {props['depth']}ft deep, "
+                    f"Ground temp: {ground_temp:.0f}°F, Deep ground: {DEEP_GROUND_TEMP}°F")
         else:
-            edge_conductance = 0.84  # No edge insulation (typical)
-        
-        # Perimeter heat loss factor
-        perimeter_factor = edge_conductance * perimeter_ft
-        
-        # Interior slab thermal conductance (much lower due to ground coupling)
-        interior_conductance = 0.025  # BTU/hr/°F/sqft for interior slab
-        
-        # Effective thermal conductance for entire slab
-        base_conductance = (perimeter_factor + interior_conductance * area_sqft) / area_sqft
-        
-        # Apply thermal bridging degradation (universal for all slabs)
-        thermal_bridging_factor = props.get('thermal_bridging_factor', 1.15)
-        total_conductance = base_conductance * thermal_bridging_factor
-        effective_r_value = 1.0 / total_conductance
-        
-        return FoundationThermalResult(
-            foundation_type='slab_only',
-            effective_r_value=effective_r_value,
-            thermal_conductance=total_conductance,
-            perimeter_factor=perimeter_factor / perimeter_ft,  # Per linear foot
-            below_grade_factor=1.0,  # No below-grade component
-            notes=f"Slab edge conductance: {edge_conductance:.2f} BTU/hr/°F/ft, Interior: {interior_conductance:.3f} BTU/hr/°F/sqft"
-        )
-    
-    def _calculate_crawlspace_thermal_factors(
-        self,
-        climate_zone: str,
-        winter_design_temp: float,
-        ground_temp: float,
-        area_sqft: float,
-        perimeter_ft: float
-    ) -> FoundationThermalResult:
-        """
-        ACCA Manual J crawl space thermal calculation.
-        
-        Heat loss occurs through:
-        1. Floor assembly (conditioned space to crawl space)
-        2. Crawl space walls (crawl space to outdoors)
-        3. Air infiltration through vents (significant impact)
-        
-        Key: Ventilated crawl spaces have higher heat loss than basements
-        due to air infiltration and limited earth coupling benefits.
-        """
-        props = self.foundation_thermal_properties['crawlspace']
-        
-        # Floor thermal resistance (conditioned space to crawl space)
-        floor_r_total = props['floor_r_value'] + 0.92 + 0.68  # Insulation + air films
-        floor_conductance = 1.0 / floor_r_total
-        
-        # Crawl space temperature - physics-based calculation for all climates
-        # Ventilated crawlspaces are influenced by both outdoor air and ground coupling
-        # Ground temperature is more stable, but ventilation reduces this benefit
-        ground_coupling_benefit = (ground_temp - winter_design_temp) * 0.3  # 30% of ground benefit due to ventilation
-        crawlspace_temp = winter_design_temp + ground_coupling_benefit + 3  # Base 3°F from structural mass
-        
-        # Temperature difference factor
-        temp_diff_factor = (70 - crawlspace_temp) / (70 - winter_design_temp)
-        
-        # Base floor conductance
-        base_conductance = floor_conductance * temp_diff_factor
-        
-        # Add ventilation penalty - ventilated crawlspaces lose more heat
-        # due to air infiltration through vents connecting to outdoor air
-        ventilation_penalty = props['ventilation_rate'] * 0.018 * temp_diff_factor  # CFM * specific heat
-        
-        # Crawl space wall losses (typically uninsulated perimeter walls)
-        wall_conductance = 1.0 / (props['wall_r_value'] + 1.6)  # Wall R + air films
-        wall_loss_per_sqft = (perimeter_ft * props['height'] * wall_conductance) / area_sqft
-        
-        # Apply thermal bridging degradation (universal physics principle)
-        thermal_bridging_factor = props.get('thermal_bridging_factor', 1.25)
-        
-        # Total effective conductance includes floor, ventilation, and wall losses
-        base_effective_conductance = base_conductance + ventilation_penalty + (wall_loss_per_sqft * 0.5)  # Increased wall impact
-        
-        # Apply thermal bridging degradation - affects all foundation types
-        effective_conductance = base_effective_conductance * thermal_bridging_factor
-        effective_r_value = 1.0 / effective_conductance
-        
-        # Perimeter factor (crawl space walls to outdoor)
-        perimeter_factor = wall_conductance * props['height']  # BTU/hr/°F per linear foot
-        
-        return FoundationThermalResult(
-            foundation_type='crawlspace',
-            effective_r_value=effective_r_value,
-            thermal_conductance=effective_conductance,
-            perimeter_factor=perimeter_factor / props['height'],  # Per sqft of wall
-            below_grade_factor=0.3,  # Limited below-grade benefit due to ventilation
-            notes=f"Floor R-{floor_r_total:.1f}, Crawlspace temp: {crawlspace_temp:.0f}°F, Ventilation: {props['ventilation_rate']} CFM/sqft"
-        )
+            return "Generic foundation thermal factors applied"
+
+
+# Foundation types in table row order; anything else uses the generic factors
+FOUNDATION_TYPES = ('slab_only', 'crawlspace', 'basement_with_slab')
+
+# Deep ground is approximately 55°F year-round at 8+ feet depth
+DEEP_GROUND_TEMP = 55
+
+
+def _crawlspace_temp(winter_design_temp, ground_temp):
+    """
+    Ventilated crawl space temperature (°F) for scalars or arrays.
     
-    def _calculate_basement_thermal_factors(
-        self,
-        climate_zone: str,
-        winter_design_temp: float,
-        ground_temp: float,
-        area_sqft: float,
-        perimeter_ft: float
-    ) -> FoundationThermalResult:
-        """
-        ACCA Manual J basement thermal calculation.
-        
-        Heat loss occurs through:
-        1. Above-grade walls (to outdoor air)
-        2. Below-grade walls (to ground - much lower loss due to soil thermal mass)
-        3. Basement floor (to deep ground - minimal loss, ~55°F year-round)
-        
-        Key principle: Below-grade foundations have significant thermal benefits
-        due to earth coupling and reduced temperature differentials.
-        """
-        props = self.foundation_thermal_properties['basement_with_slab']
-        
-        # Above-grade wall thermal conductance (exposed to outdoor air)
-        above_grade_r = props['wall_r_value'] + 1.6  # Wall R + air films
-        above_grade_conductance = 1.0 / above_grade_r
-        
-        # Below-grade wall thermal conductance (earth-coupled)
-        # Per ACCA Manual J and building science: ground temperature is much more
-        # stable and warmer than outdoor air in winter
-        # Use ground temperature differential instead of outdoor air differential
-        temp_reduction_factor = (70 - ground_temp) / (70 - winter_design_temp)
-        below_grade_conductance = above_grade_conductance * temp_reduction_factor * 0.6  # Additional reduction for soil contact
-        
-        # Floor thermal conductance (deep ground coupling - very low)
-        # Deep ground is approximately 55°F year-round at 8+ feet depth
-        deep_ground_temp = 55  # °F typical deep ground temperature
-        floor_temp_factor = (70 - deep_ground_temp) / (70 - winter_design_temp)
-        floor_conductance = 0.02 * floor_temp_factor  # Very low due to stable ground temp
-        
-        # Calculate heat loss components
-        above_grade_area = perimeter_ft * props['above_grade_height']
-        below_grade_area = perimeter_ft * (props['depth'] - props['above_grade_height'])
-        
-        # Above-grade loss (full outdoor temperature differential)
-        above_grade_loss = above_grade_area * above_grade_conductance
-        
-        # Below-grade loss (reduced temperature differential + soil benefits)
-        below_grade_loss = below_grade_area * below_grade_conductance
-        
-        # Floor loss (minimal due to deep ground coupling)
-        floor_loss = area_sqft * floor_conductance
-        
-        total_loss = above_grade_loss + below_grade_loss + floor_loss
-        
-        # Effective thermal conductance per sqft of conditioned space
-        effective_conductance = total_loss / area_sqft
-        effective_r_value = 1.0 / effective_conductance
-        
-        return FoundationThermalResult(
-            foundation_type='basement_with_slab',
-            effective_r_value=effective_r_value,
-            thermal_conductance=effective_conductance,
-            perimeter_factor=below_grade_loss / (perimeter_ft * area_sqft),  # Below-grade wall loss per sqft
-            below_grade_factor=temp_reduction_factor,  # Actual temperature benefit
-            notes=f"Wall R-{props['wall_r_value']}, {props['depth']}ft deep, Ground temp: {ground_temp:.0f}°F, Deep ground: {deep_ground_temp}°F"
-        )
+    Ventilation keeps only 30% of the ground coupling benefit, plus a base
+    3°F from structural mass.
+    """
+    return winter_design_temp + (ground_temp - winter_design_temp) * 0.3 + 3
+
+
+@dataclass(frozen=True)
+class _FoundationTable:
+    """Per-type constants of the Manual J foundation formulas, one row per FOUNDATION_TYPES entry"""
+    slab_edge_conductance: float
+    slab_interior_conductance: float
+    slab_bridging: float
+    crawl_floor_r: float  # floor insulation + air films
+    crawl_floor_conductance: float
+    crawl_ventilation: float  # ventilation_rate * specific heat factor
+    crawl_wall_conductance: float
+    crawl_height: float
+    crawl_bridging: float
+    basement_wall_conductance: float
+    basement_above_grade_height: float
+    basement_below_grade_height: float
+
+
+def _compile_foundation_table(properties: Dict[str, Dict[str, float]]) -> _FoundationTable:
+    """Fold the construction properties into the constants the formulas actually use"""
+    slab = properties['slab_only']
+    if slab['edge_insulation_r'] > 5:
+        edge_conductance = 0.54
+    elif slab['edge_insulation_r'] > 0:
+        edge_conductance = 0.68
+    else:
+        edge_conductance = 0.84
+    crawl = properties['crawlspace']
+    crawl_floor_r = crawl['floor_r_value'] + 0.92 + 0.68
+    basement = properties['basement_with_slab']
+    return _FoundationTable(
+        slab_edge_conductance=edge_conductance,
+        slab_interior_conductance=0.025,
+        slab_bridging=slab.get('thermal_bridging_factor', 1.15),
+        crawl_floor_r=crawl_floor_r,
+        crawl_floor_conductance=1.0 / crawl_floor_r,
+        crawl_ventilation=crawl['ventilation_rate'] * 0.018,
+        crawl_wall_conductance=1.0 / (crawl['wall_r_value'] + 1.6),
+        crawl_height=crawl['height'],
+        crawl_bridging=crawl.get('thermal_bridging_factor', 1.25),
+        basement_wall_conductance=1.0 / (basement['wall_r_value'] + 1.6),
+        basement_above_grade_height=basement['above_grade_height'],
+        basement_below_grade_height=basement['depth'] - basement['above_grade_height'],
+    )
+
+
+# Compiled once at import from the ACCA defaults
+_calculator = FoundationThermalCalculator()
+_FOUNDATION_TABLE = _compile_foundation_table(_calculator.foundation_thermal_properties)
+
+
+def calculate_foundation_thermal_factors_batch(
+    foundation_types: Sequence[str],
+    winter_design_temps: Sequence[float],
+    building_areas_sqft: Sequence[float],
+    building_perimeters_ft: Optional[Sequence[float]] = None
+) -> FoundationThermalBatch:
+    """
+    Foundation thermal factors for many buildings per ACCA Manual J.
+
+    Evaluates the Manual J formulas with array arithmetic against the
+    constants compiled at import; calculate_foundation_thermal_factors is
+    a one-building call of this function. Missing perimeters (None or NaN)
+    are estimated from area. Notes are not produced.
+
+    Args:
+        foundation_types: Foundation type per building
+        winter_design_temps: 99% heating design temperature per building (°F)
+        building_areas_sqft: Conditioned floor area per building
+        building_perimeters_ft: Perimeter per building, optional
+
+    Returns:
+        FoundationThermalBatch of equal-length arrays
+    """
+    types = np.asarray(foundation_types, dtype=object)
+    design = np.asarray(winter_design_temps, dtype=float)
+    area = np.asarray(building_areas_sqft, dtype=float)
+    types, design, area = np.broadcast_arrays(types, design, area)
+
+    # Estimated perimeter assuming a 1.5:1 rectangle, typical for residential
+    width = np.sqrt(area / 1.5)
+    estimated = 2 * (width + width * 1.5)
+    if building_perimeters_ft is None:
+        perimeter = estimated
+    else:
+        perimeter = np.broadcast_to(np.asarray(building_perimeters_ft, dtype=float), area.shape)
+        perimeter = np.where(np.isnan(perimeter), estimated, perimeter)
+
+    table = _FOUNDATION_TABLE
+    # Ground temperature (warmer than air due to thermal mass)
+    ground = design + _calculator.ground_temperature_offset
+    r_value = np.full(area.shape, 10.0)
+    conductance = np.full(area.shape, 0.1)
+    perimeter_factor = np.ones(area.shape)
+    below_grade = np.ones(area.shape)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Slab-on-grade: heat loss is concentrated at the slab edge (Table 4A),
+        # the interior slab is well coupled to the ground
+        slab = types == 'slab_only'
+        if slab.any():
+            a, p = area[slab], perimeter[slab]
+            edge_total = table.slab_edge_conductance * p
+            total = (edge_total + table.slab_interior_conductance * a) / a * table.slab_bridging
+            conductance[slab] = total
+            r_value[slab] = 1.0 / total
+            perimeter_factor[slab] = edge_total / p
+
+        # Ventilated crawl space: floor to crawl space, vent air infiltration,
+        # and mostly uninsulated perimeter walls to outdoors
+        crawl = types == 'crawlspace'
+        if crawl.any():
+            a, p, t = area[crawl], perimeter[crawl], design[crawl]
+            temp_diff = (70 - _crawlspace_temp(t, ground[crawl])) / (70 - t)
+            wall_loss = (p * table.crawl_height * table.crawl_wall_conductance) / a
+            base = table.crawl_floor_conductance * temp_diff + table.crawl_ventilation * temp_diff + wall_loss * 0.5
+            total = base * table.crawl_bridging
+            conductance[crawl] = total
+            r_value[crawl] = 1.0 / total
+            perimeter_factor[crawl] = (table.crawl_wall_conductance * table.crawl_height) / table.crawl_height
+            below_grade[crawl] = 0.3
+
+        # Basement: above-grade walls see outdoor air, below-grade walls see
+        # the ground (extra 0.6 for soil contact), the floor sees deep ground
+        basement = types == 'basement_with_slab'
+        if basement.any():
+            a, p, t = area[basement], perimeter[basement], design[basement]
+            reduction = (70 - ground[basement]) / (70 - t)
+            below_conductance = table.basement_wall_conductance * reduction * 0.6
+            floor_conductance = 0.02 * ((70 - DEEP_GROUND_TEMP) / (70 - t))
+            below_loss = p * table.basement_below_grade_height * below_conductance
+            total_loss = (p * table.basement_above_grade_height * table.basement_wall_conductance
+                          + below_loss + a * floor_conductance)
+            total = total_loss / a
+            conductance[basement] = total
+            r_value[basement] = 1.0 / total
+            perimeter_factor[basement] = below_loss / (p * a)
+            below_grade[basement] = reduction
+
+    return FoundationThermalBatch(
+        foundation_type=types,
+        effective_r_value=r_value,
+        thermal_conductance=conductance,
+        perimeter_factor=perimeter_factor,
+        below_grade_factor=below_grade
+    )
 
 
 def get_foundation_thermal_factors(
@@ -323,8 +317,7 @@ def get_foundation_thermal_factors(
     Returns:
         Dictionary with thermal factors for Manual J calculations
     """
-    calculator = FoundationThermalCalculator()
-    result = calculator.calculate_foundation_thermal_factors(
+    result = _calculator.calculate_foundation_thermal_factors(
         foundation_type, climate_zone, winter_design_temp,
         building_area_sqft, building_perimeter_ft
     )
@@ -10,6 +10,10 @@ import numpy as np
 from typing import List, Dict, Any, Tuple, Optional
 from dataclasses import dataclass
 
+from infrastructure.extractors.segment_index import SegmentArray, nearest_segment
+from infrastructure.extractors.footprint import FootprintEngine
+from infrastructure.extractors.fenestration import FenestrationData, get_fenestration_extractor
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,17 +52,24 @@ class EnvelopeExtractor:
     def __init__(self):
         self.min_wall_length = 3.0  # Minimum wall length in feet
         self.wall_angle_tolerance = 15  # Degrees for orientation classification
+        self.snap_tolerance_ft = 0.5  # Wall ends this close are joined
+        self.max_opening_ft = 8.0  # Widest doorway bridged in the wall network
+        self.opening_wall_distance_ft = 2.0  # Max distance from an opening to its wall
         
     def extract_envelope(
         self, 
         vector_data: Dict[str, Any],
         scale_factor: float = 1.0,
         north_angle: float = 0.0,
-        schedules: Dict[str, Any] = None
+        schedules: Dict[str, Any] = None,
+        fenestration: Optional[FenestrationData] = None
     ) -> BuildingEnvelope:
         """
         Extract building envelope from vector paths
         PROPERLY extracts actual building geometry
+        
+        fenestration: openings already extracted from this sheet; detected
+        here only when not given
         """
         logger.info("Extracting building envelope from vector data")
         
@@ -74,87 +85,44 @@ class EnvelopeExtractor:
         paths = vector_data.get('paths', [])
         logger.info(f"Processing {len(paths)} vector paths")
         
-        # Find walls by looking for long straight lines
-        wall_candidates = []
-        for path in paths:
-            # Handle both object and dict formats
-            if hasattr(path, 'points'):
-                points = path.points
-                path_type = path.path_type if hasattr(path, 'path_type') else 'line'
-            elif isinstance(path, dict):
-                points = path.get('points', [])
-                path_type = path.get('path_type', 'line')
-            else:
-                continue
-            
-            # Process lines and rectangles (walls are usually these)
-            if path_type in ['line', 'rect'] and len(points) >= 2:
-                # For rectangles, process each edge
-                if path_type == 'rect' and len(points) >= 4:
-                    # Rectangle has 4 edges
-                    edges = [
-                        (points[0], points[1]),  # Bottom
-                        (points[1], points[2]),  # Right
-                        (points[2], points[3]),  # Top
-                        (points[3], points[0])   # Left
-                    ]
-                else:
-                    # Single line
-                    edges = [(points[0], points[1])]
-                
-                for p1, p2 in edges:
-                    # Calculate length in feet
-                    length_px = math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
-                    length_ft = length_px * scale_factor
-                    
-                    # Walls are typically 8+ feet long
-                    if length_ft >= 8.0:
-                        # Calculate orientation
-                        angle = math.degrees(math.atan2(p2[1] - p1[1], p2[0] - p1[0]))
-                        angle = (angle - north_angle) % 360
-                        orientation = self._angle_to_orientation(angle)
-                        
-                        wall = Wall(
-                            start=(p1[0] * scale_factor, p1[1] * scale_factor),
-                            end=(p2[0] * scale_factor, p2[1] * scale_factor),
-                            length_ft=length_ft,
-                            orientation=orientation,
-                            angle=angle,
-                            windows=[],
-                            doors=[]
-                        )
-                        wall_candidates.append(wall)
-        
-        if not wall_candidates:
-            logger.warning("No walls found in vector data, using defaults")
-            return self._create_default_envelope()
-        
-        # Find exterior walls using smart heuristics
-        exterior_walls = self._identify_exterior_walls(wall_candidates)
-        
-        if len(exterior_walls) < 4:
-            logger.warning(f"Only {len(exterior_walls)} exterior walls found, using longest walls")
-            # Fallback: use longest walls
+        # Exterior walls from the footprint of the wall network
+        exterior_walls, floor_area = self._find_exterior_walls(paths, scale_factor, north_angle)
+        
+        if not exterior_walls:
+            logger.warning("No closed wall network found, using longest walls")
+            # Fallback: walls are typically 8+ feet long; use the longest
+            segments = SegmentArray.from_paths(paths, ('line', 'rect'))
+            wall_candidates = self._walls_from_segments(segments.subset(segments.length * scale_factor >= 8.0),
+                                                        scale_factor, north_angle)
+            if not wall_candidates:
+                logger.warning("No walls found in vector data, using defaults")
+                return self._create_default_envelope()
             wall_candidates.sort(key=lambda w: w.length_ft, reverse=True)
             exterior_walls = wall_candidates[:min(12, len(wall_candidates))]
+            
+            floor_area = self._estimate_area_from_walls(exterior_walls)
+            if floor_area < 500:  # Sanity check
+                # Fallback estimation
+                floor_area = (sum(w.length_ft for w in exterior_walls) / 4) ** 2  # Assume squarish
         
         # Calculate ACTUAL metrics
         total_perimeter = sum(w.length_ft for w in exterior_walls)
         
-        # Better area estimation from actual walls
-        floor_area = self._estimate_area_from_walls(exterior_walls)
-        if floor_area < 500:  # Sanity check
-            # Fallback estimation
-            floor_area = (total_perimeter / 4) ** 2  # Assume squarish
-        
         # Get ceiling height from data or use standard
         ceiling_height = 9.0  # Standard, could extract from elevations
         
         # Calculate wall orientations from ACTUAL walls
         wall_orientations = self._calculate_wall_orientations(exterior_walls)
         
-        # Window distribution from schedules if available
-        window_areas = self._get_window_distribution(schedules, floor_area)
+        # Windows and doors detected on the sheet, each on its nearest exterior wall
+        self._assign_openings_to_walls(exterior_walls, vector_data, scale_factor, fenestration)
+        window_areas = self._calculate_window_areas_by_orientation(exterior_walls)
+        door_areas = self._calculate_door_areas_by_orientation(exterior_walls)
+        if not any(window_areas.values()):
+            # Window distribution from schedules if available
+            window_areas = self._get_window_distribution(schedules, floor_area)
+        if not any(door_areas.values()):
+            door_areas = {"N": 20, "S": 20, "E": 0, "W": 20}  # Typical 3 doors
         
         envelope = BuildingEnvelope(
             exterior_walls=exterior_walls,
@@ -164,7 +132,7 @@ class EnvelopeExtractor:
             ceiling_height_ft=ceiling_height,
             wall_orientations=wall_orientations,
             window_areas=window_areas,
-            door_areas={"N": 20, "S": 20, "E": 0, "W": 20},  # Typical 3 doors
+            door_areas=door_areas,
             shape_factor=total_perimeter / math.sqrt(floor_area)
         )
         
@@ -174,44 +142,6 @@ class EnvelopeExtractor:
         
         return envelope
     
-    def _identify_exterior_walls(self, walls: List[Wall]) -> List[Wall]:
-        """
-        Identify which walls are exterior using smart heuristics
-        """
-        if not walls:
-            return []
-        
-        # Strategy: Find walls that form a closed perimeter
-        # Group walls by approximate orientation
-        horizontal = [w for w in walls if abs(w.angle % 180 - 90) < 30]
-        vertical = [w for w in walls if abs(w.angle % 180) < 30 or abs(w.angle % 180 - 180) < 30]
-        
-        exterior = []
-        
-        # Take the outermost walls in each direction
-        if horizontal:
-            horizontal.sort(key=lambda w: w.start[1])
-            # Take top and bottom
-            if len(horizontal) >= 2:
-                exterior.append(horizontal[0])   # Top
-                exterior.append(horizontal[-1])  # Bottom
-        
-        if vertical:
-            vertical.sort(key=lambda w: w.start[0])
-            # Take left and right
-            if len(vertical) >= 2:
-                exterior.append(vertical[0])   # Left
-                exterior.append(vertical[-1])  # Right
-        
-        # Add more walls if we need them for a complete perimeter
-        remaining = [w for w in walls if w not in exterior]
-        remaining.sort(key=lambda w: w.length_ft, reverse=True)
-        
-        while len(exterior) < 8 and remaining:  # Typical house has 8-12 exterior walls
-            exterior.append(remaining.pop(0))
-        
-        return exterior
-    
     def _estimate_area_from_walls(self, walls: List[Wall]) -> float:
         """
         Estimate floor area from exterior walls
@@ -263,94 +193,71 @@ class EnvelopeExtractor:
         paths: List[Any],
         scale_factor: float,
         north_angle: float
-    ) -> List[Wall]:
+    ) -> Tuple[List[Wall], float]:
         """
         Identify exterior walls from vector paths
-        Uses connectivity and closure to find building perimeter
-        """
-        exterior_walls = []
         
-        # Convert paths to walls with proper scaling
-        potential_walls = []
-        for path in paths:
-            if path.path_type == "line" and len(path.points) == 2:
-                # Calculate wall properties
-                p1, p2 = path.points[0], path.points[1]
-                length_px = math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
-                length_ft = length_px * scale_factor
-                
-                if length_ft < self.min_wall_length:
-                    continue
-                
-                # Calculate orientation
-                angle = math.degrees(math.atan2(p2[1] - p1[1], p2[0] - p1[0]))
-                # Adjust for north arrow
-                angle = (angle - north_angle) % 360
-                orientation = self._angle_to_orientation(angle)
-                
-                wall = Wall(
-                    start=(p1[0] * scale_factor, p1[1] * scale_factor),
-                    end=(p2[0] * scale_factor, p2[1] * scale_factor),
-                    length_ft=length_ft,
-                    orientation=orientation,
-                    angle=angle,
-                    windows=[],
-                    doors=[]
-                )
-                potential_walls.append(wall)
-        
-        # Find connected walls that form a closed loop (the exterior)
-        # This is simplified - a full implementation would use graph algorithms
-        exterior_walls = self._find_closed_loop(potential_walls)
-        
-        # If we can't find a closed loop, use the longest walls as likely exterior
-        if not exterior_walls and potential_walls:
-            # Sort by length and take the longest walls
-            potential_walls.sort(key=lambda w: w.length_ft, reverse=True)
-            
-            # Take walls that likely form a perimeter
-            # Heuristic: walls that together roughly form a rectangle
-            total_length = sum(w.length_ft for w in potential_walls[:10])
-            for wall in potential_walls:
-                exterior_walls.append(wall)
-                if sum(w.length_ft for w in exterior_walls) > total_length * 0.4:
-                    break
-        
-        return exterior_walls
-    
-    def _find_closed_loop(self, walls: List[Wall]) -> List[Wall]:
-        """
-        Find walls that form a closed loop (building perimeter)
-        Simplified version - real implementation would use graph traversal
-        """
-        if not walls:
-            return []
+        Walks the outer face of the wall network (see FootprintEngine), so
+        each exterior wall is a straight run of the building outline and
+        its orientation is the direction it faces (outward normal).
         
-        # Group parallel walls
-        horizontal = [w for w in walls if abs(w.angle % 180 - 90) < 45]
-        vertical = [w for w in walls if abs(w.angle % 180) < 45 or abs(w.angle % 180 - 180) < 45]
+        Returns:
+            (exterior walls, enclosed floor area in sqft); ([], 0) if the
+            wall network does not close
+        """
+        segments = SegmentArray.from_paths(paths, ('line', 'rect'))
+        segments = segments.subset(segments.length * scale_factor >= self.min_wall_length)
         
-        # If we have both horizontal and vertical walls, likely found perimeter
-        if horizontal and vertical:
-            # Take the outermost walls of each orientation
-            exterior = []
-            
-            # Get extremes in each direction
-            if horizontal:
-                horizontal.sort(key=lambda w: w.start[1])
-                exterior.append(horizontal[0])  # Topmost
-                if len(horizontal) > 1:
-                    exterior.append(horizontal[-1])  # Bottommost
-            
-            if vertical:
-                vertical.sort(key=lambda w: w.start[0])
-                exterior.append(vertical[0])  # Leftmost
-                if len(vertical) > 1:
-                    exterior.append(vertical[-1])  # Rightmost
-            
-            return exterior
+        engine = FootprintEngine(
+            snap_tolerance=self.snap_tolerance_ft / scale_factor,
+            max_opening=self.max_opening_ft / scale_factor
+        )
+        footprint = engine.compute(segments)
+        if footprint is None:
+            return [], 0.0
         
-        return []
+        exterior_walls = []
+        for start, end, outward in zip(footprint.wall_starts, footprint.wall_ends, footprint.outward_angles):
+            length_ft = float(np.hypot(*(end - start))) * scale_factor
+            if length_ft < self.min_wall_length:
+                continue  # Jogs and wall-thickness returns
+            angle = (float(outward) - north_angle) % 360
+            exterior_walls.append(Wall(
+                start=(float(start[0]) * scale_factor, float(start[1]) * scale_factor),
+                end=(float(end[0]) * scale_factor, float(end[1]) * scale_factor),
+                length_ft=length_ft,
+                orientation=self._angle_to_orientation(angle),
+                angle=angle,
+                windows=[],
+                doors=[]
+            ))
+        
+        floor_area = footprint.area * scale_factor ** 2
+        logger.info(f"Footprint: {len(exterior_walls)} exterior walls, "
+                    f"{footprint.perimeter * scale_factor:.1f}ft perimeter, {floor_area:.0f}sqft")
+        return exterior_walls, floor_area
+    
+    def _walls_from_segments(
+        self,
+        segments: SegmentArray,
+        scale_factor: float,
+        north_angle: float
+    ) -> List[Wall]:
+        """Wall per segment, oriented by its direction (no inside/outside known)"""
+        angles = (np.degrees(np.arctan2(segments.end[:, 1] - segments.start[:, 1],
+                                        segments.end[:, 0] - segments.start[:, 0])) - north_angle) % 360
+        return [
+            Wall(
+                start=(float(start[0]) * scale_factor, float(start[1]) * scale_factor),
+                end=(float(end[0]) * scale_factor, float(end[1]) * scale_factor),
+                length_ft=float(length) * scale_factor,
+                orientation=self._angle_to_orientation(angle),
+                angle=float(angle),
+                windows=[],
+                doors=[]
+            )
+            for start, end, length, angle in zip(segments.start, segments.end, segments.length, angles)
+        ]
     
     def _angle_to_orientation(self, angle: float) -> str:
         """Convert angle to cardinal direction"""
@@ -471,24 +378,34 @@ class EnvelopeExtractor:
     def _assign_openings_to_walls(
         self,
         walls: List[Wall],
-        schedules: Dict[str, Any],
-        texts: List[Any]
+        vector_data: Dict[str, Any],
+        scale_factor: float,
+        fenestration: Optional[FenestrationData] = None
     ):
-        """Assign windows and doors from schedules to appropriate walls"""
-        # This is a simplified version
-        # A full implementation would use spatial matching
-        
-        # Distribute windows evenly among walls for now
-        # Better approach: match window labels to wall proximity
-        total_windows = len(schedules.get('windows', []))
-        if total_windows > 0 and walls:
-            windows_per_wall = total_windows / len(walls)
-            for i, wall in enumerate(walls):
-                # Assign proportional windows to each wall
-                num_windows = int(windows_per_wall + 0.5)
-                for j in range(num_windows):
-                    if j < len(schedules['windows']):
-                        wall.windows.append(schedules['windows'][j])
+        """Attach windows and doors detected on the sheet to their nearest exterior wall"""
+        if not walls:
+            return
+        
+        if fenestration is None:
+            fenestration = get_fenestration_extractor().extract_fenestration(
+                vector_data, [], walls, scale_factor=scale_factor
+            )
+        openings = [('windows', w) for w in fenestration.windows] + [('doors', d) for d in fenestration.doors]
+        if not openings:
+            return
+        
+        starts = np.array([w.start for w in walls], dtype=float)
+        ends = np.array([w.end for w in walls], dtype=float)
+        locations = np.array([opening.location for _, opening in openings], dtype=float)
+        nearest, distance = nearest_segment(locations, starts, ends)
+        
+        for (kind, opening), wall_index, dist in zip(openings, nearest, distance):
+            if dist <= self.opening_wall_distance_ft:
+                getattr(walls[wall_index], kind).append({
+                    'id': getattr(opening, 'window_id', None) or getattr(opening, 'door_id', None),
+                    'area': opening.area_sqft,
+                    'width_ft': opening.width_ft
+                })
     
     def _create_default_envelope(self) -> BuildingEnvelope:
         """Create a default envelope when vector extraction fails"""
@@ -11,6 +11,8 @@ from typing import List, Dict, Any, Tuple, Optional
 from dataclasses import dataclass
 import numpy as np
 
+from infrastructure.extractors.segment_index import SegmentArray, SegmentGrid, path_fields, nearest_segment
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,14 +77,22 @@ class FenestrationExtractor:
     
     # Window symbol patterns in vectors (typical CAD representations)
     WINDOW_PATTERNS = {
-        'double_line': {'parallel_gap': (2, 6)},  # Two parallel lines with gap
+        'double_line': {
+            'parallel_gap': (2, 6),  # Gap between the lines on the drawing
+            'max_angle_deg': 5,  # Parallel tolerance
+            'min_overlap': 0.8,  # Shared extent as a fraction of the longer line
+        },
         'rectangle': {'aspect_ratio': (1.5, 4.0)},  # Rectangular openings
         'arc': {'in_wall': True},  # Arc in wall indicates window
     }
     
     # Door symbol patterns
     DOOR_PATTERNS = {
-        'arc_swing': {'radius': (2.5, 4.0)},  # Arc showing door swing
+        'arc_swing': {
+            'radius': (2.5, 4.0),  # Arc showing door swing
+            'sweep_deg': (75, 105),  # Quarter-circle swing
+            'radius_tolerance': 0.08,  # Max deviation from a circular arc
+        },
         'angled_line': {'angle': (20, 45)},  # Angled line for door in plan
         'break_in_wall': {'gap': (2.5, 4.0)},  # Gap in wall for doorway
     }
@@ -196,59 +206,119 @@ class FenestrationExtractor:
         walls: List[Any],
         scale_factor: float
     ) -> List[Window]:
-        """Extract windows from vector symbols"""
+        """Extract windows from double-line symbols (parallel line pairs)"""
         windows = []
         
         if not vector_data or 'paths' not in vector_data:
             return windows
         
-        paths = vector_data['paths']
-        window_id = 0
+        segments = SegmentArray.from_paths(vector_data['paths'])
         
-        # Look for window patterns
-        for i, path in enumerate(paths):
-            # Get path points
-            if hasattr(path, 'points'):
-                points = path.points
-            else:
-                points = path.get('points', [])
+        for center, width in self._find_window_pairs(segments, scale_factor):
+            location = (center[0] * scale_factor, center[1] * scale_factor)
+            orientation = self._determine_orientation(location, walls)
             
-            if len(points) < 2:
-                continue
+            window = Window(
+                window_id=f"W{len(windows):03d}",
+                location=location,
+                width_ft=width,
+                height_ft=5.0,  # Default 5 ft height (not shown in plan)
+                area_sqft=width * 5.0,
+                orientation=orientation,
+                wall_id=None,
+                room_id=None,
+                window_type='double',  # Default assumption
+                frame_type='vinyl',  # Common default
+                glazing_type='low-e',  # Modern default
+                u_value=0.30,  # Energy code typical
+                shgc=0.30,  # Balanced for most climates
+                vt=0.50,
+                air_leakage=0.30,
+                confidence=0.7
+            )
             
-            # Check for double-line pattern (common window representation)
-            if self._is_window_pattern(path, paths[max(0, i-5):min(len(paths), i+5)]):
-                # Calculate window dimensions
-                width, height = self._calculate_opening_size(points, scale_factor)
-                
-                if self.min_window_width <= width <= self.max_window_width:
-                    center = self._calculate_center(points)
-                    orientation = self._determine_orientation(center, walls)
-                    
-                    window = Window(
-                        window_id=f"W{window_id:03d}",
-                        location=(center[0] * scale_factor, center[1] * scale_factor),
-                        width_ft=width,
-                        height_ft=height if height > 0 else 5.0,  # Default 5 ft height
-                        area_sqft=width * (height if height > 0 else 5.0),
-                        orientation=orientation,
-                        wall_id=None,
-                        room_id=None,
-                        window_type='double',  # Default assumption
-                        frame_type='vinyl',  # Common default
-                        glazing_type='low-e',  # Modern default
-                        u_value=0.30,  # Energy code typical
-                        shgc=0.30,  # Balanced for most climates
-                        vt=0.50,
-                        air_leakage=0.30,
-                        confidence=0.7
-                    )
-                    
-                    windows.append(window)
-                    window_id += 1
+            windows.append(window)
         
         return windows
     
+    def _find_window_pairs(
+        self,
+        segments: SegmentArray,
+        scale_factor: float
+    ) -> List[Tuple[Tuple[float, float], float]]:
+        """
+        Find double-line window symbols: pairs of parallel lines a small gap
+        apart that share most of their length
+        
+        Candidate pairs come from a grid over segment midpoints, and the
+        parallelism, gap and overlap tests run over all candidates at once.
+        Each line is used by at most one window (tightest pairs first), so
+        a three-line symbol yields one window.
+        
+        Returns:
+            (center, width_ft) per window, center in drawing units
+        """
+        pattern = self.WINDOW_PATTERNS['double_line']
+        gap_min, gap_max = pattern['parallel_gap']
+        min_overlap = pattern['min_overlap']
+        
+        # Only lines that could be a window edge on their own
+        scaled_length = segments.length * scale_factor
+        segments = segments.subset(
+            (scaled_length >= self.min_window_width * min_overlap) &
+            (scaled_length <= self.max_window_width / min_overlap)
+        )
+        if len(segments) < 2:
+            return []
+        
+        # Paired midpoints are at most gap_max across and (1 - min_overlap) of
+        # the longer line along - both within one cell
+        max_length = float(segments.length.max())
+        grid = SegmentGrid(segments, cell_size=gap_max + (1 - min_overlap) * max_length)
+        first, second = grid.candidate_pairs()
+        if len(first) == 0:
+            return []
+        
+        # Cheapest test first: most nearby pairs are not parallel
+        u = segments.direction[first]
+        v = segments.direction[second]
+        parallel = np.abs(u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]) <= math.sin(math.radians(pattern['max_angle_deg']))
+        first, second, u = first[parallel], second[parallel], u[parallel]
+        
+        offset = segments.midpoint[second] - segments.midpoint[first]
+        gap = np.abs(u[:, 0] * offset[:, 1] - u[:, 1] * offset[:, 0])
+        in_gap = (gap >= gap_min) & (gap <= gap_max)
+        first, second, u, gap = first[in_gap], second[in_gap], u[in_gap], gap[in_gap]
+        
+        # Extent of the second line projected onto the first line's axis
+        origin = segments.start[first]
+        t_start = np.einsum('ij,ij->i', segments.start[second] - origin, u)
+        t_end = np.einsum('ij,ij->i', segments.end[second] - origin, u)
+        overlap = (np.minimum(segments.length[first], np.maximum(t_start, t_end)) -
+                   np.maximum(0.0, np.minimum(t_start, t_end)))
+        longer = np.maximum(segments.length[first], segments.length[second])
+        
+        width_ft = overlap * scale_factor
+        is_window = (
+            (overlap >= min_overlap * longer) &
+            (width_ft >= self.min_window_width) & (width_ft <= self.max_window_width)
+        )
+        
+        matches = []
+        used = np.zeros(len(segments), dtype=bool)
+        candidates = np.flatnonzero(is_window)
+        for k in candidates[np.argsort(gap[candidates], kind='stable')]:
+            a, b = first[k], second[k]
+            if used[a] or used[b]:
+                continue
+            used[a] = used[b] = True
+            center = (segments.midpoint[a] + segments.midpoint[b]) / 2
+            matches.append(((float(center[0]), float(center[1])), float(width_ft[k])))
+        
+        # Sheet order (top to bottom, left to right) for stable window IDs
+        matches.sort(key=lambda match: (match[0][1], match[0][0]))
+        return matches
+    
     def _extract_doors_from_vectors(
         self,
         vector_data: Dict,
@@ -261,25 +331,17 @@ class FenestrationExtractor:
         if not vector_data or 'paths' not in vector_data:
             return doors
         
-        paths = vector_data['paths']
-        door_id = 0
-        
-        # Look for door swing arcs
-        for path in paths:
-            if hasattr(path, 'path_type') and path.path_type == 'curve':
-                # Check if this is a door swing arc
-                if self._is_door_swing(path):
-                    # Extract door from swing arc
-                    door = self._extract_door_from_swing(path, scale_factor, door_id)
-                    if door:
-                        doors.append(door)
-                        door_id += 1
+        # Door swing arcs (hinge at the arc center, leaf width = radius)
+        for hinge, radius in self._find_door_swings(vector_data['paths']):
+            door = self._extract_door_from_swing(hinge, radius, scale_factor, len(doors))
+            if door:
+                doors.append(door)
         
         # Look for gaps in walls (doorways)
         door_gaps = self._find_wall_gaps(walls, (self.min_door_width, self.max_door_width))
         for gap in door_gaps:
             door = Door(
-                door_id=f"D{door_id:03d}",
+                door_id=f"D{len(doors):03d}",
                 location=gap['center'],
                 width_ft=gap['width'],
                 height_ft=7.0,  # Standard door height
@@ -295,62 +357,91 @@ class FenestrationExtractor:
                 confidence=0.6
             )
             doors.append(door)
-            door_id += 1
         
         return doors
     
-    def _is_window_pattern(self, path: Any, nearby_paths: List[Any]) -> bool:
-        """Check if path represents a window"""
-        # Look for parallel lines close together (double-line window symbol)
-        if hasattr(path, 'path_type') and path.path_type == 'line':
-            for other in nearby_paths:
-                if hasattr(other, 'path_type') and other.path_type == 'line':
-                    if self._are_parallel_lines(path, other):
-                        gap = self._calculate_line_gap(path, other)
-                        if 2 <= gap <= 6:  # Window gap in inches on drawing
-                            return True
-        return False
-    
-    def _is_door_swing(self, path: Any) -> bool:
-        """Check if curved path is a door swing arc"""
-        if hasattr(path, 'path_type') and path.path_type == 'curve':
-            # Door swings are typically quarter circles
-            # Check arc properties
-            return True  # Simplified - would check arc angle and radius
-        return False
+    def _find_door_swings(self, paths: List[Any]) -> List[Tuple[Tuple[float, float], float]]:
+        """
+        Find curves that are quarter-circle door swings
+        
+        Each curve is a cubic Bezier (start, control 1, control 2, end). The
+        arc center is where the normals at both ends meet; a swing must be
+        circular (both ends and the curve midpoint at the same radius) and
+        sweep roughly 90 degrees. All curves are tested at once.
+        
+        Returns:
+            (hinge, radius) per swing, in drawing units
+        """
+        curves = []
+        for path in paths:
+            path_type, points = path_fields(path)
+            if path_type == 'curve' and len(points) == 4:
+                curves.append(points)
+        if not curves:
+            return []
+        
+        pattern = self.DOOR_PATTERNS['arc_swing']
+        bezier = np.asarray(curves, dtype=float)
+        p0, c1, c2, p3 = bezier[:, 0], bezier[:, 1], bezier[:, 2], bezier[:, 3]
+        
+        # Normals to the end tangents; center = p0 + s * n0 on both normals
+        tangent_start = c1 - p0
+        tangent_end = p3 - c2
+        n0 = np.stack([-tangent_start[:, 1], tangent_start[:, 0]], axis=1)
+        n3 = np.stack([-tangent_end[:, 1], tangent_end[:, 0]], axis=1)
+        denom = n0[:, 0] * n3[:, 1] - n0[:, 1] * n3[:, 0]
+        chord = p3 - p0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            s = (chord[:, 0] * n3[:, 1] - chord[:, 1] * n3[:, 0]) / denom
+            center = p0 + s[:, None] * n0
+            
+            r_start = np.linalg.norm(p0 - center, axis=1)
+            r_end = np.linalg.norm(p3 - center, axis=1)
+            radius = (r_start + r_end) / 2
+            midpoint = (p0 + 3 * c1 + 3 * c2 + p3) / 8  # Bezier at t = 0.5
+            r_mid = np.linalg.norm(midpoint - center, axis=1)
+            
+            cos_sweep = np.einsum('ij,ij->i', p0 - center, p3 - center) / (r_start * r_end)
+            sweep = np.degrees(np.arccos(np.clip(cos_sweep, -1.0, 1.0)))
+            
+            tolerance = pattern['radius_tolerance'] * radius
+            is_swing = (
+                np.isfinite(radius) & (radius > 0) &
+                (np.abs(r_start - r_end) <= tolerance) &
+                (np.abs(r_mid - radius) <= tolerance) &
+                (sweep >= pattern['sweep_deg'][0]) & (sweep <= pattern['sweep_deg'][1])
+            )
+        
+        return [((float(center[k, 0]), float(center[k, 1])), float(radius[k]))
+                for k in np.flatnonzero(is_swing)]
     
     def _extract_door_from_swing(
         self,
-        arc_path: Any,
+        hinge: Tuple[float, float],
+        radius: float,
         scale_factor: float,
         door_id: int
     ) -> Optional[Door]:
-        """Extract door from swing arc"""
-        # Calculate door width from arc radius
-        if hasattr(arc_path, 'points') and len(arc_path.points) >= 2:
-            # Estimate radius from arc points
-            radius = self._estimate_arc_radius(arc_path.points)
-            width = radius * scale_factor
-            
-            if self.min_door_width <= width <= self.max_door_width:
-                center = arc_path.points[0]  # Arc origin is door hinge
-                
-                return Door(
-                    door_id=f"D{door_id:03d}",
-                    location=(center[0] * scale_factor, center[1] * scale_factor),
-                    width_ft=width,
-                    height_ft=7.0,
-                    area_sqft=width * 7.0,
-                    orientation='unknown',
-                    wall_id=None,
-                    room_id=None,
-                    door_type='interior',
-                    material='wood',
-                    has_glass=width > 3,  # Assume glass if wide
-                    glass_area_sqft=10 if width > 3 else 0,
-                    u_value=0.50,
-                    confidence=0.7
-                )
+        """Build a door from a swing arc (leaf width = arc radius)"""
+        width = radius * scale_factor
+        
+        if self.min_door_width <= width <= self.max_door_width:
+            return Door(
+                door_id=f"D{door_id:03d}",
+                location=(hinge[0] * scale_factor, hinge[1] * scale_factor),
+                width_ft=width,
+                height_ft=7.0,
+                area_sqft=width * 7.0,
+                orientation='unknown',
+                wall_id=None,
+                room_id=None,
+                door_type='interior',
+                material='wood',
+                has_glass=width > 3,  # Assume glass if wide
+                glass_area_sqft=10 if width > 3 else 0,
+                u_value=0.50,
+                confidence=0.7
+            )
         return None
     
     def _find_wall_gaps(
@@ -484,9 +575,9 @@ class FenestrationExtractor:
         
         # Calculate wall area (simplified)
         total_wall_area = 1260  # Default for 140 ft perimeter × 9 ft height
-        if walls:
-            # Calculate from actual walls if available
-            pass
+        if walls and all(hasattr(w, 'length_ft') for w in walls):
+            # Exterior walls from the envelope footprint, 9 ft height
+            total_wall_area = sum(w.length_ft for w in walls) * 9.0
         
         # Window-to-wall ratio
         wwr = total_window_area / total_wall_area if total_wall_area > 0 else 0.15
@@ -516,59 +607,22 @@ class FenestrationExtractor:
             orientation_distribution=orientation_dist
         )
     
-    def _are_parallel_lines(self, path1: Any, path2: Any) -> bool:
-        """Check if two line paths are parallel"""
-        # Calculate angles and compare
-        return False  # Simplified
-    
-    def _calculate_line_gap(self, path1: Any, path2: Any) -> float:
-        """Calculate gap between parallel lines"""
-        return 4.0  # Simplified
-    
-    def _calculate_opening_size(
-        self,
-        points: List[Tuple[float, float]],
-        scale_factor: float
-    ) -> Tuple[float, float]:
-        """Calculate width and height of opening"""
-        if len(points) >= 2:
-            width = abs(points[1][0] - points[0][0]) * scale_factor
-            height = abs(points[1][1] - points[0][1]) * scale_factor
-            
-            # Ensure width > height for proper orientation
-            if height > width:
-                width, height = height, width
-            
-            return width, height
-        
-        return 3.0, 5.0  # Default window size
-    
-    def _calculate_center(self, points: List[Tuple[float, float]]) -> Tuple[float, float]:
-        """Calculate center point"""
-        if not points:
-            return (0, 0)
-        
-        x = sum(p[0] for p in points) / len(points)
-        y = sum(p[1] for p in points) / len(points)
-        return (x, y)
-    
     def _determine_orientation(
         self,
         location: Tuple[float, float],
         walls: List[Any]
     ) -> str:
-        """Determine cardinal orientation of opening"""
-        # This would check which wall the opening is on
-        # and determine its orientation
-        return 'S'  # Simplified - assume south-facing
-    
-    def _estimate_arc_radius(self, points: List[Tuple[float, float]]) -> float:
-        """Estimate radius of arc from points"""
-        if len(points) >= 3:
-            # Use three points to estimate circle radius
-            # Simplified - would use proper circle fitting
-            return 3.0  # Default door width
-        return 3.0
+        """Orientation of the nearest exterior wall (walls from the envelope footprint)"""
+        walls = [w for w in walls if hasattr(w, 'start') and hasattr(w, 'orientation')]
+        if not walls:
+            return 'S'  # Simplified - assume south-facing
+        
+        index, _ = nearest_segment(
+            np.array([location], dtype=float),
+            np.array([w.start for w in walls], dtype=float),
+            np.array([w.end for w in walls], dtype=float)
+        )
+        return walls[int(index[0])].orientation
     
     def _merge_with_schedule(
         self,
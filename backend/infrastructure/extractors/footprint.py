@@ -0,0 +1,320 @@
+"""
+Building Footprint Engine
+Finds the outer boundary of the wall network as a planar graph: bridge
+door openings, split walls where they meet, snap the nodes, then walk the
+outer face. Every step is array work over segment pairs from a spatial
+grid, so the cost stays near-linear in the number of wall lines.
+"""
+
+import logging
+import math
+from typing import Tuple, Optional
+from dataclasses import dataclass
+import numpy as np
+
+from infrastructure.extractors.segment_index import SegmentArray, SegmentGrid
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Footprint:
+    """Outer boundary of a wall network (sheet coordinates, drawing units)"""
+    wall_starts: np.ndarray  # (m, 2) start of each straight exterior wall run
+    wall_ends: np.ndarray  # (m, 2)
+    outward_angles: np.ndarray  # (m,) outward normal, degrees CCW from sheet +x with north up
+    area: float  # Enclosed area
+    perimeter: float  # Length of the exterior wall runs
+    ring: np.ndarray  # (k, 2) boundary walk, including any dead-end spurs
+
+
+class FootprintEngine:
+    """
+    Outer-face walk over the planar graph of wall segments
+
+    Steps:
+    1. Bridge openings: collinear walls separated by up to max_opening
+       (doorways) are joined, each end to its nearest partner only
+    2. Split: segments crossing or touching within snap_tolerance are cut
+       at the meeting point (T-junctions, corners, crossings)
+    3. Snap: cut points are rounded to a snap_tolerance grid to form nodes
+    4. Walk: from the leftmost node of the heaviest connected component,
+       follow the outer face keeping the outside on the left
+    5. Collinear boundary edges are merged back into wall runs; spurs
+       (edges walked in both directions) are not exterior walls
+    """
+
+    PARALLEL_TOLERANCE_DEG = 2.0
+    MERGE_TOLERANCE_DEG = 1.0
+
+    def __init__(self, snap_tolerance: float, max_opening: float):
+        self.snap_tolerance = snap_tolerance
+        self.max_opening = max_opening
+
+    def compute(self, segments: SegmentArray) -> Optional[Footprint]:
+        """Footprint of the wall network, or None if no closed boundary exists"""
+        segments = segments.subset(segments.length > self.snap_tolerance)
+        if len(segments) < 3:
+            return None
+
+        segments = self._bridge_openings(segments)
+        nodes, edges = self._planar_graph(segments)
+        if len(edges) < 3:
+            return None
+
+        edges = self._heaviest_component(nodes, edges)
+        walk = self._walk_outer_face(nodes, edges)
+        if walk is None:
+            return None
+        return self._build_footprint(nodes, walk)
+
+    # ------------------------------------------------------------------
+    # Graph construction
+    # ------------------------------------------------------------------
+
+    def _cell_size(self, segments: SegmentArray, padding: float) -> float:
+        return max(float(np.median(segments.length)), 4 * padding, 1e-6)
+
+    def _bridge_openings(self, segments: SegmentArray) -> SegmentArray:
+        """Add a segment across each gap between collinear walls (doorways)"""
+        tol = self.snap_tolerance
+        grid = SegmentGrid(segments, self._cell_size(segments, self.max_opening), extent_padding=self.max_opening)
+        first, second = grid.candidate_pairs()
+        if len(first) == 0:
+            return segments
+
+        u = segments.direction[first]
+        v = segments.direction[second]
+        parallel = np.abs(u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]) <= math.sin(math.radians(self.PARALLEL_TOLERANCE_DEG))
+        first, second, u = first[parallel], second[parallel], u[parallel]
+
+        offset = segments.midpoint[second] - segments.midpoint[first]
+        collinear = np.abs(u[:, 0] * offset[:, 1] - u[:, 1] * offset[:, 0]) <= tol
+        first, second, u = first[collinear], second[collinear], u[collinear]
+
+        # Second segment's endpoints along the first segment's axis
+        origin = segments.start[first]
+        t_start = np.einsum('ij,ij->i', segments.start[second] - origin, u)
+        t_end = np.einsum('ij,ij->i', segments.end[second] - origin, u)
+        length = segments.length[first]
+        ahead = np.minimum(t_start, t_end) - length  # Gap beyond the first segment's end
+        behind = -np.maximum(t_start, t_end)  # Gap before its start
+        gap = np.maximum(ahead, behind)
+        is_gap = (gap > tol) & (gap <= self.max_opening)
+        first, second, gap = first[is_gap], second[is_gap], gap[is_gap]
+        ahead, t_start, t_end = ahead[is_gap], t_start[is_gap], t_end[is_gap]
+
+        # Endpoints facing each other: (segment, 0=start / 1=end)
+        forward = ahead >= 0
+        first_side = forward.astype(np.int64)
+        second_side = np.where(forward, t_end < t_start, t_end > t_start).astype(np.int64)
+        first_key = first * 2 + first_side
+        second_key = second * 2 + second_side
+
+        # Bridge each endpoint to its nearest partner only
+        nearest = np.full(2 * len(segments), np.inf)
+        np.minimum.at(nearest, first_key, gap)
+        np.minimum.at(nearest, second_key, gap)
+        keep = (gap <= nearest[first_key]) & (gap <= nearest[second_key])
+        if not keep.any():
+            return segments
+
+        endpoints = np.stack([segments.start, segments.end], axis=1)  # (n, 2 sides, 2)
+        bridge_start = endpoints[first[keep], first_side[keep]]
+        bridge_end = endpoints[second[keep], second_side[keep]]
+        # The same bridge can be found from either side
+        bridge = np.unique(np.round(np.hstack([
+            np.minimum(bridge_start, bridge_end), np.maximum(bridge_start, bridge_end)
+        ]) / tol).astype(np.int64), axis=0, return_index=True)[1]
+
+        return SegmentArray(
+            start=np.vstack([segments.start, bridge_start[bridge]]),
+            end=np.vstack([segments.end, bridge_end[bridge]]),
+            source=np.concatenate([segments.source, np.full(len(bridge), -1, dtype=np.int64)])
+        )
+
+    def _planar_graph(self, segments: SegmentArray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Nodes and undirected edges after splitting at every meeting point
+
+        Returns:
+            (nodes (N, 2), edges (E, 2) node index pairs)
+        """
+        tol = self.snap_tolerance
+        n = len(segments)
+        grid = SegmentGrid(segments, self._cell_size(segments, tol), extent_padding=tol)
+        first, second = grid.candidate_pairs()
+
+        # Cut parameters: each segment's own ends plus every meeting point
+        cut_segment = [np.arange(n), np.arange(n)]
+        cut_param = [np.zeros(n), np.ones(n)]
+        cut_point = [segments.start, segments.end]
+        cut_priority = [np.ones(n), np.ones(n)]
+
+        if len(first):
+            p = segments.start[first]
+            r = segments.end[first] - p
+            q = segments.start[second]
+            s = segments.end[second] - q
+            denom = r[:, 0] * s[:, 1] - r[:, 1] * s[:, 0]
+            qp = q - p
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t = (qp[:, 0] * s[:, 1] - qp[:, 1] * s[:, 0]) / denom
+                u = (qp[:, 0] * r[:, 1] - qp[:, 1] * r[:, 0]) / denom
+                t_tol = tol / segments.length[first]
+                u_tol = tol / segments.length[second]
+                hit = (
+                    (np.abs(denom) > 1e-9 * segments.length[first] * segments.length[second]) &
+                    (t >= -t_tol) & (t <= 1 + t_tol) & (u >= -u_tol) & (u <= 1 + u_tol)
+                )
+            t = np.clip(t[hit], 0.0, 1.0)
+            u = np.clip(u[hit], 0.0, 1.0)
+            # Both segments are cut at the same point so they share a node
+            point = p[hit] + t[:, None] * r[hit]
+            cut_segment += [first[hit], second[hit]]
+            cut_param += [t, u]
+            cut_point += [point, point]
+            cut_priority += [np.zeros(len(t)), np.zeros(len(t))]
+
+        cut_segment = np.concatenate(cut_segment)
+        cut_param = np.concatenate(cut_param)
+        cut_point = np.vstack(cut_point)
+        cut_priority = np.concatenate(cut_priority)
+
+        # Along each segment; at (nearly) the same place a meeting point wins
+        # over the segment's own end so a T-junction does not leave a stub
+        order = np.lexsort((cut_priority, cut_param, cut_segment))
+        cut_segment, cut_param, cut_point = cut_segment[order], cut_param[order], cut_point[order]
+        same_segment = cut_segment[1:] == cut_segment[:-1]
+        too_close = np.diff(cut_param) * segments.length[cut_segment[1:]] <= tol
+        keep = np.concatenate([[True], ~(same_segment & too_close)])
+        cut_segment, cut_point = cut_segment[keep], cut_point[keep]
+
+        # Snap cut points to nodes
+        snapped = np.round(cut_point / tol).astype(np.int64)
+        snapped_nodes, node_of_cut = np.unique(snapped, axis=0, return_inverse=True)
+        node_of_cut = node_of_cut.reshape(-1)
+        nodes = np.zeros((len(snapped_nodes), 2))
+        np.add.at(nodes, node_of_cut, cut_point)
+        nodes /= np.bincount(node_of_cut, minlength=len(nodes))[:, None]
+
+        # Consecutive cuts along a segment form an edge
+        consecutive = cut_segment[1:] == cut_segment[:-1]
+        a = node_of_cut[:-1][consecutive]
+        b = node_of_cut[1:][consecutive]
+        distinct = a != b
+        edges = np.unique(np.stack([np.minimum(a, b)[distinct], np.maximum(a, b)[distinct]], axis=1), axis=0)
+        return nodes, edges
+
+    def _heaviest_component(self, nodes: np.ndarray, edges: np.ndarray) -> np.ndarray:
+        """Edges of the connected component with the most total wall length"""
+        label = np.arange(len(nodes))
+        a, b = edges[:, 0], edges[:, 1]
+        while True:
+            low = np.minimum(label[a], label[b])
+            updated = label.copy()
+            np.minimum.at(updated, a, low)
+            np.minimum.at(updated, b, low)
+            updated = updated[updated]  # Pointer jumping
+            if np.array_equal(updated, label):
+                break
+            label = updated
+
+        edge_label = label[a]
+        edge_length = np.linalg.norm(nodes[a] - nodes[b], axis=1)
+        weight = np.bincount(edge_label, weights=edge_length, minlength=len(nodes))
+        return edges[edge_label == np.argmax(weight)]
+
+    # ------------------------------------------------------------------
+    # Outer face
+    # ------------------------------------------------------------------
+
+    def _walk_outer_face(self, nodes: np.ndarray, edges: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Half-edges (origin, destination) along the outer face, in order
+
+        Angles use north-up coordinates (sheet y flipped). Outgoing half-edges
+        are sorted by angle around each node; leaving a node, the walk takes
+        the edge just clockwise of the one it arrived on, which keeps the
+        face on the left. Started from the leftmost node heading as far
+        counterclockwise as possible, that face is the outside.
+        """
+        origin = np.concatenate([edges[:, 0], edges[:, 1]])
+        destination = np.concatenate([edges[:, 1], edges[:, 0]])
+        half = len(edges)
+        twin = np.concatenate([np.arange(half, 2 * half), np.arange(half)])
+        delta = nodes[destination] - nodes[origin]
+        angle = np.arctan2(-delta[:, 1], delta[:, 0])
+
+        order = np.lexsort((angle, origin))
+        position = np.empty_like(order)
+        position[order] = np.arange(len(order))
+        sorted_origin = origin[order]
+        group_start = np.searchsorted(sorted_origin, np.arange(len(nodes)), side='left')
+        degree = np.searchsorted(sorted_origin, np.arange(len(nodes)), side='right') - group_start
+
+        # next(h) = outgoing edge at h's destination just clockwise of twin(h)
+        arrive = position[twin] - group_start[destination]
+        following = order[group_start[destination] + (arrive - 1) % degree[destination]]
+
+        # Leftmost node (lowest of ties), outgoing edge with the largest angle
+        used = np.unique(origin)
+        north_up = np.stack([nodes[used, 0], -nodes[used, 1]], axis=1)
+        start_node = used[np.lexsort((north_up[:, 1], north_up[:, 0]))[0]]
+        start = order[group_start[start_node] + degree[start_node] - 1]
+
+        walk = [start]
+        current = following[start]
+        while current != start:
+            walk.append(current)
+            if len(walk) > len(origin):
+                logger.warning("Footprint walk did not close")
+                return None
+            current = following[current]
+        walk = np.asarray(walk)
+        return np.stack([origin[walk], destination[walk]], axis=1)
+
+    def _build_footprint(self, nodes: np.ndarray, walk: np.ndarray) -> Optional[Footprint]:
+        ring = nodes[walk[:, 0]]
+        x, y = ring[:, 0], ring[:, 1]
+        area = abs(float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))) / 2
+
+        # Spurs are walked out and back; only edges walked once are exterior
+        keys = np.minimum(walk[:, 0], walk[:, 1]) * len(nodes) + np.maximum(walk[:, 0], walk[:, 1])
+        _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        boundary = walk[counts[inverse.reshape(-1)] == 1]
+        if len(boundary) < 3 or area <= 0:
+            return None
+
+        # Merge collinear consecutive edges into wall runs
+        start, end = nodes[boundary[:, 0]], nodes[boundary[:, 1]]
+        delta = end - start
+        direction = np.degrees(np.arctan2(-delta[:, 1], delta[:, 0]))
+        turn = np.abs((direction - np.roll(direction, 1) + 180) % 360 - 180)
+        connected = boundary[:, 0] == np.roll(boundary[:, 1], 1)
+        new_run = (turn > self.MERGE_TOLERANCE_DEG) | ~connected
+        if not new_run.any():
+            return None
+        # Rotate so the walk starts at a corner, then group runs
+        first_corner = int(np.argmax(new_run))
+        rotation = np.roll(np.arange(len(boundary)), -first_corner)
+        start, end, direction, new_run = start[rotation], end[rotation], direction[rotation], new_run[rotation]
+        run_first = np.flatnonzero(new_run)
+        run_last = np.concatenate([run_first[1:], [len(new_run)]]) - 1
+
+        wall_starts = start[run_first]
+        wall_ends = end[run_last]
+        run_delta = wall_ends - wall_starts
+        run_direction = np.degrees(np.arctan2(-run_delta[:, 1], run_delta[:, 0]))
+        # Outside is on the left of the walk
+        outward = (run_direction + 90) % 360
+        perimeter = float(np.linalg.norm(run_delta, axis=1).sum())
+
+        return Footprint(
+            wall_starts=wall_starts,
+            wall_ends=wall_ends,
+            outward_angles=outward,
+            area=area,
+            perimeter=perimeter,
+            ring=ring
+        )
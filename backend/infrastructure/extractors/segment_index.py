@@ -0,0 +1,227 @@
+"""
+Segment Spatial Index
+Columnar line-segment arrays and a uniform grid over them, so geometric
+neighbour queries (parallel pairs, wall openings) only compare segments that
+are actually close on the sheet
+"""
+
+import logging
+from typing import List, Any, Tuple, Sequence, Optional
+from dataclasses import dataclass, field
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def path_fields(path: Any) -> Tuple[str, List]:
+    """(path_type, points) for a VectorPath or a serialized path dict"""
+    if hasattr(path, 'points'):
+        return getattr(path, 'path_type', 'line'), path.points
+    return path.get('path_type', 'line'), path.get('points', [])
+
+
+def nearest_segment(points: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nearest segment to each point (all points against all segments)
+
+    Returns:
+        (segment index, distance) per point
+    """
+    delta = ends - starts                                    # (m, 2)
+    length_sq = np.maximum(np.einsum('ij,ij->i', delta, delta), 1e-12)
+    rel = points[:, None, :] - starts[None, :, :]            # (k, m, 2)
+    t = np.clip(np.einsum('kmj,mj->km', rel, delta) / length_sq, 0.0, 1.0)
+    closest = starts[None, :, :] + t[:, :, None] * delta[None, :, :]
+    distance = np.linalg.norm(points[:, None, :] - closest, axis=2)
+    index = np.argmin(distance, axis=1)
+    return index, distance[np.arange(len(points)), index]
+
+
+@dataclass
+class SegmentArray:
+    """
+    Line segments stored column-wise (one row per segment)
+
+    Derived geometry (lengths, unit directions, midpoints) is computed once
+    on construction so pair tests are plain array arithmetic.
+    """
+    start: np.ndarray   # (n, 2)
+    end: np.ndarray     # (n, 2)
+    source: np.ndarray  # (n,) index of the originating path
+    length: np.ndarray = field(init=False)
+    direction: np.ndarray = field(init=False)  # (n, 2) unit vectors
+    midpoint: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        delta = self.end - self.start
+        self.length = np.hypot(delta[:, 0], delta[:, 1])
+        safe_length = np.where(self.length > 0, self.length, 1.0)
+        self.direction = delta / safe_length[:, None]
+        self.midpoint = (self.start + self.end) / 2
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    @classmethod
+    def from_paths(cls, paths: Sequence[Any], path_types: Tuple[str, ...] = ('line',)) -> 'SegmentArray':
+        """
+        Straight edges of paths of the given types; other paths are skipped
+
+        Lines give one segment; rectangles and other closed polylines give
+        one segment per edge, all pointing back to the same source path.
+        """
+        coords = []
+        sources = []
+        for index, path in enumerate(paths):
+            path_type, points = path_fields(path)
+            if path_type not in path_types or len(points) < 2 or path_type == 'curve':
+                continue
+            if len(points) == 2:
+                coords.append((points[0][0], points[0][1], points[1][0], points[1][1]))
+                sources.append(index)
+                continue
+            edges = list(zip(points[:-1], points[1:]))
+            closed = path_type == 'rect' or (
+                getattr(path, 'is_closed', False) if hasattr(path, 'points') else path.get('is_closed', False)
+            )
+            if closed:
+                edges.append((points[-1], points[0]))
+            for p1, p2 in edges:
+                coords.append((p1[0], p1[1], p2[0], p2[1]))
+                sources.append(index)
+
+        array = np.asarray(coords, dtype=float).reshape(-1, 4)
+        return cls(
+            start=array[:, :2],
+            end=array[:, 2:],
+            source=np.asarray(sources, dtype=np.int64)
+        )
+
+    def subset(self, mask: np.ndarray) -> 'SegmentArray':
+        """Segments selected by a boolean mask or index array"""
+        return SegmentArray(start=self.start[mask], end=self.end[mask], source=self.source[mask])
+
+
+class SegmentGrid:
+    """
+    Uniform grid over segments
+
+    Midpoint mode (default): each segment sits in the cell of its midpoint.
+    With cell_size at least the largest midpoint distance a caller cares
+    about, every such pair lies in the same or an adjacent cell. Pairs are
+    generated by sorting cell keys once and range-joining each cell with
+    itself and four half-plane neighbours, so each unordered pair of cells
+    is visited exactly once and the cost tracks the number of local pairs
+    rather than n².
+
+    Extent mode (extent_padding set): each segment is registered in every
+    cell its bounding box, grown by the padding, overlaps. Segments that
+    cross or come within the padding of each other always share a cell,
+    whatever their lengths.
+    """
+
+    # Same cell plus half of the 8-neighbourhood; the other half is symmetric
+    NEIGHBOUR_OFFSETS = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+    def __init__(self, segments: SegmentArray, cell_size: float, extent_padding: Optional[float] = None):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.segments = segments
+        self.cell_size = cell_size
+        self.extent_padding = extent_padding
+
+        cells = np.floor(segments.midpoint / cell_size).astype(np.int64) if len(segments) else np.zeros((0, 2), np.int64)
+        if len(cells):
+            # Shift by one so neighbour offsets never go negative
+            cells -= cells.min(axis=0) - 1
+        self._cx = cells[:, 0]
+        self._cy = cells[:, 1]
+        self._rows = int(self._cy.max()) + 2 if len(cells) else 1
+        keys = self._cx * self._rows + self._cy
+        self._order = np.argsort(keys, kind='stable')
+        self._sorted_keys = keys[self._order]
+
+    def candidate_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Index pairs (i, j), i < j, whose midpoints share a cell or touch cells
+
+        Returns:
+            Two equal-length int arrays of segment indices
+        """
+        n = len(self.segments)
+        if n < 2:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        if self.extent_padding is not None:
+            return self._extent_pairs()
+
+        firsts = []
+        seconds = []
+        own = np.arange(n)
+        for dx, dy in self.NEIGHBOUR_OFFSETS:
+            target = (self._cx + dx) * self._rows + (self._cy + dy)
+            lo = np.searchsorted(self._sorted_keys, target, side='left')
+            hi = np.searchsorted(self._sorted_keys, target, side='right')
+            counts = hi - lo
+            total = int(counts.sum())
+            if total == 0:
+                continue
+
+            # Expand each segment's matching range [lo, hi) into explicit pairs
+            first = np.repeat(own, counts)
+            run_starts = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+            second = self._order[run_starts + np.arange(total)]
+
+            if (dx, dy) == (0, 0):
+                keep = first < second
+                first, second = first[keep], second[keep]
+            firsts.append(first)
+            seconds.append(second)
+
+        if not firsts:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        first = np.concatenate(firsts)
+        second = np.concatenate(seconds)
+        return np.minimum(first, second), np.maximum(first, second)
+
+    def _extent_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Unique pairs of segments registered in a common cell"""
+        segments = self.segments
+        n = len(segments)
+        pad = self.extent_padding
+        low = np.floor((np.minimum(segments.start, segments.end) - pad) / self.cell_size).astype(np.int64)
+        high = np.floor((np.maximum(segments.start, segments.end) + pad) / self.cell_size).astype(np.int64)
+        low, high = low - low.min(axis=0), high - low.min(axis=0)
+
+        # One (segment, cell) entry per covered cell
+        span_x = high[:, 0] - low[:, 0] + 1
+        span_y = high[:, 1] - low[:, 1] + 1
+        counts = span_x * span_y
+        entry_segment = np.repeat(np.arange(n), counts)
+        k = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        per_row = np.repeat(span_y, counts)
+        cell_x = np.repeat(low[:, 0], counts) + k // per_row
+        cell_y = np.repeat(low[:, 1], counts) + k % per_row
+        keys = cell_x * (int(high[:, 1].max()) + 1) + cell_y
+
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        entry_segment = entry_segment[order]
+
+        # Pair every entry with the entries after it in the same cell
+        positions = np.arange(len(keys))
+        group_end = np.searchsorted(keys, keys, side='right')
+        later = group_end - positions - 1
+        total = int(later.sum())
+        if total == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        first = np.repeat(entry_segment, later)
+        offsets = np.arange(total) - np.repeat(np.cumsum(later) - later, later)
+        second = entry_segment[np.repeat(positions + 1, later) + offsets]
+
+        # Segments sharing several cells pair once
+        a, b = np.minimum(first, second), np.maximum(first, second)
+        pair_keys = np.unique(a[a != b] * n + b[a != b])
+        return pair_keys // n, pair_keys % n
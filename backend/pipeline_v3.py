@@ -9,17 +9,21 @@ import json
 import os
 import time
 import re
-import math
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Callable
+from dataclasses import dataclass, asdict, fields
 from datetime import datetime
+from enum import Enum
+
+import numpy as np
 
 # Domain imports
 from domain.core.climate_zones import get_climate_data_for_zone, get_zone_for_zipcode
 from domain.core.thermal_envelope import get_envelope_builder
 
 # Models
-from domain.models.spaces import Space, SpaceType, CeilingType, BoundaryCondition
+from domain.models.spaces import Space, Surface, SpaceType, CeilingType, BoundaryCondition
 from domain.models.zones import ThermalZone, ZoneType, BuildingThermalModel
 
 # Infrastructure extractors
@@ -33,10 +37,11 @@ from infrastructure.extractors.zones.overlay_aligner import get_overlay_aligner
 
 # Extractors - Infrastructure layer
 from infrastructure.extractors.envelope import get_envelope_extractor
-from infrastructure.extractors.foundation import get_foundation_extractor
+from infrastructure.extractors.foundation import get_foundation_extractor, FoundationData
 from infrastructure.extractors.fenestration import get_fenestration_extractor
 from infrastructure.extractors.mechanical import get_mechanical_extractor
-from infrastructure.extractors.energy_specs import get_energy_spec_extractor
+from infrastructure.extractors.energy_specs import get_energy_spec_extractor, EnergySpecs
+from infrastructure.extractors.scale import ScaleResult
 
 # Vision Processing - Infrastructure layer
 from infrastructure.extractors.vision_processor import VisionProcessor
@@ -47,11 +52,14 @@ from domain.core.telemetry import get_telemetry
 
 # Domain calculations
 from domain.calculations.manual_j_v2 import get_manual_j_calculator
-from domain.calculations.infiltration_aim2 import get_infiltration_calculator, calculate_infiltration_loads
+from domain.calculations.infiltration_aim2 import get_infiltration_calculator
 from domain.mechanical.duct_loss_calculator import calculate_intelligent_duct_losses
-from domain.calculations.parallel_path import get_parallel_path_calculator
 from domain.calculations.zone_loads import get_zone_load_calculator
+from domain.calculations.load_plan import get_load_plan_compiler, internal_gain_components, EnvelopeInputs, LoadPlan
 from domain.calculations.diversity_factors import get_diversity_calculator
+from domain.calculations.orientation_sweep import get_orientation_sweep_calculator, COMPASS_POINTS
+from domain.calculations.hourly_simulation import get_hourly_simulation_calculator, ZoneLoadComponents, SIMULATION_MODES
+from domain.calculations.uncertainty import get_uncertainty_calculator, UncertaintyComponents, DEFAULT_SAMPLES, MAX_SAMPLES
 
 # Models and types for building thermal model
 from domain.models.zones import BuildingThermalModel, ThermalZone
@@ -64,6 +72,23 @@ from infrastructure.utils.text_extraction import extract_text_from_pdf
 
 logger = logging.getLogger(__name__)
 
+# Bump when calculation output changes - part of the upload dedup fingerprint,
+# so results from an older pipeline are never reused
+PIPELINE_VERSION = os.getenv("PIPELINE_VERSION", "v3.1")
+
+# progress_callback(stage, progress_percent, message, **data)
+ProgressCallback = Callable[..., None]
+
+
+def _report_progress(progress_callback: Optional[ProgressCallback], stage: str, progress: int, message: str, **data) -> None:
+    """Send a stage event to the caller; never lets a reporting error fail the pipeline"""
+    if progress_callback is None:
+        return
+    try:
+        progress_callback(stage, progress, message, **data)
+    except Exception as e:
+        logger.warning(f"Progress callback failed at {stage}: {e}")
+
 
 @dataclass
 class PipelineV3Result:
@@ -109,6 +134,19 @@ class PipelineV3Result:
     # Raw data for debugging
     raw_extractions: Optional[Dict[str, Any]] = None
     
+    # Cooling load across building rotations (when orientation is unknown or requested)
+    orientation_sweep: Optional[Dict[str, Any]] = None
+    
+    # Hourly heating/cooling profiles (design days or synthetic year, on request)
+    hourly_simulation: Optional[Dict[str, Any]] = None
+    
+    # Monte Carlo P10/P50/P90 design loads (on request)
+    uncertainty: Optional[Dict[str, Any]] = None
+    
+    # Cached Phase 1/2 outputs for scenario re-runs
+    extraction_snapshot: Optional['ExtractionSnapshot'] = None
+    recalculated_stages: Optional[List[str]] = None
+    
     def __post_init__(self):
         if self.zone_loads is None:
             self.zone_loads = {}
@@ -116,6 +154,150 @@ class PipelineV3Result:
             self.warnings = []
 
 
+# Re-runnable stages in pipeline order and the user inputs each one consumes.
+# Phase 1 PDF/vision extraction never depends on these and is never repeated;
+# when an input changes, its stage and every later stage are re-run.
+RECALC_STAGES = ('building_characteristics', 'thermal_zones', 'zone_loads')
+
+STAGE_INPUT_KEYS = {
+    'building_characteristics': ('conditioned_sqft', 'total_sqft', 'floor_count', 'year_built', 'foundation_type'),
+    'thermal_zones': ('conditioned_sqft', 'total_sqft', 'floor_count', 'foundation_type', 'basement_status'),
+    'zone_loads': (),  # Always re-run - consumes every remaining input
+}
+
+
+def get_invalidated_stages(previous_inputs: Dict[str, Any], new_inputs: Dict[str, Any]) -> List[str]:
+    """
+    Determine which recalculation stages a change of user inputs invalidates.
+    
+    Returns:
+        Stage names in pipeline order; 'zone_loads' is always included
+    """
+    changed_keys = {
+        key for key in set(previous_inputs) | set(new_inputs)
+        if previous_inputs.get(key) != new_inputs.get(key)
+    }
+    for index, stage in enumerate(RECALC_STAGES):
+        if changed_keys & set(STAGE_INPUT_KEYS[stage]):
+            return list(RECALC_STAGES[index:])
+    return ['zone_loads']
+
+
+def _estimate_floor_count(total_sqft: float) -> int:
+    """Floor count assumed from conditioned area when the user didn't give one"""
+    return 2 if total_sqft > 2000 else 1
+
+
+# Classes a stored snapshot may rebuild, by name. Snapshots are kept as tagged
+# JSON and loading only ever constructs these (plus builtins and datetime).
+SNAPSHOT_TYPES = {cls.__name__: cls for cls in (
+    BuildingThermalModel, ThermalZone, ZoneType, Space, SpaceType, CeilingType,
+    BoundaryCondition, Surface, EnergySpecs, FoundationData, ScaleResult
+)}
+
+
+def _encode_snapshot_value(value: Any) -> Any:
+    """Convert a snapshot value to tagged JSON (see SNAPSHOT_TYPES)"""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, list):
+        return [_encode_snapshot_value(item) for item in value]
+    if isinstance(value, tuple):
+        return {'__tuple__': [_encode_snapshot_value(item) for item in value]}
+    if isinstance(value, dict):
+        if all(isinstance(key, str) and not key.startswith('__') for key in value):
+            return {key: _encode_snapshot_value(item) for key, item in value.items()}
+        # Non-string keys (page numbers) survive as key/value pairs
+        return {'__items__': [[_encode_snapshot_value(key), _encode_snapshot_value(item)] for key, item in value.items()]}
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, np.generic):
+        return value.item()
+    
+    type_name = type(value).__name__
+    if SNAPSHOT_TYPES.get(type_name) is not type(value):
+        raise TypeError(f"{type_name} is not a snapshot type")
+    if isinstance(value, Enum):
+        return {'__enum__': type_name, 'value': _encode_snapshot_value(value.value)}
+    return {
+        '__type__': type_name,
+        'fields': {f.name: _encode_snapshot_value(getattr(value, f.name)) for f in fields(value) if f.init}
+    }
+
+
+def _decode_snapshot_value(value: Any) -> Any:
+    """Rebuild a snapshot value from tagged JSON"""
+    if isinstance(value, list):
+        return [_decode_snapshot_value(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if '__tuple__' in value:
+        return tuple(_decode_snapshot_value(item) for item in value['__tuple__'])
+    if '__items__' in value:
+        return {_decode_snapshot_value(key): _decode_snapshot_value(item) for key, item in value['__items__']}
+    if '__datetime__' in value:
+        return datetime.fromisoformat(value['__datetime__'])
+    if '__enum__' in value:
+        return SNAPSHOT_TYPES[value['__enum__']](_decode_snapshot_value(value['value']))
+    if '__type__' in value:
+        return SNAPSHOT_TYPES[value['__type__']](
+            **{name: _decode_snapshot_value(item) for name, item in value['fields'].items()}
+        )
+    return {key: _decode_snapshot_value(item) for key, item in value.items()}
+
+
+@dataclass
+class ExtractionSnapshot:
+    """Phase 1 extraction and Phase 2 thermal model cached for load re-runs"""
+    zip_code: str
+    user_inputs: Dict[str, Any]
+    extraction_data: Dict[str, Any]  # Phase 1 output (building_data before Phase 2 overrides)
+    building_model: BuildingThermalModel  # Phase 2 output
+    created_at: Optional[datetime] = None
+    
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.utcnow()
+    
+    def compact(self) -> 'ExtractionSnapshot':
+        """
+        Copy without the data only Phase 1 and room detection need
+        (page vectors, text blocks, AI spec excerpts), for long-lived storage.
+        """
+        extraction_data = {
+            key: value for key, value in self.extraction_data.items()
+            if key not in ('pages', 'text_blocks', 'construction_context')
+        }
+        extraction_data['pages'] = [
+            {key: value for key, value in page.items() if key != 'vector_data'}
+            for page in self.extraction_data.get('pages', [])
+        ]
+        construction_context = self.extraction_data.get('construction_context') or {}
+        extraction_data['construction_context'] = {
+            'thermal_intelligence': construction_context.get('thermal_intelligence', {}),
+            'confidence': construction_context.get('confidence')
+        }
+        if extraction_data.get('detected_spaces') is None:
+            extraction_data['detected_spaces'] = []
+        
+        return ExtractionSnapshot(
+            zip_code=self.zip_code,
+            user_inputs=dict(self.user_inputs),
+            extraction_data=extraction_data,
+            building_model=self.building_model,
+            created_at=self.created_at
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form for storage (rebuilt by from_dict)"""
+        return _encode_snapshot_value({f.name: getattr(self, f.name) for f in fields(self)})
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ExtractionSnapshot':
+        """Rebuild a snapshot stored with to_dict"""
+        return cls(**_decode_snapshot_value(data))
+
+
 class PipelineV3:
     """
     Zone-based pipeline for professional HVAC load calculations.
@@ -164,7 +346,8 @@ class PipelineV3:
         self,
         pdf_path: str,
         zip_code: str,
-        user_inputs: Optional[Dict[str, Any]] = None
+        user_inputs: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> PipelineV3Result:
         """
         Process blueprint through zone-based pipeline.
@@ -174,6 +357,7 @@ class PipelineV3:
             pdf_path: Path to blueprint PDF
             zip_code: Building location zip code
             user_inputs: Optional user overrides (sqft, year_built, etc.)
+            progress_callback: Optional stage progress receiver (stage, percent, message, **data)
             
         Returns:
             PipelineV3Result with zone-based load calculations
@@ -193,7 +377,8 @@ class PipelineV3:
             logger.info("PHASE 1: DATA EXTRACTION")
             logger.info("="*40)
             
-            extraction_data = self._extract_all_data(pdf_path, zip_code, user_inputs)
+            extraction_data = self._extract_all_data(pdf_path, zip_code, user_inputs, progress_callback)
+            phase1_building_data = copy.deepcopy(extraction_data.get('building_data', {}))
             
             # PHASE 2: BUILD THERMAL ZONES (V3's zone-based approach)
             logger.info("\n" + "="*40)
@@ -201,6 +386,9 @@ class PipelineV3:
             logger.info("="*40)
             
             building_model = self._build_thermal_zones(extraction_data, user_inputs)
+            _report_progress(progress_callback, 'zones_built', 75,
+                             f"Built {len(building_model.zones)} thermal zones",
+                             zones=len(building_model.zones))
             
             # PHASE 3: CALCULATE ZONE-BASED LOADS (V3's Manual J implementation)
             logger.info("\n" + "="*40)
@@ -208,6 +396,18 @@ class PipelineV3:
             logger.info("="*40)
             
             results = self._calculate_zone_loads(building_model, extraction_data, zip_code)
+            _report_progress(progress_callback, 'loads_calculated', 90,
+                             "Manual J load calculations complete",
+                             heating_load_btu_hr=round(results.heating_load_btu_hr),
+                             cooling_load_btu_hr=round(results.cooling_load_btu_hr))
+            
+            # Keep Phase 1/2 outputs so input variants can skip extraction
+            results.extraction_snapshot = ExtractionSnapshot(
+                zip_code=zip_code,
+                user_inputs=dict(user_inputs or {}),
+                extraction_data={**extraction_data, 'building_data': phase1_building_data},
+                building_model=building_model
+            )
             
             # Add metadata and validation
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -434,6 +634,15 @@ class PipelineV3:
         heating_components = {}
         cooling_components = {}
         
+        # One plan for every conditioned zone; diversity is applied per zone below
+        thermal_intelligence = extraction_data.get('construction_context', {}).get('thermal_intelligence', {})
+        envelope_inputs = EnvelopeInputs.from_properties(
+            self._zone_envelope_properties(climate_data, building_info), climate_data, thermal_intelligence
+        )
+        zone_load_plan = get_load_plan_compiler().compile(
+            building_model, climate_data, envelope_inputs, cooling_diversity=False
+        )
+        
         for zone in building_model.zones:
             if not zone.is_conditioned:
                 continue
@@ -445,7 +654,8 @@ class PipelineV3:
                 foundation_data,
                 fenestration_data,
                 climate_data,
-                building_info
+                building_info,
+                zone_load_plan
             )
             
             zone_loads[zone.zone_id] = {
@@ -564,17 +774,68 @@ class PipelineV3:
         
         return result
     
+    def recalculate_loads(
+        self,
+        snapshot: ExtractionSnapshot,
+        user_inputs: Optional[Dict[str, Any]] = None
+    ) -> PipelineV3Result:
+        """
+        Re-run load calculations against a cached extraction.
+        
+        Phase 1 is never repeated. Only the stages invalidated by inputs that
+        differ from the snapshot's are re-run (see get_invalidated_stages);
+        unchanged stages reuse the cached building data and thermal model.
+        
+        Args:
+            snapshot: Cached Phase 1/2 outputs from a completed run
+            user_inputs: Input overrides merged over the snapshot's inputs
+            
+        Returns:
+            PipelineV3Result for the merged inputs
+        """
+        start_time = datetime.now()
+        merged_inputs = {**snapshot.user_inputs, **(user_inputs or {})}
+        stages = get_invalidated_stages(snapshot.user_inputs, merged_inputs)
+        
+        extraction_data = dict(snapshot.extraction_data)
+        extraction_data['user_inputs'] = merged_inputs
+        extraction_data['building_data'] = copy.deepcopy(snapshot.extraction_data.get('building_data', {}))
+        
+        if 'building_characteristics' in stages:
+            self._apply_building_input_overrides(extraction_data['building_data'], merged_inputs)
+        base_building_data = copy.deepcopy(extraction_data['building_data'])
+        
+        if 'thermal_zones' in stages:
+            building_model = self._build_thermal_zones(extraction_data, merged_inputs)
+        else:
+            building_model = copy.deepcopy(snapshot.building_model)
+        
+        results = self._calculate_zone_loads(building_model, extraction_data, snapshot.zip_code)
+        results.recalculated_stages = stages
+        results.extraction_snapshot = ExtractionSnapshot(
+            zip_code=snapshot.zip_code,
+            user_inputs=merged_inputs,
+            extraction_data={**extraction_data, 'building_data': base_building_data},
+            building_model=building_model,
+            created_at=snapshot.created_at
+        )
+        results.processing_time_seconds = (datetime.now() - start_time).total_seconds()
+        return results
+    
     def _extract_all_data(
         self,
         pdf_path: str,
         zip_code: str,
-        user_inputs: Optional[Dict]
+        user_inputs: Optional[Dict],
+        progress_callback: Optional[ProgressCallback] = None
     ) -> Dict[str, Any]:
         """
         Phase 1: Extract all data from blueprint (adapted from V2's proven method)
         """
         import fitz
         doc = fitz.open(pdf_path)
+        _report_progress(progress_callback, 'extraction_started', 10,
+                         f"Reading {len(doc)} page blueprint", pages=len(doc))
         
         extraction_data = {
             'pdf_path': pdf_path,
@@ -621,6 +882,9 @@ class PipelineV3:
                 'page_type': page_type,
                 'page_confidence': confidence
             })
+            _report_progress(progress_callback, 'page_extracted', 10 + int(40 * (page_num + 1) / len(doc)),
+                             f"Extracted page {page_num + 1}/{len(doc)} ({page_type})",
+                             page=page_num + 1, pages=len(doc), page_type=page_type)
         
         extraction_data['page_classifications'] = page_classifications
         
@@ -670,6 +934,8 @@ class PipelineV3:
                 logger.info(f"    Air leakage: {energy_specs.ach50} ACH50")
         else:
             logger.info("  ⚠ No energy specifications found in text, will use defaults")
+        _report_progress(progress_callback, 'specs_extracted', 55, "Construction specifications analyzed",
+                         energy_specs_found=energy_specs.extraction_source != "none")
         
         # 1.4 Detect scale
         logger.info("\n1.4 Detecting drawing scale...")
@@ -686,6 +952,13 @@ class PipelineV3:
             extraction_data['scale_factor'] = 1.0 / 48.0
         else:
             extraction_data['scale_factor'] = 1.0 / scale_result.scale_px_per_ft
+        if scale_result:
+            _report_progress(progress_callback, 'scale_detected', 60,
+                             f"Drawing scale detected ({scale_result.scale_px_per_ft} px/ft)",
+                             scale_px_per_ft=scale_result.scale_px_per_ft)
+        else:
+            _report_progress(progress_callback, 'scale_detected', 60, "No scale found, using 1/4\" = 1'",
+                             scale_px_per_ft=None)
         
         # 1.3 Extract foundation
         logger.info("\n1.3 Extracting foundation...")
@@ -703,6 +976,9 @@ class PipelineV3:
         extraction_data['building_data'] = building_data
         logger.info(f"  ✓ Building: {building_data['total_sqft']:.0f} sqft, "
                    f"{building_data['floor_count']} floors")
+        _report_progress(progress_callback, 'building_extracted', 65,
+                         f"{building_data['total_sqft']:.0f} sqft, {building_data['floor_count']} floors",
+                         total_sqft=round(building_data['total_sqft']), floor_count=building_data['floor_count'])
         
         return extraction_data
     
@@ -774,42 +1050,12 @@ class PipelineV3:
             summer_design_temp=climate_data.get('summer_1', 95)
         )
         
-        # Process each page's room data
-        spaces_created = []
-        page_classifications = extraction_data.get('page_classifications', {})
-        
-        for page_num, page_data in enumerate(extraction_data.get('pages', [])):
-            page_info = page_classifications.get(page_num, ('unknown', 0.1))
-            page_type, confidence = page_info
-            
-            # Skip non-floor-plan pages
-            if page_type not in ['main_floor_plan', 'bonus_floor_plan'] or confidence < 0.3:
-                logger.info(f"  Skipping page {page_num + 1} ({page_type}, conf={confidence:.2f})")
-                continue
-                
-            floor_level = self._get_floor_level_from_page_type(page_type)
-            
-            # Get room data for this page
-            room_graph = None
-            if page_data.get('vector_data'):
-                # Use V2's proven room extractor
-                vector_dict = self._vector_to_dict(page_data['vector_data'])
-                room_graph = self.room_extractor.extract_rooms(
-                    vector_dict,
-                    extraction_data.get('text_blocks', []),
-                    scale_factor=extraction_data.get('scale_factor', 1.0/48.0),
-                    floor_number=floor_level
-                )
-            
-            if room_graph and room_graph.rooms:
-                logger.info(f"  Page {page_num + 1} ({page_type}): {len(room_graph.rooms)} spaces")
-                
-                for room in room_graph.rooms.values():
-                    space = self._convert_room_to_space(room, page_type, extraction_data)
-                    if space:
-                        spaces_created.append(space)
-        
-        logger.info(f"  ✓ Created {len(spaces_created)} spaces total")
+        # Room detection only depends on Phase 1 outputs - reuse cached spaces on re-runs
+        detected_spaces = extraction_data.get('detected_spaces')
+        if detected_spaces is None:
+            detected_spaces = self._detect_spaces_from_pages(extraction_data)
+            extraction_data['detected_spaces'] = detected_spaces
+        spaces_created = copy.deepcopy(detected_spaces)
         
         # Fallback: If no spaces detected from vectors, create reasonable spaces from building data
         if not spaces_created:
@@ -862,6 +1108,46 @@ class PipelineV3:
         
         return building_model
     
+    def _detect_spaces_from_pages(self, extraction_data: Dict[str, Any]) -> List[Space]:
+        """Run room detection on floor plan pages and convert rooms to spaces"""
+        spaces_created = []
+        page_classifications = extraction_data.get('page_classifications', {})
+        
+        for page_num, page_data in enumerate(extraction_data.get('pages', [])):
+            page_info = page_classifications.get(page_num, ('unknown', 0.1))
+            page_type, confidence = page_info
+            
+            # Skip non-floor-plan pages
+            if page_type not in ['main_floor_plan', 'bonus_floor_plan'] or confidence < 0.3:
+                logger.info(f"  Skipping page {page_num + 1} ({page_type}, conf={confidence:.2f})")
+                continue
+                
+            floor_level = self._get_floor_level_from_page_type(page_type)
+            
+            # Get room data for this page
+            room_graph = None
+            if page_data.get('vector_data'):
+                # Use V2's proven room extractor
+                vector_dict = self._vector_to_dict(page_data['vector_data'])
+                room_graph = self.room_extractor.extract_rooms(
+                    vector_dict,
+                    extraction_data.get('text_blocks', []),
+                    scale_factor=extraction_data.get('scale_factor', 1.0/48.0),
+                    floor_number=floor_level
+                )
+            
+            if room_graph and room_graph.rooms:
+                logger.info(f"  Page {page_num + 1} ({page_type}): {len(room_graph.rooms)} spaces")
+                
+                for room in room_graph.rooms.values():
+                    space = self._convert_room_to_space(room, page_type, extraction_data)
+                    if space:
+                        spaces_created.append(space)
+        
+        logger.info(f"  ✓ Created {len(spaces_created)} spaces total")
+        
+        return spaces_created
+    
     def _get_floor_level_from_page_type(self, page_type: str) -> int:
         """Get floor level based on page type"""
         if page_type == 'main_floor_plan':
@@ -1269,6 +1555,7 @@ class PipelineV3:
         else:
             logger.warning("  No floor plan pages found, using all text blocks")
             total_sqft = self._extract_total_sqft_from_text(extraction_data['text_blocks'])
+        sqft_estimates = {'text': total_sqft}
         
         # INDUSTRY-LEADING GPT VISION AREA CALCULATION
         # If text extraction failed or returned fallback defaults, use GPT Vision
@@ -1287,6 +1574,7 @@ class PipelineV3:
             if use_gpt_vision and (total_sqft <= 0 or total_sqft in [2000.0, 2599]):  # Common fallback values
                 logger.info("🎯 Text extraction failed - using GPT Vision for SMART area calculation")
                 vision_sqft = self._calculate_area_with_gpt_vision(pdf_path, page_classifications)
+                sqft_estimates['vision'] = vision_sqft
                 if vision_sqft > 0:
                     total_sqft = vision_sqft
                     logger.info(f"✅ GPT Vision calculated: {total_sqft:.0f} sqft")
@@ -1303,27 +1591,44 @@ class PipelineV3:
         # Building characteristics
         building_data = {
             'total_sqft': total_sqft,
-            'floor_count': 2 if total_sqft > 2000 else 1,  # Estimate from size
+            'floor_count': _estimate_floor_count(total_sqft),  # Estimate from size
             'building_era': 'new',  # Default
-            'foundation_type': extraction_data['foundation'].foundation_type
+            'foundation_type': extraction_data['foundation'].foundation_type,
+            'sqft_estimates': sqft_estimates  # Independent takeoffs, for the area uncertainty band
         }
         
+        # 🏛️ PROFESSIONAL MODE: User input processing moved to beginning of pipeline for consistency
+        self._apply_building_input_overrides(building_data, user_inputs)
+        
+        return building_data
+    
+    def _apply_building_input_overrides(self, building_data: Dict[str, Any], user_inputs: Optional[Dict]) -> Dict[str, Any]:
+        """
+        Apply user-provided building characteristics over extracted values.
+        
+        Values estimated from the area are re-derived from the resulting
+        total_sqft unless the user supplied them, so a recalculation with
+        edited inputs matches a fresh run with the same inputs.
+        """
+        user_provided_conditioned_sqft = user_inputs and (user_inputs.get('conditioned_sqft') or user_inputs.get('total_sqft'))
+        
         # Set professional mode flags if user provided conditioned_sqft
         if user_provided_conditioned_sqft:
+            building_data['total_sqft'] = float(user_provided_conditioned_sqft)
             building_data['user_provided_conditioned_sqft'] = True
             building_data['ai_area_discovery_disabled'] = True
-            logger.info(f"🏛️ PROFESSIONAL MODE: Set flags in building_data - total_sqft={total_sqft}")
+            logger.info(f"🏛️ PROFESSIONAL MODE: Set flags in building_data - total_sqft={building_data['total_sqft']}")
         else:
             building_data['user_provided_conditioned_sqft'] = False
             building_data['ai_area_discovery_disabled'] = False
         
-        # 🏛️ PROFESSIONAL MODE: User input processing moved to beginning of pipeline for consistency
-        
         # Handle remaining user inputs (sqft processing moved above)
         if user_inputs:
             for key in ['floor_count', 'year_built', 'foundation_type']:
                 if key in user_inputs:
                     building_data[key] = user_inputs[key]
+        if not user_inputs or 'floor_count' not in user_inputs:
+            building_data['floor_count'] = _estimate_floor_count(building_data['total_sqft'])
         
         # Set building era from year
         if 'year_built' in building_data:
@@ -1476,7 +1781,7 @@ class PipelineV3:
         elif vision_data and vision_data.get('floor_count'):
             info['floor_count'] = vision_data['floor_count']
         else:
-            info['floor_count'] = 2 if info['total_sqft'] > 2000 else 1
+            info['floor_count'] = _estimate_floor_count(info['total_sqft'])
         
         # Building era
         if user_inputs and user_inputs.get('year_built'):
@@ -2067,36 +2372,23 @@ Example: "LIVING 15'x12'=180 + KITCHEN 12'x10'=120 + ... = TOTAL: 1853"
         foundation_data: Any,
         fenestration_data: Any,
         climate_data: Dict,
-        building_info: Dict
+        building_info: Dict,
+        load_plan: LoadPlan
     ) -> Tuple[float, float, Dict]:
         """
         Calculate heating and cooling loads for a single zone.
         Returns (heating_btu_hr, cooling_btu_hr, component_breakdown)
-        """
         
-        # Prepare envelope properties
-        envelope_properties = {
-            'wall_r_value': building_info.get('wall_r_value', 20),
-            'ceiling_r_value': building_info.get('ceiling_r_value', 49),
-            'floor_r_value': building_info.get('floor_r_value', 30),
-            'window_u_value': 0.30,
-            'door_u_value': 0.20,
-            'ach50': building_info.get('ach50', 10.0),
-            'floor_count': building_info.get('floor_count', 2),
-            'outdoor_winter': climate_data['winter_99'],
-            'outdoor_summer': climate_data['summer_1']
-        }
-        
-        # Get thermal intelligence from AI analysis
-        thermal_intelligence = extraction_data.get('construction_context', {}).get('thermal_intelligence', {})
+        load_plan is the run's plan, compiled once without cooling diversity.
+        """
         
         # Use the zone load calculator
         zone_result = self.zone_load_calculator.calculate_zone_loads(
             zone,
             building_model,
             climate_data,
-            envelope_properties,
-            thermal_intelligence=thermal_intelligence
+            self._zone_envelope_properties(climate_data, building_info),
+            load_plan=load_plan
         )
         
         # Apply diversity factors
@@ -2131,6 +2423,20 @@ Example: "LIVING 15'x12'=180 + KITCHEN 12'x10'=120 + ... = TOTAL: 1853"
         
         return zone_result.heating_load_btu_hr, adjusted_cooling, components
     
+    def _zone_envelope_properties(self, climate_data: Dict, building_info: Dict) -> Dict[str, Any]:
+        """ZoneLoadCalculator envelope properties from the prepared building info"""
+        return {
+            'wall_r_value': building_info.get('wall_r_value', 20),
+            'ceiling_r_value': building_info.get('ceiling_r_value', 49),
+            'floor_r_value': building_info.get('floor_r_value', 30),
+            'window_u_value': 0.30,
+            'door_u_value': 0.20,
+            'ach50': building_info.get('ach50', 10.0),
+            'floor_count': building_info.get('floor_count', 2),
+            'outdoor_winter': climate_data['winter_99'],
+            'outdoor_summer': climate_data['summer_1']
+        }
+    
     def _calculate_confidence(
         self,
         space_confidence: float,
@@ -2260,18 +2566,38 @@ Example: "LIVING 15'x12'=180 + KITCHEN 12'x10'=120 + ... = TOTAL: 1853"
         climate_data = extraction_data.get('climate_data', {})
         building_data = extraction_data.get('building_data', {})
         energy_specs = extraction_data.get('energy_specs')
+        sweep_steps = self._get_orientation_sweep_steps(extraction_data.get('user_inputs') or {})
+        zone_orientation_gains = {}
+        design_sweep = None
+        hourly_mode = self._get_hourly_simulation_mode(extraction_data.get('user_inputs') or {})
+        zone_components = []
+        uncertainty_samples = self._get_uncertainty_samples(extraction_data.get('user_inputs') or {})
+        zone_uncertainty = {}
+        
+        # 🧮 Compile the building into conductance/gain terms once; every zone reads the same evaluation
+        thermal_intelligence = extraction_data.get('construction_context', {}).get('thermal_intelligence', {})
+        envelope_inputs = EnvelopeInputs.from_specs(climate_data, energy_specs, extraction_data.get('user_inputs'), thermal_intelligence)
+        load_plan = get_load_plan_compiler().compile(building_model, climate_data, envelope_inputs, building_model.conditioned_zones)
         
-        for zone in building_model.conditioned_zones:
+        for zone_index, zone in enumerate(building_model.conditioned_zones):
             logger.info(f"  Calculating zone: {zone.name} ({zone.total_area_sqft:.0f} sqft)")
             
-            # Zone-specific load calculation with AI thermal intelligence
-            thermal_intelligence = extraction_data.get('construction_context', {}).get('thermal_intelligence', {})
-            zone_heating = self._calculate_zone_heating_load(zone, building_model, climate_data, energy_specs, thermal_intelligence, extraction_data.get('user_inputs'))
-            zone_cooling = self._calculate_zone_cooling_load(zone, building_model, climate_data, energy_specs, thermal_intelligence, extraction_data.get('user_inputs'))
+            uncertainty_components = UncertaintyComponents() if uncertainty_samples else None
+            zone_heating = self._calculate_zone_heating_load(zone, load_plan, zone_index, uncertainty_components)
+            orientation_gains = {'solar': {}, 'wall': {}} if sweep_steps else None
+            load_components = ZoneLoadComponents(zone=zone) if hourly_mode else None
+            zone_cooling = self._calculate_zone_cooling_load(zone, load_plan, zone_index, thermal_intelligence, orientation_gains, load_components, uncertainty_components)
+            if orientation_gains is not None:
+                zone_orientation_gains[zone.zone_id] = orientation_gains
             
             # Apply zone-specific multipliers
             heating_multiplier = zone.get_infiltration_modifier(is_heating=True)
             zone_heating *= heating_multiplier
+            if load_components is not None:
+                load_components.heating_btuh = zone_heating
+                zone_components.append(load_components)
+            if uncertainty_components is not None:
+                zone_uncertainty[zone.zone_id] = (uncertainty_components, heating_multiplier)
             
             # NOTE: Bonus zone multipliers are already applied INSIDE the zone heating/cooling calculations
             # Do NOT apply them again here to avoid double-multiplication
@@ -2320,8 +2646,10 @@ Example: "LIVING 15'x12'=180 + KITCHEN 12'x10'=120 + ... = TOTAL: 1853"
             bonus_cooling = sum(zone_loads[z.zone_id]['cooling'] for z in bonus_zones)
             design_cooling = primary_cooling + (bonus_cooling * 0.5)
             logger.info(f"    Cooling diversity applied: Primary {primary_cooling:,.0f} + 50% bonus {bonus_cooling * 0.5:,.0f}")
+            zone_cooling_weights = {z.zone_id: (0.5 if z.is_bonus_zone else 1.0) for z in building_model.zones}
         else:
             design_cooling = total_cooling
+            zone_cooling_weights = {}
         
         # 🔧 CRITICAL: Apply duct losses BEFORE production accuracy check
         # This ensures loads are properly sized for actual system configuration
@@ -2447,6 +2775,12 @@ Example: "LIVING 15'x12'=180 + KITCHEN 12'x10'=120 + ... = TOTAL: 1853"
             
             # Build envelope data from building model for baselines
             envelope = self._build_envelope_for_reliability(building_model, building_data, energy_specs, extraction_data)
+            if sweep_steps:
+                design_sweep = self._run_orientation_sweep(
+                    design_cooling, zone_orientation_gains, zone_cooling_weights,
+                    duct_results.cooling_factor, climate_data, sweep_steps
+                )
+                envelope['orientation_sweep'] = design_sweep.to_dict()
             
             # Process through reliability layer
             decision_engine = get_decision_engine()
@@ -2469,6 +2803,45 @@ Example: "LIVING 15'x12'=180 + KITCHEN 12'x10'=120 + ... = TOTAL: 1853"
             # Add telemetry (method temporarily disabled)
             # telemetry.log_reliability_decision(enhanced_result)
         
+        # Orientation curve for the final load (rotation 0 = building as modeled)
+        orientation_sweep = None
+        if sweep_steps:
+            final_scale = duct_results.cooling_factor * (final_cooling_load / design_cooling if design_cooling else 1.0)
+            if design_sweep is not None:
+                # Reliability path already swept the facade gains; only the base and scale moved
+                orientation_sweep = get_orientation_sweep_calculator().rescale(
+                    design_sweep, final_cooling_load, final_scale
+                ).to_dict()
+            else:
+                orientation_sweep = self._run_orientation_sweep(
+                    final_cooling_load, zone_orientation_gains, zone_cooling_weights,
+                    final_scale, climate_data, sweep_steps
+                ).to_dict()
+        
+        hourly_simulation = None
+        if hourly_mode and zone_components:
+            simulation = get_hourly_simulation_calculator().simulate(
+                zone_components, climate_data, mode=hourly_mode,
+                heating_factor=duct_results.heating_factor,
+                cooling_factor=duct_results.cooling_factor
+            )
+            # Full 8760-hour profiles are too large for job results; annual mode keeps summaries
+            hourly_simulation = simulation.to_dict(include_profiles=(hourly_mode == 'design_day'))
+        
+        uncertainty = None
+        if uncertainty_samples and zone_uncertainty:
+            building_uncertainty = UncertaintyComponents()
+            for zone_id, (components, heating_multiplier) in zone_uncertainty.items():
+                building_uncertainty.add(components, heating_multiplier, zone_cooling_weights.get(zone_id, 1.0))
+            uncertainty = get_uncertainty_calculator().run(
+                components=building_uncertainty,
+                inputs=self._build_uncertain_inputs(energy_specs, climate_data, user_inputs or {}, building_data, total_area),
+                heating_btuh=final_heating_load,
+                cooling_btuh=final_cooling_load,
+                orientation_curve_btuh=self._orientation_uncertainty_curve(orientation_sweep, user_inputs or {}),
+                samples=uncertainty_samples
+            ).to_dict()
+        
         # Update design loads with final values (either zone calcs or reliability result)
         design_heating = final_heating_load
         design_cooling = final_cooling_load
@@ -2529,11 +2902,139 @@ Example: "LIVING 15'x12'=180 + KITCHEN 12'x10'=120 + ... = TOTAL: 1853"
             warnings=all_warnings,
             building_model=building_model,
             processing_time_seconds=0,  # Will be set by caller
-            zip_code=zip_code  # Store for report generation
+            zip_code=zip_code,  # Store for report generation
+            orientation_sweep=orientation_sweep,
+            hourly_simulation=hourly_simulation,
+            uncertainty=uncertainty
         )
         
         return result
     
+    def _get_orientation_sweep_steps(self, user_inputs: Dict[str, Any]) -> Optional[int]:
+        """
+        Number of building rotations to evaluate, or None to skip the sweep.
+        Off unless requested ("true", "8" or "36"); uncertainty bands also
+        request it when the orientation is unknown, since they sample the curve.
+        """
+        requested = user_inputs.get('orientation_sweep')
+        if requested is not None:
+            if not requested or str(requested).lower() in ('false', '0', 'off'):
+                return None
+            return 36 if str(requested) == '36' else 8
+        
+        orientation = user_inputs.get('building_orientation') or user_inputs.get('buildingOrientation')
+        if self._get_uncertainty_samples(user_inputs) and orientation not in COMPASS_POINTS:
+            return 8
+        return None
+    
+    def _get_hourly_simulation_mode(self, user_inputs: Dict[str, Any]) -> Optional[str]:
+        """Hourly simulation mode requested by the user ('design_day' / 'annual'), or None"""
+        requested = user_inputs.get('hourly_simulation')
+        if not requested or str(requested).lower() in ('false', '0', 'off'):
+            return None
+        requested = str(requested).lower()
+        if requested in ('8760', 'year'):
+            return 'annual'
+        return requested if requested in SIMULATION_MODES else 'design_day'
+    
+    def _get_uncertainty_samples(self, user_inputs: Dict[str, Any]) -> Optional[int]:
+        """Monte Carlo sample count for the uncertainty bands, or None when not requested"""
+        requested = user_inputs.get('uncertainty')
+        if not requested or str(requested).lower() in ('false', '0', 'off'):
+            return None
+        if isinstance(requested, bool) or not str(requested).isdigit():
+            return DEFAULT_SAMPLES
+        return min(int(requested), MAX_SAMPLES)
+    
+    def _build_uncertain_inputs(
+        self,
+        energy_specs: Any,
+        climate_data: Dict,
+        user_inputs: Dict[str, Any],
+        building_data: Dict[str, Any],
+        total_area: float
+    ) -> List:
+        """
+        Nominal value and provenance of each sampled input, mirroring the
+        precedence the load calculations use (user, blueprint, climate, default)
+        """
+        calculator = get_uncertainty_calculator()
+        specs_found = energy_specs is not None and energy_specs.extraction_source != "none"
+        confidence = energy_specs.confidence if specs_found else 0.0
+        inputs = []
+        
+        for name, attr, default in (('wall_r', 'wall_r_value', 20), ('roof_r', 'roof_r_value', 49), ('floor_r', 'floor_r_value', 30)):
+            if specs_found:
+                value = getattr(energy_specs, attr)
+                nominal, source = (value, 'blueprint') if value else (default, 'default')
+            elif climate_data:
+                nominal, source = climate_data.get(f'typical_{name}', default), 'climate_default'
+            else:
+                nominal, source = default, 'default'
+            inputs.append(calculator.input_from_source(name, nominal, source, confidence))
+        
+        window_u_mapping = {'standard': 0.35, 'high_performance': 0.25, 'premium': 0.20}
+        if window_u_mapping.get(user_inputs.get('window_performance')):
+            window_u, source = window_u_mapping[user_inputs['window_performance']], 'user'
+        elif specs_found and energy_specs.window_u_value:
+            window_u, source = energy_specs.window_u_value, 'blueprint'
+        elif climate_data and climate_data.get('typical_window_u'):
+            window_u, source = climate_data['typical_window_u'], 'climate_default'
+        else:
+            window_u, source = 0.30, 'default'
+        inputs.append(calculator.input_from_source('window_u', window_u, source, confidence))
+        
+        # Solar gains use a fixed SHGC, so it is sampled at the default spread
+        inputs.append(calculator.input_from_source('window_shgc', 0.3, 'default'))
+        
+        if energy_specs is not None and energy_specs.ach50:
+            inputs.append(calculator.input_from_source('ach50', energy_specs.ach50, 'blueprint', max(confidence, 0.5)))
+        else:
+            inputs.append(calculator.input_from_source('ach50', 4.0, 'default'))  # AIM-2 'tight'
+        
+        inputs.append(calculator.area_input(
+            total_area,
+            building_data.get('sqft_estimates'),
+            user_provided=bool(building_data.get('user_provided_conditioned_sqft'))
+        ))
+        return inputs
+    
+    def _orientation_uncertainty_curve(self, orientation_sweep: Optional[Dict[str, Any]], user_inputs: Dict[str, Any]) -> Optional[List[float]]:
+        """Rotation curve to sample from when the plans give no orientation"""
+        orientation = user_inputs.get('building_orientation') or user_inputs.get('buildingOrientation')
+        if orientation in COMPASS_POINTS or not orientation_sweep:
+            return None
+        return orientation_sweep['cooling_btuh']
+    
+    def _run_orientation_sweep(
+        self,
+        base_cooling: float,
+        zone_orientation_gains: Dict[str, Dict[str, Dict[str, float]]],
+        zone_cooling_weights: Dict[str, float],
+        scale: float,
+        climate_data: Dict,
+        steps: int
+    ):
+        """Combine per-zone facade gains and evaluate every rotation"""
+        facade_solar = {}
+        facade_wall = {}
+        for zone_id, gains in zone_orientation_gains.items():
+            weight = zone_cooling_weights.get(zone_id, 1.0)
+            for direction, value in gains['solar'].items():
+                facade_solar[direction] = facade_solar.get(direction, 0) + value * weight
+            for direction, value in gains['wall'].items():
+                facade_wall[direction] = facade_wall.get(direction, 0) + value * weight
+        
+        latitude_band = self.manual_j_calculator._get_latitude_band(climate_data.get('zone', '4A'))
+        return get_orientation_sweep_calculator().sweep(
+            base_cooling_btuh=base_cooling,
+            facade_solar_btuh=facade_solar,
+            facade_wall_btuh=facade_wall,
+            latitude_band=latitude_band,
+            steps=steps,
+            scale=scale
+        )
+    
     def _build_envelope_for_reliability(
         self, 
         building_model: BuildingThermalModel, 
@@ -2652,72 +3153,49 @@ Example: "LIVING 15'x12'=180 + KITCHEN 12'x10'=120 + ... = TOTAL: 1853"
         
         return envelope
     
-    def _calculate_zone_heating_load(self, zone: ThermalZone, building_model: BuildingThermalModel, climate_data: Dict, energy_specs=None, thermal_intelligence=None, user_inputs: Dict = None) -> float:
-        """Calculate heating load using ACCA Manual J methodology with comprehensive diagnostics"""
-        
-        # Get climate-specific design conditions
-        winter_design_temp = climate_data.get('winter_99', building_model.winter_design_temp)
-        indoor_temp = 70  # Standard indoor heating setpoint
-        design_td = indoor_temp - winter_design_temp  # Temperature difference
-        
+    def _calculate_zone_heating_load(self, zone: ThermalZone, load_plan: LoadPlan, zone_index: int, uncertainty_components: UncertaintyComponents = None) -> float:
+        """
+        Heating load of a zone from the compiled load plan, with diagnostics.
+        When uncertainty_components is given, also records the load split by
+        envelope element for the uncertainty bands.
+        """
+        design_td = load_plan.design_td[0]
         logger.info(f"\n🔥 HEATING LOAD DIAGNOSTICS - Zone: {zone.name}")
-        logger.info(f"   Design conditions: {indoor_temp}°F indoor - {winter_design_temp}°F outdoor = {design_td}°F ΔT")
-        logger.info(f"   Zone area: {zone.total_area_sqft:.0f} sqft, Spaces: {len(zone.spaces)}")
-        
-        total_load = 0
-        zone_diagnostics = {
-            'spaces': [],
-            'total_envelope': 0,
-            'total_infiltration': 0,
-            'total_before_multipliers': 0,
-            'total_after_multipliers': 0
-        }
+        logger.info(f"   Design ΔT: {design_td}°F, Zone area: {zone.total_area_sqft:.0f} sqft, Spaces: {len(zone.spaces)}")
         
-        # Calculate component loads per ACCA Manual J
-        for i, space in enumerate(zone.spaces):
-            logger.info(f"\n   Space {i+1}: {space.space_type.value if space.space_type else 'unknown'} - {space.area_sqft:.0f} sqft")
-            
-            # 1. Envelope conduction losses (walls, windows, doors, roof, floor)
-            envelope_load = self._calculate_envelope_heating_load(space, design_td, building_model, climate_data, energy_specs, thermal_intelligence, user_inputs)
-            logger.info(f"      Envelope load: {envelope_load:,.0f} BTU/hr ({envelope_load/space.area_sqft:.1f} BTU/hr·sqft)")
-            
-            # 2. Infiltration load  
-            infiltration_load = self._calculate_infiltration_heating_load(space, design_td, climate_data, energy_specs, thermal_intelligence, building_model)
-            logger.info(f"      Infiltration load: {infiltration_load:,.0f} BTU/hr ({infiltration_load/space.area_sqft:.1f} BTU/hr·sqft)")
-            
-            # 3. Calculate total load - NO ARTIFICIAL MULTIPLIERS
-            # The physics-based calculations already account for:
-            # - Bonus rooms have more exposed surfaces (calculated in envelope_load)
-            # - Upper floors have different infiltration (calculated in infiltration_load)
-            # - User provided total conditioned sqft includes ALL spaces
-            # Adding multipliers would be double-counting!
-            
-            base_load = envelope_load + infiltration_load
-            space_load = base_load  # Use physics-based calculation directly
-            
-            logger.info(f"      Total space load: {space_load:,.0f} BTU/hr ({space_load/space.area_sqft:.1f} BTU/hr·sqft)")
-            
-            # Track diagnostics
-            space_diagnostics = {
-                'area_sqft': space.area_sqft,
-                'envelope_load': envelope_load,
-                'infiltration_load': infiltration_load,
-                'final_load': space_load
-            }
-            zone_diagnostics['spaces'].append(space_diagnostics)
-            zone_diagnostics['total_envelope'] += envelope_load
-            zone_diagnostics['total_infiltration'] += infiltration_load
-            zone_diagnostics['total_before_multipliers'] += base_load
-            zone_diagnostics['total_after_multipliers'] += space_load
-            
-            total_load += space_load
+        components = load_plan.row_components('heating')
+        wall, window, roof, floor, infiltration = (
+            load_plan.component_index(name) for name in ('wall', 'window', 'roof', 'floor', 'infiltration')
+        )
+        total_envelope = 0
+        total_infiltration = 0
+        
+        for i, (space, row) in enumerate(zip(zone.spaces, load_plan.zone_rows(zone_index))):
+            space_components = components[row]
+            envelope_load = space_components[wall] + space_components[window] + space_components[roof] + space_components[floor]
+            infiltration_load = space_components[infiltration]
+            logger.info(f"   Space {i+1}: {space.name} - {space.area_sqft:.0f} sqft: "
+                        f"envelope {envelope_load:,.0f} (walls {space_components[wall]:,.0f}, windows {space_components[window]:,.0f}, "
+                        f"roof {space_components[roof]:,.0f}, floor {space_components[floor]:,.0f}) + "
+                        f"infiltration {infiltration_load:,.0f} BTU/hr")
+            
+            if uncertainty_components is not None:
+                uncertainty_components.heating_wall += space_components[wall]
+                uncertainty_components.heating_window += space_components[window]
+                uncertainty_components.heating_roof += space_components[roof]
+                uncertainty_components.heating_floor += space_components[floor]
+                uncertainty_components.heating_infiltration += infiltration_load
+            
+            total_envelope += envelope_load
+            total_infiltration += infiltration_load
+        
+        # Physics-based terms only - NO ARTIFICIAL MULTIPLIERS (bonus rooms, upper
+        # floors and the user's total sqft are already in the envelope and infiltration)
+        total_load = float(load_plan.zone_loads('heating')[zone_index])
         
-        # Zone summary with intensity analysis
         logger.info(f"\n   🔥 ZONE HEATING SUMMARY:")
-        logger.info(f"      Total envelope: {zone_diagnostics['total_envelope']:,.0f} BTU/hr")
-        logger.info(f"      Total infiltration: {zone_diagnostics['total_infiltration']:,.0f} BTU/hr") 
-        logger.info(f"      Before multipliers: {zone_diagnostics['total_before_multipliers']:,.0f} BTU/hr")
-        logger.info(f"      After multipliers: {zone_diagnostics['total_after_multipliers']:,.0f} BTU/hr")
+        logger.info(f"      Total envelope: {total_envelope:,.0f} BTU/hr")
+        logger.info(f"      Total infiltration: {total_infiltration:,.0f} BTU/hr") 
         logger.info(f"      Final zone load: {total_load:,.0f} BTU/hr ({total_load/zone.total_area_sqft:.1f} BTU/hr·sqft)")
         
         # Manual J expectation analysis for single-story homes
@@ -2741,463 +3219,79 @@ Example: "LIVING 15'x12'=180 + KITCHEN 12'x10'=120 + ... = TOTAL: 1853"
         
         return total_load
     
-    def _calculate_zone_cooling_load(self, zone: ThermalZone, building_model: BuildingThermalModel, climate_data: Dict, energy_specs=None, thermal_intelligence=None, user_inputs: Dict = None) -> float:
-        """Calculate cooling load using ACCA Manual J methodology"""
-        
-        # Get climate-specific design conditions
-        summer_design_temp = climate_data.get('summer_1', building_model.summer_design_temp)
-        indoor_temp = 75  # Standard indoor cooling setpoint
-        design_td = summer_design_temp - indoor_temp  # Temperature difference
-        
-        total_sensible = 0
-        total_latent = 0
+    def _calculate_zone_cooling_load(self, zone: ThermalZone, load_plan: LoadPlan, zone_index: int, thermal_intelligence=None, orientation_gains: Dict = None, load_components: ZoneLoadComponents = None, uncertainty_components: UncertaintyComponents = None) -> float:
+        """
+        Cooling load of a zone from the compiled load plan.
+        When orientation_gains is given, also accumulates the orientation-dependent
+        solar and wall gains per facade direction for the orientation sweep.
+        When load_components is given, also records the design load split by
+        driver (temperature, solar, internal schedules) for hourly simulation.
+        When uncertainty_components is given, also records the load split by
+        the uncertain input behind each part.
+        """
+        components = load_plan.row_components('cooling')
+        wall, window, roof, solar, internal, internal_latent, infiltration, infiltration_latent = (
+            load_plan.component_index(name) for name in (
+                'wall', 'window', 'roof', 'solar', 'internal', 'internal_latent', 'infiltration', 'infiltration_latent'
+            )
+        )
         
-        # Calculate component loads per ACCA Manual J
-        for space in zone.spaces:
-            # 1. Envelope conduction gains
-            envelope_sensible = self._calculate_envelope_cooling_load(space, design_td, climate_data, energy_specs, thermal_intelligence, user_inputs)
-            
-            # 2. Solar heat gains through windows (with AI orientation intelligence)
-            solar_gains = self._calculate_solar_gains(space, climate_data, thermal_intelligence)
-            
-            # 3. Internal gains (people, lights, equipment)
-            internal_sensible, internal_latent = self._calculate_internal_gains(space)
-            
-            # 4. Infiltration gains
-            infiltration_sensible, infiltration_latent = self._calculate_infiltration_cooling_load(space, design_td, climate_data, energy_specs, building_model)
-            
-            # Apply diversity factors for secondary spaces
-            diversity_factor = 1.0
-            if not zone.primary_occupancy:
-                diversity_factor = 0.7  # Reduced load for secondary spaces
-            elif space.space_type == SpaceType.BEDROOM:
-                diversity_factor = 0.8  # Bedrooms get some diversity
-            
-            space_sensible = (envelope_sensible + solar_gains + internal_sensible + infiltration_sensible) * diversity_factor
-            space_latent = (internal_latent + infiltration_latent) * diversity_factor
+        for space, row in zip(zone.spaces, load_plan.zone_rows(zone_index)):
+            space_components = components[row]
+            # Secondary-space diversity is the row's cooling multiplier
+            diversity_factor = load_plan.row_multiplier[row, 1]
+            envelope_sensible = space_components[wall] + space_components[window] + space_components[roof]
+            solar_gains = space_components[solar]
+            
+            if orientation_gains is not None:
+                self._accumulate_orientation_gains(
+                    orientation_gains, solar_gains * diversity_factor,
+                    space_components[wall] * diversity_factor, thermal_intelligence
+                )
             
-            total_sensible += space_sensible
-            total_latent += space_latent
-        
-        return total_sensible + total_latent
+            if load_components is not None:
+                people_sensible, people_latent, lighting_sensible, equipment_sensible = internal_gain_components(space)
+                load_components.conduction_btuh += (envelope_sensible + space_components[infiltration]) * diversity_factor
+                load_components.solar_btuh += solar_gains * diversity_factor
+                load_components.people_sensible_btuh += people_sensible * diversity_factor
+                load_components.lighting_btuh += lighting_sensible * diversity_factor
+                load_components.equipment_btuh += equipment_sensible * diversity_factor
+                load_components.people_latent_btuh += people_latent * diversity_factor
+                load_components.infiltration_latent_btuh += space_components[infiltration_latent] * diversity_factor
+            
+            if uncertainty_components is not None:
+                uncertainty_components.cooling_wall += space_components[wall] * diversity_factor
+                uncertainty_components.cooling_window += space_components[window] * diversity_factor
+                uncertainty_components.cooling_roof += space_components[roof] * diversity_factor
+                uncertainty_components.cooling_solar += solar_gains * diversity_factor
+                uncertainty_components.cooling_internal += (space_components[internal] + space_components[internal_latent]) * diversity_factor
+                uncertainty_components.cooling_infiltration += (space_components[infiltration] + space_components[infiltration_latent]) * diversity_factor
+        
+        return float(load_plan.zone_loads('cooling')[zone_index])
     
-    def _calculate_envelope_heating_load(self, space: Space, design_td: float, building_model: 'BuildingThermalModel', climate_data: Dict = None, energy_specs=None, thermal_intelligence=None, user_inputs: Dict = None) -> float:
-        """Calculate envelope conduction heating load using climate-specific values"""
-        
-        # 🪟 WINDOW PERFORMANCE INTEGRATION: User input takes priority
-        user_window_u = None
-        if user_inputs and user_inputs.get('window_performance'):
-            window_performance = user_inputs['window_performance']
-            # Map user-friendly terms to U-values (lower = better)
-            window_u_mapping = {
-                'standard': 0.35,      # Basic single/double pane
-                'high_performance': 0.25,  # Good double pane with Low-E
-                'premium': 0.20        # Triple pane or advanced Low-E
-            }
-            user_window_u = window_u_mapping.get(window_performance)
-            if user_window_u:
-                logger.info(f"🪟 USER WINDOW PERFORMANCE: {window_performance} → U={user_window_u}")
-        
-        # Use extracted energy specs first, then user input, then climate data, then defaults
-        if user_window_u:
-            # User input takes priority for window performance
-            window_u_value = user_window_u
-            window_source = "user_input"
-        elif energy_specs and energy_specs.extraction_source != "none" and energy_specs.window_u_value:
-            # Use extracted specifications from blueprint
-            window_u_value = energy_specs.window_u_value
-            window_source = "blueprint_extracted"
-        elif climate_data and climate_data.get('typical_window_u'):
-            # Use climate-specific envelope values from our climate data
-            window_u_value = climate_data.get('typical_window_u', 0.30)
-            window_source = "climate_data"
-        else:
-            # Fallback values
-            window_u_value = 0.30
-            window_source = "default"
-        
-        # Wall and roof values (use blueprint specs if available)
-        if energy_specs and energy_specs.extraction_source != "none":
-            # Use extracted specifications from blueprint
-            wall_r = energy_specs.wall_r_value if energy_specs.wall_r_value else 20
-            roof_r = energy_specs.roof_r_value if energy_specs.roof_r_value else 49
-            floor_r = energy_specs.floor_r_value if energy_specs.floor_r_value else 30
-            logger.info(f"      Using extracted specs: Wall R-{wall_r}, Floor R-{floor_r}, Window U-{window_u_value} ({window_source})")
-        elif climate_data:
-            # Use climate-specific envelope values from our climate data
-            wall_r = climate_data.get('typical_wall_r', 20)
-            roof_r = climate_data.get('typical_roof_r', 49) 
-            floor_r = climate_data.get('typical_floor_r', 30)
-            logger.info(f"      Using climate defaults: Wall R-{wall_r}, Floor R-{floor_r}, Window U-{window_u_value} ({window_source})")
-        else:
-            # Fallback values
-            wall_r, roof_r, floor_r = 20, 49, 30
-            logger.info(f"      Using hardcoded defaults: Wall R-{wall_r}, Floor R-{floor_r}, Window U-{window_u_value} ({window_source})")
-            
-        # Convert R-values to U-values with thermal bridging (like V2)
-        parallel_path_calc = get_parallel_path_calculator()
-        wall_u_value = parallel_path_calc.calculate_wall_u_value(wall_r - 3.3, '16oc_2x4')  # Subtract films/layers for cavity R
-        roof_u_value = parallel_path_calc.calculate_ceiling_u_value(roof_r - 1.2, '24oc')  # Thermal bridging for ceiling
-        floor_u_value = parallel_path_calc.calculate_floor_u_value(floor_r - 3.0, '16oc')  # Thermal bridging for floor
-        
-        # Apply AI thermal intelligence to surface area calculations
-        ai_ceiling_height = space.ceiling_height_ft
-        ai_window_ratio = 0.18  # Default 18% WWR
-        
-        if thermal_intelligence:
-            # Ceiling height intelligence
-            ceiling_info = thermal_intelligence.get('ceiling_volume', {})
-            if ceiling_info.get('ceiling_height_ft'):
-                ai_ceiling_height = ceiling_info['ceiling_height_ft']
-                logger.info(f"      AI detected ceiling height: {ai_ceiling_height}ft")
-            
-            # Window orientation intelligence (affects effective window area for loads)
-            window_info = thermal_intelligence.get('window_orientation', {})
-            if window_info.get('large_windows_detected'):
-                ai_window_ratio = 0.22  # Increase for large windows
-                logger.info(f"      AI detected large windows: using {ai_window_ratio:.1%} WWR")
-        
-        # Estimate surface areas with AI adjustments
-        perimeter = 4 * (space.area_sqft ** 0.5)  # Approximate perimeter
-        wall_area = perimeter * ai_ceiling_height * 0.8  # 80% of gross wall area
-        window_area = wall_area * ai_window_ratio  # AI-adjusted window ratio
-        roof_area = space.area_sqft if space.ceiling_under == BoundaryCondition.ATTIC else 0
-        floor_area = space.area_sqft
-        
-        # Calculate loads: Q = U × A × ΔT with detailed diagnostics
-        wall_load = wall_u_value * wall_area * design_td
-        window_load = window_u_value * window_area * design_td
-        roof_load = roof_u_value * roof_area * design_td
-        
-        
-        # 🏗️ WORLD-CLASS FOUNDATION THERMAL MODELING
-        # Uses ACCA Manual J foundation thermal factors calculated earlier
-        foundation_thermal = getattr(building_model, 'foundation_thermal_factors', {})
-        
-        if foundation_thermal and space.floor_level == 1:  # Apply foundation thermal to ground floor only
-            # Use our calculated foundation thermal conductance
-            thermal_conductance = foundation_thermal.get('foundation_conductance', 0.1)
-            foundation_load = thermal_conductance * floor_area * design_td
-            
-            # Foundation-specific adjustments based on boundary condition
-            if space.floor_over == BoundaryCondition.CRAWLSPACE:
-                # Crawlspace temperature moderation factor
-                foundation_load *= 0.8  # Crawlspace buffers outdoor temperature
-                foundation_type_note = "Crawlspace with thermal bridging"
-            elif space.floor_over == BoundaryCondition.GROUND:
-                # Slab-on-grade with ground coupling
-                foundation_load *= 1.0  # Full thermal exposure
-                foundation_type_note = "Slab-on-grade with edge losses"
-            elif space.floor_over == BoundaryCondition.GARAGE:
-                # Floor over garage - partial conditioning
-                foundation_load *= 0.6  # Garage partially heated
-                foundation_type_note = "Floor over garage"
-            else:
-                foundation_load = 0  # Over conditioned space
-                foundation_type_note = "Over conditioned space"
-                
-        else:
-            # Fallback for upper floors or missing foundation thermal data
-            if space.floor_over == BoundaryCondition.GROUND:
-                # Generic slab calculation
-                perimeter = 4 * math.sqrt(floor_area)
-                slab_edge_u = 0.54  # Manual J default
-                foundation_load = slab_edge_u * perimeter * design_td
-                foundation_type_note = "Generic slab calculation"
-            elif space.floor_over == BoundaryCondition.CRAWLSPACE:
-                # Generic crawlspace calculation
-                foundation_load = floor_u_value * floor_area * design_td * 0.8
-                foundation_type_note = "Generic crawlspace calculation"
-            elif space.floor_over == BoundaryCondition.GARAGE:
-                foundation_load = floor_u_value * floor_area * (design_td * 0.6)
-                foundation_type_note = "Floor over garage"
-            else:
-                foundation_load = 0
-                foundation_type_note = "No foundation heat loss"
-        
-        # Use foundation_load as floor_load for envelope calculations
-        floor_load = foundation_load
-        
-        # DIAGNOSTIC LOGGING - Detailed heating load breakdown with foundation components
-        total_envelope = wall_load + window_load + roof_load + floor_load
-        logger.info(f"    HEATING ENVELOPE BREAKDOWN ({space.name}):")
-        logger.info(f"      Walls:     {wall_load:8,.0f} BTU/hr (U={wall_u_value:.3f}, A={wall_area:.0f}, ΔT={design_td:.1f})")
-        logger.info(f"      Windows:   {window_load:8,.0f} BTU/hr (U={window_u_value:.3f}, A={window_area:.0f}, ΔT={design_td:.1f})")
-        logger.info(f"      Roof:      {roof_load:8,.0f} BTU/hr (U={roof_u_value:.3f}, A={roof_area:.0f}, ΔT={design_td:.1f})")
-        
-        # 🏗️ Foundation thermal diagnostics
-        if foundation_load > 0:
-            conductance = foundation_thermal.get('foundation_conductance', 0) if foundation_thermal else 0
-            r_value = foundation_thermal.get('foundation_r_value', 0) if foundation_thermal else 0
-            logger.info(f"      Foundation: {foundation_load:7,.0f} BTU/hr ({foundation_type_note})")
-            if foundation_thermal and space.floor_level == 1:
-                logger.info(f"                  Thermal conductance: {conductance:.3f} BTU/hr/°F/sqft, R-{r_value:.1f}")
-        elif floor_load > 0:
-            logger.info(f"      Foundation: {floor_load:7,.0f} BTU/hr ({space.floor_over.value})")
-            
-        logger.info(f"      TOTAL ENV: {total_envelope:8,.0f} BTU/hr")
-        
-        return total_envelope
-    
-    def _calculate_infiltration_heating_load(self, space: Space, design_td: float, climate_data: Dict = None, energy_specs=None, thermal_intelligence=None, building_model=None) -> float:
-        """Calculate infiltration heating load using AIM-2 model (same as V2)"""
-        # Use AIM-2 model for realistic infiltration calculation
-        # This matches V2's approach and gives much more accurate results
-        
-        building_data = {
-            'sqft': space.area_sqft,
-            'volume_cuft': space.volume_cuft,
-            'envelope_area': space.area_sqft * 3,  # Estimate envelope area
-            'height_ft': 18,  # Typical 2-story height
-            'floors': building_model.total_floors if building_model else 1,  # Building-type-aware infiltration
-            'terrain': 'suburban',
-            'shielding': 'moderate'
-        }
-        
-        if not climate_data:
-            climate_data = {'winter_99': 10, 'design_wind_mph': 15}
-        
-        # Use AIM-2 model to calculate realistic infiltration
-        # CRITICAL: For NEW CONSTRUCTION, default to tight/very tight per 2021 IECC
-        # New homes must meet 3 ACH50 or better (≈0.20 ACH natural)
-        construction_quality = 'tight'  # Default for NEW CONSTRUCTION
-        
-        if energy_specs and energy_specs.ach50:
-            # Map extracted ACH50 to construction quality categories
-            # For NEW CONSTRUCTION, even 3.0 ACH50 is code minimum
-            if energy_specs.ach50 <= 2.0:
-                construction_quality = 'very_tight'  # High performance new construction
-            elif energy_specs.ach50 <= 3.0:
-                construction_quality = 'tight'  # Code-compliant new construction
-            elif energy_specs.ach50 <= 5.0:
-                construction_quality = 'average'  # Below code (shouldn't happen in new)
-            else:
-                construction_quality = 'leaky'  # Way below code
-            logger.info(f"      Using extracted ACH50: {energy_specs.ach50} (NEW CONSTRUCTION: {construction_quality})")
-            
-        elif thermal_intelligence:
-            # Use AI construction quality assessment
-            construction_context = thermal_intelligence.get('construction_method', {})
-            ai_quality = construction_context.get('construction_quality', 'average')
-            
-            # Map AI quality assessment to infiltration categories for NEW CONSTRUCTION
-            if ai_quality == 'above_average':
-                construction_quality = 'tight'  # Good new construction
-            elif ai_quality == 'below_average':
-                construction_quality = 'average'  # Poor new construction (still must meet code)
-            else:
-                construction_quality = 'tight'  # Default to code-compliant
-                
-            logger.info(f"      Using AI construction quality: {ai_quality} (NEW CONSTRUCTION: {construction_quality})")
-        else:
-            logger.info(f"      Using default NEW CONSTRUCTION: {construction_quality}")
-            
-        infiltration_results = calculate_infiltration_loads(
-            building_data, 
-            climate_data, 
-            construction_quality=construction_quality
-        )
-        
-        # Scale the result for this space's proportion of the building
-        # AIM-2 calculates for whole building, we need per-space
-        infiltration_load = infiltration_results['heating_load_btu_hr']
-        
-        # DIAGNOSTIC LOGGING - Compare infiltration with V2
-        logger.info(f"    INFILTRATION BREAKDOWN ({space.name}):")
-        logger.info(f"      CFM:       {infiltration_results['infiltration_cfm']:8,.1f} (Stack: {infiltration_results['stack_cfm']:.0f}, Wind: {infiltration_results['wind_cfm']:.0f})")
-        logger.info(f"      ACH:       {infiltration_results['infiltration_ach']:8,.2f} (V2 showed ~0.95 for heating)")
-        logger.info(f"      Load:      {infiltration_load:8,.0f} BTU/hr (V2 had 18,844 total)")
-        logger.info(f"      Formula:   1.08 × {infiltration_results['infiltration_cfm']:.0f} CFM × {design_td:.1f}°F = {1.08 * infiltration_results['infiltration_cfm'] * design_td:,.0f}")
-        
-        return infiltration_load
-    
-    def _calculate_envelope_cooling_load(self, space: Space, design_td: float, climate_data: Dict = None, energy_specs=None, thermal_intelligence=None, user_inputs: Dict = None) -> float:
-        """Calculate envelope conduction cooling load using climate-specific values"""
-        # Similar to heating but with CLTD (Cooling Load Temperature Difference) adjustments
-        # This accounts for thermal mass and time lag effects
-        
-        # 🪟 WINDOW PERFORMANCE INTEGRATION: Same logic as heating
-        user_window_u = None
-        if user_inputs and user_inputs.get('window_performance'):
-            window_performance = user_inputs['window_performance']
-            window_u_mapping = {
-                'standard': 0.35,      # Basic single/double pane
-                'high_performance': 0.25,  # Good double pane with Low-E  
-                'premium': 0.20        # Triple pane or advanced Low-E
-            }
-            user_window_u = window_u_mapping.get(window_performance)
-        
-        # Use extracted energy specs first, then user input, then climate data, then defaults
-        if user_window_u:
-            window_u_value = user_window_u
-        elif energy_specs and energy_specs.extraction_source != "none" and energy_specs.window_u_value:
-            window_u_value = energy_specs.window_u_value
-        elif climate_data and climate_data.get('typical_window_u'):
-            window_u_value = climate_data.get('typical_window_u', 0.30)
-        else:
-            window_u_value = 0.30
-        
-        # Wall and roof values (use blueprint specs if available)
-        if energy_specs and energy_specs.extraction_source != "none":
-            # Use extracted specifications from blueprint
-            wall_r = energy_specs.wall_r_value if energy_specs.wall_r_value else 20
-            roof_r = energy_specs.roof_r_value if energy_specs.roof_r_value else 49
-        elif climate_data:
-            # Use climate-specific envelope values
-            wall_r = climate_data.get('typical_wall_r', 20)
-            roof_r = climate_data.get('typical_roof_r', 49)
-        else:
-            wall_r, roof_r = 20, 49
-            
-        wall_u_value = 1.0 / wall_r
-        roof_u_value = 1.0 / roof_r
-        
-        # Estimate areas
-        perimeter = 4 * (space.area_sqft ** 0.5)
-        wall_area = perimeter * space.ceiling_height_ft * 0.8
-        window_area = wall_area * 0.18  # 18% WWR like V2
-        roof_area = space.area_sqft if space.ceiling_under == BoundaryCondition.ATTIC else 0
-        
-        # Apply CLTD factors (simplified - real Manual J uses detailed tables)
-        wall_cltd = design_td * 0.7  # Walls have thermal mass
-        window_cltd = design_td * 1.0  # Windows respond immediately
-        roof_cltd = design_td * 1.2  # Roof gets additional solar load
-        
-        wall_load = wall_u_value * wall_area * wall_cltd
-        window_load = window_u_value * window_area * window_cltd
-        roof_load = roof_u_value * roof_area * roof_cltd
-        
-        # DIAGNOSTIC LOGGING - Cooling envelope breakdown
-        total_envelope = wall_load + window_load + roof_load
-        logger.info(f"    COOLING ENVELOPE BREAKDOWN ({space.name}):")
-        logger.info(f"      Walls:     {wall_load:8,.0f} BTU/hr (CLTD method)")
-        logger.info(f"      Windows:   {window_load:8,.0f} BTU/hr (A={window_area:.0f} = {window_area/wall_area:.1%} WWR)")
-        logger.info(f"      Roof:      {roof_load:8,.0f} BTU/hr")
-        logger.info(f"      TOTAL ENV: {total_envelope:8,.0f} BTU/hr")
-        
-        return total_envelope
-    
-    def _calculate_solar_gains(self, space: Space, climate_data: Dict, thermal_intelligence=None) -> float:
-        """Calculate solar heat gains through windows using climate-specific values"""
-        # Calculate wall area first
-        perimeter = 4 * (space.area_sqft ** 0.5)
-        wall_area = perimeter * space.ceiling_height_ft * 0.8
-        window_area = wall_area * 0.18  # 18% window-to-wall ratio (same as V2)
-        shgc = 0.3  # Solar Heat Gain Coefficient for typical windows
-        
-        # Apply AI thermal intelligence for window orientation and solar exposure
-        solar_multiplier = 1.0
+    def _window_direction_shares(self, thermal_intelligence=None) -> Dict[str, float]:
+        """Share of window area per facade direction (AI ratios when available)"""
         if thermal_intelligence and 'window_orientation' in thermal_intelligence:
             window_info = thermal_intelligence['window_orientation']
-            
-            # Adjust based on solar exposure assessment
-            solar_exposure = window_info.get('solar_exposure', 'medium')
-            if solar_exposure == 'high':
-                solar_multiplier = 1.3  # High solar exposure
-            elif solar_exposure == 'low': 
-                solar_multiplier = 0.7  # Shaded or north-facing
-            
-            # Account for south-facing ratio (more solar gain)
-            south_ratio = window_info.get('south_facing_ratio', 0.4)
-            if south_ratio > 0.5:
-                solar_multiplier *= 1.1  # More south-facing windows
-        
-        # Use climate-specific solar intensity
-        if climate_data:
-            solar_intensity = climate_data.get('solar_gain_factor', 200) * solar_multiplier
-        else:
-            solar_intensity = 200 * solar_multiplier  # BTU/hr/sqft fallback
-        
-        solar_gain = window_area * shgc * solar_intensity
-        
-        # DIAGNOSTIC LOGGING - Solar gains
-        logger.info(f"    SOLAR GAINS ({space.name}):")
-        logger.info(f"      Window A:  {window_area:8,.0f} sqft")
-        logger.info(f"      SHGC:      {shgc:8,.2f}")
-        logger.info(f"      Solar I:   {solar_intensity:8,.1f} BTU/hr·sqft")
-        logger.info(f"      Solar Q:   {solar_gain:8,.0f} BTU/hr")
-        
-        return solar_gain
-    
-    def _calculate_internal_gains(self, space: Space) -> Tuple[float, float]:
-        """Calculate internal gains from people, lights, equipment"""
-        # ACCA Manual J internal gains
-        
-        # People (sensible and latent)
-        occupants = space.design_occupants if space.design_occupants > 0 else max(1, space.area_sqft / 400)
-        people_sensible = occupants * 230  # BTU/hr per person
-        people_latent = occupants * 190    # BTU/hr per person
-        
-        # Lighting
-        lighting_sensible = space.area_sqft * space.lighting_w_per_sqft * 3.41  # Convert W to BTU/hr
-        
-        # Equipment
-        equipment_sensible = space.area_sqft * space.equipment_w_per_sqft * 3.41
-        
-        total_sensible = people_sensible + lighting_sensible + equipment_sensible
-        total_latent = people_latent
-        
-        # DIAGNOSTIC LOGGING - Internal gains
-        logger.info(f"    INTERNAL GAINS ({space.name}):")
-        logger.info(f"      People S:  {people_sensible:8,.0f} BTU/hr ({getattr(space, 'occupants', 0):.1f} people)")
-        logger.info(f"      People L:  {people_latent:8,.0f} BTU/hr")
-        logger.info(f"      Lighting:  {lighting_sensible:8,.0f} BTU/hr ({getattr(space, 'lighting_w_per_sqft', 0):.1f} W/sqft)")
-        logger.info(f"      Equipment: {equipment_sensible:8,.0f} BTU/hr ({getattr(space, 'equipment_w_per_sqft', 0):.1f} W/sqft)")
-        logger.info(f"      TOTAL S:   {total_sensible:8,.0f} BTU/hr")
-        logger.info(f"      TOTAL L:   {total_latent:8,.0f} BTU/hr")
-        
-        return total_sensible, total_latent
+            north = window_info.get('north_facing_ratio', 0.2)
+            south = window_info.get('south_facing_ratio', 0.4)
+            east_west = max(0.0, 1.0 - north - south) / 2
+            return {'N': north, 'S': south, 'E': east_west, 'W': east_west}
+        return {'N': 0.25, 'E': 0.25, 'S': 0.25, 'W': 0.25}
     
-    def _calculate_infiltration_cooling_load(self, space: Space, design_td: float, climate_data: Dict, energy_specs=None, building_model=None) -> Tuple[float, float]:
-        """Calculate infiltration cooling load (sensible and latent) using AIM-2 model"""
-        # Use same AIM-2 approach as heating but with cooling conditions
-        
-        building_data = {
-            'sqft': space.area_sqft,
-            'volume_cuft': space.volume_cuft,
-            'envelope_area': space.area_sqft * 3,
-            'height_ft': 18,
-            'floors': building_model.total_floors if building_model else 1,  # Building-type-aware infiltration
-            'terrain': 'suburban',
-            'shielding': 'moderate'
-        }
-        
-        # For cooling, create different climate data (lower temperature difference)
-        cooling_climate_data = {
-            'winter_99': climate_data.get('summer_1', 91) - design_td,  # Indoor temp for cooling
-            'design_wind_mph': climate_data.get('design_wind_mph', 10)  # Lower wind for cooling
-        }
-        
-        # Use AIM-2 model for cooling infiltration
-        # Use extracted ACH50 specs if available, otherwise fall back to V2's leaky assumption
-        if energy_specs and energy_specs.ach50:
-            # Map extracted ACH50 to construction quality for NEW CONSTRUCTION
-            if energy_specs.ach50 <= 2.0:
-                construction_quality = 'very_tight'
-            elif energy_specs.ach50 <= 3.0:
-                construction_quality = 'tight'
-            elif energy_specs.ach50 <= 5.0:
-                construction_quality = 'average'
-            else:
-                construction_quality = 'leaky'
-        else:
-            construction_quality = 'tight'  # Default to code-compliant new construction
-            
-        infiltration_results = calculate_infiltration_loads(
-            building_data, 
-            cooling_climate_data, 
-            construction_quality=construction_quality
-        )
-        
-        # AIM-2 gives heating load, calculate cooling sensible from CFM
-        cfm = infiltration_results['infiltration_cfm']
-        sensible_load = 1.08 * cfm * design_td
-        
-        # Latent load: Q = 0.68 × CFM × Δgr (simplified)
-        grain_difference = 30  # Typical for cooling
-        latent_load = 0.68 * cfm * grain_difference
-        
-        return sensible_load, latent_load
+    def _accumulate_orientation_gains(
+        self,
+        orientation_gains: Dict[str, Dict[str, float]],
+        solar_gain: float,
+        wall_gain: float,
+        thermal_intelligence
+    ) -> None:
+        """Split a space's solar and wall cooling gains across facade directions"""
+        for direction, share in self._window_direction_shares(thermal_intelligence).items():
+            orientation_gains['solar'][direction] = orientation_gains['solar'].get(direction, 0) + solar_gain * share
+        
+        for direction in ('N', 'E', 'S', 'W'):
+            orientation_gains['wall'][direction] = orientation_gains['wall'].get(direction, 0) + wall_gain / 4
 
 
 # Main execution function
@@ -3297,11 +3391,44 @@ Focus on practical, cost-effective solutions. Consider the climate zone and load
         }
 
 
+def pipeline_result_to_dict(result: PipelineV3Result) -> Dict[str, Any]:
+    """Convert a PipelineV3Result to the JSON-serializable result dictionary"""
+    return {
+        'heating_load_btu_hr': result.heating_load_btu_hr,
+        'cooling_load_btu_hr': result.cooling_load_btu_hr,
+        'heating_tons': result.heating_tons,
+        'cooling_tons': result.cooling_tons,
+        'heating_per_sqft': result.heating_per_sqft,
+        'cooling_per_sqft': result.cooling_per_sqft,
+        'total_conditioned_area_sqft': result.total_conditioned_area_sqft,
+        'zones': len(result.building_model.zones) if result.building_model else 0,
+        'zones_created': len(result.building_model.zones) if result.building_model else 0,
+        'spaces': result.spaces_detected,
+        'spaces_detected': result.spaces_detected,
+        'zone_loads': result.zone_loads,
+        'heating_components': result.heating_components,
+        'cooling_components': result.cooling_components,
+        'garage_detected': result.garage_detected,
+        'bonus_over_garage': result.bonus_over_garage,
+        'confidence': result.confidence_score,
+        'confidence_score': result.confidence_score,
+        'warnings': result.warnings,
+        'processing_time': result.processing_time_seconds,
+        'processing_time_seconds': result.processing_time_seconds,
+        'orientation_sweep': result.orientation_sweep,
+        'hourly_simulation': result.hourly_simulation,
+        'uncertainty': result.uncertainty,
+        'raw_extractions': result.raw_extractions or {}  # Include raw pipeline data for enhanced collection
+    }
+
+
 def run_pipeline_v3(
     pdf_path: str,
     zip_code: str,
     user_inputs: Optional[Dict[str, Any]] = None,
-    openai_api_key: Optional[str] = None
+    openai_api_key: Optional[str] = None,
+    include_snapshot: bool = False,
+    progress_callback: Optional[ProgressCallback] = None
 ) -> Dict[str, Any]:
     """
     Run Pipeline V3 and return results as dictionary.
@@ -3311,12 +3438,14 @@ def run_pipeline_v3(
         zip_code: Building location zip code
         user_inputs: Optional user overrides
         openai_api_key: Optional OpenAI API key for vision processing
+        include_snapshot: Also return the ExtractionSnapshot (not JSON serializable)
+        progress_callback: Optional stage progress receiver (stage, percent, message, **data)
         
     Returns:
         Dictionary with all results
     """
     pipeline = PipelineV3(openai_api_key=openai_api_key)
-    result = pipeline.process_blueprint(pdf_path, zip_code, user_inputs)
+    result = pipeline.process_blueprint(pdf_path, zip_code, user_inputs, progress_callback)
     
     # Convert to dictionary for JSON serialization with enhanced data collection
     # Generate AI equipment recommendations if API key is available
@@ -3327,7 +3456,31 @@ def run_pipeline_v3(
         except Exception as e:
             logger.warning(f"Failed to generate equipment recommendations: {e}")
     
+    output = pipeline_result_to_dict(result)
+    output['equipment_recommendations'] = equipment_report  # AI-generated equipment recommendations
+    
+    if include_snapshot:
+        output['extraction_snapshot'] = result.extraction_snapshot
+    
+    return output
+
+
+# Shared pipeline for snapshot re-runs (no vision processing needed)
+_scenario_pipeline = None
+
+def get_scenario_pipeline() -> PipelineV3:
+    """Get or create the global pipeline used for scenario re-runs"""
+    global _scenario_pipeline
+    if _scenario_pipeline is None:
+        _scenario_pipeline = PipelineV3()
+    return _scenario_pipeline
+
+
+def _scenario_row(label: str, user_inputs: Dict[str, Any], result: PipelineV3Result) -> Dict[str, Any]:
+    """Flatten a scenario result into a comparison table row"""
     return {
+        'label': label,
+        'user_inputs': user_inputs,
         'heating_load_btu_hr': result.heating_load_btu_hr,
         'cooling_load_btu_hr': result.cooling_load_btu_hr,
         'heating_tons': result.heating_tons,
@@ -3335,22 +3488,78 @@ def run_pipeline_v3(
         'heating_per_sqft': result.heating_per_sqft,
         'cooling_per_sqft': result.cooling_per_sqft,
         'total_conditioned_area_sqft': result.total_conditioned_area_sqft,
-        'zones': len(result.building_model.zones) if result.building_model else 0,
-        'zones_created': len(result.building_model.zones) if result.building_model else 0,
-        'spaces': result.spaces_detected,
-        'spaces_detected': result.spaces_detected,
         'zone_loads': result.zone_loads,
-        'heating_components': result.heating_components,
-        'cooling_components': result.cooling_components,
-        'garage_detected': result.garage_detected,
-        'bonus_over_garage': result.bonus_over_garage,
-        'confidence': result.confidence_score,
         'confidence_score': result.confidence_score,
         'warnings': result.warnings,
-        'processing_time': result.processing_time_seconds,
-        'processing_time_seconds': result.processing_time_seconds,
-        'raw_extractions': result.raw_extractions or {},  # Include raw pipeline data for enhanced collection
-        'equipment_recommendations': equipment_report  # AI-generated equipment recommendations
+        'recalculated_stages': result.recalculated_stages,
+        'processing_time_seconds': result.processing_time_seconds
+    }
+
+
+def run_scenarios(
+    extraction_snapshot: ExtractionSnapshot,
+    scenario_inputs: List[Dict[str, Any]],
+    labels: Optional[List[str]] = None,
+    max_workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Compare load variants against one cached extraction.
+    
+    Each variant's inputs are merged over the snapshot's original inputs and only
+    the stages they invalidate are re-run, so no PDF parsing or vision calls happen.
+    Variants run concurrently on a thread pool.
+    
+    Args:
+        extraction_snapshot: Cached Phase 1/2 outputs from a completed run
+        scenario_inputs: Pipeline-format user input overrides, one dict per variant
+        labels: Optional display label per variant
+        max_workers: Pool size (defaults to SCENARIO_MAX_WORKERS or 4)
+        
+    Returns:
+        Comparison table with the baseline row and one row per variant
+    """
+    pipeline = get_scenario_pipeline()
+    labels = labels or []
+    max_workers = max_workers or int(os.getenv("SCENARIO_MAX_WORKERS", "4"))
+    start_time = time.time()
+    
+    variants = [({}, 'baseline')] + [
+        (inputs, labels[i] if i < len(labels) and labels[i] else f"scenario_{i + 1}")
+        for i, inputs in enumerate(scenario_inputs)
+    ]
+    
+    def _run_variant(variant: Tuple[Dict[str, Any], str]) -> Dict[str, Any]:
+        inputs, label = variant
+        try:
+            result = pipeline.recalculate_loads(extraction_snapshot, inputs)
+            return _scenario_row(label, inputs, result)
+        except Exception as e:
+            logger.error(f"Scenario '{label}' failed: {e}", exc_info=True)
+            return {'label': label, 'user_inputs': inputs, 'error': str(e)}
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(variants)))) as executor:
+        rows = list(executor.map(_run_variant, variants))
+    
+    baseline = rows[0]
+    scenarios = rows[1:]
+    
+    # Deltas relative to the baseline inputs
+    if 'error' not in baseline:
+        for row in scenarios:
+            if 'error' in row:
+                continue
+            for load_key, delta_key in (('heating_load_btu_hr', 'heating'), ('cooling_load_btu_hr', 'cooling')):
+                delta = row[load_key] - baseline[load_key]
+                row[f'{delta_key}_delta_btu_hr'] = delta
+                row[f'{delta_key}_delta_pct'] = (delta / baseline[load_key] * 100) if baseline[load_key] else 0.0
+    
+    logger.info(f"🔀 SCENARIOS: {len(scenarios)} variants compared in {time.time() - start_time:.2f}s")
+    
+    return {
+        'zip_code': extraction_snapshot.zip_code,
+        'baseline': baseline,
+        'scenarios': scenarios,
+        'processing_time_seconds': time.time() - start_time
     }
 
 
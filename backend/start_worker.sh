@@ -4,13 +4,7 @@
 echo "🚀 Starting Pipeline V3 Worker..."
 echo "Working directory: $(pwd)"
 
-# For now, pipeline_v3 runs synchronously in the web process
-# In the future, we can add Celery workers here if needed
-echo "✅ Pipeline V3 uses direct execution - no separate worker needed"
-echo "Web API handles processing asynchronously using asyncio"
-
-# Keep the worker process alive (required by Render)
-while true; do
-    echo "⏰ Worker heartbeat: $(date)"
-    sleep 300  # 5 minutes
-done
\ No newline at end of file
+# Forks WORKER_CONCURRENCY pipeline processes that consume the durable job queue
+# (Redis Streams when REDIS_URL is set, otherwise the job_queue database table).
+# The web service enqueues uploads when JOB_QUEUE_ENABLED=true.
+exec python -m app.worker
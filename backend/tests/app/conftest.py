@@ -0,0 +1,23 @@
+"""
+Shared setup for the API/service tests
+
+Points the app at a throwaway SQLite database and artifact directory
+and disables Redis before any app module is imported, so the tests run
+without external services.
+"""
+
+import os
+import tempfile
+
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp(prefix='autohvac-tests-')}/autohvac.db"
+os.environ["ARTIFACT_DIR"] = tempfile.mkdtemp(prefix="autohvac-artifacts-")
+os.environ.pop("REDIS_URL", None)
+
+import pytest
+
+from app.database import create_db_and_tables
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    create_db_and_tables()
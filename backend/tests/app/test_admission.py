@@ -0,0 +1,34 @@
+"""
+Admission control with the worker pool: per-user limits come from job rows
+"""
+
+import uuid
+
+import pytest
+
+from app.services.admission import AdmissionController, AdmissionRejected
+from app.services.job_storage import job_storage
+
+
+def _save_jobs(email: str, status: str, count: int) -> list:
+    job_ids = [str(uuid.uuid4()) for _ in range(count)]
+    for job_id in job_ids:
+        job_storage.save_job(job_id, {"status": status, "filename": "plan.pdf", "email": email})
+    return job_ids
+
+
+def test_worker_queue_enforces_per_user_limits():
+    controller = AdmissionController(max_in_flight_per_user=1, max_queued_per_user=2, max_queue_depth=50)
+    email = f"{uuid.uuid4().hex}@example.com"
+    _save_jobs(email, "processing", 1)
+    _save_jobs(email, "completed", 3)
+    queued = _save_jobs(email, "queued", 2)
+
+    with pytest.raises(AdmissionRejected, match="too many queued jobs"):
+        controller.check(email, worker_queue=True)
+    # A saved job being admitted does not count against itself
+    controller.check(email, worker_queue=True, job_id=queued[0])
+    controller.check(f"{uuid.uuid4().hex}@example.com", worker_queue=True)
+
+    job_storage.update_job(queued[1], {"status": "completed"})
+    controller.check(email, worker_queue=True)
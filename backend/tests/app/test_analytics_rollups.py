@@ -0,0 +1,41 @@
+"""
+Re-deriving job counters from the jobs table must agree with the events
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+from app.database import engine
+from app.models.user import AnalyticsRollup, JobModel
+from app.services.analytics_rollups import DAY, _bucket_start, analytics_rollups
+from app.services.job_storage import job_storage
+
+
+def _failed_today() -> float:
+    with Session(engine) as session:
+        return session.exec(select(AnalyticsRollup.value).where(
+            AnalyticsRollup.granularity == DAY,
+            AnalyticsRollup.bucket_start == _bucket_start(datetime.utcnow(), DAY),
+            AnalyticsRollup.metric == "jobs_failed"
+        )).first() or 0
+
+
+def test_refresh_keeps_failed_jobs():
+    failed = []
+    for _ in range(2):
+        job_id = str(uuid.uuid4())
+        job_storage.save_job(job_id, {"status": "processing", "filename": "plan.pdf", "email": "tester@example.com"})
+        job_storage.update_job(job_id, {"status": "failed", "error": "Server busy: pipeline queue full"})
+        failed.append(job_id)
+    # A failure recorded before completed_at was stamped on failures
+    with Session(engine) as session:
+        session.exec(update(JobModel).where(JobModel.id == failed[1]).values(completed_at=None))
+        session.commit()
+    before = _failed_today()
+
+    analytics_rollups.refresh()
+
+    assert _failed_today() >= before >= 2
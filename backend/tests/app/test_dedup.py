@@ -0,0 +1,47 @@
+"""
+Upload deduplication: concurrent identical uploads must resolve to exactly
+one job running the pipeline, with every other job following it
+"""
+
+import uuid
+
+from app.services.dedup import compute_job_fingerprint, find_duplicate_job
+from app.services.job_storage import job_storage
+
+
+def _processing_job():
+    job_id = str(uuid.uuid4())
+    job_storage.save_job(job_id, {
+        "status": "processing",
+        "filename": "plan.pdf",
+        "zip_code": "99006",
+        "email": "tester@example.com"
+    })
+    return job_id
+
+
+def test_only_the_claim_holder_runs():
+    fingerprint = compute_job_fingerprint(uuid.uuid4().hex, "99006", {"foundation_type": "slab"})
+    first, second, third = _processing_job(), _processing_job(), _processing_job()
+
+    assert find_duplicate_job(fingerprint, first) is None
+    duplicate = find_duplicate_job(fingerprint, second)
+    assert duplicate is not None and not duplicate.completed
+    assert duplicate.job_id == first
+    # The holder never follows a job that is following it
+    assert find_duplicate_job(fingerprint, third).job_id == first
+    assert job_storage._read_db(second)["fingerprint"] is None
+
+
+def test_completed_job_releases_the_claim():
+    fingerprint = compute_job_fingerprint(uuid.uuid4().hex, "99006", {})
+    first = _processing_job()
+    assert find_duplicate_job(fingerprint, first) is None
+    job_storage.update_job(first, {"status": "completed", "result": {"heating_load_btu_hr": 1.0}})
+
+    duplicate = find_duplicate_job(fingerprint, _processing_job())
+    assert duplicate.completed and duplicate.job_id == first
+
+    rerun = _processing_job()
+    assert find_duplicate_job(fingerprint, rerun, include_completed=False) is None
+    assert job_storage._read_db(rerun)["fingerprint"] == fingerprint
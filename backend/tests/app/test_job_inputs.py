@@ -0,0 +1,171 @@
+"""
+PATCH /jobs/{job_id}/inputs on a completed job
+"""
+
+import asyncio
+import json
+import uuid
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.routes import blueprint
+from app.services.dedup import compute_job_fingerprint
+from app.services.job_storage import job_storage
+from app.services.snapshot_store import snapshot_store
+from pipeline_v3 import ExtractionSnapshot, get_scenario_pipeline, run_pipeline_v3
+
+OWNER = "owner@example.com"
+FILE_SHA256 = "cd" * 32
+
+app = FastAPI()
+app.include_router(blueprint.router, prefix="/api/v1/blueprint")
+
+
+def _request(method: str, url: str, **kwargs) -> httpx.Response:
+    async def send():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, url, **kwargs)
+    return asyncio.run(send())
+
+
+@pytest.fixture(scope="module")
+def pipeline_run():
+    """One offline pipeline run on the sample blueprint, shared by the tests"""
+    return run_pipeline_v3("test.pdf", "99006", {}, None, include_snapshot=True)
+
+
+@pytest.fixture
+def completed_job(pipeline_run):
+    job_id = str(uuid.uuid4())
+    snapshot = pipeline_run["extraction_snapshot"]
+    job_storage.save_job(job_id, {
+        "status": "completed",
+        "progress": 100,
+        "filename": "test.pdf",
+        "zip_code": "99006",
+        "email": OWNER,
+        "user_inputs": snapshot.user_inputs,
+        "result": {"heating_load_btu_hr": pipeline_run["heating_load_btu_hr"]},
+        "file_sha256": FILE_SHA256,
+        "fingerprint": compute_job_fingerprint(FILE_SHA256, "99006", snapshot.user_inputs)
+    })
+    snapshot_store.save_snapshot(job_id, snapshot.compact())
+    return job_id
+
+
+def test_edit_rekeys_the_dedup_fingerprint(completed_job):
+    original = job_storage.get_job(completed_job)["fingerprint"]
+
+    response = _request(
+        "PATCH", f"/api/v1/blueprint/jobs/{completed_job}/inputs",
+        params={"email": OWNER},
+        json={"foundation_type": "basement"}
+    )
+    assert response.status_code == 200, response.text
+
+    job = job_storage._read_db(completed_job)
+    assert job["fingerprint"] != original
+    assert job["fingerprint"] == compute_job_fingerprint(FILE_SHA256, "99006", job["user_inputs"])
+
+
+def test_only_the_owner_can_edit(completed_job):
+    url = f"/api/v1/blueprint/jobs/{completed_job}/inputs"
+    before = job_storage.get_job(completed_job)
+
+    response = _request("PATCH", url, params={"email": "someone-else@example.com"}, json={"foundation_type": "slab"})
+    assert response.status_code == 403
+    assert _request("PATCH", url, json={"foundation_type": "slab"}).status_code == 422
+
+    after = job_storage.get_job(completed_job)
+    assert after["result"] == before["result"]
+    assert after["user_inputs"] == before["user_inputs"]
+
+
+def test_snapshot_round_trips_through_json(pipeline_run):
+    snapshot = pipeline_run["extraction_snapshot"].compact()
+    restored = ExtractionSnapshot.from_dict(json.loads(json.dumps(snapshot.to_dict())))
+
+    assert restored.extraction_data.keys() == snapshot.extraction_data.keys()
+    assert restored.extraction_data["page_classifications"] == snapshot.extraction_data["page_classifications"]
+    assert restored.created_at == snapshot.created_at
+
+    changes = {"foundation_type": "crawlspace"}
+    expected = get_scenario_pipeline().recalculate_loads(snapshot, changes)
+    actual = get_scenario_pipeline().recalculate_loads(restored, changes)
+    assert actual.heating_load_btu_hr == expected.heating_load_btu_hr
+    assert actual.cooling_load_btu_hr == expected.cooling_load_btu_hr
+
+
+@pytest.mark.parametrize("changes", [
+    {"conditioned_sqft": 2400},
+    {"conditioned_sqft": 2400, "floor_count": 1},
+    {"conditioned_sqft": 1500, "foundation_type": "basement"},
+])
+def test_recalculation_matches_a_fresh_run(pipeline_run, changes):
+    snapshot = pipeline_run["extraction_snapshot"]
+    merged = {**snapshot.user_inputs, **changes}
+
+    recalculated = get_scenario_pipeline().recalculate_loads(snapshot, changes)
+    fresh = run_pipeline_v3("test.pdf", "99006", merged, None, include_snapshot=True)
+
+    assert recalculated.heating_load_btu_hr == fresh["heating_load_btu_hr"]
+    assert recalculated.cooling_load_btu_hr == fresh["cooling_load_btu_hr"]
+
+    # sqft_estimates are Phase 1 takeoffs, which a recalculation never repeats
+    building, fresh_building = (
+        {key: value for key, value in s.extraction_data["building_data"].items() if key != "sqft_estimates"}
+        for s in (recalculated.extraction_snapshot, fresh["extraction_snapshot"])
+    )
+    assert building == fresh_building
+
+
+def test_edit_loads_a_snapshot_saved_by_another_process(completed_job):
+    # The worker that saved it is a different service: only the artifact store is shared
+    snapshot_store._snapshots.clear()
+
+    response = _request(
+        "PATCH", f"/api/v1/blueprint/jobs/{completed_job}/inputs",
+        params={"email": OWNER},
+        json={"foundation_type": "basement"}
+    )
+    assert response.status_code == 200, response.text
+
+
+def test_edit_requests_uncertainty_bands(completed_job):
+    response = _request(
+        "PATCH", f"/api/v1/blueprint/jobs/{completed_job}/inputs",
+        params={"email": OWNER},
+        json={"uncertainty": "200"}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["result"]["uncertainty"] is not None
+    assert job_storage.get_job(completed_job)["user_inputs"]["uncertainty"] == "200"
+
+
+def test_edit_requests_hourly_simulation(completed_job):
+    response = _request(
+        "PATCH", f"/api/v1/blueprint/jobs/{completed_job}/inputs",
+        params={"email": OWNER},
+        json={"hourly_simulation": "design_day"}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["result"]["hourly_simulation"] is not None
+    assert job_storage.get_job(completed_job)["user_inputs"]["hourly_simulation"] == "design_day"
+
+
+def test_orientation_sweep_is_opt_in(pipeline_run):
+    assert pipeline_run["orientation_sweep"] is None
+
+
+def test_edit_requests_orientation_sweep(completed_job):
+    response = _request(
+        "PATCH", f"/api/v1/blueprint/jobs/{completed_job}/inputs",
+        params={"email": OWNER},
+        json={"orientation_sweep": "true"}
+    )
+    assert response.status_code == 200, response.text
+    assert len(response.json()["result"]["orientation_sweep"]["cooling_btuh"]) == 8
+    assert job_storage.get_job(completed_job)["user_inputs"]["orientation_sweep"] == "true"
@@ -0,0 +1,127 @@
+"""
+JobStorage persistence: fields written through update_job must come back
+from PostgreSQL, not only from the cache or in-memory fallback
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+import redis
+
+from app.services.job_storage import JobStorage, job_storage
+from app.services.redis_pool import redis_breaker
+
+
+def _new_job(**fields):
+    job_id = str(uuid.uuid4())
+    job_storage.save_job(job_id, {
+        "status": "created",
+        "filename": "plan.pdf",
+        "zip_code": "99006",
+        "email": "tester@example.com",
+        **fields
+    })
+    return job_id
+
+
+def test_upload_hash_and_size_persist():
+    job_id = _new_job()
+    assert job_storage.update_job(job_id, {
+        "saved_file_path": "uploads/plan.pdf",
+        "file_sha256": "ab" * 32,
+        "file_size_bytes": 48213
+    })
+
+    job = job_storage._read_db(job_id)
+    assert job["file_sha256"] == "ab" * 32
+    assert job["file_size_bytes"] == 48213
+    assert job["saved_file_path"] == "uploads/plan.pdf"
+
+
+
+class _FlakyRedis:
+    """Just the hash commands JobStorage pipelines, with switchable outages"""
+
+    def __init__(self):
+        self.data = {}
+        self.down = False
+
+    def pipeline(self, transaction=False):
+        return _FlakyPipeline(self)
+
+
+class _FlakyPipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    def execute(self):
+        if self.client.down:
+            raise redis.ConnectionError("redis unreachable")
+        data, results = self.client.data, []
+        for name, args, kwargs in self.commands:
+            if name == "hset":
+                data.setdefault(args[0], {}).update(kwargs["mapping"])
+            elif name == "delete":
+                results.append(sum(data.pop(key, None) is not None for key in args))
+                continue
+            elif name == "setex":
+                data[args[0]] = args[2]
+            results.append({"hgetall": lambda: dict(data.get(args[0], {})),
+                            "exists": lambda: int(args[0] in data)}.get(name, lambda: True)())
+        return results
+
+
+@pytest.fixture
+def flaky_storage():
+    storage = JobStorage()
+    storage.redis_client = _FlakyRedis()
+    yield storage
+    redis_breaker.record_success()
+
+
+@pytest.mark.parametrize("outage", ["write_fails", "circuit_open"])
+def test_cache_missing_a_write_is_dropped_once_redis_recovers(flaky_storage, outage):
+    job_id = str(uuid.uuid4())
+    flaky_storage.save_job(job_id, {"status": "created", "filename": "plan.pdf", "email": "tester@example.com"})
+    assert flaky_storage.get_job(job_id)["status"] == "created"
+
+    if outage == "write_fails":
+        flaky_storage.redis_client.down = True
+        flaky_storage.update_job(job_id, {"status": "processing"})
+        flaky_storage.redis_client.down = False
+    else:
+        for _ in range(redis_breaker.failure_threshold):
+            redis_breaker.record_failure()
+        flaky_storage.update_job(job_id, {"status": "processing"})
+        redis_breaker.record_success()
+
+    assert flaky_storage._read_db(job_id)["status"] == "processing"
+    assert flaky_storage.get_job(job_id)["status"] == "processing"
+
+
+def test_cached_and_stored_timestamps_match(flaky_storage):
+    job_id = str(uuid.uuid4())
+    flaky_storage.save_job(job_id, {
+        "status": "created",
+        "filename": "plan.pdf",
+        "email": "tester@example.com",
+        "created_at": "2026-03-01T09:30:00+02:00"
+    })
+    flaky_storage.update_job(job_id, {"status": "completed", "completed_at": datetime(2026, 3, 1, 8, 0)})
+
+    cached = flaky_storage.get_job(job_id)
+    stored = flaky_storage._read_db(job_id)
+    assert cached["created_at"] == stored["created_at"] == "2026-03-01T07:30:00.000000"
+    assert cached["completed_at"] == stored["completed_at"] == "2026-03-01T08:00:00.000000"
+
+
+def test_terminal_transitions_stamp_completed_at():
+    job_id = _new_job()
+    job_storage.update_job(job_id, {"status": "failed", "error": "Job cancelled by user"})
+
+    assert job_storage._read_db(job_id)["completed_at"] is not None
@@ -0,0 +1,74 @@
+"""
+POST /upload must not leave spool files behind on the web host
+"""
+
+import asyncio
+import os
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.routes import blueprint
+
+app = FastAPI()
+app.include_router(blueprint.router, prefix="/api/v1/blueprint")
+
+
+class _RecordingQueue:
+    def __init__(self):
+        self.payloads = []
+
+    def enqueue(self, job_id, payload):
+        self.payloads.append(payload)
+
+
+def _upload() -> httpx.Response:
+    async def send():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(
+                "/api/v1/blueprint/upload",
+                data={"email": "spool@example.com", "zip_code": "99006"},
+                files={"file": ("plan.pdf", b"%PDF-1.4 test", "application/pdf")}
+            )
+    return asyncio.run(send())
+
+
+@pytest.fixture
+def spool_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(blueprint, "UPLOAD_SPOOL_DIR", str(tmp_path))
+    monkeypatch.setattr(blueprint.user_service, "can_upload_new_report", lambda email, session: True)
+    monkeypatch.setattr(blueprint, "job_queue_enabled", lambda: True)
+    return tmp_path
+
+
+def test_queued_upload_discards_the_spool_file(spool_dir, monkeypatch):
+    queue = _RecordingQueue()
+
+    async def save_upload_file(job_id, path, filename, sha256):
+        return f"uploads/{job_id}/{filename}"
+
+    monkeypatch.setattr(blueprint.storage_service, "save_upload_file", save_upload_file)
+    monkeypatch.setattr(blueprint, "get_job_queue", lambda: queue)
+
+    response = _upload()
+
+    assert response.status_code == 200, response.text
+    assert len(queue.payloads) == 1
+    assert queue.payloads[0]["pdf_path"] is None
+    assert queue.payloads[0]["saved_file_path"].startswith("uploads/")
+    assert os.listdir(spool_dir) == []
+
+
+def test_failed_upload_discards_the_spool_file(spool_dir, monkeypatch):
+    async def save_upload_file(job_id, path, filename, sha256):
+        raise RuntimeError("storage down")
+
+    monkeypatch.setattr(blueprint.storage_service, "save_upload_file", save_upload_file)
+
+    response = _upload()
+
+    assert response.status_code == 500
+    assert os.listdir(spool_dir) == []
@@ -0,0 +1,138 @@
+"""
+Micro-benchmark for the slotted domain models
+
+Compares the slotted, aggregate-caching models against plain dataclasses with
+the previous re-summing properties: memory per building model and the cost of
+reading zone aggregates repeatedly, as the load loops do.
+
+    PYTHONPATH=. python tests/validation/benchmark_models.py
+"""
+
+import timeit
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+from typing import Dict
+
+from domain.models.spaces import BoundaryCondition, Space, SpaceType, Surface
+from domain.models.zones import BuildingThermalModel, ThermalZone, ZoneType
+
+
+ZONES = 4
+SPACES_PER_ZONE = 8
+READS = 200
+
+
+def _plain(model_cls, properties: Dict[str, property]):
+    """Plain (dict-backed, uncached) dataclass with the same fields as a model"""
+    plain_fields = [
+        (f.name, f.type, field(default=f.default, default_factory=f.default_factory))
+        for f in fields(model_cls) if not f.name.startswith('_')
+    ]
+    return make_dataclass(f"Plain{model_cls.__name__}", plain_fields, namespace=properties)
+
+
+# The properties as they were before caching: re-summed on every access
+PlainSurface = _plain(Surface, {
+    'window_area': property(lambda self: sum(w.get('area_sqft', 0) for w in self.windows)),
+    'net_wall_area': property(lambda self: self.area_sqft if self.surface_type != "wall" else max(
+        0, self.area_sqft - sum(w.get('area_sqft', 0) for w in self.windows)
+        - sum(d.get('area_sqft', 0) for d in self.doors))),
+})
+PlainSpace = _plain(Space, {
+    'volume_cuft': Space.volume_cuft,
+    'exterior_wall_area': property(lambda self: sum(
+        s.area_sqft for s in self.surfaces
+        if s.surface_type == "wall" and s.boundary_condition == BoundaryCondition.EXTERIOR)),
+})
+PlainZone = _plain(ThermalZone, {
+    'total_area_sqft': property(lambda self: sum(space.area_sqft for space in self.spaces)),
+    'total_volume_cuft': property(lambda self: sum(space.volume_cuft for space in self.spaces)),
+    'exterior_wall_area': property(lambda self: sum(space.exterior_wall_area for space in self.spaces)),
+})
+PlainBuilding = _plain(BuildingThermalModel, {})
+
+
+def _surfaces(surface_cls, prefix: str) -> list:
+    walls = [
+        surface_cls(f"{prefix}_w{direction}", "wall", 120.0, direction,
+                    windows=[{'area_sqft': 15.0}], doors=[{'area_sqft': 20.0}] if direction == 'S' else [])
+        for direction in ('N', 'E', 'S', 'W')
+    ]
+    return walls + [
+        surface_cls(f"{prefix}_f", "floor", 200.0, boundary_condition=BoundaryCondition.GROUND),
+        surface_cls(f"{prefix}_c", "ceiling", 200.0, boundary_condition=BoundaryCondition.ATTIC),
+    ]
+
+
+def build(surface_cls=Surface, space_cls=Space, zone_cls=ThermalZone, building_cls=BuildingThermalModel):
+    zones = []
+    for z in range(ZONES):
+        spaces = [
+            space_cls(f"s{z}_{i}", f"Room {i}", SpaceType.BEDROOM, 1, 200.0, surfaces=_surfaces(surface_cls, f"s{z}_{i}"))
+            for i in range(SPACES_PER_ZONE)
+        ]
+        zones.append(zone_cls(f"z{z}", f"Zone {z}", ZoneType.MAIN_LIVING, 1, spaces=spaces))
+    return building_cls("bench", 200.0 * ZONES * SPACES_PER_ZONE, 1, zones=zones)
+
+
+def build_plain():
+    return build(PlainSurface, PlainSpace, PlainZone, PlainBuilding)
+
+
+def read_aggregates(zones) -> float:
+    total = 0.0
+    for zone in zones:
+        total += zone.total_area_sqft + zone.total_volume_cuft + zone.exterior_wall_area
+        for space in zone.spaces:
+            for surface in space.surfaces:
+                total += surface.net_wall_area
+    return total
+
+
+def allocated_bytes(builder) -> int:
+    tracemalloc.start()
+    model = builder()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del model
+    return size
+
+
+def main():
+    slotted = build()
+    plain = build_plain()
+    assert read_aggregates(slotted.zones) == read_aggregates(plain.zones)
+
+    # Caches must follow mutations
+    slotted.zones[0].spaces[0].area_sqft = 260.0
+    slotted.zones[0].spaces[0].surfaces[0].windows.append({'area_sqft': 5.0})
+    plain.zones[0].spaces[0].area_sqft = 260.0
+    plain.zones[0].spaces[0].surfaces[0].windows.append({'area_sqft': 5.0})
+    assert read_aggregates(slotted.zones) == read_aggregates(plain.zones)
+    assert slotted.surface_store.exterior_wall_area_by_zone().tolist() == [z.exterior_wall_area for z in plain.zones]
+
+    # Child lists are the caller's own lists, and mutating them is seen too
+    surfaces = []
+    space = Space("alias", "Alias", SpaceType.BEDROOM, 1, 150.0, surfaces=surfaces)
+    slotted.zones[1].spaces.append(space)
+    plain.zones[1].spaces.append(PlainSpace("alias", "Alias", SpaceType.BEDROOM, 1, 150.0,
+                                            surfaces=_surfaces(PlainSurface, "alias")))
+    surfaces.extend(_surfaces(Surface, "alias"))
+    assert space.surfaces is surfaces
+    assert read_aggregates(slotted.zones) == read_aggregates(plain.zones)
+    assert slotted.surface_store.exterior_wall_area_by_zone().tolist() == [z.exterior_wall_area for z in plain.zones]
+
+    plain_bytes = allocated_bytes(build_plain)
+    slotted_bytes = allocated_bytes(build)
+    plain_s = min(timeit.repeat(lambda: read_aggregates(plain.zones), number=READS, repeat=5)) / READS
+    slotted_s = min(timeit.repeat(lambda: read_aggregates(slotted.zones), number=READS, repeat=5)) / READS
+
+    print(f"Model: {ZONES} zones × {SPACES_PER_ZONE} spaces × 6 surfaces")
+    print(f"  Memory     plain {plain_bytes / 1024:8.1f} KiB   slotted {slotted_bytes / 1024:8.1f} KiB "
+          f"({slotted_bytes / plain_bytes:.0%})")
+    print(f"  Aggregates plain {plain_s * 1e6:8.1f} µs    slotted {slotted_s * 1e6:8.1f} µs  "
+          f"({plain_s / slotted_s:.1f}× faster, per full read)")
+
+
+if __name__ == '__main__':
+    main()
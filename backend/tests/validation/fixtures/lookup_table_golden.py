@@ -0,0 +1,684 @@
+"""
+Golden values for the compiled lookup tables
+
+Recorded from the original per-call implementations of the foundation,
+duct loss, parallel-path and assembly calculators; the table-driven code
+must reproduce them exactly. Floats are stored as repr() so they round-trip.
+"""
+
+DESIGN_TEMPS = [-30.0, -4.0, 25.0, 45.5]
+AREAS = [640.0, 3917.0]
+PERIMETERS = [None, 96.0, 231.7]
+FOUNDATION_TYPES = ['slab_only', 'crawlspace', 'basement_with_slab', 'pier_and_beam']
+SYSTEM_TYPES = ['ducted', 'ductless']
+DUCT_LOCATIONS = [None, '', 'attic', 'Crawl_Space', 'conditioned_space', 'unconditioned_basement', 'garage']
+DUCT_ZONES = ['1A', '5B', '8', '9']
+DUCT_FOUNDATIONS = ['crawlspace', 'basement_with_slab', 'pier']
+DUCT_TEMPS = [(-25.0, 85.0), (5.0, 95.0), (25.0, 101.0), (40.0, 118.0)]
+WALL_R_VALUES = [0.0, 3.5, 11.0, 13.0, 16.7, 21.0, 38.0]
+WALL_FRAMING = ['16oc_2x4', '24oc_2x4', '16oc_2x6', '24oc_2x6', 'advanced', 'steel', 'rim_joist', '24oc_2x8', 'log']
+ASSEMBLY_TYPES = ['wall', 'ceiling', 'floor', 'roof']
+ERA_ZONES = ['1', '4', '5', '6', '5B', '']
+R_TARGETS = [0.0, 3.0, 12.0, 16.0, 19.5, 34.0, 43.5, 70.0]
+
+# (foundation type, design temp, area, perimeter) -> (effective R, conductance, perimeter factor, below-grade factor, notes)
+FOUNDATION_FACTORS = {
+    ('slab_only', -30.0, 640.0, None): (5.416015535444439, 0.1846375796848485, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', -30.0, 640.0, 96.0): (5.758710048949037, 0.17364999999999997, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', -30.0, 640.0, 231.7): (2.642202077266246, 0.37847218749999995, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', -30.0, 3917.0, None): (10.897732237254607, 0.0917622105433491, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', -30.0, 3917.0, 96.0): (19.074773648373082, 0.05242526167985703, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', -30.0, 3917.0, 231.7): (11.642632126560793, 0.0858912305335716, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', -4.0, 640.0, None): (5.416015535444439, 0.1846375796848485, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', -4.0, 640.0, 96.0): (5.758710048949037, 0.17364999999999997, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', -4.0, 640.0, 231.7): (2.642202077266246, 0.37847218749999995, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', -4.0, 3917.0, None): (10.897732237254607, 0.0917622105433491, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', -4.0, 3917.0, 96.0): (19.074773648373082, 0.05242526167985703, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', -4.0, 3917.0, 231.7): (11.642632126560793, 0.0858912305335716, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', 25.0, 640.0, None): (5.416015535444439, 0.1846375796848485, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', 25.0, 640.0, 96.0): (5.758710048949037, 0.17364999999999997, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', 25.0, 640.0, 231.7): (2.642202077266246, 0.37847218749999995, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', 25.0, 3917.0, None): (10.897732237254607, 0.0917622105433491, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', 25.0, 3917.0, 96.0): (19.074773648373082, 0.05242526167985703, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', 25.0, 3917.0, 231.7): (11.642632126560793, 0.0858912305335716, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', 45.5, 640.0, None): (5.416015535444439, 0.1846375796848485, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', 45.5, 640.0, 96.0): (5.758710048949037, 0.17364999999999997, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', 45.5, 640.0, 231.7): (2.642202077266246, 0.37847218749999995, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', 45.5, 3917.0, None): (10.897732237254607, 0.0917622105433491, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', 45.5, 3917.0, 96.0): (19.074773648373082, 0.05242526167985703, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('slab_only', 45.5, 3917.0, 231.7): (11.642632126560793, 0.0858912305335716, 0.84, 1.0, 'Slab edge conductance: 0.84 BTU/hr/°F/ft, Interior: 0.025 BTU/hr/°F/sqft'),
+    ('crawlspace', -30.0, 640.0, None): (5.060286682408583, 0.19761726217535613, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: -24°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', -30.0, 640.0, 96.0): (5.223689509099425, 0.19143557408189105, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: -24°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', -30.0, 640.0, 231.7): (3.2608346627825826, 0.30666994908189105, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: -24°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', -30.0, 3917.0, None): (6.879237911474356, 0.14536493909187687, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: -24°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', -30.0, 3917.0, 96.0): (8.114663412566752, 0.12323370042081505, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: -24°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', -30.0, 3917.0, 231.7): (7.039185761873603, 0.1420618852561482, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: -24°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', -4.0, 640.0, None): (5.1242040563550555, 0.19515225955137297, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 2°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', -4.0, 640.0, 96.0): (5.29182926359909, 0.1889705714579079, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 2°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', -4.0, 640.0, 231.7): (3.287257527018443, 0.30420494645790785, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 2°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', -4.0, 3917.0, None): (6.997903741018646, 0.14289993646789367, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 2°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', -4.0, 3917.0, 96.0): (8.280291319214946, 0.12076869779683186, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 2°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', -4.0, 3917.0, 231.7): (7.163483747950015, 0.13959688263216505, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 2°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', 25.0, 640.0, None): (5.289817909155188, 0.18904242398765392, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 31°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', 25.0, 640.0, 96.0): (5.4686425443384605, 0.18286073589418883, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 31°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', 25.0, 640.0, 231.7): (3.35463401932465, 0.29809511089418883, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 31°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', 25.0, 3917.0, None): (7.310470519358185, 0.13679010090417462, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 31°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', 25.0, 3917.0, 96.0): (8.721523836220362, 0.11465886223311281, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 31°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', 25.0, 3917.0, 231.7): (7.491363558947007, 0.13348704706844597, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 31°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', 45.5, 640.0, None): (5.681908071765524, 0.17599721561304188, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 52°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', 45.5, 640.0, 96.0): (5.8887430060523585, 0.16981552751957685, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 52°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', 45.5, 640.0, 231.7): (3.5081576634860325, 0.28504990251957685, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 52°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', 45.5, 3917.0, None): (8.081141609631285, 0.12374489252956263, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 52°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', 45.5, 3917.0, 96.0): (9.84119714258599, 0.10161365385850081, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 52°F, Ventilation: 2.5 CFM/sqft'),
+    ('crawlspace', 45.5, 3917.0, 231.7): (8.302762651623276, 0.12044183869383399, 0.2173913043478261, 0.3, 'Floor R-20.6, Crawlspace temp: 52°F, Ventilation: 2.5 CFM/sqft'),
+    ('basement_with_slab', -30.0, 640.0, None): (10.978939873722425, 0.09108347540853674, 0.0005273437499999999, 0.9, 'Wall R-8, 8ft deep, Ground temp: -20°F, Deep ground: 55°F'),
+    ('basement_with_slab', -30.0, 640.0, 96.0): (11.7820324005891, 0.084875, 0.0005273437499999999, 0.9, 'Wall R-8, 8ft deep, Ground temp: -20°F, Deep ground: 55°F'),
+    ('basement_with_slab', -30.0, 640.0, 231.7): (4.984828078601914, 0.20060872395833326, 0.0005273437499999998, 0.9, 'Wall R-8, 8ft deep, Ground temp: -20°F, Deep ground: 55°F'),
+    ('basement_with_slab', -30.0, 3917.0, None): (25.903564516337628, 0.038604725591695706, 8.616287975491446e-05, 0.9, 'Wall R-8, 8ft deep, Ground temp: -20°F, Deep ground: 55°F'),
+    ('basement_with_slab', -30.0, 3917.0, 96.0): (61.05906377141432, 0.016377584886392647, 8.616287975491447e-05, 0.9, 'Wall R-8, 8ft deep, Ground temp: -20°F, Deep ground: 55°F'),
+    ('basement_with_slab', -30.0, 3917.0, 231.7): (28.33876044752139, 0.03528735852267891, 8.616287975491446e-05, 0.9, 'Wall R-8, 8ft deep, Ground temp: -20°F, Deep ground: 55°F'),
+    ('basement_with_slab', -4.0, 640.0, None): (11.10971450357614, 0.09001131394313572, 0.0005067567567567567, 0.8648648648648649, 'Wall R-8, 8ft deep, Ground temp: 6°F, Deep ground: 55°F'),
+    ('basement_with_slab', -4.0, 640.0, 96.0): (11.911468812877263, 0.0839527027027027, 0.0005067567567567568, 0.8648648648648649, 'Wall R-8, 8ft deep, Ground temp: 6°F, Deep ground: 55°F'),
+    ('basement_with_slab', -4.0, 640.0, 231.7): (5.078906612355349, 0.1968927716779279, 0.0005067567567567567, 0.8648648648648649, 'Wall R-8, 8ft deep, Ground temp: 6°F, Deep ground: 55°F'),
+    ('basement_with_slab', -4.0, 3917.0, None): (25.77364099980144, 0.038799329904831995, 8.279916372844633e-05, 0.8648648648648649, 'Wall R-8, 8ft deep, Ground temp: 6°F, Deep ground: 55°F'),
+    ('basement_with_slab', -4.0, 3917.0, 96.0): (58.449718698957476, 0.01710872220190576, 8.279916372844635e-05, 0.8648648648648649, 'Wall R-8, 8ft deep, Ground temp: 6°F, Deep ground: 55°F'),
+    ('basement_with_slab', -4.0, 3917.0, 231.7): (28.119871975733925, 0.0355620395734003, 8.279916372844635e-05, 0.8648648648648649, 'Wall R-8, 8ft deep, Ground temp: 6°F, Deep ground: 55°F'),
+    ('basement_with_slab', 25.0, 640.0, None): (11.447696314705457, 0.08735381971265452, 0.0004557291666666666, 0.7777777777777778, 'Wall R-8, 8ft deep, Ground temp: 35°F, Deep ground: 55°F'),
+    ('basement_with_slab', 25.0, 640.0, 96.0): (12.244897959183673, 0.08166666666666667, 0.0004557291666666667, 0.7777777777777778, 'Wall R-8, 8ft deep, Ground temp: 35°F, Deep ground: 55°F'),
+    ('basement_with_slab', 25.0, 640.0, 231.7): (5.3281531844040515, 0.18768229166666667, 0.0004557291666666667, 0.7777777777777778, 'Wall R-8, 8ft deep, Ground temp: 35°F, Deep ground: 55°F'),
+    ('basement_with_slab', 25.0, 3917.0, None): (25.457158068896344, 0.03928168247585358, 7.446174793634584e-05, 0.7777777777777778, 'Wall R-8, 8ft deep, Ground temp: 35°F, Deep ground: 55°F'),
+    ('basement_with_slab', 25.0, 3917.0, 96.0): (52.85148871098318, 0.018920942898476723, 7.446174793634584e-05, 0.7777777777777778, 'Wall R-8, 8ft deep, Ground temp: 35°F, Deep ground: 55°F'),
+    ('basement_with_slab', 25.0, 3917.0, 231.7): (27.59163164197328, 0.03624287294698324, 7.446174793634585e-05, 0.7777777777777778, 'Wall R-8, 8ft deep, Ground temp: 35°F, Deep ground: 55°F'),
+    ('basement_with_slab', 45.5, 640.0, None): (12.242934948800313, 0.08167976095454058, 0.0003467793367346938, 0.5918367346938775, 'Wall R-8, 8ft deep, Ground temp: 56°F, Deep ground: 55°F'),
+    ('basement_with_slab', 45.5, 640.0, 96.0): (13.023255813953488, 0.07678571428571429, 0.0003467793367346939, 0.5918367346938775, 'Wall R-8, 8ft deep, Ground temp: 56°F, Deep ground: 55°F'),
+    ('basement_with_slab', 45.5, 640.0, 231.7): (5.9517840959952935, 0.16801684736394557, 0.00034677933673469386, 0.5918367346938775, 'Wall R-8, 8ft deep, Ground temp: 56°F, Deep ground: 55°F'),
+    ('basement_with_slab', 45.5, 3917.0, None): (24.806779237707886, 0.040311561223552, 5.666039711774421e-05, 0.5918367346938775, 'Wall R-8, 8ft deep, Ground temp: 56°F, Deep ground: 55°F'),
+    ('basement_with_slab', 45.5, 3917.0, 96.0): (43.8784234831512, 0.02279024451240798, 5.6660397117744216e-05, 0.5918367346938775, 'Wall R-8, 8ft deep, Ground temp: 56°F, Deep ground: 55°F'),
+    ('basement_with_slab', 45.5, 3917.0, 231.7): (26.527639724725734, 0.037696531254830246, 5.6660397117744216e-05, 0.5918367346938775, 'Wall R-8, 8ft deep, Ground temp: 56°F, Deep ground: 55°F'),
+    ('pier_and_beam', -30.0, 640.0, None): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', -30.0, 640.0, 96.0): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', -30.0, 640.0, 231.7): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', -30.0, 3917.0, None): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', -30.0, 3917.0, 96.0): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', -30.0, 3917.0, 231.7): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', -4.0, 640.0, None): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', -4.0, 640.0, 96.0): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', -4.0, 640.0, 231.7): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', -4.0, 3917.0, None): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', -4.0, 3917.0, 96.0): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', -4.0, 3917.0, 231.7): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', 25.0, 640.0, None): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', 25.0, 640.0, 96.0): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', 25.0, 640.0, 231.7): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', 25.0, 3917.0, None): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', 25.0, 3917.0, 96.0): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', 25.0, 3917.0, 231.7): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', 45.5, 640.0, None): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', 45.5, 640.0, 96.0): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', 45.5, 640.0, 231.7): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', 45.5, 3917.0, None): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', 45.5, 3917.0, 96.0): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+    ('pier_and_beam', 45.5, 3917.0, 231.7): (10.0, 0.1, 1.0, 1.0, 'Generic foundation thermal factors applied'),
+}
+
+# (system, location, zone, foundation, winter, summer) -> (heating, cooling, confidence, notes, source)
+DUCT_FACTORS = {
+    ('ducted', None, '1A', 'crawlspace', -25.0, 85.0): (1.1799, 1.2133800000000003, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 1A, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', None, '1A', 'crawlspace', 5.0, 95.0): (1.147125, 1.1796750000000003, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 1A, severe temperature differential', 'foundation_inferred'),
+    ('ducted', None, '1A', 'crawlspace', 25.0, 101.0): (1.1143499999999997, 1.1459700000000002, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 1A, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', None, '1A', 'crawlspace', 40.0, 118.0): (1.1143499999999997, 1.1459700000000002, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 1A, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', None, '1A', 'basement_with_slab', -25.0, 85.0): (1.0165, 1.0815000000000001, 0.75, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '1A', 'basement_with_slab', 5.0, 95.0): (1.0165, 1.0815000000000001, 0.75, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '1A', 'basement_with_slab', 25.0, 101.0): (1.0165, 1.0815000000000001, 0.75, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '1A', 'basement_with_slab', 40.0, 118.0): (1.0165, 1.0815000000000001, 0.75, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '1A', 'pier', -25.0, 85.0): (1.1799, 1.35, 0.75, 'Ducts in vented attic (new construction) in climate zone 1A, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', None, '1A', 'pier', 5.0, 95.0): (1.147125, 1.3230000000000002, 0.75, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'foundation_inferred'),
+    ('ducted', None, '1A', 'pier', 25.0, 101.0): (1.147125, 1.3230000000000002, 0.75, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'foundation_inferred'),
+    ('ducted', None, '1A', 'pier', 40.0, 118.0): (1.147125, 1.3230000000000002, 0.75, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'foundation_inferred'),
+    ('ducted', None, '5B', 'crawlspace', -25.0, 85.0): (1.26684, 1.132488, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 5B, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', None, '5B', 'crawlspace', 5.0, 95.0): (1.23165, 1.10103, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 5B, severe temperature differential', 'foundation_inferred'),
+    ('ducted', None, '5B', 'crawlspace', 25.0, 101.0): (1.1964599999999999, 1.069572, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 5B, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', None, '5B', 'crawlspace', 40.0, 118.0): (1.1964599999999999, 1.069572, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 5B, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', None, '5B', 'basement_with_slab', -25.0, 85.0): (1.0914000000000001, 1.0094, 0.75, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '5B', 'basement_with_slab', 5.0, 95.0): (1.0914000000000001, 1.0094, 0.75, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '5B', 'basement_with_slab', 25.0, 101.0): (1.0914000000000001, 1.0094, 0.75, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '5B', 'basement_with_slab', 40.0, 118.0): (1.0914000000000001, 1.0094, 0.75, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '5B', 'pier', -25.0, 85.0): (1.26684, 1.27008, 0.75, 'Ducts in vented attic (new construction) in climate zone 5B, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', None, '5B', 'pier', 5.0, 95.0): (1.23165, 1.2348, 0.75, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'foundation_inferred'),
+    ('ducted', None, '5B', 'pier', 25.0, 101.0): (1.23165, 1.2348, 0.75, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'foundation_inferred'),
+    ('ducted', None, '5B', 'pier', 40.0, 118.0): (1.23165, 1.2348, 0.75, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'foundation_inferred'),
+    ('ducted', None, '8', 'crawlspace', -25.0, 85.0): (1.3662, 1.09782, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 8, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', None, '8', 'crawlspace', 5.0, 95.0): (1.32825, 1.067325, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 8, severe temperature differential', 'foundation_inferred'),
+    ('ducted', None, '8', 'crawlspace', 25.0, 101.0): (1.2903, 1.03683, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 8, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', None, '8', 'crawlspace', 40.0, 118.0): (1.2903, 1.03683, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 8, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', None, '8', 'basement_with_slab', -25.0, 85.0): (1.1770000000000003, 0.9784999999999999, 0.75, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '8', 'basement_with_slab', 5.0, 95.0): (1.1770000000000003, 0.9784999999999999, 0.75, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '8', 'basement_with_slab', 25.0, 101.0): (1.1770000000000003, 0.9784999999999999, 0.75, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '8', 'basement_with_slab', 40.0, 118.0): (1.1770000000000003, 0.9784999999999999, 0.75, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '8', 'pier', -25.0, 85.0): (1.3662, 1.2312, 0.75, 'Ducts in vented attic (new construction) in climate zone 8, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', None, '8', 'pier', 5.0, 95.0): (1.32825, 1.1969999999999998, 0.75, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'foundation_inferred'),
+    ('ducted', None, '8', 'pier', 25.0, 101.0): (1.32825, 1.1969999999999998, 0.75, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'foundation_inferred'),
+    ('ducted', None, '8', 'pier', 40.0, 118.0): (1.32825, 1.1969999999999998, 0.75, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'foundation_inferred'),
+    ('ducted', None, '9', 'crawlspace', -25.0, 85.0): (1.242, 1.1556000000000002, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 9, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', None, '9', 'crawlspace', 5.0, 95.0): (1.2075, 1.1235000000000002, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 9, severe temperature differential', 'foundation_inferred'),
+    ('ducted', None, '9', 'crawlspace', 25.0, 101.0): (1.1729999999999998, 1.0914000000000001, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 9, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', None, '9', 'crawlspace', 40.0, 118.0): (1.1729999999999998, 1.0914000000000001, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 9, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', None, '9', 'basement_with_slab', -25.0, 85.0): (1.07, 1.03, 0.75, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '9', 'basement_with_slab', 5.0, 95.0): (1.07, 1.03, 0.75, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '9', 'basement_with_slab', 25.0, 101.0): (1.07, 1.03, 0.75, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '9', 'basement_with_slab', 40.0, 118.0): (1.07, 1.03, 0.75, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'foundation_inferred'),
+    ('ducted', None, '9', 'pier', -25.0, 85.0): (1.242, 1.296, 0.75, 'Ducts in vented attic (new construction) in climate zone 9, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', None, '9', 'pier', 5.0, 95.0): (1.2075, 1.26, 0.75, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'foundation_inferred'),
+    ('ducted', None, '9', 'pier', 25.0, 101.0): (1.2075, 1.26, 0.75, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'foundation_inferred'),
+    ('ducted', None, '9', 'pier', 40.0, 118.0): (1.2075, 1.26, 0.75, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '1A', 'crawlspace', -25.0, 85.0): (1.1799, 1.2133800000000003, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 1A, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', '', '1A', 'crawlspace', 5.0, 95.0): (1.147125, 1.1796750000000003, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 1A, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '1A', 'crawlspace', 25.0, 101.0): (1.1143499999999997, 1.1459700000000002, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 1A, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', '', '1A', 'crawlspace', 40.0, 118.0): (1.1143499999999997, 1.1459700000000002, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 1A, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', '', '1A', 'basement_with_slab', -25.0, 85.0): (1.0165, 1.0815000000000001, 0.75, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '1A', 'basement_with_slab', 5.0, 95.0): (1.0165, 1.0815000000000001, 0.75, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '1A', 'basement_with_slab', 25.0, 101.0): (1.0165, 1.0815000000000001, 0.75, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '1A', 'basement_with_slab', 40.0, 118.0): (1.0165, 1.0815000000000001, 0.75, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '1A', 'pier', -25.0, 85.0): (1.1799, 1.35, 0.75, 'Ducts in vented attic (new construction) in climate zone 1A, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', '', '1A', 'pier', 5.0, 95.0): (1.147125, 1.3230000000000002, 0.75, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '1A', 'pier', 25.0, 101.0): (1.147125, 1.3230000000000002, 0.75, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '1A', 'pier', 40.0, 118.0): (1.147125, 1.3230000000000002, 0.75, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '5B', 'crawlspace', -25.0, 85.0): (1.26684, 1.132488, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 5B, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', '', '5B', 'crawlspace', 5.0, 95.0): (1.23165, 1.10103, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 5B, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '5B', 'crawlspace', 25.0, 101.0): (1.1964599999999999, 1.069572, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 5B, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', '', '5B', 'crawlspace', 40.0, 118.0): (1.1964599999999999, 1.069572, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 5B, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', '', '5B', 'basement_with_slab', -25.0, 85.0): (1.0914000000000001, 1.0094, 0.75, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '5B', 'basement_with_slab', 5.0, 95.0): (1.0914000000000001, 1.0094, 0.75, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '5B', 'basement_with_slab', 25.0, 101.0): (1.0914000000000001, 1.0094, 0.75, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '5B', 'basement_with_slab', 40.0, 118.0): (1.0914000000000001, 1.0094, 0.75, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '5B', 'pier', -25.0, 85.0): (1.26684, 1.27008, 0.75, 'Ducts in vented attic (new construction) in climate zone 5B, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', '', '5B', 'pier', 5.0, 95.0): (1.23165, 1.2348, 0.75, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '5B', 'pier', 25.0, 101.0): (1.23165, 1.2348, 0.75, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '5B', 'pier', 40.0, 118.0): (1.23165, 1.2348, 0.75, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '8', 'crawlspace', -25.0, 85.0): (1.3662, 1.09782, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 8, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', '', '8', 'crawlspace', 5.0, 95.0): (1.32825, 1.067325, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 8, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '8', 'crawlspace', 25.0, 101.0): (1.2903, 1.03683, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 8, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', '', '8', 'crawlspace', 40.0, 118.0): (1.2903, 1.03683, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 8, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', '', '8', 'basement_with_slab', -25.0, 85.0): (1.1770000000000003, 0.9784999999999999, 0.75, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '8', 'basement_with_slab', 5.0, 95.0): (1.1770000000000003, 0.9784999999999999, 0.75, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '8', 'basement_with_slab', 25.0, 101.0): (1.1770000000000003, 0.9784999999999999, 0.75, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '8', 'basement_with_slab', 40.0, 118.0): (1.1770000000000003, 0.9784999999999999, 0.75, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '8', 'pier', -25.0, 85.0): (1.3662, 1.2312, 0.75, 'Ducts in vented attic (new construction) in climate zone 8, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', '', '8', 'pier', 5.0, 95.0): (1.32825, 1.1969999999999998, 0.75, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '8', 'pier', 25.0, 101.0): (1.32825, 1.1969999999999998, 0.75, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '8', 'pier', 40.0, 118.0): (1.32825, 1.1969999999999998, 0.75, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '9', 'crawlspace', -25.0, 85.0): (1.242, 1.1556000000000002, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 9, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', '', '9', 'crawlspace', 5.0, 95.0): (1.2075, 1.1235000000000002, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 9, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '9', 'crawlspace', 25.0, 101.0): (1.1729999999999998, 1.0914000000000001, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 9, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', '', '9', 'crawlspace', 40.0, 118.0): (1.1729999999999998, 1.0914000000000001, 0.75, 'Ducts in vented crawlspace (new construction) in climate zone 9, moderate temperature differential', 'foundation_inferred'),
+    ('ducted', '', '9', 'basement_with_slab', -25.0, 85.0): (1.07, 1.03, 0.75, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '9', 'basement_with_slab', 5.0, 95.0): (1.07, 1.03, 0.75, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '9', 'basement_with_slab', 25.0, 101.0): (1.07, 1.03, 0.75, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '9', 'basement_with_slab', 40.0, 118.0): (1.07, 1.03, 0.75, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'foundation_inferred'),
+    ('ducted', '', '9', 'pier', -25.0, 85.0): (1.242, 1.296, 0.75, 'Ducts in vented attic (new construction) in climate zone 9, extreme temperature differential', 'foundation_inferred'),
+    ('ducted', '', '9', 'pier', 5.0, 95.0): (1.2075, 1.26, 0.75, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '9', 'pier', 25.0, 101.0): (1.2075, 1.26, 0.75, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'foundation_inferred'),
+    ('ducted', '', '9', 'pier', 40.0, 118.0): (1.2075, 1.26, 0.75, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'foundation_inferred'),
+    ('ducted', 'attic', '1A', 'crawlspace', -25.0, 85.0): (1.1799, 1.35, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, extreme temperature differential', 'user_input'),
+    ('ducted', 'attic', '1A', 'crawlspace', 5.0, 95.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '1A', 'crawlspace', 25.0, 101.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '1A', 'crawlspace', 40.0, 118.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '1A', 'basement_with_slab', -25.0, 85.0): (1.1799, 1.35, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, extreme temperature differential', 'user_input'),
+    ('ducted', 'attic', '1A', 'basement_with_slab', 5.0, 95.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '1A', 'basement_with_slab', 25.0, 101.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '1A', 'basement_with_slab', 40.0, 118.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '1A', 'pier', -25.0, 85.0): (1.1799, 1.35, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, extreme temperature differential', 'user_input'),
+    ('ducted', 'attic', '1A', 'pier', 5.0, 95.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '1A', 'pier', 25.0, 101.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '1A', 'pier', 40.0, 118.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '5B', 'crawlspace', -25.0, 85.0): (1.26684, 1.27008, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, extreme temperature differential', 'user_input'),
+    ('ducted', 'attic', '5B', 'crawlspace', 5.0, 95.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '5B', 'crawlspace', 25.0, 101.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '5B', 'crawlspace', 40.0, 118.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '5B', 'basement_with_slab', -25.0, 85.0): (1.26684, 1.27008, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, extreme temperature differential', 'user_input'),
+    ('ducted', 'attic', '5B', 'basement_with_slab', 5.0, 95.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '5B', 'basement_with_slab', 25.0, 101.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '5B', 'basement_with_slab', 40.0, 118.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '5B', 'pier', -25.0, 85.0): (1.26684, 1.27008, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, extreme temperature differential', 'user_input'),
+    ('ducted', 'attic', '5B', 'pier', 5.0, 95.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '5B', 'pier', 25.0, 101.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '5B', 'pier', 40.0, 118.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '8', 'crawlspace', -25.0, 85.0): (1.3662, 1.2312, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, extreme temperature differential', 'user_input'),
+    ('ducted', 'attic', '8', 'crawlspace', 5.0, 95.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '8', 'crawlspace', 25.0, 101.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '8', 'crawlspace', 40.0, 118.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '8', 'basement_with_slab', -25.0, 85.0): (1.3662, 1.2312, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, extreme temperature differential', 'user_input'),
+    ('ducted', 'attic', '8', 'basement_with_slab', 5.0, 95.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '8', 'basement_with_slab', 25.0, 101.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '8', 'basement_with_slab', 40.0, 118.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '8', 'pier', -25.0, 85.0): (1.3662, 1.2312, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, extreme temperature differential', 'user_input'),
+    ('ducted', 'attic', '8', 'pier', 5.0, 95.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '8', 'pier', 25.0, 101.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '8', 'pier', 40.0, 118.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '9', 'crawlspace', -25.0, 85.0): (1.242, 1.296, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, extreme temperature differential', 'user_input'),
+    ('ducted', 'attic', '9', 'crawlspace', 5.0, 95.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '9', 'crawlspace', 25.0, 101.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '9', 'crawlspace', 40.0, 118.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '9', 'basement_with_slab', -25.0, 85.0): (1.242, 1.296, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, extreme temperature differential', 'user_input'),
+    ('ducted', 'attic', '9', 'basement_with_slab', 5.0, 95.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '9', 'basement_with_slab', 25.0, 101.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '9', 'basement_with_slab', 40.0, 118.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '9', 'pier', -25.0, 85.0): (1.242, 1.296, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, extreme temperature differential', 'user_input'),
+    ('ducted', 'attic', '9', 'pier', 5.0, 95.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '9', 'pier', 25.0, 101.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'attic', '9', 'pier', 40.0, 118.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '1A', 'crawlspace', -25.0, 85.0): (1.1799, 1.2133800000000003, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 1A, extreme temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '1A', 'crawlspace', 5.0, 95.0): (1.147125, 1.1796750000000003, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '1A', 'crawlspace', 25.0, 101.0): (1.1143499999999997, 1.1459700000000002, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 1A, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '1A', 'crawlspace', 40.0, 118.0): (1.1143499999999997, 1.1459700000000002, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 1A, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '1A', 'basement_with_slab', -25.0, 85.0): (1.1799, 1.2133800000000003, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 1A, extreme temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '1A', 'basement_with_slab', 5.0, 95.0): (1.147125, 1.1796750000000003, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '1A', 'basement_with_slab', 25.0, 101.0): (1.1143499999999997, 1.1459700000000002, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 1A, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '1A', 'basement_with_slab', 40.0, 118.0): (1.1143499999999997, 1.1459700000000002, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 1A, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '1A', 'pier', -25.0, 85.0): (1.1799, 1.2133800000000003, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 1A, extreme temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '1A', 'pier', 5.0, 95.0): (1.147125, 1.1796750000000003, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '1A', 'pier', 25.0, 101.0): (1.1143499999999997, 1.1459700000000002, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 1A, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '1A', 'pier', 40.0, 118.0): (1.1143499999999997, 1.1459700000000002, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 1A, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '5B', 'crawlspace', -25.0, 85.0): (1.26684, 1.132488, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 5B, extreme temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '5B', 'crawlspace', 5.0, 95.0): (1.23165, 1.10103, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '5B', 'crawlspace', 25.0, 101.0): (1.1964599999999999, 1.069572, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 5B, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '5B', 'crawlspace', 40.0, 118.0): (1.1964599999999999, 1.069572, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 5B, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '5B', 'basement_with_slab', -25.0, 85.0): (1.26684, 1.132488, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 5B, extreme temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '5B', 'basement_with_slab', 5.0, 95.0): (1.23165, 1.10103, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '5B', 'basement_with_slab', 25.0, 101.0): (1.1964599999999999, 1.069572, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 5B, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '5B', 'basement_with_slab', 40.0, 118.0): (1.1964599999999999, 1.069572, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 5B, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '5B', 'pier', -25.0, 85.0): (1.26684, 1.132488, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 5B, extreme temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '5B', 'pier', 5.0, 95.0): (1.23165, 1.10103, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '5B', 'pier', 25.0, 101.0): (1.1964599999999999, 1.069572, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 5B, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '5B', 'pier', 40.0, 118.0): (1.1964599999999999, 1.069572, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 5B, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '8', 'crawlspace', -25.0, 85.0): (1.3662, 1.09782, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 8, extreme temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '8', 'crawlspace', 5.0, 95.0): (1.32825, 1.067325, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '8', 'crawlspace', 25.0, 101.0): (1.2903, 1.03683, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 8, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '8', 'crawlspace', 40.0, 118.0): (1.2903, 1.03683, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 8, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '8', 'basement_with_slab', -25.0, 85.0): (1.3662, 1.09782, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 8, extreme temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '8', 'basement_with_slab', 5.0, 95.0): (1.32825, 1.067325, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '8', 'basement_with_slab', 25.0, 101.0): (1.2903, 1.03683, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 8, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '8', 'basement_with_slab', 40.0, 118.0): (1.2903, 1.03683, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 8, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '8', 'pier', -25.0, 85.0): (1.3662, 1.09782, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 8, extreme temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '8', 'pier', 5.0, 95.0): (1.32825, 1.067325, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '8', 'pier', 25.0, 101.0): (1.2903, 1.03683, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 8, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '8', 'pier', 40.0, 118.0): (1.2903, 1.03683, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 8, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '9', 'crawlspace', -25.0, 85.0): (1.242, 1.1556000000000002, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 9, extreme temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '9', 'crawlspace', 5.0, 95.0): (1.2075, 1.1235000000000002, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '9', 'crawlspace', 25.0, 101.0): (1.1729999999999998, 1.0914000000000001, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 9, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '9', 'crawlspace', 40.0, 118.0): (1.1729999999999998, 1.0914000000000001, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 9, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '9', 'basement_with_slab', -25.0, 85.0): (1.242, 1.1556000000000002, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 9, extreme temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '9', 'basement_with_slab', 5.0, 95.0): (1.2075, 1.1235000000000002, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '9', 'basement_with_slab', 25.0, 101.0): (1.1729999999999998, 1.0914000000000001, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 9, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '9', 'basement_with_slab', 40.0, 118.0): (1.1729999999999998, 1.0914000000000001, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 9, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '9', 'pier', -25.0, 85.0): (1.242, 1.1556000000000002, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 9, extreme temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '9', 'pier', 5.0, 95.0): (1.2075, 1.1235000000000002, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '9', 'pier', 25.0, 101.0): (1.1729999999999998, 1.0914000000000001, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 9, moderate temperature differential', 'user_input'),
+    ('ducted', 'Crawl_Space', '9', 'pier', 40.0, 118.0): (1.1729999999999998, 1.0914000000000001, 0.95, 'Ducts in vented crawlspace (new construction) in climate zone 9, moderate temperature differential', 'user_input'),
+    ('ducted', 'conditioned_space', '1A', 'crawlspace', -25.0, 85.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '1A', 'crawlspace', 5.0, 95.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '1A', 'crawlspace', 25.0, 101.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '1A', 'crawlspace', 40.0, 118.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '1A', 'basement_with_slab', -25.0, 85.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '1A', 'basement_with_slab', 5.0, 95.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '1A', 'basement_with_slab', 25.0, 101.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '1A', 'basement_with_slab', 40.0, 118.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '1A', 'pier', -25.0, 85.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '1A', 'pier', 5.0, 95.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '1A', 'pier', 25.0, 101.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '1A', 'pier', 40.0, 118.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '5B', 'crawlspace', -25.0, 85.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '5B', 'crawlspace', 5.0, 95.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '5B', 'crawlspace', 25.0, 101.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '5B', 'crawlspace', 40.0, 118.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '5B', 'basement_with_slab', -25.0, 85.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '5B', 'basement_with_slab', 5.0, 95.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '5B', 'basement_with_slab', 25.0, 101.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '5B', 'basement_with_slab', 40.0, 118.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '5B', 'pier', -25.0, 85.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '5B', 'pier', 5.0, 95.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '5B', 'pier', 25.0, 101.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '5B', 'pier', 40.0, 118.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '8', 'crawlspace', -25.0, 85.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '8', 'crawlspace', 5.0, 95.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '8', 'crawlspace', 25.0, 101.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '8', 'crawlspace', 40.0, 118.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '8', 'basement_with_slab', -25.0, 85.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '8', 'basement_with_slab', 5.0, 95.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '8', 'basement_with_slab', 25.0, 101.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '8', 'basement_with_slab', 40.0, 118.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '8', 'pier', -25.0, 85.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '8', 'pier', 5.0, 95.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '8', 'pier', 25.0, 101.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '8', 'pier', 40.0, 118.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '9', 'crawlspace', -25.0, 85.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '9', 'crawlspace', 5.0, 95.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '9', 'crawlspace', 25.0, 101.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '9', 'crawlspace', 40.0, 118.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '9', 'basement_with_slab', -25.0, 85.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '9', 'basement_with_slab', 5.0, 95.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '9', 'basement_with_slab', 25.0, 101.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '9', 'basement_with_slab', 40.0, 118.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '9', 'pier', -25.0, 85.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '9', 'pier', 5.0, 95.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '9', 'pier', 25.0, 101.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'conditioned_space', '9', 'pier', 40.0, 118.0): (1.03, 1.03, 0.95, 'Ducts in conditioned space - minimal thermal losses', 'user_input'),
+    ('ducted', 'unconditioned_basement', '1A', 'crawlspace', -25.0, 85.0): (1.0165, 1.0815000000000001, 0.95, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '1A', 'crawlspace', 5.0, 95.0): (1.0165, 1.0815000000000001, 0.95, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '1A', 'crawlspace', 25.0, 101.0): (1.0165, 1.0815000000000001, 0.95, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '1A', 'crawlspace', 40.0, 118.0): (1.0165, 1.0815000000000001, 0.95, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '1A', 'basement_with_slab', -25.0, 85.0): (1.0165, 1.0815000000000001, 0.95, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '1A', 'basement_with_slab', 5.0, 95.0): (1.0165, 1.0815000000000001, 0.95, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '1A', 'basement_with_slab', 25.0, 101.0): (1.0165, 1.0815000000000001, 0.95, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '1A', 'basement_with_slab', 40.0, 118.0): (1.0165, 1.0815000000000001, 0.95, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '1A', 'pier', -25.0, 85.0): (1.0165, 1.0815000000000001, 0.95, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '1A', 'pier', 5.0, 95.0): (1.0165, 1.0815000000000001, 0.95, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '1A', 'pier', 25.0, 101.0): (1.0165, 1.0815000000000001, 0.95, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '1A', 'pier', 40.0, 118.0): (1.0165, 1.0815000000000001, 0.95, 'Ducts in unconditioned basement in climate zone 1A, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '5B', 'crawlspace', -25.0, 85.0): (1.0914000000000001, 1.0094, 0.95, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '5B', 'crawlspace', 5.0, 95.0): (1.0914000000000001, 1.0094, 0.95, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '5B', 'crawlspace', 25.0, 101.0): (1.0914000000000001, 1.0094, 0.95, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '5B', 'crawlspace', 40.0, 118.0): (1.0914000000000001, 1.0094, 0.95, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '5B', 'basement_with_slab', -25.0, 85.0): (1.0914000000000001, 1.0094, 0.95, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '5B', 'basement_with_slab', 5.0, 95.0): (1.0914000000000001, 1.0094, 0.95, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '5B', 'basement_with_slab', 25.0, 101.0): (1.0914000000000001, 1.0094, 0.95, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '5B', 'basement_with_slab', 40.0, 118.0): (1.0914000000000001, 1.0094, 0.95, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '5B', 'pier', -25.0, 85.0): (1.0914000000000001, 1.0094, 0.95, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '5B', 'pier', 5.0, 95.0): (1.0914000000000001, 1.0094, 0.95, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '5B', 'pier', 25.0, 101.0): (1.0914000000000001, 1.0094, 0.95, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '5B', 'pier', 40.0, 118.0): (1.0914000000000001, 1.0094, 0.95, 'Ducts in unconditioned basement in climate zone 5B, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '8', 'crawlspace', -25.0, 85.0): (1.1770000000000003, 0.9784999999999999, 0.95, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '8', 'crawlspace', 5.0, 95.0): (1.1770000000000003, 0.9784999999999999, 0.95, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '8', 'crawlspace', 25.0, 101.0): (1.1770000000000003, 0.9784999999999999, 0.95, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '8', 'crawlspace', 40.0, 118.0): (1.1770000000000003, 0.9784999999999999, 0.95, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '8', 'basement_with_slab', -25.0, 85.0): (1.1770000000000003, 0.9784999999999999, 0.95, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '8', 'basement_with_slab', 5.0, 95.0): (1.1770000000000003, 0.9784999999999999, 0.95, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '8', 'basement_with_slab', 25.0, 101.0): (1.1770000000000003, 0.9784999999999999, 0.95, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '8', 'basement_with_slab', 40.0, 118.0): (1.1770000000000003, 0.9784999999999999, 0.95, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '8', 'pier', -25.0, 85.0): (1.1770000000000003, 0.9784999999999999, 0.95, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '8', 'pier', 5.0, 95.0): (1.1770000000000003, 0.9784999999999999, 0.95, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '8', 'pier', 25.0, 101.0): (1.1770000000000003, 0.9784999999999999, 0.95, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '8', 'pier', 40.0, 118.0): (1.1770000000000003, 0.9784999999999999, 0.95, 'Ducts in unconditioned basement in climate zone 8, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '9', 'crawlspace', -25.0, 85.0): (1.07, 1.03, 0.95, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '9', 'crawlspace', 5.0, 95.0): (1.07, 1.03, 0.95, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '9', 'crawlspace', 25.0, 101.0): (1.07, 1.03, 0.95, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '9', 'crawlspace', 40.0, 118.0): (1.07, 1.03, 0.95, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '9', 'basement_with_slab', -25.0, 85.0): (1.07, 1.03, 0.95, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '9', 'basement_with_slab', 5.0, 95.0): (1.07, 1.03, 0.95, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '9', 'basement_with_slab', 25.0, 101.0): (1.07, 1.03, 0.95, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '9', 'basement_with_slab', 40.0, 118.0): (1.07, 1.03, 0.95, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '9', 'pier', -25.0, 85.0): (1.07, 1.03, 0.95, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '9', 'pier', 5.0, 95.0): (1.07, 1.03, 0.95, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '9', 'pier', 25.0, 101.0): (1.07, 1.03, 0.95, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'user_input'),
+    ('ducted', 'unconditioned_basement', '9', 'pier', 40.0, 118.0): (1.07, 1.03, 0.95, 'Ducts in unconditioned basement in climate zone 9, mild temperature differential', 'user_input'),
+    ('ducted', 'garage', '1A', 'crawlspace', -25.0, 85.0): (1.1799, 1.35, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, extreme temperature differential', 'user_input'),
+    ('ducted', 'garage', '1A', 'crawlspace', 5.0, 95.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '1A', 'crawlspace', 25.0, 101.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '1A', 'crawlspace', 40.0, 118.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '1A', 'basement_with_slab', -25.0, 85.0): (1.1799, 1.35, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, extreme temperature differential', 'user_input'),
+    ('ducted', 'garage', '1A', 'basement_with_slab', 5.0, 95.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '1A', 'basement_with_slab', 25.0, 101.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '1A', 'basement_with_slab', 40.0, 118.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '1A', 'pier', -25.0, 85.0): (1.1799, 1.35, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, extreme temperature differential', 'user_input'),
+    ('ducted', 'garage', '1A', 'pier', 5.0, 95.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '1A', 'pier', 25.0, 101.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '1A', 'pier', 40.0, 118.0): (1.147125, 1.3230000000000002, 0.95, 'Ducts in vented attic (new construction) in climate zone 1A, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '5B', 'crawlspace', -25.0, 85.0): (1.26684, 1.27008, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, extreme temperature differential', 'user_input'),
+    ('ducted', 'garage', '5B', 'crawlspace', 5.0, 95.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '5B', 'crawlspace', 25.0, 101.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '5B', 'crawlspace', 40.0, 118.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '5B', 'basement_with_slab', -25.0, 85.0): (1.26684, 1.27008, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, extreme temperature differential', 'user_input'),
+    ('ducted', 'garage', '5B', 'basement_with_slab', 5.0, 95.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '5B', 'basement_with_slab', 25.0, 101.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '5B', 'basement_with_slab', 40.0, 118.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '5B', 'pier', -25.0, 85.0): (1.26684, 1.27008, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, extreme temperature differential', 'user_input'),
+    ('ducted', 'garage', '5B', 'pier', 5.0, 95.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '5B', 'pier', 25.0, 101.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '5B', 'pier', 40.0, 118.0): (1.23165, 1.2348, 0.95, 'Ducts in vented attic (new construction) in climate zone 5B, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '8', 'crawlspace', -25.0, 85.0): (1.3662, 1.2312, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, extreme temperature differential', 'user_input'),
+    ('ducted', 'garage', '8', 'crawlspace', 5.0, 95.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '8', 'crawlspace', 25.0, 101.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '8', 'crawlspace', 40.0, 118.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '8', 'basement_with_slab', -25.0, 85.0): (1.3662, 1.2312, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, extreme temperature differential', 'user_input'),
+    ('ducted', 'garage', '8', 'basement_with_slab', 5.0, 95.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '8', 'basement_with_slab', 25.0, 101.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '8', 'basement_with_slab', 40.0, 118.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '8', 'pier', -25.0, 85.0): (1.3662, 1.2312, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, extreme temperature differential', 'user_input'),
+    ('ducted', 'garage', '8', 'pier', 5.0, 95.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '8', 'pier', 25.0, 101.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '8', 'pier', 40.0, 118.0): (1.32825, 1.1969999999999998, 0.95, 'Ducts in vented attic (new construction) in climate zone 8, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '9', 'crawlspace', -25.0, 85.0): (1.242, 1.296, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, extreme temperature differential', 'user_input'),
+    ('ducted', 'garage', '9', 'crawlspace', 5.0, 95.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '9', 'crawlspace', 25.0, 101.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '9', 'crawlspace', 40.0, 118.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '9', 'basement_with_slab', -25.0, 85.0): (1.242, 1.296, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, extreme temperature differential', 'user_input'),
+    ('ducted', 'garage', '9', 'basement_with_slab', 5.0, 95.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '9', 'basement_with_slab', 25.0, 101.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '9', 'basement_with_slab', 40.0, 118.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '9', 'pier', -25.0, 85.0): (1.242, 1.296, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, extreme temperature differential', 'user_input'),
+    ('ducted', 'garage', '9', 'pier', 5.0, 95.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '9', 'pier', 25.0, 101.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ducted', 'garage', '9', 'pier', 40.0, 118.0): (1.2075, 1.26, 0.95, 'Ducts in vented attic (new construction) in climate zone 9, severe temperature differential', 'user_input'),
+    ('ductless', None, '1A', 'crawlspace', -25.0, 85.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+    ('ductless', None, '1A', 'crawlspace', 5.0, 95.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+    ('ductless', None, '1A', 'crawlspace', 25.0, 101.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+    ('ductless', None, '1A', 'crawlspace', 40.0, 118.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+    ('ductless', None, '5B', 'crawlspace', -25.0, 85.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+    ('ductless', None, '5B', 'crawlspace', 5.0, 95.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+    ('ductless', None, '5B', 'crawlspace', 25.0, 101.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+    ('ductless', None, '5B', 'crawlspace', 40.0, 118.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+    ('ductless', None, '8', 'crawlspace', -25.0, 85.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+    ('ductless', None, '8', 'crawlspace', 5.0, 95.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+    ('ductless', None, '8', 'crawlspace', 25.0, 101.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+    ('ductless', None, '8', 'crawlspace', 40.0, 118.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+    ('ductless', None, '9', 'crawlspace', -25.0, 85.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+    ('ductless', None, '9', 'crawlspace', 5.0, 95.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+    ('ductless', None, '9', 'crawlspace', 25.0, 101.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+    ('ductless', None, '9', 'crawlspace', 40.0, 118.0): (1.0, 1.0, 1.0, 'Ductless system - no distribution losses', 'user_input'),
+}
+
+# (framing type, is_steel) -> U-value per WALL_R_VALUES entry
+WALL_U_VALUES = {
+    ('16oc_2x4', False): [0.36921374642020316, 0.16718975841420608, 0.09232587456665617, 0.08475793511017182, 0.07495745351402458, 0.0674783480249801, 0.053537837476411936],
+    ('16oc_2x4', True): [0.41692546583850937, 0.21490147783251234, 0.1400375939849624, 0.13246965452847806, 0.12266917293233082, 0.11519006744328632, 0.10124955689471818],
+    ('24oc_2x4', False): [0.38346784691486596, 0.16832541812925875, 0.088600243122777, 0.08054087902626121, 0.07010400252127325, 0.06213924083164143, 0.047293502325374055],
+    ('24oc_2x4', True): [0.4208074534161491, 0.2056650246305419, 0.12593984962406013, 0.11788048552754435, 0.10744360902255638, 0.09947884733292459, 0.0846331088266572],
+    ('16oc_2x6', False): [0.35983707492658906, 0.157813086920592, 0.08294920307304209, 0.07538126361655774, 0.06558078202041051, 0.058101676531366005, 0.04416116598279786],
+    ('16oc_2x6', True): [0.41692546583850937, 0.21490147783251234, 0.1400375939849624, 0.13246965452847806, 0.12266917293233082, 0.11519006744328632, 0.10124955689471818],
+    ('24oc_2x6', False): [0.3761295822676897, 0.16098715348208253, 0.08126197847560077, 0.07320261437908497, 0.062765737874097, 0.054800976184465194, 0.03995523767819783],
+    ('24oc_2x6', True): [0.4208074534161491, 0.2056650246305419, 0.12593984962406013, 0.11788048552754435, 0.10744360902255638, 0.09947884733292459, 0.0846331088266572],
+    ('advanced', False): [0.4062744077063265, 0.17014247367334298, 0.08263923281257035, 0.07379358929200423, 0.0623384809328711, 0.05359666932229962, 0.03730256608371347],
+    ('advanced', True): [0.4270186335403728, 0.19088669950738918, 0.10338345864661655, 0.09453781512605045, 0.0830827067669173, 0.07434089515634582, 0.05804679191775967],
+    ('steel', False): [0.3635121062223379, 0.16673549452818504, 0.09381612714420784, 0.08644475754373607, 0.07689883391112512, 0.06961399090231554, 0.05603557153682709],
+    ('steel', True): [0.41537267080745344, 0.2185960591133005, 0.1456766917293233, 0.13830532212885155, 0.1287593984962406, 0.12147455548743101, 0.10789613612194258],
+    ('rim_joist', False): [0.3492580057276751, 0.16559983481313237, 0.09754175858808697, 0.09066181362764666, 0.08175228490387645, 0.07495309809565417, 0.06227990668786496],
+    ('rim_joist', True): [0.4114906832298137, 0.22783251231527096, 0.15977443609022557, 0.15289449112978523, 0.14398496240601502, 0.13718577559779277, 0.12451258419000354],
+    ('24oc_2x8', False): [0.39202030721166364, 0.16900681395829034, 0.0863648642564495, 0.07801064537591484, 0.06719193192562244, 0.05893577651563825, 0.04354690123475134],
+    ('24oc_2x8', True): [0.42313664596273287, 0.20012315270935963, 0.1174812030075188, 0.10912698412698413, 0.09830827067669173, 0.09005211526670753, 0.07466323998582063],
+    ('log', False): [0.39202030721166364, 0.16900681395829034, 0.0863648642564495, 0.07801064537591484, 0.06719193192562244, 0.05893577651563825, 0.04354690123475134],
+    ('log', True): [0.42313664596273287, 0.20012315270935963, 0.1174812030075188, 0.10912698412698413, 0.09830827067669173, 0.09005211526670753, 0.07466323998582063],
+}
+
+# (assembly type, era value, zone) -> library key
+ASSEMBLIES_BY_ERA = {
+    ('wall', 'pre_1960', '1'): '2x4_R0',
+    ('wall', 'pre_1960', '4'): '2x4_R0',
+    ('wall', 'pre_1960', '5'): '2x4_R0',
+    ('wall', 'pre_1960', '6'): '2x4_R0',
+    ('wall', 'pre_1960', '5B'): '2x4_R0',
+    ('wall', 'pre_1960', ''): '2x4_R0',
+    ('wall', '1960_1979', '1'): '2x4_R11',
+    ('wall', '1960_1979', '4'): '2x4_R11',
+    ('wall', '1960_1979', '5'): '2x4_R11',
+    ('wall', '1960_1979', '6'): '2x4_R11',
+    ('wall', '1960_1979', '5B'): '2x4_R11',
+    ('wall', '1960_1979', ''): '2x4_R11',
+    ('wall', '1980_1999', '1'): '2x4_R13',
+    ('wall', '1980_1999', '4'): '2x4_R13',
+    ('wall', '1980_1999', '5'): '2x4_R13',
+    ('wall', '1980_1999', '6'): '2x4_R13',
+    ('wall', '1980_1999', '5B'): '2x4_R13',
+    ('wall', '1980_1999', ''): '2x4_R13',
+    ('wall', '2000_2009', '1'): '2x6_R19',
+    ('wall', '2000_2009', '4'): '2x6_R19',
+    ('wall', '2000_2009', '5'): '2x6_R19',
+    ('wall', '2000_2009', '6'): '2x6_R19',
+    ('wall', '2000_2009', '5B'): '2x6_R19',
+    ('wall', '2000_2009', ''): '2x6_R19',
+    ('wall', '2010_2019', '1'): '2x6_R20',
+    ('wall', '2010_2019', '4'): '2x6_R20',
+    ('wall', '2010_2019', '5'): '2x6_R20',
+    ('wall', '2010_2019', '6'): '2x6_R20',
+    ('wall', '2010_2019', '5B'): '2x6_R20',
+    ('wall', '2010_2019', ''): '2x6_R20',
+    ('wall', '2020_plus', '1'): '2x6_R21',
+    ('wall', '2020_plus', '4'): '2x6_R21',
+    ('wall', '2020_plus', '5'): '2x6_R20_foam',
+    ('wall', '2020_plus', '6'): '2x6_R20_foam',
+    ('wall', '2020_plus', '5B'): '2x6_R21',
+    ('wall', '2020_plus', ''): '2x6_R21',
+    ('ceiling', 'pre_1960', '1'): 'ceiling_R0',
+    ('ceiling', 'pre_1960', '4'): 'ceiling_R0',
+    ('ceiling', 'pre_1960', '5'): 'ceiling_R0',
+    ('ceiling', 'pre_1960', '6'): 'ceiling_R0',
+    ('ceiling', 'pre_1960', '5B'): 'ceiling_R0',
+    ('ceiling', 'pre_1960', ''): 'ceiling_R0',
+    ('ceiling', '1960_1979', '1'): 'ceiling_R19',
+    ('ceiling', '1960_1979', '4'): 'ceiling_R19',
+    ('ceiling', '1960_1979', '5'): 'ceiling_R19',
+    ('ceiling', '1960_1979', '6'): 'ceiling_R19',
+    ('ceiling', '1960_1979', '5B'): 'ceiling_R19',
+    ('ceiling', '1960_1979', ''): 'ceiling_R19',
+    ('ceiling', '1980_1999', '1'): 'ceiling_R30',
+    ('ceiling', '1980_1999', '4'): 'ceiling_R30',
+    ('ceiling', '1980_1999', '5'): 'ceiling_R30',
+    ('ceiling', '1980_1999', '6'): 'ceiling_R30',
+    ('ceiling', '1980_1999', '5B'): 'ceiling_R30',
+    ('ceiling', '1980_1999', ''): 'ceiling_R30',
+    ('ceiling', '2000_2009', '1'): 'ceiling_R38',
+    ('ceiling', '2000_2009', '4'): 'ceiling_R38',
+    ('ceiling', '2000_2009', '5'): 'ceiling_R38',
+    ('ceiling', '2000_2009', '6'): 'ceiling_R38',
+    ('ceiling', '2000_2009', '5B'): 'ceiling_R38',
+    ('ceiling', '2000_2009', ''): 'ceiling_R38',
+    ('ceiling', '2010_2019', '1'): 'ceiling_R49',
+    ('ceiling', '2010_2019', '4'): 'ceiling_R49',
+    ('ceiling', '2010_2019', '5'): 'ceiling_R49',
+    ('ceiling', '2010_2019', '6'): 'ceiling_R49',
+    ('ceiling', '2010_2019', '5B'): 'ceiling_R49',
+    ('ceiling', '2010_2019', ''): 'ceiling_R49',
+    ('ceiling', '2020_plus', '1'): 'ceiling_R49',
+    ('ceiling', '2020_plus', '4'): 'ceiling_R49',
+    ('ceiling', '2020_plus', '5'): 'ceiling_R49',
+    ('ceiling', '2020_plus', '6'): 'ceiling_R60',
+    ('ceiling', '2020_plus', '5B'): 'ceiling_R49',
+    ('ceiling', '2020_plus', ''): 'ceiling_R49',
+    ('floor', 'pre_1960', '1'): 'floor_R0',
+    ('floor', 'pre_1960', '4'): 'floor_R0',
+    ('floor', 'pre_1960', '5'): 'floor_R0',
+    ('floor', 'pre_1960', '6'): 'floor_R0',
+    ('floor', 'pre_1960', '5B'): 'floor_R0',
+    ('floor', 'pre_1960', ''): 'floor_R0',
+    ('floor', '1960_1979', '1'): 'floor_R13',
+    ('floor', '1960_1979', '4'): 'floor_R13',
+    ('floor', '1960_1979', '5'): 'floor_R13',
+    ('floor', '1960_1979', '6'): 'floor_R13',
+    ('floor', '1960_1979', '5B'): 'floor_R13',
+    ('floor', '1960_1979', ''): 'floor_R13',
+    ('floor', '1980_1999', '1'): 'floor_R13',
+    ('floor', '1980_1999', '4'): 'floor_R13',
+    ('floor', '1980_1999', '5'): 'floor_R13',
+    ('floor', '1980_1999', '6'): 'floor_R13',
+    ('floor', '1980_1999', '5B'): 'floor_R13',
+    ('floor', '1980_1999', ''): 'floor_R13',
+    ('floor', '2000_2009', '1'): 'floor_R19',
+    ('floor', '2000_2009', '4'): 'floor_R19',
+    ('floor', '2000_2009', '5'): 'floor_R19',
+    ('floor', '2000_2009', '6'): 'floor_R19',
+    ('floor', '2000_2009', '5B'): 'floor_R19',
+    ('floor', '2000_2009', ''): 'floor_R19',
+    ('floor', '2010_2019', '1'): 'floor_R19',
+    ('floor', '2010_2019', '4'): 'floor_R19',
+    ('floor', '2010_2019', '5'): 'floor_R30',
+    ('floor', '2010_2019', '6'): 'floor_R30',
+    ('floor', '2010_2019', '5B'): 'floor_R19',
+    ('floor', '2010_2019', ''): 'floor_R19',
+    ('floor', '2020_plus', '1'): 'floor_R19',
+    ('floor', '2020_plus', '4'): 'floor_R19',
+    ('floor', '2020_plus', '5'): 'floor_R30',
+    ('floor', '2020_plus', '6'): 'floor_R30',
+    ('floor', '2020_plus', '5B'): 'floor_R19',
+    ('floor', '2020_plus', ''): 'floor_R19',
+    ('roof', 'pre_1960', '1'): '2x6_R20',
+    ('roof', 'pre_1960', '4'): '2x6_R20',
+    ('roof', 'pre_1960', '5'): '2x6_R20',
+    ('roof', 'pre_1960', '6'): '2x6_R20',
+    ('roof', 'pre_1960', '5B'): '2x6_R20',
+    ('roof', 'pre_1960', ''): '2x6_R20',
+    ('roof', '1960_1979', '1'): '2x6_R20',
+    ('roof', '1960_1979', '4'): '2x6_R20',
+    ('roof', '1960_1979', '5'): '2x6_R20',
+    ('roof', '1960_1979', '6'): '2x6_R20',
+    ('roof', '1960_1979', '5B'): '2x6_R20',
+    ('roof', '1960_1979', ''): '2x6_R20',
+    ('roof', '1980_1999', '1'): '2x6_R20',
+    ('roof', '1980_1999', '4'): '2x6_R20',
+    ('roof', '1980_1999', '5'): '2x6_R20',
+    ('roof', '1980_1999', '6'): '2x6_R20',
+    ('roof', '1980_1999', '5B'): '2x6_R20',
+    ('roof', '1980_1999', ''): '2x6_R20',
+    ('roof', '2000_2009', '1'): '2x6_R20',
+    ('roof', '2000_2009', '4'): '2x6_R20',
+    ('roof', '2000_2009', '5'): '2x6_R20',
+    ('roof', '2000_2009', '6'): '2x6_R20',
+    ('roof', '2000_2009', '5B'): '2x6_R20',
+    ('roof', '2000_2009', ''): '2x6_R20',
+    ('roof', '2010_2019', '1'): '2x6_R20',
+    ('roof', '2010_2019', '4'): '2x6_R20',
+    ('roof', '2010_2019', '5'): '2x6_R20',
+    ('roof', '2010_2019', '6'): '2x6_R20',
+    ('roof', '2010_2019', '5B'): '2x6_R20',
+    ('roof', '2010_2019', ''): '2x6_R20',
+    ('roof', '2020_plus', '1'): '2x6_R20',
+    ('roof', '2020_plus', '4'): '2x6_R20',
+    ('roof', '2020_plus', '5'): '2x6_R20',
+    ('roof', '2020_plus', '6'): '2x6_R20',
+    ('roof', '2020_plus', '5B'): '2x6_R20',
+    ('roof', '2020_plus', ''): '2x6_R20',
+}
+
+# (assembly type, target R) -> library key
+ASSEMBLIES_BY_R_VALUE = {
+    ('wall', 0.0): '2x4_R0',
+    ('wall', 3.0): '2x4_R0',
+    ('wall', 12.0): '2x4_R11',
+    ('wall', 16.0): '2x4_R15',
+    ('wall', 19.5): '2x6_R19',
+    ('wall', 34.0): '2x6_R20_foam',
+    ('wall', 43.5): '2x6_R20_foam',
+    ('wall', 70.0): '2x6_R20_foam',
+    ('ceiling', 0.0): 'ceiling_R0',
+    ('ceiling', 3.0): 'ceiling_R0',
+    ('ceiling', 12.0): 'ceiling_R19',
+    ('ceiling', 16.0): 'ceiling_R19',
+    ('ceiling', 19.5): 'ceiling_R19',
+    ('ceiling', 34.0): 'ceiling_R30',
+    ('ceiling', 43.5): 'ceiling_R38',
+    ('ceiling', 70.0): 'ceiling_R60',
+    ('floor', 0.0): 'floor_R0',
+    ('floor', 3.0): 'floor_R0',
+    ('floor', 12.0): 'floor_R13',
+    ('floor', 16.0): 'floor_R13',
+    ('floor', 19.5): 'floor_R19',
+    ('floor', 34.0): 'floor_R30',
+    ('floor', 43.5): 'floor_R30',
+    ('floor', 70.0): 'floor_R30',
+    ('roof', 0.0): '2x6_R20',
+    ('roof', 3.0): '2x6_R20',
+    ('roof', 12.0): '2x6_R20',
+    ('roof', 16.0): '2x6_R20',
+    ('roof', 19.5): '2x6_R20',
+    ('roof', 34.0): '2x6_R20',
+    ('roof', 43.5): '2x6_R20',
+    ('roof', 70.0): '2x6_R20',
+}
@@ -0,0 +1,59 @@
+"""
+Golden envelope loads for a building with modeled surfaces
+
+Recorded from ZoneLoadCalculator's original per-surface implementation (before
+loads were compiled into a LoadPlan). Compiled plans must reproduce the
+envelope components exactly. Floats are stored as repr() so they round-trip.
+"""
+
+from domain.models.spaces import BoundaryCondition, Space, SpaceType, Surface
+from domain.models.zones import BuildingThermalModel, ThermalZone, ZoneType
+
+CLIMATE = {'winter_99': -2.0, 'summer_1': 91.0, 'design_wind_mph': 15}
+ENVELOPE_PROPERTIES = {
+    'wall_r_value': 21, 'window_u_value': 0.32, 'ceiling_r_value': 49, 'floor_r_value': 30,
+    'ach50': 5.0, 'outdoor_winter': CLIMATE['winter_99'], 'outdoor_summer': CLIMATE['summer_1']
+}
+
+
+def build_model() -> BuildingThermalModel:
+    """Two zones covering every surface boundary condition"""
+    living = Space("living", "Living", SpaceType.LIVING, 1, 420.0, floor_over=BoundaryCondition.CRAWLSPACE, surfaces=[
+        Surface("living_n", "wall", 180.0, "N", u_value=0.06, windows=[{'area_sqft': 24.0}]),
+        Surface("living_s", "wall", 160.0, "S", u_value=0.0, windows=[{'area_sqft': 40.0}], doors=[{'area_sqft': 20.0}]),
+        Surface("living_ceiling", "ceiling", 420.0, u_value=0.026),
+        Surface("living_floor", "floor", 420.0, u_value=0.047, boundary_condition=BoundaryCondition.CRAWLSPACE),
+        Surface("living_garage", "wall", 96.0, "E", u_value=0.07, boundary_condition=BoundaryCondition.GARAGE),
+    ])
+    kitchen = Space("kitchen", "Kitchen", SpaceType.KITCHEN, 1, 210.0, surfaces=[
+        Surface("kitchen_w", "wall", 120.0, "W", u_value=0.06, windows=[{'area_sqft': 15.0}]),
+        Surface("kitchen_slab", "floor", 210.0, u_value=0.1, boundary_condition=BoundaryCondition.GROUND),
+        Surface("kitchen_stem", "wall", 30.0, u_value=0.1, boundary_condition=BoundaryCondition.GROUND),
+        Surface("kitchen_crawl_wall", "wall", 40.0, u_value=0.0, boundary_condition=BoundaryCondition.CRAWLSPACE),
+        Surface("kitchen_partition", "wall", 90.0, u_value=0.2, boundary_condition=BoundaryCondition.CONDITIONED),
+    ])
+    bonus = Space("bonus", "Bonus", SpaceType.BEDROOM, 2, 300.0, floor_over=BoundaryCondition.GARAGE,
+                  is_over_garage=True, surfaces=[
+        Surface("bonus_e", "wall", 110.0, "E", u_value=0.06, windows=[{'area_sqft': 12.0}]),
+        Surface("bonus_roof", "roof", 320.0, u_value=0.03),
+        Surface("bonus_attic", "ceiling", 80.0, u_value=0.03, boundary_condition=BoundaryCondition.ATTIC),
+        Surface("bonus_floor", "floor", 300.0, u_value=0.05, boundary_condition=BoundaryCondition.GARAGE),
+    ])
+    zones = [
+        ThermalZone("main", "Main", ZoneType.MAIN_LIVING, 1, spaces=[living, kitchen]),
+        ThermalZone("bonus", "Bonus", ZoneType.BONUS, 2, spaces=[bonus], primary_occupancy=False),
+    ]
+    return BuildingThermalModel("surfaces", 930.0, 2, zones=zones)
+
+
+# zone id -> mode -> envelope component -> BTU/hr
+ENVELOPE_COMPONENTS = {
+    'main': {
+        'heating': {'walls': 1983.0171428571427, 'windows': 1820.1599999999999, 'ceiling': 786.24, 'floor': 1750.896},
+        'cooling': {'walls': 422.00380952380954, 'windows': 404.48, 'ceiling': 174.72, 'floor': 221.08799999999997},
+    },
+    'bonus': {
+        'heating': {'walls': 423.36, 'windows': 276.48, 'ceiling': 691.1999999999999, 'floor': 930.0},
+        'cooling': {'walls': 94.08, 'windows': 61.44, 'ceiling': 153.6, 'floor': 165.0},
+    },
+}
@@ -0,0 +1,70 @@
+"""
+ZIP → design conditions must match the original per-request CSV lookup
+
+The climate database only precomputes that lookup; any change to which
+station a ZIP maps to is a change in design loads.
+"""
+
+import csv
+
+import pytest
+
+from domain.core.climate_db import ASHRAE_TEMPS_FILE
+from domain.core.climate_zones import get_climate_data_for_zip
+from domain.core.zip_climate_zones import ZIP_CLIMATE_ZONES
+
+
+def _csv_scan(zip_code: str) -> dict:
+    """The original lookup: zone by 3-digit prefix, then the first CSV row in that zone"""
+    result = {'found': False, 'climate_zone': '4A', 'winter_99': 10, 'summer_1': 90, 'summer_wb': 75}
+    zone = ZIP_CLIMATE_ZONES.get(zip_code[:3])
+    if zone is None:
+        return result
+    result.update(found=True, climate_zone=zone, location='US', state='US')
+    with open(ASHRAE_TEMPS_FILE) as f:
+        for row in csv.DictReader(f):
+            if row['climate_zone'] == zone:
+                for key in ('winter_99', 'summer_1', 'summer_wb', 'daily_range'):
+                    result[key] = float(row[key])
+                break
+    return result
+
+
+@pytest.mark.parametrize('zip_code, zone, winter_99, summer_1', [
+    ('99006', '5B', -2.0, 91.0),   # Spokane area: zone 5B → first 5B station (Denver)
+    ('80202', '5B', -2.0, 91.0),
+    ('10001', '4A', 17.0, 93.0),
+    ('33130', '1A', 47.0, 91.0),
+    ('60601', '5A', -4.0, 91.0),
+])
+def test_known_zips(zip_code, zone, winter_99, summer_1):
+    result = get_climate_data_for_zip(zip_code)
+
+    assert result['found']
+    assert result['climate_zone'] == zone
+    assert (result['winter_99'], result['summer_1']) == (winter_99, summer_1)
+    assert result['location'] == 'US'
+
+
+def test_zone_without_station_keeps_default_temperatures():
+    prefix = next(p for p, zone in ZIP_CLIMATE_ZONES.items() if zone == '4B')
+    result = get_climate_data_for_zip(prefix + '01')
+
+    assert result['found'] and result['climate_zone'] == '4B'
+    assert (result['winter_99'], result['summer_1'], result['summer_wb']) == (10, 90, 75)
+
+
+@pytest.mark.parametrize('zip_code', ['', '12', '000', 'abcde'])
+def test_unmapped_zips_use_defaults(zip_code):
+    result = get_climate_data_for_zip(zip_code)
+
+    assert not result['found']
+    assert result['climate_zone'] == '4A'
+
+
+def test_every_prefix_matches_the_csv_scan():
+    for prefix in ZIP_CLIMATE_ZONES:
+        zip_code = prefix + '42'
+        result = get_climate_data_for_zip(zip_code)
+        expected = _csv_scan(zip_code)
+        assert {key: result.get(key) for key in expected} == expected, zip_code
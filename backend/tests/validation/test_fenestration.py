@@ -0,0 +1,92 @@
+"""
+Window and door symbols from small vector sheets
+
+Drawing units are inches (scale_factor 1/12 ft per unit), so a 36-unit
+opening is a 3 ft window or door.
+"""
+
+import pytest
+
+from infrastructure.extractors.fenestration import FenestrationExtractor
+from infrastructure.extractors.segment_index import SegmentArray
+
+SCALE = 1 / 12
+KAPPA = 0.5522847498  # Bezier control offset for a quarter circle
+
+
+def _line(x1, y1, x2, y2):
+    return {'path_type': 'line', 'points': [[x1, y1], [x2, y2]]}
+
+
+def _curve(*points):
+    return {'path_type': 'curve', 'points': [list(point) for point in points]}
+
+
+def _quarter_arc(cx, cy, r):
+    """Swing from (cx + r, cy) to (cx, cy + r) about (cx, cy)"""
+    return _curve((cx + r, cy), (cx + r, cy + KAPPA * r), (cx + KAPPA * r, cy + r), (cx, cy + r))
+
+
+def _extract(paths):
+    return FenestrationExtractor().extract_fenestration({'paths': paths}, [], [], None, SCALE)
+
+
+def test_parallel_pair_is_one_window():
+    result = _extract([_line(0, 0, 36, 0), _line(0, 4, 36, 4)])
+
+    assert len(result.windows) == 1
+    window = result.windows[0]
+    assert window.width_ft == pytest.approx(3.0)
+    assert window.location == pytest.approx((18 * SCALE, 2 * SCALE))
+    assert result.doors == []
+
+
+def test_three_line_symbol_is_one_window():
+    result = _extract([_line(0, 0, 36, 0), _line(0, 3, 36, 3), _line(0, 6, 36, 6)])
+
+    assert len(result.windows) == 1
+    assert result.windows[0].width_ft == pytest.approx(3.0)
+
+
+def test_pairs_outside_the_symbol_tolerances_are_not_windows():
+    extractor = FenestrationExtractor()
+    paths = [
+        _line(0, 0, 36, 0), _line(0, 12, 36, 12),        # Too far apart
+        _line(100, 0, 136, 0), _line(100, 4, 136, 10),   # Not parallel
+        _line(200, 0, 236, 0), _line(218, 4, 254, 4),    # Half overlap
+    ]
+
+    assert extractor._find_window_pairs(SegmentArray.from_paths(paths), SCALE) == []
+
+
+def test_quarter_arc_is_one_36_unit_swing():
+    extractor = FenestrationExtractor()
+
+    swings = extractor._find_door_swings([_quarter_arc(10, 20, 36)])
+
+    assert len(swings) == 1
+    hinge, radius = swings[0]
+    assert hinge == pytest.approx((10, 20))
+    assert radius == pytest.approx(36)
+
+    doors = _extract([_quarter_arc(10, 20, 36)]).doors
+    assert len(doors) == 1 and doors[0].width_ft == pytest.approx(3.0)
+
+
+def test_non_circular_curve_is_not_a_swing():
+    extractor = FenestrationExtractor()
+    # Same end points and end tangents as a quarter arc, but the controls pull the middle inward
+    curve = _curve((36, 0), (36, 10), (10, 36), (0, 36))
+
+    assert extractor._find_door_swings([curve]) == []
+    assert _extract([curve]).doors == []
+
+
+def test_empty_sheet():
+    extractor = FenestrationExtractor()
+
+    assert extractor._find_window_pairs(SegmentArray.from_paths([]), SCALE) == []
+    assert extractor._find_door_swings([]) == []
+    result = _extract([])
+    assert result.windows == [] and result.doors == []
+    assert result.total_window_area == 0
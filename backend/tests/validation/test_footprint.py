@@ -0,0 +1,89 @@
+"""
+Outer-face footprints of small wall networks
+
+Coordinates are sheet units (feet here, y down); outward angles are degrees
+CCW from east with north up, so the top wall of a sheet faces 90°.
+"""
+
+import numpy as np
+import pytest
+
+from infrastructure.extractors.footprint import FootprintEngine
+from infrastructure.extractors.segment_index import SegmentArray
+
+
+def _segments(*polylines, closed=False):
+    """Line paths along each polyline"""
+    paths = []
+    for points in polylines:
+        pairs = list(zip(points[:-1], points[1:]))
+        if closed:
+            pairs.append((points[-1], points[0]))
+        paths.extend({'path_type': 'line', 'points': [list(a), list(b)]} for a, b in pairs)
+    return SegmentArray.from_paths(paths)
+
+
+def _compute(segments):
+    return FootprintEngine(snap_tolerance=0.25, max_opening=4.0).compute(segments)
+
+
+def _walls(footprint):
+    """(start, end, outward angle) per wall run, starting from the top-left corner"""
+    walls = [
+        (tuple(np.round(start, 6)), tuple(np.round(end, 6)), round(float(angle), 6))
+        for start, end, angle in zip(footprint.wall_starts, footprint.wall_ends, footprint.outward_angles)
+    ]
+    first = walls.index(min(walls, key=lambda wall: (wall[0][1], wall[0][0])))
+    return walls[first:] + walls[:first]
+
+
+def test_rectangle_with_doorway_gap():
+    # 3 ft doorway in the bottom wall
+    segments = _segments([(20, 30), (40, 30), (40, 0), (0, 0), (0, 30), (17, 30)])
+
+    footprint = _compute(segments)
+
+    assert footprint is not None
+    assert footprint.area == pytest.approx(1200)
+    assert footprint.perimeter == pytest.approx(140)
+    assert sorted(angle for _, _, angle in _walls(footprint)) == [0, 90, 180, 270]
+
+
+def test_l_shape():
+    segments = _segments([(0, 0), (40, 0), (40, 20), (20, 20), (20, 40), (0, 40)], closed=True)
+
+    footprint = _compute(segments)
+
+    assert footprint.area == pytest.approx(1200)
+    assert footprint.perimeter == pytest.approx(160)
+    assert _walls(footprint) == [
+        ((0, 0), (40, 0), 90),
+        ((40, 0), (40, 20), 0),
+        ((40, 20), (20, 20), 270),
+        ((20, 20), (20, 40), 0),
+        ((20, 40), (0, 40), 270),
+        ((0, 40), (0, 0), 180),
+    ]
+
+
+def test_spur_is_not_an_exterior_wall():
+    rectangle = [(0, 0), (40, 0), (40, 30), (0, 30), (0, 0)]
+
+    plain = _compute(_segments(rectangle))
+    footprint = _compute(_segments(rectangle, [(40, 15), (50, 15)]))
+
+    assert footprint.area == pytest.approx(1200)
+    assert footprint.perimeter == pytest.approx(140)
+    assert _walls(footprint) == _walls(plain)
+    # The spur is walked out and back, so it stays in the ring
+    assert any(np.allclose(point, (50, 15)) for point in footprint.ring)
+
+
+@pytest.mark.parametrize('polylines', [
+    [[(0, 0), (40, 0), (40, 30), (0, 30)]],                      # Open side
+    [[(20, 30), (40, 30), (40, 0), (0, 0), (0, 30), (14, 30)]],  # 6 ft gap is wider than a doorway
+    [[(0, 0), (40, 0)], [(0, 10), (40, 10)]],                    # Fewer than three walls
+    [],                                                          # Empty sheet
+])
+def test_no_closed_boundary(polylines):
+    assert _compute(_segments(*polylines)) is None
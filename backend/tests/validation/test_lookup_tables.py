@@ -0,0 +1,119 @@
+"""
+Golden tests for the precomputed lookup tables
+
+The scalar calculators are one-entry calls of the table-driven batch paths,
+so both must reproduce the values recorded from the original per-call
+formulas exactly (bit-for-bit, not within a tolerance).
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from domain.thermal.foundation_thermal import (
+    FoundationThermalCalculator,
+    calculate_foundation_thermal_factors_batch,
+)
+from domain.mechanical.duct_loss_calculator import (
+    DuctConfiguration,
+    IntelligentDuctLossCalculator,
+    calculate_duct_losses_batch,
+)
+from domain.calculations.parallel_path import ParallelPathCalculator
+from domain.core.thermal_assemblies import ConstructionEra, ThermalAssemblyLibrary
+from fixtures import lookup_table_golden as golden
+
+
+LIBRARY = ThermalAssemblyLibrary()
+ASSEMBLIES = {**LIBRARY.WALL_ASSEMBLIES, **LIBRARY.CEILING_ASSEMBLIES, **LIBRARY.FLOOR_ASSEMBLIES}
+
+
+def test_foundation_factors_match_golden():
+    calculator = FoundationThermalCalculator()
+    cases = list(golden.FOUNDATION_FACTORS)
+
+    batch = calculate_foundation_thermal_factors_batch(
+        [c[0] for c in cases],
+        [c[1] for c in cases],
+        [c[2] for c in cases],
+        [np.nan if c[3] is None else c[3] for c in cases],
+    )
+
+    for i, case in enumerate(cases):
+        foundation_type, design, area, perimeter = case
+        expected = golden.FOUNDATION_FACTORS[case]
+        r_value, conductance, perimeter_factor, below_grade, _ = expected
+        assert batch.foundation_type[i] == foundation_type
+        assert batch.effective_r_value[i] == r_value
+        assert batch.thermal_conductance[i] == conductance
+        assert batch.perimeter_factor[i] == perimeter_factor
+        assert batch.below_grade_factor[i] == below_grade
+
+        result = calculator.calculate_foundation_thermal_factors(foundation_type, '5B', design, area, perimeter)
+        assert result.foundation_type == foundation_type
+        assert (result.effective_r_value, result.thermal_conductance, result.perimeter_factor,
+                result.below_grade_factor, result.notes) == expected
+
+
+def test_foundation_batch_estimates_missing_perimeters():
+    batch = calculate_foundation_thermal_factors_batch(['crawlspace'] * 2, [-4.0, 25.0], [640.0, 3917.0])
+
+    assert batch.thermal_conductance[0] == golden.FOUNDATION_FACTORS[('crawlspace', -4.0, 640.0, None)][1]
+    assert batch.thermal_conductance[1] == golden.FOUNDATION_FACTORS[('crawlspace', 25.0, 3917.0, None)][1]
+
+
+def test_duct_factors_match_golden():
+    calculator = IntelligentDuctLossCalculator()
+    cases = list(golden.DUCT_FACTORS)
+
+    batch = calculate_duct_losses_batch(*(list(column) for column in zip(*cases)))
+
+    for i, case in enumerate(cases):
+        expected = golden.DUCT_FACTORS[case]
+        heating, cooling, confidence, _, _ = expected
+        assert batch.heating_factor[i] == heating
+        assert batch.cooling_factor[i] == cooling
+        assert batch.confidence[i] == confidence
+
+        result = calculator.calculate_duct_losses(DuctConfiguration(*case))
+        assert (result.heating_factor, result.cooling_factor, result.confidence,
+                result.notes, result.source) == expected
+
+
+@pytest.mark.parametrize('framing_type', golden.WALL_FRAMING)
+@pytest.mark.parametrize('is_steel', [False, True])
+def test_wall_u_values_match_golden(framing_type, is_steel):
+    calculator = ParallelPathCalculator()
+    expected = golden.WALL_U_VALUES[(framing_type, is_steel)]
+
+    assert calculator.calculate_wall_u_values(golden.WALL_R_VALUES, framing_type, is_steel).tolist() == expected
+    assert [calculator.calculate_wall_u_value(r, framing_type, is_steel) for r in golden.WALL_R_VALUES] == expected
+
+
+def test_wall_u_values_accept_per_entry_framing():
+    calculator = ParallelPathCalculator()
+    framing = ['16oc_2x4', '24oc_2x6', 'steel']
+    batch = calculator.calculate_wall_u_values([13.0, 21.0, 13.0], framing, [False, False, True])
+
+    r_index = {r: i for i, r in enumerate(golden.WALL_R_VALUES)}
+    assert batch[0] == golden.WALL_U_VALUES[('16oc_2x4', False)][r_index[13.0]]
+    assert batch[1] == golden.WALL_U_VALUES[('24oc_2x6', False)][r_index[21.0]]
+    assert batch[2] == golden.WALL_U_VALUES[('steel', True)][r_index[13.0]]
+
+
+@pytest.mark.parametrize('assembly_type', golden.ASSEMBLY_TYPES)
+def test_assemblies_match_golden(assembly_type):
+    eras, zones = zip(*itertools.product(ConstructionEra, golden.ERA_ZONES))
+
+    by_era = LIBRARY.get_assemblies_by_era(assembly_type, eras, zones)
+    for era, zone, assembly in zip(eras, zones, by_era):
+        expected = ASSEMBLIES[golden.ASSEMBLIES_BY_ERA[(assembly_type, era.value, zone)]]
+        assert assembly is expected
+        assert LIBRARY.get_assembly_by_era(assembly_type, era, zone) is expected
+
+    by_r_value = LIBRARY.get_assemblies_by_r_value(assembly_type, golden.R_TARGETS)
+    for target, assembly in zip(golden.R_TARGETS, by_r_value):
+        expected = ASSEMBLIES[golden.ASSEMBLIES_BY_R_VALUE[(assembly_type, target)]]
+        assert assembly is expected
+        assert LIBRARY.get_assembly_by_r_value(assembly_type, target) is expected
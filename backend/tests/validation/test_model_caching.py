@@ -0,0 +1,99 @@
+"""
+Cached aggregates on the domain models must follow every kind of mutation
+
+Child lists are the caller's own lists, so appending to a list passed at
+construction has to show up in the aggregates without touching the model.
+"""
+
+import pickle
+
+from domain.models.spaces import Space, SpaceType, Surface
+from domain.models.zones import BuildingThermalModel, ThermalZone, ZoneType
+
+
+def _space(space_id: str, surfaces=None) -> Space:
+    return Space(space_id, space_id, SpaceType.BEDROOM, 1, 200.0, surfaces=surfaces if surfaces is not None else [])
+
+
+def _wall(surface_id: str, area: float = 100.0) -> Surface:
+    return Surface(surface_id, "wall", area, "N", windows=[{'area_sqft': 10.0}])
+
+
+def test_child_lists_alias_the_callers_list():
+    surfaces = []
+    space = _space("s1", surfaces)
+    assert space.exterior_wall_area == 0
+
+    surfaces.append(_wall("w1"))
+    assert space.surfaces is surfaces
+    assert len(space.surfaces) == 1
+    assert space.exterior_wall_area == 100.0
+
+
+def test_field_changes_invalidate_holders():
+    wall = _wall("w1")
+    space = _space("s1", [wall])
+    spaces = [space]
+    zone = ThermalZone("z1", "Zone", ZoneType.MAIN_LIVING, 1, spaces=spaces)
+    building = BuildingThermalModel("b", 200.0, 1, zones=[zone])
+    assert zone.total_area_sqft == 200.0
+    assert building.surface_store.net_area_sqft.tolist() == [90.0]
+
+    space.area_sqft = 250.0
+    wall.area_sqft = 120.0
+    assert zone.total_area_sqft == 250.0
+    assert zone.exterior_wall_area == 120.0
+
+    wall.windows.append({'area_sqft': 5.0})
+    spaces.append(_space("s2", [_wall("w2", 50.0)]))
+    assert zone.total_area_sqft == 450.0
+    assert building.surface_store.net_area_sqft.tolist() == [105.0, 40.0]
+
+
+def test_pickle_round_trip_rebuilds_caches():
+    zone = ThermalZone("z1", "Zone", ZoneType.MAIN_LIVING, 1, spaces=[_space("s1", [_wall("w1")])])
+    assert zone.exterior_wall_area == 100.0
+
+    copy = pickle.loads(pickle.dumps(zone))
+    copy.spaces[0].surfaces[0].area_sqft = 80.0
+    assert copy.exterior_wall_area == 80.0
+    assert zone.exterior_wall_area == 100.0
+
+
+class _CountingList(list):
+    """List that counts full walks (iteration and comparison)"""
+    walks = 0
+
+    def __iter__(self):
+        _CountingList.walks += 1
+        return super().__iter__()
+
+    def __eq__(self, other):
+        _CountingList.walks += 1
+        return super().__eq__(other)
+
+    __hash__ = None
+
+
+def test_cache_hits_do_not_walk_child_lists():
+    spaces = _CountingList([_space("s1"), _space("s2")])
+    zone = ThermalZone("z1", "Zone", ZoneType.MAIN_LIVING, 1, spaces=spaces)
+    assert zone.total_area_sqft == 400.0
+    assert zone.total_volume_cuft == 3600.0
+
+    walks = _CountingList.walks
+    for _ in range(10):
+        assert zone.total_area_sqft == 400.0
+        assert zone.total_volume_cuft == 3600.0
+    assert _CountingList.walks == walks
+
+
+def test_replacing_a_child_list_adopts_the_new_children():
+    zone = ThermalZone("z1", "Zone", ZoneType.MAIN_LIVING, 1, spaces=[_space("s1")])
+    assert zone.total_area_sqft == 200.0
+
+    replacement = _space("s2")
+    zone.spaces = [replacement]
+    assert zone.total_area_sqft == 200.0
+    replacement.area_sqft = 300.0
+    assert zone.total_area_sqft == 300.0
@@ -0,0 +1,38 @@
+"""
+Modeled surfaces must load exactly as ZoneLoadCalculator's per-surface rules did
+
+The compiled plan only regroups those terms; the golden components were
+recorded from the original implementation on a model with every boundary.
+"""
+
+import pytest
+
+from domain.calculations.load_plan import EnvelopeInputs, get_load_plan_compiler
+from domain.calculations.zone_loads import ZoneLoadCalculator
+from fixtures import surface_model_golden as golden
+
+COMPONENTS = ('walls', 'windows', 'ceiling', 'floor')
+
+
+def _envelope_components(result):
+    return {
+        mode: {name: getattr(components, name) for name in COMPONENTS}
+        for mode, components in (('heating', result.heating_components), ('cooling', result.cooling_components))
+    }
+
+
+@pytest.mark.parametrize('shared_plan', [False, True])
+def test_zone_envelope_components_match_golden(shared_plan):
+    model = golden.build_model()
+    load_plan = None
+    if shared_plan:
+        envelope = EnvelopeInputs.from_properties(golden.ENVELOPE_PROPERTIES, golden.CLIMATE)
+        load_plan = get_load_plan_compiler().compile(
+            model, golden.CLIMATE, envelope, zones=model.zones, cooling_diversity=False
+        )
+
+    for zone in model.zones:
+        result = ZoneLoadCalculator().calculate_zone_loads(
+            zone, model, golden.CLIMATE, golden.ENVELOPE_PROPERTIES, load_plan=load_plan
+        )
+        assert _envelope_components(result) == golden.ENVELOPE_COMPONENTS[zone.zone_id], zone.zone_id
@@ -11,6 +11,7 @@ export const USE_SMOKE_TEST = process.env.NEXT_PUBLIC_USE_SMOKE_TEST === 'true';
 export const API_ENDPOINTS = {
   upload: `${API_BASE}/blueprint/upload`,
   jobStatus: (jobId: string) => `${API_BASE}/blueprint/jobs/${jobId}`,
+  jobEvents: (jobId: string) => `${API_BASE}/blueprint/jobs/${jobId}/events`,
   health: '/healthz',
 } as const;
 
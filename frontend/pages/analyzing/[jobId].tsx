@@ -2,6 +2,7 @@ import { useRouter } from 'next/router'
 import { useState, useEffect } from 'react'
 import useSWR from 'swr'
 import { apiHelpers } from '../../lib/fetcher'
+import { API_URL, API_ENDPOINTS } from '../../constants/api'
 import Head from 'next/head'
 import ShareModal from '../../components/ShareModal'
 import { useSession } from 'next-auth/react'
@@ -16,6 +17,22 @@ interface JobStatus {
   error?: string
 }
 
+interface JobProgressEvent {
+  job_id: string
+  stage: string
+  status: string
+  progress: number | null
+  message: string
+  data?: Record<string, any>
+}
+
+// Event names sent by GET /blueprint/jobs/{jobId}/events
+const JOB_EVENT_STAGES = [
+  'processing', 'queued', 'started', 'extraction_started', 'page_extracted', 'specs_extracted',
+  'scale_detected', 'building_extracted', 'zones_built', 'loads_calculated', 'report_generating',
+  'duplicate_progress', 'retrying', 'completed', 'failed'
+]
+
 interface ProcessingStage {
   title: string
   description: string
@@ -235,6 +252,8 @@ export default function AnalyzingPage() {
   const [showPasswordPrompt, setShowPasswordPrompt] = useState(false)
   const [passwordPromptDismissed, setPasswordPromptDismissed] = useState(false)
   const [showCompletionGate, setShowCompletionGate] = useState(false)
+  const [liveEvent, setLiveEvent] = useState<JobProgressEvent | null>(null)
+  const [liveConnected, setLiveConnected] = useState(false)
   
   useEffect(() => {
     // Use session email only - no more cookies
@@ -245,12 +264,12 @@ export default function AnalyzingPage() {
     }
   }, [session])
   
-  // Poll job status every 2 seconds
+  // Poll job status every 2 seconds (slow fallback poll while the live stream is connected)
   const { data: jobStatus, error, mutate } = useSWR<JobStatus>(
     jobId ? jobId as string : null,
     apiHelpers.getJobStatus,
     {
-      refreshInterval: 2000,
+      refreshInterval: liveConnected ? 15000 : 2000,
       refreshWhenHidden: false,
       refreshWhenOffline: false,
       revalidateOnFocus: true,
@@ -260,6 +279,40 @@ export default function AnalyzingPage() {
     }
   )
   
+  // Live stage progress from the server-sent event stream
+  const jobActive = jobStatus?.status === 'processing' || jobStatus?.status === 'pending'
+  useEffect(() => {
+    if (!jobId || !jobActive || typeof EventSource === 'undefined') return
+    
+    const source = new EventSource(`${API_URL}${API_ENDPOINTS.jobEvents(jobId as string)}`)
+    const handleEvent = (message: MessageEvent) => {
+      const event: JobProgressEvent = JSON.parse(message.data)
+      setLiveEvent(event)
+      if (event.status === 'completed' || event.status === 'failed') {
+        source.close()
+        setLiveConnected(false)
+        mutate()
+      }
+    }
+    
+    source.onopen = () => setLiveConnected(true)
+    source.onerror = () => setLiveConnected(false)  // Browser retries; polling covers the gap
+    JOB_EVENT_STAGES.forEach((stage) => source.addEventListener(stage, handleEvent))
+    
+    return () => {
+      source.close()
+      setLiveConnected(false)
+    }
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [jobId, jobActive])
+  
+  // Real progress from the stream replaces the simulated animation
+  useEffect(() => {
+    if (liveEvent?.progress != null && jobStatus?.status === 'processing') {
+      setDisplayProgress((current) => Math.max(current, liveEvent.progress as number))
+    }
+  }, [liveEvent, jobStatus?.status])
+  
   // Rotate facts every 4 seconds
   useEffect(() => {
     if (jobStatus?.status === 'processing' || jobStatus?.status === 'pending') {
@@ -276,6 +329,8 @@ export default function AnalyzingPage() {
       // Start at 0 and quickly move to 15%
       setDisplayProgress(0)
       setTimeout(() => setDisplayProgress(15), 100)
+    } else if (jobStatus?.status === 'processing' && liveConnected) {
+      // Live stream drives the progress bar
     } else if (jobStatus?.status === 'processing') {
       // Smooth increase from 15% to 90% over time
       setDisplayProgress(15)
@@ -312,7 +367,7 @@ export default function AnalyzingPage() {
     } else if (jobStatus?.status === 'failed') {
       // Keep at current progress
     }
-  }, [jobStatus?.status, session, userEmail])
+  }, [jobStatus?.status, session, userEmail, liveConnected])
 
   // Rotate technical status messages
   useEffect(() => {
@@ -519,7 +574,7 @@ export default function AnalyzingPage() {
                     detect HVAC requirements, and calculate precise load requirements.
                   </p>
                   <p className="text-sm text-brand-600 font-medium animate-pulse">
-                    {technicalStatusMessages[currentStatusMessage]}
+                    {liveEvent?.message || technicalStatusMessages[currentStatusMessage]}
                   </p>
                 </div>
               )}